@@ -12,7 +12,7 @@ from pyscnomics.contracts.transition import Transition
 from pyscnomics.optimize import sensitivity_psc, uncertainty_psc
 from pyscnomics.tools.summary import get_summary
 from pyscnomics.tools.table import get_table
-from pyscnomics.optimize.optimization import optimize_psc
+from pyscnomics.optimize.optimization import optimize_psc, get_evaluation_stats_info
 from pyscnomics.optimize.optimization_transition import optimize_psc_core as optimize_psc_trans
 from pyscnomics.econ.selection import OptimizationParameter, FluidType
 from pyscnomics.tools.ltp import oil_ltp_predict, gas_ltp_predict
@@ -43,7 +43,9 @@ from pyscnomics.api.converter import (convert_str_to_date,
                                       convert_to_float,
                                       read_fluid_type,
                                       convert_to_method_limit,
-                                      convert_to_uncertainty_distribution)
+                                      convert_to_uncertainty_distribution,
+                                      convert_to_uncertainty_sampling,
+                                      convert_to_optimization_method)
 from pyscnomics.econ.limit import econ_limit
 
 
@@ -406,6 +408,8 @@ def get_contract_optimization(data: dict, contract_type: str = 'Cost Recovery')
     target_optimization_value = data['optimization_arguments']['target_optimization']
     target_parameter = convert_str_to_optimization_targetparameter(
         str_object=data['optimization_arguments']['target_parameter'])
+    method = convert_to_optimization_method(target=data['optimization_arguments']['method'])
+    tolerance = data['optimization_arguments']['tolerance']
 
     # Retrieving the contract, contract_arguments_dict, summary_arguments_dict based on the contract type
     if contract_type == 'Cost Recovery':
@@ -428,6 +432,9 @@ def get_contract_optimization(data: dict, contract_type: str = 'Cost Recovery')
         contract_arguments = NotImplemented
         summary_argument = NotImplemented
 
+    # Counting the contract evaluations of this request
+    evaluation_stats = {}
+
     if contract_type == 'Transition':
         # Retrieve the original useful life of the capital cost
         useful_life_original = contract.contract2.capital_cost_total.useful_life.tolist()
@@ -439,6 +446,9 @@ def get_contract_optimization(data: dict, contract_type: str = 'Cost Recovery')
             target_optimization_value=target_optimization_value,
             summary_argument=summary_argument,
             target_parameter=target_parameter,
+            method=method,
+            tolerance=tolerance,
+            evaluation_stats=evaluation_stats,
         )
 
     else:
@@ -451,6 +461,9 @@ def get_contract_optimization(data: dict, contract_type: str = 'Cost Recovery')
             target_optimization_value=target_optimization_value,
             summary_argument=summary_argument,
             target_parameter=target_parameter,
+            method=method,
+            tolerance=tolerance,
+            evaluation_stats=evaluation_stats,
         )
 
     # Treatment to add the useful life of optimization into the result
@@ -512,6 +525,9 @@ def get_contract_optimization(data: dict, contract_type: str = 'Cost Recovery')
     result_parameters = pd.DataFrame(optimization_result).set_index('list_str').to_dict()
     result_parameters['optimization_result'] = result_optimization
 
+    # Reporting the evaluations of this request and the share served without a contract run
+    result_parameters['evaluation_cache'] = get_evaluation_stats_info(evaluation_stats=evaluation_stats)
+
     # Adding the execution info
     result_parameters = add_execution_info(data=result_parameters)
 
@@ -1377,6 +1393,7 @@ def get_sensitivity(data:dict, contract_type:str):
         base_value=data['sensitivity_arguments']['base_value'],
         step=data['sensitivity_arguments']['step'],
         dataframe_output=False,
+        executor='thread',
     )
 
     return sensitivity_result
@@ -1440,6 +1457,11 @@ def get_uncertainty(data: dict, contract_type: str):
         'opex_distribution': convert_to_uncertainty_distribution(target=data['uncertainty_arguments']['opex_distribution']),
         'capex_distribution': convert_to_uncertainty_distribution(target=data['uncertainty_arguments']['capex_distribution']),
         'lifting_distribution': convert_to_uncertainty_distribution(target=data['uncertainty_arguments']['lifting_distribution']),
+        'sampling': convert_to_uncertainty_sampling(target=data['uncertainty_arguments']['sampling']),
+        'seed': data['uncertainty_arguments']['seed'],
+        'rel_tol': data['uncertainty_arguments']['rel_tol'],
+        'batch_size': data['uncertainty_arguments']['batch_size'],
+        'streaming': data['uncertainty_arguments']['streaming'],
     }
 
     return uncertainty_psc(**uncertainty_args)
@@ -9,7 +9,7 @@ import numpy as np
 
 from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, CostOfSales, LBT
 from pyscnomics.dataset.sample import assign_lifting, read_fluid_type
-from pyscnomics.econ.selection import TaxRegime, TaxType, FTPTaxRegime, GrossSplitRegime, LimitMethod, UncertaintyDistribution
+from pyscnomics.econ.selection import TaxRegime, TaxType, FTPTaxRegime, GrossSplitRegime, LimitMethod, UncertaintyDistribution, UncertaintySampling, OptimizationMethod
 from pyscnomics.tools.helper import (get_inflation_applied_converter,
                                      get_npv_mode_converter,
                                      get_discounting_mode_converter,
@@ -487,10 +487,16 @@ class OptimizationBM(BaseModel):
         The value of the optimization target.
     target_parameter: str
         The targeted optimization parameter.
+    method: str
+        The search method, either "Bounded" or "Root".
+    tolerance: float
+        The accepted difference to the target of the "Root" method, in the unit of the targeted parameter.
     """
     dict_optimization: OptimizationDictBM
     target_optimization: float | int
     target_parameter: str
+    method: str = Field(default="Bounded")
+    tolerance: float = Field(default=1e-6)
 
 
 class SensitivityBM(BaseModel):
@@ -522,6 +528,20 @@ class UncertaintyBM(BaseModel):
     ----------
     run_number: int
         The number of the simulation.
+    sampling: str
+        The sampling scheme, either "Random", "Latin Hypercube" or "Sobol".
+    seed: Optional[int]
+        The seed of the sampling. A seeded request is reproducible. When None, a seed
+        is drawn and returned with the outcomes.
+    rel_tol: Optional[float]
+        The relative tolerance of P10, P50 and P90 of NPV, IRR and PI at which the
+        simulation stops early. When None, all run_number runs are evaluated.
+    batch_size: Optional[int]
+        The number of runs evaluated between two convergence checks. When None, it is
+        derived from run_number.
+    streaming: bool
+        Whether to aggregate the runs in bounded memory with quantile sketches,
+        rather than exactly from every run.
     """
     run_number: int
     oil_price_distribution: str
@@ -549,6 +569,11 @@ class UncertaintyBM(BaseModel):
     opex_stddev: float | int = Field(default=1.25)
     capex_stddev: float | int = Field(default=1.25)
     lifting_stddev: float | int = Field(default=1.25)
+    sampling: str = Field(default="Random")
+    seed: Optional[int] = Field(default=None)
+    rel_tol: Optional[float] = Field(default=None)
+    batch_size: Optional[int] = Field(default=None)
+    streaming: bool = Field(default=False)
 
 
 class LtpBM(BaseModel):
@@ -1546,3 +1571,51 @@ def convert_to_uncertainty_distribution(target: str):
         if target == key:
             return attrs[key]
 
+
+def convert_to_uncertainty_sampling(target: str):
+    """
+    Function to convert string into Uncertainty Sampling selection.
+
+    Parameters
+    ----------
+    target: str
+        The target that will be converted.
+
+    Returns
+    -------
+    UncertaintySampling
+
+    """
+    attrs = {
+        'Random': UncertaintySampling.RANDOM,
+        'Latin Hypercube': UncertaintySampling.LATIN_HYPERCUBE,
+        'Sobol': UncertaintySampling.SOBOL,
+    }
+
+    for key in attrs.keys():
+        if target == key:
+            return attrs[key]
+
+
+def convert_to_optimization_method(target: str):
+    """
+    Function to convert string into Optimization Method selection.
+
+    Parameters
+    ----------
+    target: str
+        The target that will be converted.
+
+    Returns
+    -------
+    OptimizationMethod
+
+    """
+    attrs = {
+        'Bounded': OptimizationMethod.BOUNDED,
+        'Root': OptimizationMethod.ROOT,
+    }
+
+    for key in attrs.keys():
+        if target == key:
+            return attrs[key]
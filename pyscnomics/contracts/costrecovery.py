@@ -5,7 +5,11 @@ Handles calculations associated with PSC Cost Recovery.
 from dataclasses import dataclass, field
 import numpy as np
 
-from pyscnomics.contracts.project import BaseProject
+from pyscnomics.contracts.project import (
+    BaseProject,
+    _WAP_PRICE_OUTPUTS,
+    _SUNK_COST_OUTPUTS,
+)
 from pyscnomics.contracts import psc_tools
 from pyscnomics.econ.selection import (
     FluidType,
@@ -809,6 +813,9 @@ class CostRecovery(BaseProject):
         [3] DIRECT_MODE
             The tax will be applied regardless the cumulative FTP, unrecoverable cost and Contractor Share condition.
 
+        The profiles may be given either for a single scenario, with shape (n_years,),
+        or for a batch of scenarios, with shape (n_scenarios, n_years).
+
 
         Parameters
         ----------
@@ -835,9 +842,10 @@ class CostRecovery(BaseProject):
         # Tax payment prior to PDJP 2017
         if ftp_tax_regime == FTPTaxRegime.PRE_PDJP_20_2017:
             applied_tax = np.where(ctr_share > 0, 1, 0)
-            cum_ti = np.cumsum(taxable_income)
+            cum_ti = np.cumsum(taxable_income, axis=-1)
 
-            applied_tax_prior = np.concatenate((np.zeros(1), applied_tax))[0:-1]
+            applied_tax_prior = np.zeros_like(applied_tax)
+            applied_tax_prior[..., 1:] = applied_tax[..., :-1]
 
             ctr_tax = np.where(
                 np.logical_and(applied_tax == 1, applied_tax_prior == 0),
@@ -851,28 +859,10 @@ class CostRecovery(BaseProject):
 
         # Tax payment after PDJP 2017
         elif ftp_tax_regime == FTPTaxRegime.PDJP_20_2017:
-            # Defining the array used in calculation of ftp tax payment
-            ftp_cum_b2 = np.cumsum(ftp_ctr)
-            ftp_prior_b3 = np.zeros_like(ftp_ctr, dtype=float)
-            ftp_diff_b4 = np.zeros_like(ftp_ctr, dtype=float)
-            ftp_considered_b5 = np.zeros_like(ftp_ctr, dtype=float)
-
-            # Looping throughout the ftp array
-            for i, value in enumerate(ftp_ctr):
-                if i == 0:
-                    ftp_prior_b3[i] = 0
-
-                ftp_prior_b3[i] = ftp_prior_b3[i - 1] + ftp_considered_b5[i - 1]
-
-                ftp_diff_b4[i] = np.where(
-                    ftp_cum_b2[i] > ftp_prior_b3[i], ftp_cum_b2[i] - ftp_prior_b3[i], 0
-                )
-                ftp_considered_b5[i] = np.where(
-                    ftp_diff_b4[i] > unrec_cost[i], ftp_diff_b4[i] - unrec_cost[i], 0
-                )
-
             # Calculating the ftp tax payment
-            ftp_tax_paid = ftp_considered_b5 * tax_rate
+            ftp_tax_paid = psc_tools.get_ftp_tax_considered(
+                ftp_ctr=ftp_ctr, unrec_cost=unrec_cost
+            ) * tax_rate
 
             # Calculating the tax from taxable income
             ti_tax = (taxable_income - ftp_ctr) * tax_rate
@@ -894,88 +884,46 @@ class CostRecovery(BaseProject):
         ctr_share: np.ndarray,
         ddmo: np.ndarray,
     ):
-        # Defining the array used in calculation of ftp tax payment
-        ftp_cum_b2 = np.cumsum(ftp_ctr)
-        ftp_prior_b3 = np.zeros_like(ftp_ctr, dtype=float)
-        ftp_diff_b4 = np.zeros_like(ftp_ctr, dtype=float)
-        ftp_considered_b5 = np.zeros_like(ftp_ctr, dtype=float)
-
-        # Looping throughout the ftp array
-        for i, value in enumerate(ftp_ctr):
-            if i == 0:
-                ftp_prior_b3[i] = 0
-
-            ftp_prior_b3[i] = ftp_prior_b3[i - 1] + ftp_considered_b5[i - 1]
-
-            ftp_diff_b4[i] = np.where(
-                ftp_cum_b2[i] > ftp_prior_b3[i], ftp_cum_b2[i] - ftp_prior_b3[i], 0
-            )
-            ftp_considered_b5[i] = np.where(
-                ftp_diff_b4[i] > unrec_cost[i], ftp_diff_b4[i] - unrec_cost[i], 0
-            )
-
-        # Calculating the ftp tax payment
-        ftp_tax_paid = ftp_considered_b5 * tax_rate
-
-        # Calculating the taxable income without ftp
-        taxable_income_wo_ftp = np.where(
-            taxable_income - ftp_ctr < 0,
-            taxable_income - ftp_ctr + ddmo,
-            taxable_income - ftp_ctr,
-        )
+        """
+        The function to get the contractor's tax payment and unpaid tax under PDJP 20/2017.
 
-        # Defining Taxing flag
-        applied_tax = np.where(ctr_share > 0, 1, 0)
-        cum_ti = np.cumsum(taxable_income_wo_ftp)
+        Parameters
+        ----------
+        ftp_ctr: np.ndarray
+            The contractor's First Tranche Petroleum (FTP)
+        unrec_cost: np.ndarray
+            The unrecoverable cost
+        tax_rate: float | np.ndarray
+            The applied effective tax rate
+        taxable_income: np.ndarray
+            The contractor's Taxable Income (TI)
+        ctr_share: np.ndarray
+            The contractor equity to be split
+        ddmo: np.ndarray
+            The net DMO
 
-        applied_tax_prior = np.concatenate((np.zeros(1), applied_tax))[0:-1]
+        Returns
+        -------
+        tax_paid: np.ndarray
+            The contractor's tax payment
+        unpaid_tax: np.ndarray
+            The unpaid contractor's tax
 
-        ctr_ets_tax = np.where(
-            np.logical_and(applied_tax == 1, applied_tax_prior == 0),
-            cum_ti * tax_rate,
-            np.where(
-                np.logical_and(applied_tax == 1, applied_tax_prior == 1),
-                taxable_income_wo_ftp * tax_rate,
-                0,
-            ),
+        Notes
+        -----
+        The profiles may be given either for a single scenario, with shape (n_years,),
+        or for a batch of scenarios, with shape (n_scenarios, n_years).
+        See psc_tools.get_tax_payment_pdjp().
+        """
+        return psc_tools.get_tax_payment_pdjp(
+            ftp_ctr=ftp_ctr,
+            unrec_cost=unrec_cost,
+            tax_rate=tax_rate,
+            taxable_income=taxable_income,
+            ctr_share=ctr_share,
+            ddmo=ddmo,
         )
 
-        # Tax from FTP and Contractor Equity
-        ctr_tax = ftp_tax_paid + ctr_ets_tax
-
-        # Contractor Share without FTP
-        ets_and_ftp_ctr = ctr_share + ftp_ctr
-
-        # Initiating the array of unpaid_tax and tax_paid
-        unpaid_tax = np.zeros_like(taxable_income, dtype=float)
-        tax_paid = np.zeros_like(taxable_income, dtype=float)
-
-        for index, i in enumerate(taxable_income):
-            if index == 0:
-                tax_paid[index] = np.where(
-                    taxable_income[index] > ctr_tax[index] + 0,
-                    ctr_tax[index] + 0,
-                    ets_and_ftp_ctr[index] - ddmo[index],
-                )
-                unpaid_tax[index] = np.where(
-                    ctr_tax[index] + 0 > tax_paid[index],
-                    ctr_tax[index] + 0 - tax_paid[index],
-                    0,
-                )
-            else:
-                tax_paid[index] = np.where(
-                    taxable_income[index] > ctr_tax[index] + unpaid_tax[index - 1],
-                    ctr_tax[index] + unpaid_tax[index - 1],
-                    ets_and_ftp_ctr[index] - ddmo[index],
-                )
-                unpaid_tax[index] = np.where(
-                    ctr_tax[index] + unpaid_tax[index - 1] > tax_paid[index],
-                    ctr_tax[index] + unpaid_tax[index - 1] - tax_paid[index],
-                    0,
-                )
-
-        return tax_paid, unpaid_tax
-
     @staticmethod
     def _unpaid_and_tax_balance(tax_payment: np.ndarray, ets_ctr: np.ndarray):
         """
@@ -994,16 +942,16 @@ class CostRecovery(BaseProject):
             The unpaid contractor's tax
         ctr_tax: np.ndarray
             The contractor's tax payment
-        """
-        unpaid_tax = np.zeros_like(ets_ctr, dtype=float)
-        unpaid_tax[0] = 0
-        ctr_tax = np.zeros_like(ets_ctr, dtype=float)
-
-        for i in range(1, len(unpaid_tax)):
-            unpaid_tax[i] = max(0, unpaid_tax[i - 1] + tax_payment[i] - ets_ctr[i])
-            ctr_tax[i] = min(ets_ctr[i], unpaid_tax[i - 1] + tax_payment[i])
 
-        return unpaid_tax, ctr_tax
+        Notes
+        -----
+        The profiles may be given either for a single scenario, with shape (n_years,),
+        or for a batch of scenarios, with shape (n_scenarios, n_years).
+        See psc_tools.get_unpaid_and_tax_balance().
+        """
+        return psc_tools.get_unpaid_and_tax_balance(
+            tax_payment=tax_payment, ets_ctr=ets_ctr
+        )
 
     def _apply_cost_of_sales(
         self, oil_applied: bool = False, gas_applied: bool = False
@@ -1302,11 +1250,25 @@ class CostRecovery(BaseProject):
         # Perform initial check to several input arguments
         self._check_attributes()
 
+        # Stages which only depend on the setup attributes and the cost arguments are
+        # skipped when these are unchanged since the last run (see `_run_stage`)
+        setup_key = self._get_setup_fingerprint()
+
         # Calculate WAP (Weighted Average Price) for each produced fluid
-        self._get_wap_price()
+        self._run_stage(
+            stage="wap_price",
+            compute=self._get_wap_price,
+            outputs=_WAP_PRICE_OUTPUTS,
+            setup_key=setup_key,
+        )
 
         # Prepare attributes associated with sunk cost
-        self._get_sunkcost_array()
+        self._run_stage(
+            stage="sunk_cost",
+            compute=self._get_sunkcost_array,
+            outputs=_SUNK_COST_OUTPUTS,
+            setup_key=setup_key,
+        )
 
         revenue_attrs = {
             "years": self.project_years,
@@ -1338,22 +1300,13 @@ class CostRecovery(BaseProject):
         print(pd.DataFrame(sunkcost_attrs))
 
 
-        # Calculate pre tax expenditures
-        self._get_expenditures_pre_tax(
+        # Calculate pre tax expenditures, indirect taxes and post tax expenditures
+        self._run_expenditures_stage(
+            setup_key=setup_key,
             year_inflation=year_inflation,
             inflation_rate=inflation_rate,
             inflation_rate_applied_to=inflation_rate_applied_to,
-        )
-
-        # Calculate indirect taxes
-        self._get_indirect_taxes(tax_rate=vat_rate)
-
-        # Calculate post tax expenditures
-        self._get_expenditures_post_tax(
-            year_inflation=year_inflation,
-            inflation_rate=inflation_rate,
             tax_rate=vat_rate,
-            inflation_rate_applied_to=inflation_rate_applied_to,
         )
 
         # Total indirect taxes for OIL and GAS
@@ -1395,26 +1348,28 @@ class CostRecovery(BaseProject):
             self._get_rc_icp_pretax()
 
         # Depreciation (tangible cost)
-        (
-            self._oil_depreciation,
-            self._oil_undepreciated_asset,
-        ) = self._oil_capital_postonstream.total_depreciation_rate(
-            depr_method=depr_method,
-            decline_factor=decline_factor,
-            year_inflation=year_inflation,
-            inflation_rate=inflation_rate,
-            tax_rate=vat_rate,
-        )
-
-        (
-            self._gas_depreciation,
-            self._gas_undepreciated_asset,
-        ) = self._gas_capital_postonstream.total_depreciation_rate(
-            depr_method=depr_method,
-            decline_factor=decline_factor,
-            year_inflation=year_inflation,
-            inflation_rate=inflation_rate,
-            tax_rate=vat_rate,
+        def _get_depreciation_stage(**kwargs):
+            depreciation = self._get_depreciation(**kwargs)
+            self._oil_depreciation, self._oil_undepreciated_asset = depreciation["oil_capital"]
+            self._gas_depreciation, self._gas_undepreciated_asset = depreciation["gas_capital"]
+
+        self._run_stage(
+            stage="depreciation",
+            compute=_get_depreciation_stage,
+            outputs=(
+                "_oil_depreciation",
+                "_oil_undepreciated_asset",
+                "_gas_depreciation",
+                "_gas_undepreciated_asset",
+            ),
+            setup_key=setup_key,
+            arguments={
+                "depr_method": depr_method,
+                "decline_factor": decline_factor,
+                "year_inflation": year_inflation,
+                "inflation_rate": inflation_rate,
+                "tax_rate": vat_rate,
+            },
         )
 
         # Treatment for small order of number, in example 1e-15
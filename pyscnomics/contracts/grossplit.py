@@ -4,6 +4,8 @@ Handles calculations associated with PSC Gross Split.
 
 import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 import numpy as np
 
 from pyscnomics.contracts.project import BaseProject
@@ -40,6 +42,384 @@ class CumulativeProductionSplitException(Exception):
     pass
 
 
+def _compile_var_split_table(
+    components: tuple,
+    params_str: dict,
+    params_enum: dict,
+) -> MappingProxyType:
+    """
+    Compile the immutable lookup table of the variable split of a Gross Split regime.
+
+    Parameters
+    ----------
+    components: tuple
+        The names of the variable split components, which are also the names of
+        the associated attributes of GrossSplit.
+    params_str: dict
+        The split of each component, keyed by the string parameters.
+    params_enum: dict
+        The split of each component, keyed by the enum parameters.
+
+    Returns
+    -------
+    MappingProxyType
+        A read-only mapping of each component, in the order of `components`,
+        to a read-only mapping of both string and enum parameters to the split.
+    """
+    return MappingProxyType({
+        key: MappingProxyType({
+            param: float(split)
+            for param, split in (*params_str[key].items(), *params_enum[key].items())
+        })
+        for key in components
+    })
+
+
+# Variable split of PERMEN ESDM No. 8 Tahun 2017
+_VAR_SPLIT_08_2017 = _compile_var_split_table(
+    components=(
+        "field_status",
+        "field_loc",
+        "res_depth",
+        "infra_avail",
+        "res_type",
+        "api_oil",
+        "domestic_use",
+        "prod_stage",
+        "co2_content",
+        "h2s_content",
+    ),
+    # The string parameters is being keep to backward compatibility
+    params_str={
+        'field_status': {
+            'POD I': 0.05,
+            'POD II': 0.0,
+            'POFD': 0.0,
+            'No POD': -0.05,
+        },
+        'field_loc': {
+            'Onshore': 0.0,
+            'Offshore (0<h<=20)': 0.08,
+            'Offshore (20<h<=50)': 0.1,
+            'Offshore (50<h<=150)': 0.12,
+            'Offshore (150<h<=1000)': 0.14,
+            'Offshore (h>1000)': 0.16,
+        },
+        'res_depth': {
+            '<=2500': 0.0,
+            '>2500': 0.01,
+        },
+        'infra_avail': {
+            'Well Developed': 0.0,
+            'New Frontier': 0.02,
+        },
+        'res_type': {
+            'Conventional': 0.0,
+            'Non Conventional': 0.16,
+        },
+        'co2_content': {
+            '<5': 0.0,
+            '5<=x<10': 0.005,
+            '10<=x<20': 0.01,
+            '20<=x<40': 0.015,
+            '40<=x<60': 0.02,
+            'x>=60': 0.04,
+        },
+        'h2s_content': {
+            '<100': 0.0,
+            '100<=x<300': 0.005,
+            '300<=x<500': 0.0075,
+            'x>=500': 0.01,
+        },
+        'api_oil': {
+            '<25': 0.01,
+            '>=25': 0.0,
+        },
+        'domestic_use': {
+            '<30': 0.0,
+            '30<=x<50': 0.02,
+            '50<=x<70': 0.03,
+            '70<=x<100': 0.04,
+        },
+        'prod_stage': {
+            'Primary': 0.0,
+            'Secondary': 0.03,
+            'Tertiary': 0.05,
+        }
+    },
+    params_enum={
+        'field_status': {
+            VariableSplit082017.FieldStatus.POD_I: 0.05,
+            VariableSplit082017.FieldStatus.POD_II: 0.0,
+            VariableSplit082017.FieldStatus.POFD: 0.0,
+            VariableSplit082017.FieldStatus.NO_POD: -0.05,
+        },
+        'field_loc': {
+            VariableSplit082017.FieldLocation.ONSHORE: 0.0,
+            VariableSplit082017.FieldLocation.OFFSHORE_0_UNTIL_LESSEQUAL_20: 0.08,
+            VariableSplit082017.FieldLocation.OFFSHORE_20_UNTIL_LESSEQUAL_50: 0.1,
+            VariableSplit082017.FieldLocation.OFFSHORE_50_UNTIL_LESSEQUAL_150: 0.12,
+            VariableSplit082017.FieldLocation.OFFSHORE_150_UNTIL_LESSEQUAL_1000: 0.14,
+            VariableSplit082017.FieldLocation.OFFSHORE_GREATERTHAN_1000: 0.16,
+        },
+        'res_depth': {
+            VariableSplit082017.ReservoirDepth.LESSEQUAL_2500: 0.0,
+            VariableSplit082017.ReservoirDepth.GREATERTHAN_2500: 0.01,
+        },
+        'infra_avail': {
+            VariableSplit082017.InfrastructureAvailability.WELL_DEVELOPED: 0.0,
+            VariableSplit082017.InfrastructureAvailability.NEW_FRONTIER: 0.02,
+        },
+        'res_type': {
+            VariableSplit082017.ReservoirType.CONVENTIONAL: 0.0,
+            VariableSplit082017.ReservoirType.NON_CONVENTIONAL: 0.16,
+        },
+        'co2_content': {
+            VariableSplit082017.CO2Content.LESSTHAN_5: 0.0,
+            VariableSplit082017.CO2Content.EQUAL_5_UNTIL_LESSTHAN_10: 0.005,
+            VariableSplit082017.CO2Content.EQUAL_10_UNTIL_LESSTHAN_20: 0.01,
+            VariableSplit082017.CO2Content.EQUAL_20_UNTIL_LESSTHAN_40: 0.015,
+            VariableSplit082017.CO2Content.EQUAL_40_UNTIL_LESSTHAN_60: 0.02,
+            VariableSplit082017.CO2Content.EQUALGREATERTHAN_60: 0.04,
+        },
+        'h2s_content': {
+            VariableSplit082017.H2SContent.LESSTHAN_100: 0.0,
+            VariableSplit082017.H2SContent.EQUAL_100_UNTIL_LESSTHAN_300: 0.005,
+            VariableSplit082017.H2SContent.EQUAL_300_UNTIL_LESSTHAN_500: 0.0075,
+            VariableSplit082017.H2SContent.EQUALGREATERTHAN_500: 0.01,
+        },
+        'api_oil': {
+            VariableSplit082017.APIOil.LESSTHAN_25: 0.01,
+            VariableSplit082017.APIOil.EQUALGREATERTHAN_25: 0.0,
+        },
+        'domestic_use': {
+            VariableSplit082017.DomesticUse.LESSTHAN_30: 0.0,
+            VariableSplit082017.DomesticUse.EQUAL_30_UNTIL_LESSTHAN_50: 0.02,
+            VariableSplit082017.DomesticUse.EQUAL_50_UNTIL_LESSTHAN_70: 0.03,
+            VariableSplit082017.DomesticUse.EQUAL_70_UNTIL_LESSTHAN_100: 0.04,
+        },
+        'prod_stage': {
+            VariableSplit082017.ProductionStage.PRIMARY: 0.0,
+            VariableSplit082017.ProductionStage.SECONDARY: 0.03,
+            VariableSplit082017.ProductionStage.TERTIARY: 0.05,
+        }
+    },
+)
+
+# Variable split of PERMEN ESDM No. 52 Tahun 2017
+_VAR_SPLIT_52_2017 = _compile_var_split_table(
+    components=(
+        "field_status",
+        "field_loc",
+        "res_depth",
+        "infra_avail",
+        "res_type",
+        "api_oil",
+        "domestic_use",
+        "prod_stage",
+        "co2_content",
+        "h2s_content",
+    ),
+    params_str={
+        'field_status': {
+            'POD I': 0.05,
+            'POD II': 0.03,
+            'No POD': 0,
+        },
+        'field_loc': {
+            'Onshore': 0,
+            'Offshore (0<h<=20)': 0.08,
+            'Offshore (20<h<=50)': 0.1,
+            'Offshore (50<h<=150)': 0.12,
+            'Offshore (150<h<=1000)': 0.14,
+            'Offshore (h>1000)': 0.16,
+        },
+        'res_depth': {
+            '<=2500': 0,
+            '>2500': 0.01,
+        },
+        'infra_avail': {
+            'Well Developed': 0,
+            'New Frontier Offshore': 0.02,
+            'New Frontier Onshore': 0.04,
+        },
+        'res_type': {
+            'Conventional': 0,
+            'Non Conventional': 0.16,
+        },
+        'co2_content': {
+            '<5': 0,
+            '5<=x<10': 0.005,
+            '10<=x<20': 0.01,
+            '20<=x<40': 0.015,
+            '40<=x<60': 0.02,
+            'x>=60': 0.04,
+        },
+        'h2s_content': {
+            '<100': 0,
+            '100<=x<1000': 0.01,
+            '1000<=x<2000': 0.02,
+            '2000<=x<3000': 0.03,
+            '3000<=x<4000': 0.04,
+            'x>=4000': 0.05,
+        },
+        'api_oil': {
+            '<25': 0.01,
+            '>=25': 0,
+        },
+        'domestic_use': {
+            '30<=x<50': 0.02,
+            '50<=x<70': 0.03,
+            '70<=x<100': 0.04,
+        },
+        'prod_stage': {
+            'Primary': 0,
+            'Secondary': 0.06,
+            'Tertiary': 0.1,
+        }
+    },
+    params_enum={
+        'field_status': {
+            VariableSplit522017.FieldStatus.POD_I: 0.05,
+            VariableSplit522017.FieldStatus.POD_II: 0.03,
+            VariableSplit522017.FieldStatus.NO_POD: 0.0,
+        },
+        'field_loc': {
+            VariableSplit522017.FieldLocation.ONSHORE: 0.0,
+            VariableSplit522017.FieldLocation.OFFSHORE_0_UNTIL_LESSEQUAL_20: 0.08,
+            VariableSplit522017.FieldLocation.OFFSHORE_20_UNTIL_LESSEQUAL_50: 0.1,
+            VariableSplit522017.FieldLocation.OFFSHORE_50_UNTIL_LESSEQUAL_150: 0.12,
+            VariableSplit522017.FieldLocation.OFFSHORE_150_UNTIL_LESSEQUAL_1000: 0.14,
+            VariableSplit522017.FieldLocation.OFFSHORE_GREATERTHAN_1000: 0.16,
+        },
+        'res_depth': {
+            VariableSplit522017.ReservoirDepth.LESSEQUAL_2500: 0.0,
+            VariableSplit522017.ReservoirDepth.GREATERTHAN_2500: 0.01,
+        },
+        'infra_avail': {
+            VariableSplit522017.InfrastructureAvailability.WELL_DEVELOPED: 0.0,
+            VariableSplit522017.InfrastructureAvailability.NEW_FRONTIER_OFFSHORE: 0.02,
+            VariableSplit522017.InfrastructureAvailability.NEW_FRONTIER_ONSHORE: 0.04,
+        },
+        'res_type': {
+            VariableSplit522017.ReservoirType.CONVENTIONAL: 0.0,
+            VariableSplit522017.ReservoirType.NON_CONVENTIONAL: 0.16,
+        },
+        'co2_content': {
+            VariableSplit522017.CO2Content.LESSTHAN_5: 0.0,
+            VariableSplit522017.CO2Content.EQUAL_5_UNTIL_LESSTHAN_10: 0.005,
+            VariableSplit522017.CO2Content.EQUAL_10_UNTIL_LESSTHAN_20: 0.01,
+            VariableSplit522017.CO2Content.EQUAL_20_UNTIL_LESSTHAN_40: 0.015,
+            VariableSplit522017.CO2Content.EQUAL_40_UNTIL_LESSTHAN_60: 0.02,
+            VariableSplit522017.CO2Content.EQUALGREATERTHAN_60: 0.04,
+        },
+        'h2s_content': {
+            VariableSplit522017.H2SContent.LESSTHAN_100: 0.0,
+            VariableSplit522017.H2SContent.EQUAL_100_UNTIL_LESSTHAN_1000: 0.01,
+            VariableSplit522017.H2SContent.EQUAL_1000_UNTIL_LESSTHAN_2000: 0.02,
+            VariableSplit522017.H2SContent.EQUAL_2000_UNTIL_LESSTHAN_3000: 0.03,
+            VariableSplit522017.H2SContent.EQUAL_3000_UNTIL_LESSTHAN_4000: 0.04,
+            VariableSplit522017.H2SContent.EQUALGREATERTHAN_4000: 0.05,
+        },
+        'api_oil': {
+            VariableSplit522017.APIOil.LESSTHAN_25: 0.01,
+            VariableSplit522017.APIOil.EQUALGREATERTHAN_25: 0.0,
+        },
+        'domestic_use': {
+            VariableSplit522017.DomesticUse.EQUAL_30_UNTIL_LESSTHAN_50: 0.02,
+            VariableSplit522017.DomesticUse.EQUAL_50_UNTIL_LESSTHAN_70: 0.03,
+            VariableSplit522017.DomesticUse.EQUAL_70_UNTIL_LESSTHAN_100: 0.04,
+        },
+        'prod_stage': {
+            VariableSplit522017.ProductionStage.PRIMARY: 0.0,
+            VariableSplit522017.ProductionStage.SECONDARY: 0.06,
+            VariableSplit522017.ProductionStage.TERTIARY: 0.1,
+        }
+    },
+)
+
+# Variable split of PERMEN ESDM No. 13 Tahun 2024
+_VAR_SPLIT_13_2024 = _compile_var_split_table(
+    components=(
+        "field_loc",
+        "infra_avail",
+        "field_reserves",
+    ),
+    params_str={
+        'field_loc': {
+            'Onshore': 0.11,
+            'shallow_offshore': 0.12,
+            'deep_offshore': 0.13,
+            'ultradeep_offshore': 0.14,
+        },
+        'infra_avail': {
+            'available': 0.10,
+            'partially_available': 0.11,
+            'not_available': 0.13,
+        },
+        'field_reserves':{
+            'low': 0.14,
+            'medium': 0.13,
+            'high': 0.12,
+        }
+    },
+    params_enum={
+        'field_loc': {
+            VariableSplit132024.FieldLocation.ONSHORE: 0.11,
+            VariableSplit132024.FieldLocation.SHALLOW_OFFSHORE: 0.12,
+            VariableSplit132024.FieldLocation.DEEP_OFFSHORE: 0.13,
+            VariableSplit132024.FieldLocation.ULTRADEEP_OFFSHORE: 0.14,
+        },
+        'infra_avail': {
+            VariableSplit132024.InfrastructureAvailability.AVAILABLE: 0.10,
+            VariableSplit132024.InfrastructureAvailability.PARTIALLY_AVAILABLE: 0.11,
+            VariableSplit132024.InfrastructureAvailability.NOT_AVAILABLE: 0.13,
+        },
+        'field_reserves':{
+            VariableSplit132024.FieldReservesAmount.LOW: 0.14,
+            VariableSplit132024.FieldReservesAmount.MEDIUM: 0.13,
+            VariableSplit132024.FieldReservesAmount.HIGH: 0.12,
+        }
+    },
+)
+
+# Lookup tables of the variable split, by Gross Split regime
+_VAR_SPLIT_TABLES = MappingProxyType({
+    GrossSplitRegime.PERMEN_ESDM_8_2017: _VAR_SPLIT_08_2017,
+    GrossSplitRegime.PERMEN_ESDM_52_2017: _VAR_SPLIT_52_2017,
+    GrossSplitRegime.PERMEN_ESDM_20_2019: _VAR_SPLIT_52_2017,
+    GrossSplitRegime.PERMEN_ESDM_12_2020: _VAR_SPLIT_52_2017,
+    GrossSplitRegime.PERMEN_ESDM_13_2024: _VAR_SPLIT_13_2024,
+})
+
+
+@lru_cache(maxsize=256)
+def _get_variable_split(regime: GrossSplitRegime, params: tuple) -> float:
+    """
+    Get the variable split of a Gross Split regime from its lookup table.
+
+    Parameters
+    ----------
+    regime: GrossSplitRegime
+        The selection of the Gross Split Regime.
+    params: tuple
+        The parameter of each variable split component, in the order of the
+        components of the lookup table.
+
+    Returns
+    -------
+    float
+        The value of variable split.
+    """
+    table = _VAR_SPLIT_TABLES[regime]
+
+    variable_split = np.array([
+        table[key][param] for key, param in zip(table, params)
+    ], dtype=float)
+
+    return float(np.sum(variable_split))
+
+
 @dataclass
 class GrossSplit(BaseProject):
 
@@ -163,6 +543,8 @@ class GrossSplit(BaseProject):
     _oil_base_split: np.ndarray = field(default=None, init=False, repr=False)
     _gas_base_split: np.ndarray = field(default=None, init=False, repr=False)
     _variable_split: float = field(default=0, init=False, repr=False)
+    _variable_split_key: tuple = field(default=None, init=False, repr=False)
+    _variable_split_cache: float = field(default=None, init=False, repr=False)
     _var_split_array: np.ndarray = field(default=None, init=False, repr=False)
     _oil_prog_price_split: np.ndarray = field(default=None, init=False, repr=False)
     _oil_prog_cum_split: np.ndarray = field(default=None, init=False, repr=False)
@@ -434,152 +816,36 @@ class GrossSplit(BaseProject):
 
         return variable_split_func
 
-    def _get_var_split_08_2017(self):
+    def _get_var_split_from_table(self, regime: GrossSplitRegime) -> float:
         """
-        A function to get the value of Variable Split based on the given parameters.
+        Get the value of variable split from the lookup table of a Gross Split regime.
+
+        Parameters
+        ----------
+        regime: GrossSplitRegime
+            The selection of the Gross Split Regime.
 
         Returns
         -------
-        _variable_split: float
+        float
             The value of variable split.
-        """
-        # The string parameters is being keep to backward compatibility
-        params_str = {
-            'field_status': {
-                'POD I': 0.05,
-                'POD II': 0.0,
-                'POFD': 0.0,
-                'No POD': -0.05,
-            },
-            'field_loc': {
-                'Onshore': 0.0,
-                'Offshore (0<h<=20)': 0.08,
-                'Offshore (20<h<=50)': 0.1,
-                'Offshore (50<h<=150)': 0.12,
-                'Offshore (150<h<=1000)': 0.14,
-                'Offshore (h>1000)': 0.16,
-            },
-            'res_depth': {
-                '<=2500': 0.0,
-                '>2500': 0.01,
-            },
-            'infra_avail': {
-                'Well Developed': 0.0,
-                'New Frontier': 0.02,
-            },
-            'res_type': {
-                'Conventional': 0.0,
-                'Non Conventional': 0.16,
-            },
-            'co2_content': {
-                '<5': 0.0,
-                '5<=x<10': 0.005,
-                '10<=x<20': 0.01,
-                '20<=x<40': 0.015,
-                '40<=x<60': 0.02,
-                'x>=60': 0.04,
-            },
-            'h2s_content': {
-                '<100': 0.0,
-                '100<=x<300': 0.005,
-                '300<=x<500': 0.0075,
-                'x>=500': 0.01,
-            },
-            'api_oil': {
-                '<25': 0.01,
-                '>=25': 0.0,
-            },
-            'domestic_use': {
-                '<30': 0.0,
-                '30<=x<50': 0.02,
-                '50<=x<70': 0.03,
-                '70<=x<100': 0.04,
-            },
-            'prod_stage': {
-                'Primary': 0.0,
-                'Secondary': 0.03,
-                'Tertiary': 0.05,
-            }
-        }
 
-        params_enum = {
-            'field_status': {
-                VariableSplit082017.FieldStatus.POD_I: 0.05,
-                VariableSplit082017.FieldStatus.POD_II: 0.0,
-                VariableSplit082017.FieldStatus.POFD: 0.0,
-                VariableSplit082017.FieldStatus.NO_POD: -0.05,
-            },
-            'field_loc': {
-                VariableSplit082017.FieldLocation.ONSHORE: 0.0,
-                VariableSplit082017.FieldLocation.OFFSHORE_0_UNTIL_LESSEQUAL_20: 0.08,
-                VariableSplit082017.FieldLocation.OFFSHORE_20_UNTIL_LESSEQUAL_50: 0.1,
-                VariableSplit082017.FieldLocation.OFFSHORE_50_UNTIL_LESSEQUAL_150: 0.12,
-                VariableSplit082017.FieldLocation.OFFSHORE_150_UNTIL_LESSEQUAL_1000: 0.14,
-                VariableSplit082017.FieldLocation.OFFSHORE_GREATERTHAN_1000: 0.16,
-            },
-            'res_depth': {
-                VariableSplit082017.ReservoirDepth.LESSEQUAL_2500: 0.0,
-                VariableSplit082017.ReservoirDepth.GREATERTHAN_2500: 0.01,
-            },
-            'infra_avail': {
-                VariableSplit082017.InfrastructureAvailability.WELL_DEVELOPED: 0.0,
-                VariableSplit082017.InfrastructureAvailability.NEW_FRONTIER: 0.02,
-            },
-            'res_type': {
-                VariableSplit082017.ReservoirType.CONVENTIONAL: 0.0,
-                VariableSplit082017.ReservoirType.NON_CONVENTIONAL: 0.16,
-            },
-            'co2_content': {
-                VariableSplit082017.CO2Content.LESSTHAN_5: 0.0,
-                VariableSplit082017.CO2Content.EQUAL_5_UNTIL_LESSTHAN_10: 0.005,
-                VariableSplit082017.CO2Content.EQUAL_10_UNTIL_LESSTHAN_20: 0.01,
-                VariableSplit082017.CO2Content.EQUAL_20_UNTIL_LESSTHAN_40: 0.015,
-                VariableSplit082017.CO2Content.EQUAL_40_UNTIL_LESSTHAN_60: 0.02,
-                VariableSplit082017.CO2Content.EQUALGREATERTHAN_60: 0.04,
-            },
-            'h2s_content': {
-                VariableSplit082017.H2SContent.LESSTHAN_100: 0.0,
-                VariableSplit082017.H2SContent.EQUAL_100_UNTIL_LESSTHAN_300: 0.005,
-                VariableSplit082017.H2SContent.EQUAL_300_UNTIL_LESSTHAN_500: 0.0075,
-                VariableSplit082017.H2SContent.EQUALGREATERTHAN_500: 0.01,
-            },
-            'api_oil': {
-                VariableSplit082017.APIOil.LESSTHAN_25: 0.01,
-                VariableSplit082017.APIOil.EQUALGREATERTHAN_25: 0.0,
-            },
-            'domestic_use': {
-                VariableSplit082017.DomesticUse.LESSTHAN_30: 0.0,
-                VariableSplit082017.DomesticUse.EQUAL_30_UNTIL_LESSTHAN_50: 0.02,
-                VariableSplit082017.DomesticUse.EQUAL_50_UNTIL_LESSTHAN_70: 0.03,
-                VariableSplit082017.DomesticUse.EQUAL_70_UNTIL_LESSTHAN_100: 0.04,
-            },
-            'prod_stage': {
-                VariableSplit082017.ProductionStage.PRIMARY: 0.0,
-                VariableSplit082017.ProductionStage.SECONDARY: 0.03,
-                VariableSplit082017.ProductionStage.TERTIARY: 0.05,
-            }
-        }
-        source_dict = {
-            'field_status': self.field_status,
-            'field_loc': self.field_loc,
-            'res_depth': self.res_depth,
-            'infra_avail': self.infra_avail,
-            'res_type': self.res_type,
-            'api_oil': self.api_oil,
-            'domestic_use': self.domestic_use,
-            'prod_stage': self.prod_stage,
-            'co2_content': self.co2_content,
-            'h2s_content': self.h2s_content,
-        }
+        Notes
+        -------
+        The variable split is cached on the contract until one of the attributes of
+        the variable split components changes. Contracts with the same components
+        share the result of the module-level cache.
+        """
+        params = tuple(getattr(self, key) for key in _VAR_SPLIT_TABLES[regime])
+        key = (regime, params)
 
-        variable_split = np.array([
-            params_str[key][param] if isinstance(param, str) else params_enum[key][param]
-            for key, param in source_dict.items()
-        ], dtype=float)
+        if self._variable_split_key != key:
+            self._variable_split_cache = _get_variable_split(regime, params)
+            self._variable_split_key = key
 
-        self._variable_split = float(np.sum(variable_split))
+        return self._variable_split_cache
 
-    def _get_var_split_52_2017(self):
+    def _get_var_split_08_2017(self):
         """
         A function to get the value of Variable Split based on the given parameters.
 
@@ -588,143 +854,22 @@ class GrossSplit(BaseProject):
         _variable_split: float
             The value of variable split.
         """
-        params_str = {
-            'field_status': {
-                'POD I': 0.05,
-                'POD II': 0.03,
-                'No POD': 0,
-            },
-            'field_loc': {
-                'Onshore': 0,
-                'Offshore (0<h<=20)': 0.08,
-                'Offshore (20<h<=50)': 0.1,
-                'Offshore (50<h<=150)': 0.12,
-                'Offshore (150<h<=1000)': 0.14,
-                'Offshore (h>1000)': 0.16,
-            },
-            'res_depth': {
-                '<=2500': 0,
-                '>2500': 0.01,
-            },
-            'infra_avail': {
-                'Well Developed': 0,
-                'New Frontier Offshore': 0.02,
-                'New Frontier Onshore': 0.04,
-            },
-            'res_type': {
-                'Conventional': 0,
-                'Non Conventional': 0.16,
-            },
-            'co2_content': {
-                '<5': 0,
-                '5<=x<10': 0.005,
-                '10<=x<20': 0.01,
-                '20<=x<40': 0.015,
-                '40<=x<60': 0.02,
-                'x>=60': 0.04,
-            },
-            'h2s_content': {
-                '<100': 0,
-                '100<=x<1000': 0.01,
-                '1000<=x<2000': 0.02,
-                '2000<=x<3000': 0.03,
-                '3000<=x<4000': 0.04,
-                'x>=4000': 0.05,
-            },
-            'api_oil': {
-                '<25': 0.01,
-                '>=25': 0,
-            },
-            'domestic_use': {
-                '30<=x<50': 0.02,
-                '50<=x<70': 0.03,
-                '70<=x<100': 0.04,
-            },
-            'prod_stage': {
-                'Primary': 0,
-                'Secondary': 0.06,
-                'Tertiary': 0.1,
-            }
-        }
-
-        params_enum = {
-            'field_status': {
-                VariableSplit522017.FieldStatus.POD_I: 0.05,
-                VariableSplit522017.FieldStatus.POD_II: 0.03,
-                VariableSplit522017.FieldStatus.NO_POD: 0.0,
-            },
-            'field_loc': {
-                VariableSplit522017.FieldLocation.ONSHORE: 0.0,
-                VariableSplit522017.FieldLocation.OFFSHORE_0_UNTIL_LESSEQUAL_20: 0.08,
-                VariableSplit522017.FieldLocation.OFFSHORE_20_UNTIL_LESSEQUAL_50: 0.1,
-                VariableSplit522017.FieldLocation.OFFSHORE_50_UNTIL_LESSEQUAL_150: 0.12,
-                VariableSplit522017.FieldLocation.OFFSHORE_150_UNTIL_LESSEQUAL_1000: 0.14,
-                VariableSplit522017.FieldLocation.OFFSHORE_GREATERTHAN_1000: 0.16,
-            },
-            'res_depth': {
-                VariableSplit522017.ReservoirDepth.LESSEQUAL_2500: 0.0,
-                VariableSplit522017.ReservoirDepth.GREATERTHAN_2500: 0.01,
-            },
-            'infra_avail': {
-                VariableSplit522017.InfrastructureAvailability.WELL_DEVELOPED: 0.0,
-                VariableSplit522017.InfrastructureAvailability.NEW_FRONTIER_OFFSHORE: 0.02,
-                VariableSplit522017.InfrastructureAvailability.NEW_FRONTIER_ONSHORE: 0.04,
-            },
-            'res_type': {
-                VariableSplit522017.ReservoirType.CONVENTIONAL: 0.0,
-                VariableSplit522017.ReservoirType.NON_CONVENTIONAL: 0.16,
-            },
-            'co2_content': {
-                VariableSplit522017.CO2Content.LESSTHAN_5: 0.0,
-                VariableSplit522017.CO2Content.EQUAL_5_UNTIL_LESSTHAN_10: 0.005,
-                VariableSplit522017.CO2Content.EQUAL_10_UNTIL_LESSTHAN_20: 0.01,
-                VariableSplit522017.CO2Content.EQUAL_20_UNTIL_LESSTHAN_40: 0.015,
-                VariableSplit522017.CO2Content.EQUAL_40_UNTIL_LESSTHAN_60: 0.02,
-                VariableSplit522017.CO2Content.EQUALGREATERTHAN_60: 0.04,
-            },
-            'h2s_content': {
-                VariableSplit522017.H2SContent.LESSTHAN_100: 0.0,
-                VariableSplit522017.H2SContent.EQUAL_100_UNTIL_LESSTHAN_1000: 0.01,
-                VariableSplit522017.H2SContent.EQUAL_1000_UNTIL_LESSTHAN_2000: 0.02,
-                VariableSplit522017.H2SContent.EQUAL_2000_UNTIL_LESSTHAN_3000: 0.03,
-                VariableSplit522017.H2SContent.EQUAL_3000_UNTIL_LESSTHAN_4000: 0.04,
-                VariableSplit522017.H2SContent.EQUALGREATERTHAN_4000: 0.05,
-            },
-            'api_oil': {
-                VariableSplit522017.APIOil.LESSTHAN_25: 0.01,
-                VariableSplit522017.APIOil.EQUALGREATERTHAN_25: 0.0,
-            },
-            'domestic_use': {
-                VariableSplit522017.DomesticUse.EQUAL_30_UNTIL_LESSTHAN_50: 0.02,
-                VariableSplit522017.DomesticUse.EQUAL_50_UNTIL_LESSTHAN_70: 0.03,
-                VariableSplit522017.DomesticUse.EQUAL_70_UNTIL_LESSTHAN_100: 0.04,
-            },
-            'prod_stage': {
-                VariableSplit522017.ProductionStage.PRIMARY: 0.0,
-                VariableSplit522017.ProductionStage.SECONDARY: 0.06,
-                VariableSplit522017.ProductionStage.TERTIARY: 0.1,
-            }
-        }
-
-        source_dict = {
-            'field_status': self.field_status,
-            'field_loc': self.field_loc,
-            'res_depth': self.res_depth,
-            'infra_avail': self.infra_avail,
-            'res_type': self.res_type,
-            'api_oil': self.api_oil,
-            'domestic_use': self.domestic_use,
-            'prod_stage': self.prod_stage,
-            'co2_content': self.co2_content,
-            'h2s_content': self.h2s_content,
-        }
+        self._variable_split = self._get_var_split_from_table(
+            regime=GrossSplitRegime.PERMEN_ESDM_8_2017
+        )
 
-        variable_split = np.array([
-            params_str[key][param] if isinstance(param, str) else params_enum[key][param]
-            for key, param in source_dict.items()
-        ], dtype=float)
+    def _get_var_split_52_2017(self):
+        """
+        A function to get the value of Variable Split based on the given parameters.
 
-        self._variable_split = float(np.sum(variable_split))
+        Returns
+        -------
+        _variable_split: float
+            The value of variable split.
+        """
+        self._variable_split = self._get_var_split_from_table(
+            regime=GrossSplitRegime.PERMEN_ESDM_52_2017
+        )
 
     def _get_var_split_13_2024(self):
         """
@@ -735,64 +880,43 @@ class GrossSplit(BaseProject):
         _variable_split: float
             The value of variable split.
         """
-        params_str = {
-            'field_loc': {
-                'Onshore': 0.11,
-                'shallow_offshore': 0.12,
-                'deep_offshore': 0.13,
-                'ultradeep_offshore': 0.14,
-            },
-            'infra_avail': {
-                'available': 0.10,
-                'partially_available': 0.11,
-                'not_available': 0.13,
-            },
-            'field_reserves':{
-                'low': 0.14,
-                'medium': 0.13,
-                'high': 0.12,
-            }
-        }
-
-        params_enum = {
-            'field_loc': {
-                VariableSplit132024.FieldLocation.ONSHORE: 0.11,
-                VariableSplit132024.FieldLocation.SHALLOW_OFFSHORE: 0.12,
-                VariableSplit132024.FieldLocation.DEEP_OFFSHORE: 0.13,
-                VariableSplit132024.FieldLocation.ULTRADEEP_OFFSHORE: 0.14,
-            },
-            'infra_avail': {
-                VariableSplit132024.InfrastructureAvailability.AVAILABLE: 0.10,
-                VariableSplit132024.InfrastructureAvailability.PARTIALLY_AVAILABLE: 0.11,
-                VariableSplit132024.InfrastructureAvailability.NOT_AVAILABLE: 0.13,
-            },
-            'field_reserves':{
-                VariableSplit132024.FieldReservesAmount.LOW: 0.14,
-                VariableSplit132024.FieldReservesAmount.MEDIUM: 0.13,
-                VariableSplit132024.FieldReservesAmount.HIGH: 0.12,
-            }
-        }
-
-        source_dict = {
-            'field_loc': self.field_loc,
-            'infra_avail': self.infra_avail,
-            'field_reserves': self.field_reserves,
-        }
-
-        variable_split = np.array([
-            params_str[key][param] if isinstance(param, str) else params_enum[key][param]
-            for key, param in source_dict.items()
-        ], dtype=float)
-
-        self._variable_split = float(np.sum(variable_split))
+        self._variable_split = self._get_var_split_from_table(
+            regime=GrossSplitRegime.PERMEN_ESDM_13_2024
+        )
 
     def _wrapper_progressive_split(
         self,
         fluid: FluidType,
-        price: np.ndarray,
-        cum: np.ndarray,
+        price: np.ndarray | float,
+        cum: np.ndarray | float | None,
         regime: GrossSplitRegime = GrossSplitRegime.PERMEN_ESDM_20_2019,
-    ):
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Function to wrap the progressive split functions.
+
+        Parameters
+        ----------
+        fluid: FluidType
+            The fluid type of the price.
+        price: np.ndarray | float
+            The price, either of shape (n_years,) or (n_scenarios, n_years).
+        cum: np.ndarray | float | None
+            The cumulative production, either of shape (n_years,) or
+            (n_scenarios, n_years). None means no cumulative production split.
+        regime: GrossSplitRegime
+            The selection of the Gross Split Regime.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The progressive price split and the progressive cumulative production split,
+            both broadcast to the common shape of `price` and `cum`.
+
+        Notes
+        -------
+        The progressive split functions evaluate the whole array at once, hence
+        the function can be used directly in place of np.vectorize.
+        """
 
         if (regime == GrossSplitRegime.PERMEN_ESDM_52_2017 or
                 regime == GrossSplitRegime.PERMEN_ESDM_20_2019 or
@@ -806,154 +930,165 @@ class GrossSplit(BaseProject):
 
         elif regime == GrossSplitRegime.PERMEN_ESDM_13_2024:
             prog_price_split = self._get_prog_price_split_13_2024(fluid, price)
-            prog_cum_split = cum * 0 # Multiplied by 0 since there is no terms in the Regulation and filling the vectorization
+            prog_cum_split = 0.0  # There is no terms in the Regulation
 
         else:
-            prog_price_split = ValueError('Not Recognized Gross Split Regime')
-            prog_cum_split = ValueError('Not Recognized Gross Split Regime')
+            raise GrossSplitException(
+                f"The Gross Split regime, {regime}, is not recognized"
+            )
+
+        shape = np.broadcast_shapes(np.shape(prog_price_split), np.shape(prog_cum_split))
 
-        return prog_price_split, prog_cum_split
+        return (
+            np.broadcast_to(prog_price_split, shape).astype(float),
+            np.broadcast_to(prog_cum_split, shape).astype(float),
+        )
 
     @staticmethod
     def _get_prog_price_split_08_2017(
         fluid: FluidType,
-        price: np.ndarray,
-    ):
+        price: np.ndarray | float,
+    ) -> np.ndarray:
         # Indonesia's Ministry Regulations No.08 The Year of 2017.
         # At Appendix B Progressive Component
-        if fluid == FluidType.OIL:
-            if price < 40:
-                ps = 0.075
-            elif 40 <= price < 55:
-                ps = 0.05
-            elif 55 <= price < 70:
-                ps = 0.025
-            elif 70 <= price < 85:
-                ps = 0.0
-            elif 85 <= price < 100:
-                ps = -0.025
-            elif 100 <= price < 115:
-                ps = -0.05
-            elif 115 <= price:
-                ps = -0.075
-            else:
-                ps = 0
-        else:
-            ps = 0
-
-        return ps
+        price = np.asarray(price, dtype=float)
+
+        if fluid != FluidType.OIL:
+            return np.zeros_like(price)
+
+        return np.select(
+            [
+                price < 40,
+                (40 <= price) & (price < 55),
+                (55 <= price) & (price < 70),
+                (70 <= price) & (price < 85),
+                (85 <= price) & (price < 100),
+                (100 <= price) & (price < 115),
+                115 <= price,
+            ],
+            [0.075, 0.05, 0.025, 0.0, -0.025, -0.05, -0.075],
+            default=0.0,
+        )
 
     @staticmethod
     def _get_prog_price_split_52_2017(
         fluid: FluidType,
-        price: np.ndarray,
-    ):
+        price: np.ndarray | float,
+    ) -> np.ndarray:
         # Indonesia's Ministry Regulations No.52 The Year of 2017.
         # At Appendix B Progressive Component
+        price = np.asarray(price, dtype=float)
+
         if fluid == FluidType.OIL:
-            ps = np.where(
-                price > 0,
-                (85 - price) * 0.25 / 100,
-                0
-            )
+            return np.where(price > 0, (85 - price) * 0.25 / 100, 0.0)
 
         elif fluid == FluidType.GAS:
-            if price < 7:
-                ps = (7 - price) * 2.5 / 100
-            elif (7 < price) and (price < 10):
-                ps = 0
-            elif price > 10:
-                ps = (10 - price) * 2.5 / 100
-            else:
-                ps = 0
+            return np.select(
+                [
+                    price < 7,
+                    (7 < price) & (price < 10),
+                    price > 10,
+                ],
+                [
+                    (7 - price) * 2.5 / 100,
+                    0.0,
+                    (10 - price) * 2.5 / 100,
+                ],
+                default=0.0,
+            )
+
         else:
             raise ValueError('Unknown fluid type')
 
-        return ps
-
     @staticmethod
     def _get_prog_price_split_13_2024(
         fluid: FluidType,
-        price: np.ndarray,
-    ):
+        price: np.ndarray | float,
+    ) -> np.ndarray:
+        price = np.asarray(price, dtype=float)
+
+        # Breakpoints of the price brackets, and the split in the form of
+        # y2 = m * (x2 - x1) + y1 within the sloping brackets
         if fluid == FluidType.OIL:
-            if price <= 45:
-                ps = 0.05
-            elif 46 < price <= 65:
-                ps = -0.0025 * (price - 45) + 0.05 # In the form of y2 = m * (x2 - x1) + y1
-            elif 65 < price <= 85:
-                ps = 0.0
-            elif 85 < price <= 105:
-                ps = -0.0025 * (price - 85) + 0.0 # In the form of y2 = m * (x2 - x1) + y1
-            elif 105 < price:
-                ps = -0.05
-            else:
-                ps = 0
+            condlist = [
+                price <= 45,
+                (46 < price) & (price <= 65),
+                (65 < price) & (price <= 85),
+                (85 < price) & (price <= 105),
+                105 < price,
+            ]
+            choicelist = [
+                0.05,
+                -0.0025 * (price - 45) + 0.05,
+                0.0,
+                -0.0025 * (price - 85) + 0.0,
+                -0.05,
+            ]
 
         elif fluid == FluidType.GAS:
-            if price <= 4:
-                ps = 0.05
-            elif 4 < price <= 7:
-                ps = -0.0025 * (price - 4) + 0.05 # In the form of y2 = m * (x2 - x1) + y1
-            elif 7 < price <= 10:
-                ps = 0.0
-            elif 10 < price <= 13:
-                ps = -0.0025 * (price - 10) + 0.0 # In the form of y2 = m * (x2 - x1) + y1
-            elif 13 < price:
-                ps = -0.05
-            else:
-                ps = 0
+            condlist = [
+                price <= 4,
+                (4 < price) & (price <= 7),
+                (7 < price) & (price <= 10),
+                (10 < price) & (price <= 13),
+                13 < price,
+            ]
+            choicelist = [
+                0.05,
+                -0.0025 * (price - 4) + 0.05,
+                0.0,
+                -0.0025 * (price - 10) + 0.0,
+                -0.05,
+            ]
 
         else:
             raise ValueError('Unknown fluid type')
 
-        return ps
+        return np.select(condlist, choicelist, default=0.0)
 
     @staticmethod
-    def _get_prog_cum_split_08_2017(cum: np.ndarray | None):
+    def _get_prog_cum_split_08_2017(cum: np.ndarray | float | None) -> np.ndarray | float:
 
         # Cumulative Progressive Split
         if cum is None:
-            px = 0
-        elif 0 < cum < 1000:
-            px = 0.05
-        elif 1000 <= cum < 10000:
-            px = 0.04
-        elif 10000 <= cum < 20000:
-            px = 0.03
-        elif 20000 <= cum < 50000:
-            px = 0.02
-        elif 50000 <= cum < 150000:
-            px = 0.01
-        elif 150000 <= cum:
-            px = 0
-        else:
+            return 0.0
+
+        cum = np.asarray(cum, dtype=float)
+        condlist = [
+            (0 < cum) & (cum < 1000),
+            (1000 <= cum) & (cum < 10000),
+            (10000 <= cum) & (cum < 20000),
+            (20000 <= cum) & (cum < 50000),
+            (50000 <= cum) & (cum < 150000),
+            150000 <= cum,
+        ]
+
+        if not np.all(np.logical_or.reduce(condlist)):
             raise ValueError('No Regulation exist regarding the cumulative value')
 
-        return px
+        return np.select(condlist, [0.05, 0.04, 0.03, 0.02, 0.01, 0.0])
 
     @staticmethod
-    def _get_prog_cum_split_52_2017(cum: np.ndarray | None):
+    def _get_prog_cum_split_52_2017(cum: np.ndarray | float | None) -> np.ndarray | float:
 
         # Cumulative Progressive Split
         if cum is None:
-            px = 0
-        elif np.logical_and(np.greater_equal(cum, 0), np.less(cum, 30000)):
-            px = 0.1
-        elif np.logical_and(np.greater_equal(cum, 30000), np.less(cum, 60000)):
-            px = 0.09
-        elif np.logical_and(np.greater_equal(cum, 60000), np.less(cum, 90000)):
-            px = 0.08
-        elif np.logical_and(np.greater_equal(cum, 90000), np.less(cum, 125000)):
-            px = 0.06
-        elif np.logical_and(np.greater_equal(cum, 125000), np.less(cum, 175000)):
-            px = 0.04
-        elif np.greater_equal(cum, 175000):
-            px = 0
-        else:
+            return 0.0
+
+        cum = np.asarray(cum, dtype=float)
+        condlist = [
+            (0 <= cum) & (cum < 30000),
+            (30000 <= cum) & (cum < 60000),
+            (60000 <= cum) & (cum < 90000),
+            (90000 <= cum) & (cum < 125000),
+            (125000 <= cum) & (cum < 175000),
+            175000 <= cum,
+        ]
+
+        if not np.all(np.logical_or.reduce(condlist)):
             raise ValueError('No Regulation exist regarding the cumulative value')
 
-        return px
+        return np.select(condlist, [0.1, 0.09, 0.08, 0.06, 0.04, 0.0])
 
     @staticmethod
     def _get_deductible_cost(ctr_gross_share, cost_tobe_deducted, carward_deduct_cost):
@@ -1295,15 +1430,9 @@ class GrossSplit(BaseProject):
             cum_production_split_offset=cum_production_split_offset
         )
 
-        # WAP (Weighted Average Price) for each produced fluid
-        self._get_wap_price()
-
-        # Validate sunk cost, pre-onstream, and post-onstream objects
-        self._get_cost_objects_validation()
-
-        # Prepare sunk costs and preonstream costs
-        self._get_sunkcost_array()
-        self._get_preonstream_array()
+        # WAP prices, validation of cost objects, sunk costs and preonstream costs,
+        # skipped when the setup attributes are unchanged since the last run
+        self._run_setup_stages(setup_key=self._get_setup_fingerprint())
 
         # Calculate (total = depreciable + non_depreciable costs)
         # for sunk cost and preonstream cost
@@ -1405,11 +1534,10 @@ class GrossSplit(BaseProject):
         # self._cumulative_prod = np.cumsum(self._oil_lifting.get_prod_rate_total_arr() + prod_gas_boe + offset_arr)
         #
         # # Progressive Split
-        # vectorized_get_prog_split = np.vectorize(self._wrapper_progressive_split)
         #
         # # Condition when the cum_production_split_offset is filled with np.ndarray
         # if isinstance(cum_production_split_offset, np.ndarray) and len(cum_production_split_offset) > 1:
-        #     self._oil_prog_price_split, self._oil_prog_cum_split = vectorized_get_prog_split(
+        #     self._oil_prog_price_split, self._oil_prog_cum_split = self._wrapper_progressive_split(
         #         fluid=self._oil_lifting.fluid_type,
         #         price=self._oil_lifting.get_price_arr(),
         #         cum=None,
@@ -1418,7 +1546,7 @@ class GrossSplit(BaseProject):
         #
         #     self._oil_prog_split = self._oil_prog_price_split + cum_production_split_offset
         #
-        #     self._gas_prog_price_split, self._gas_prog_cum_split = vectorized_get_prog_split(
+        #     self._gas_prog_price_split, self._gas_prog_cum_split = self._wrapper_progressive_split(
         #         fluid=self._gas_lifting.fluid_type,
         #         price=self._gas_lifting.get_price_arr(),
         #         cum=None,
@@ -1429,7 +1557,7 @@ class GrossSplit(BaseProject):
         #
         # # Condition when the cum_production_split_offset is not filled
         # else:
-        #     self._oil_prog_price_split, self._oil_prog_cum_split = vectorized_get_prog_split(
+        #     self._oil_prog_price_split, self._oil_prog_cum_split = self._wrapper_progressive_split(
         #         fluid=self._oil_lifting.fluid_type,
         #         price=self._oil_lifting.get_price_arr(),
         #         cum=self._cumulative_prod,
@@ -1437,7 +1565,7 @@ class GrossSplit(BaseProject):
         #     )
         #     self._oil_prog_split = self._oil_prog_price_split + self._oil_prog_cum_split
         #
-        #     self._gas_prog_price_split, self._gas_prog_cum_split = vectorized_get_prog_split(
+        #     self._gas_prog_price_split, self._gas_prog_cum_split = self._wrapper_progressive_split(
         #         fluid=self._gas_lifting.fluid_type,
         #         price=self._gas_lifting.get_price_arr(),
         #         cum=self._cumulative_prod,
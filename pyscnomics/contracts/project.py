@@ -2,9 +2,10 @@
 Configure base project as the foundation (or parent class) for PSC contract.
 """
 
+import copy
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from datetime import date
 from functools import reduce
 
@@ -14,6 +15,7 @@ from pyscnomics.econ.selection import (
     CostType,
     OtherRevenue,
     InflationAppliedTo,
+    DeprMethod,
 )
 from pyscnomics.econ.costs import (
     CapitalCost,
@@ -23,9 +25,78 @@ from pyscnomics.econ.costs import (
     LBT,
     CostOfSales,
 )
+from pyscnomics.tools.helper import get_fingerprint
 # from pyscnomics.econ.results import CashFlow
 
 
+# Cost categories scaled by the CAPEX multiplier; the others follow the OPEX multiplier
+_CAPEX_CATEGORIES = ("capital", "intangible")
+
+# Attributes which define the cost objects of a contract, and thus its linear stages
+_LINEAR_STAGE_ATTRS = (
+    "start_date",
+    "end_date",
+    "oil_onstream_date",
+    "gas_onstream_date",
+    "approval_year",
+    "capital_cost",
+    "intangible_cost",
+    "opex",
+    "asr_cost",
+    "lbt_cost",
+    "cost_of_sales",
+)
+
+# Attributes which are processed upon construction of a contract
+_SETUP_ATTRS = _LINEAR_STAGE_ATTRS + ("lifting",)
+
+# Attributes whose assignment invalidates the setup fingerprint of a contract
+_FINGERPRINT_ATTRS = frozenset(_SETUP_ATTRS + ("_cost_multipliers",))
+
+# Fluids and cost categories of the cached stages of the run pipeline
+_STAGE_FLUIDS = ("oil", "gas", "sulfur", "electricity", "co2")
+_STAGE_CATEGORIES = ("capital", "intangible", "opex", "asr", "lbt", "cost_of_sales")
+
+# Outputs of the cached stages of the run pipeline
+_WAP_PRICE_OUTPUTS = tuple(f"_{fluid}_wap_price" for fluid in _STAGE_FLUIDS)
+
+_SUNK_COST_OUTPUTS = tuple(
+    f"_{fluid}_{kind}_sunk_cost"
+    for fluid in ("oil", "gas")
+    for kind in ("depreciable", "non_depreciable")
+)
+
+_PREONSTREAM_OUTPUTS = tuple(
+    f"_{fluid}_{kind}_preonstream"
+    for fluid in ("oil", "gas")
+    for kind in ("depreciable", "non_depreciable")
+)
+
+_EXPENDITURES_OUTPUTS = tuple(
+    f"_{fluid}_{categ}_{kind}"
+    for fluid in ("oil", "gas")
+    for categ in _STAGE_CATEGORIES
+    for kind in ("expenditures_pre_tax", "indirect_tax", "expenditures_post_tax")
+)
+
+
+# Integer codes of the fluids and cost types held by the cost ledgers
+_LEDGER_FLUIDS = {"oil": 0, "gas": 1}
+_LEDGER_COST_TYPES = {
+    CostType.POST_ONSTREAM_COST: 0,
+    CostType.PRE_ONSTREAM_COST: 1,
+    CostType.SUNK_COST: 2,
+}
+
+
+def _get_hashable(value):
+    """Convert an argument of a linear stage into a hashable cache key."""
+    if isinstance(value, np.ndarray):
+        return value.dtype.str, value.shape, value.tobytes()
+
+    return value
+
+
 class BaseProjectException(Exception):
     """ Exception to be raised for a misuse of BaseProject class """
 
@@ -56,6 +127,71 @@ class PostOnstreamException(Exception):
     pass
 
 
+@dataclass
+class _CostLedger:
+    """
+    Store the cost lines of a cost category, sorted by fluid and cost type.
+
+    The fluid and cost type of every cost line are kept as small integer codes,
+    and the cost lines of each pair of fluid and cost type are contiguous. The
+    cost object of a pair is then a slice of the sorted cost lines, whose arrays
+    are views rather than copies.
+
+    Parameters
+    ----------
+    key : tuple
+        The project timelines upon which the cost types were assigned.
+    costs : tuple
+        The cost objects of the category, as provided to the project.
+    total : CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+        The sum of the cost objects of the category.
+    rows : CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+        The OIL and GAS cost lines, sorted by fluid and cost type.
+    fluid_code : np.ndarray
+        The code of the fluid of each cost line.
+    cost_type_code : np.ndarray
+        The code of the cost type of each cost line.
+    bounds : dict
+        The slice of the cost lines of each pair of fluid and cost type.
+    placeholders : dict
+        The zero-cost objects of the pairs of fluid and cost type without cost lines.
+    """
+
+    key: tuple
+    costs: tuple
+    total: CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+    rows: CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+    fluid_code: np.ndarray
+    cost_type_code: np.ndarray
+    bounds: dict
+    placeholders: dict
+
+    def get_cost(
+        self, fluid: str, cost_type: CostType
+    ) -> CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales:
+        """
+        Get the cost object of a fluid and a cost type.
+
+        Parameters
+        ----------
+        fluid : str
+            The fluid, either "oil" or "gas".
+        cost_type : CostType
+            The cost type.
+
+        Returns
+        -------
+        CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+            A view of the associated cost lines, or a zero-cost placeholder if
+            there is none.
+        """
+
+        if (fluid, cost_type) in self.placeholders:
+            return self.placeholders[(fluid, cost_type)]
+
+        return self.rows.take(self.bounds[(fluid, cost_type)])
+
+
 @dataclass
 class BaseProject:
     """
@@ -362,6 +498,17 @@ class BaseProject:
     _consolidated_non_capital: np.ndarray = field(default=None, init=False, repr=False)
     _consolidated_cashflow: np.ndarray = field(default=None, init=False, repr=False)
 
+    # Attributes associated with the linear-scaling shortcut of CAPEX and OPEX
+    _cost_multipliers: dict = field(default=None, init=False, repr=False)
+    _linear_cache: dict = field(default=None, init=False, repr=False)
+
+    # Attributes associated with the cached stages of the run pipeline
+    _stage_cache: dict = field(default=None, init=False, repr=False)
+    _setup_fingerprint: str = field(default=None, init=False, repr=False)
+
+    # Attributes associated with the cost ledgers of the cost categories
+    _cost_ledgers: dict = field(default=None, init=False, repr=False)
+
     def __post_init__(self):
         """
         Handles the following operations/procedures:
@@ -382,11 +529,12 @@ class BaseProject:
         -   Prepare attribute lbt_cost;
         -   Prepare attribute cost_of_sales;
         -   Prepare attributes associated with total cost per component
-            (leveraging dunder method __add__). The attributes are:
+            (leveraging classmethod concat). The attributes are:
             capital_cost_total, intangible_cost_total, opex_total, asr_cost_total,
             lbt_cost_total, and cost_of_sales_total;
-        -   Classify cost categories by fluid
-        -   Modify cost_type in each cost categories, accounting for engineering sense
+        -   Prepare the cost ledgers: classify cost categories by fluid, modify
+            cost_type in each cost categories accounting for engineering sense,
+            and sort the cost lines by fluid and cost type;
         -   Define postonstream, sunk cost, and preonstream attributes
         -   Raise an exception if the start year of the project is inconsistent;
         -   Raise an exception if the end year of the project is inconsistent.
@@ -705,61 +853,45 @@ class BaseProject:
                     f"instances, not as an/a {self.cost_of_sales.__class__.__qualname__}"
                 )
 
-        # Prepare attributes associated with total cost per component
-        self.capital_cost_total = reduce(lambda x, y: x + y, self.capital_cost)
-        self.intangible_cost_total = reduce(lambda x, y: x + y, self.intangible_cost)
-        self.opex_total = reduce(lambda x, y: x + y, self.opex)
-        self.asr_cost_total = reduce(lambda x, y: x + y, self.asr_cost)
-        self.lbt_cost_total = reduce(lambda x, y: x + y, self.lbt_cost)
-        self.cost_of_sales_total = reduce(lambda x, y: x + y, self.cost_of_sales)
-
-        # Classify cost categories by fluid
-        (
-            capital_cost,
-            intangible,
-            opex,
-            asr,
-            lbt,
-            cost_of_sales,
-        ) = [
-            self._classify_costs_by_fluid(classifier=func)
-            for func in [
-                self._classify_capital_cost_by_fluid,
-                self._classify_intangible_cost_by_fluid,
-                self._classify_opex_by_fluid,
-                self._classify_asr_cost_by_fluid,
-                self._classify_lbt_cost_by_fluid,
-                self._classify_cost_of_sales_by_fluid,
-            ]
-        ]
-
-        # Modify cost_type in each cost categories, accounting for engineering sense
-        costs_list = [
-            capital_cost,
-            intangible,
-            opex,
-            asr,
-            lbt,
-            cost_of_sales,
-        ]
-
-        for cost in costs_list:
-            for ftype in [FluidType.OIL, FluidType.GAS]:
-                self._prepare_cost_types(cost_obj=cost[ftype.name.lower()])
+        # Validate approval_year prior to the assignment of cost types
+        self._validate_approval_year()
 
-        # Define post-onstream cost, pre-onstream cost, and sunk cost attributes
-        costs_mapping = (
-            ("capital", self._filter_capital_cost, capital_cost),
-            ("intangible", self._filter_intangible, intangible),
-            ("opex", self._filter_opex, opex),
-            ("asr", self._filter_asr, asr),
-            ("lbt", self._filter_lbt, lbt),
-            ("cost_of_sales", self._filter_cost_of_sales, cost_of_sales),
+        # Prepare the cost ledgers, which classify the cost lines by fluid and
+        # cost type. The ledgers of a cloned project are reused as long as their
+        # cost objects and the project timelines are unchanged.
+        ledger_key = (
+            self.start_date,
+            self.end_date,
+            self.approval_year,
+            self.oil_onstream_date,
+            self.gas_onstream_date,
         )
 
-        fluid_types = (
-            FluidType.OIL.name.lower(),
-            FluidType.GAS.name.lower(),
+        costs_mapping = (
+            (
+                "capital", self.capital_cost, "capital_cost_total", CapitalCost,
+                self._classify_capital_cost_by_fluid, self._filter_capital_cost,
+            ),
+            (
+                "intangible", self.intangible_cost, "intangible_cost_total", Intangible,
+                self._classify_intangible_cost_by_fluid, self._filter_intangible,
+            ),
+            (
+                "opex", self.opex, "opex_total", OPEX,
+                self._classify_opex_by_fluid, self._filter_opex,
+            ),
+            (
+                "asr", self.asr_cost, "asr_cost_total", ASR,
+                self._classify_asr_cost_by_fluid, self._filter_asr,
+            ),
+            (
+                "lbt", self.lbt_cost, "lbt_cost_total", LBT,
+                self._classify_lbt_cost_by_fluid, self._filter_lbt,
+            ),
+            (
+                "cost_of_sales", self.cost_of_sales, "cost_of_sales_total", CostOfSales,
+                self._classify_cost_of_sales_by_fluid, self._filter_cost_of_sales,
+            ),
         )
 
         categories = (
@@ -768,13 +900,35 @@ class BaseProject:
             ("sunk_cost", CostType.SUNK_COST),
         )
 
-        for prefix, filter_func, source in costs_mapping:
-            for ftype in fluid_types:
+        previous_ledgers = self._cost_ledgers or {}
+        self._cost_ledgers = {}
+
+        for prefix, costs, total_attr, cost_class, classifier, filter_func in costs_mapping:
+            ledger = previous_ledgers.get(prefix)
+
+            if ledger is not None and ledger.costs is costs and ledger.key == ledger_key:
+                setattr(self, total_attr, ledger.total)
+
+            else:
+                # Prepare attribute associated with total cost of the component
+                setattr(self, total_attr, cost_class.concat(costs))
+                ledger = self._get_cost_ledger(
+                    key=ledger_key,
+                    costs=costs,
+                    total=getattr(self, total_attr),
+                    classifier=classifier,
+                    filter_func=filter_func,
+                )
+
+            self._cost_ledgers[prefix] = ledger
+
+            # Define post-onstream cost, pre-onstream cost, and sunk cost attributes
+            for ftype in _LEDGER_FLUIDS:
                 for categ_name, categ_type in categories:
                     setattr(
                         self,
                         f"_{ftype}_{prefix}_{categ_name}",
-                        filter_func(cost_obj_fluid=source[ftype], include_cost_type=categ_type)
+                        ledger.get_cost(fluid=ftype, cost_type=categ_type),
                     )
 
         # Raise an exception error if the start year of the project is inconsistent
@@ -783,6 +937,16 @@ class BaseProject:
         # Raise an exception error if the end year of the project is inconsistent
         self._check_inconsistent_end_year()
 
+        # Fingerprint the setup attributes once, for the cached stages of the run pipeline
+        self._setup_fingerprint = self._get_setup_fingerprint()
+
+    def __setattr__(self, name, value):
+        # Assigning a setup attribute or the cost multipliers invalidates the setup
+        # fingerprint, which is then computed again upon the next run
+        if name in _FINGERPRINT_ATTRS:
+            object.__setattr__(self, "_setup_fingerprint", None)
+        object.__setattr__(self, name, value)
+
     def _get_lifting_by_commodity(self, commodity: FluidType) -> Lifting:
         """
         Get the aggregated lifting data for a specific commodity type.
@@ -1134,6 +1298,8 @@ class BaseProject:
         -----
         - The filtering is performed by masking the `cost_allocation` array
           of the total capital cost object.
+        - The selected cost lines are taken from the total capital cost object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]`` and ``cost = [0]``.
         """
@@ -1154,24 +1320,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(cct.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return CapitalCost(
-                **kwargs,
-                expense_year=cct.expense_year[mask],
-                cost=cct.cost[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                cost_type=np.array(cct.cost_type)[mask].tolist(),
-                description=np.array(cct.description)[mask].tolist(),
-                tax_portion=cct.tax_portion[mask],
-                tax_discount=cct.tax_discount[mask],
-                pis_year=cct.pis_year[mask],
-                salvage_value=cct.salvage_value[mask],
-                useful_life=cct.useful_life[mask],
-                depreciation_factor=cct.depreciation_factor[mask],
-                is_ic_applied=np.array(cct.is_ic_applied)[mask].tolist(),
-            )
+            index = np.flatnonzero(np.array(cct.cost_allocation) == fluid_type)
+            return cct.take(index)
 
     def _classify_intangible_cost_by_fluid(self, fluid_type: FluidType) -> Intangible:
         """
@@ -1199,6 +1349,8 @@ class BaseProject:
         -----
         - The filtering is performed by masking the `cost_allocation` array
           of the total intangible cost object.
+        - The selected cost lines are taken from the total intangible cost object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]`` and ``cost = [0]``.
         """
@@ -1219,19 +1371,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(ict.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return Intangible(
-                **kwargs,
-                expense_year=ict.expense_year[mask],
-                cost=ict.cost[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                description=np.array(ict.description)[mask].tolist(),
-                cost_type=np.array(ict.cost_type)[mask].tolist(),
-                tax_portion=ict.tax_portion[mask],
-                tax_discount=ict.tax_discount[mask],
-            )
+            index = np.flatnonzero(np.array(ict.cost_allocation) == fluid_type)
+            return ict.take(index)
 
     def _classify_opex_by_fluid(self, fluid_type: FluidType) -> OPEX:
         """
@@ -1259,6 +1400,8 @@ class BaseProject:
         -----
         - The filtering is performed by masking the `cost_allocation` array
           of the total OPEX object.
+        - The selected cost lines are taken from the total OPEX object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]``, ``fixed_cost = [0]``, and
           ``cost_allocation = [fluid_type]``.
@@ -1279,21 +1422,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(ot.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return OPEX(
-                **kwargs,
-                expense_year=ot.expense_year[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                cost_type=np.array(ot.cost_type)[mask].tolist(),
-                description=np.array(ot.description)[mask].tolist(),
-                tax_portion=ot.tax_portion[mask],
-                tax_discount=ot.tax_discount[mask],
-                fixed_cost=ot.fixed_cost[mask],
-                prod_rate=ot.prod_rate[mask],
-                cost_per_volume=ot.cost_per_volume[mask],
-            )
+            index = np.flatnonzero(np.array(ot.cost_allocation) == fluid_type)
+            return ot.take(index)
 
     def _classify_asr_cost_by_fluid(self, fluid_type: FluidType) -> ASR:
         """
@@ -1322,6 +1452,8 @@ class BaseProject:
         -----
         - Filtering is done by applying a boolean mask to the
           `cost_allocation` array of the total ASR object.
+        - The selected cost lines are taken from the total ASR object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]``, ``cost = [0]``, and
           ``cost_allocation = [fluid_type]``.
@@ -1342,21 +1474,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(act.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return ASR(
-                **kwargs,
-                expense_year=act.expense_year[mask],
-                cost=act.cost[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                cost_type=np.array(act.cost_type)[mask].tolist(),
-                description=np.array(act.description)[mask].tolist(),
-                tax_portion=act.tax_portion[mask],
-                tax_discount=act.tax_discount[mask],
-                final_year=act.final_year[mask],
-                future_rate=act.future_rate[mask],
-            )
+            index = np.flatnonzero(np.array(act.cost_allocation) == fluid_type)
+            return act.take(index)
 
     def _classify_lbt_cost_by_fluid(self, fluid_type: FluidType) -> LBT:
         """
@@ -1385,6 +1504,8 @@ class BaseProject:
         -----
         - Filtering is performed using a boolean mask applied to the
           `cost_allocation` array of the total LBT object.
+        - The selected cost lines are taken from the total LBT object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]``, ``cost = [0]``, and
           ``cost_allocation = [fluid_type]``.
@@ -1405,25 +1526,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(lct.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return LBT(
-                **kwargs,
-                expense_year=lct.expense_year[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                cost_type=np.array(lct.cost_type)[mask].tolist(),
-                description=np.array(lct.description)[mask].tolist(),
-                tax_portion=lct.tax_portion[mask],
-                tax_discount=lct.tax_discount[mask],
-                final_year=lct.final_year[mask],
-                utilized_land_area=lct.utilized_land_area[mask],
-                utilized_building_area=lct.utilized_building_area[mask],
-                njop_land=lct.njop_land[mask],
-                njop_building=lct.njop_building[mask],
-                gross_revenue=lct.gross_revenue[mask],
-                cost=lct.cost[mask],
-            )
+            index = np.flatnonzero(np.array(lct.cost_allocation) == fluid_type)
+            return lct.take(index)
 
     def _classify_cost_of_sales_by_fluid(self, fluid_type: FluidType) -> CostOfSales:
         """
@@ -1451,6 +1555,8 @@ class BaseProject:
         -----
         - Filtering is performed using a boolean mask applied to the
           `cost_allocation` array of the total Cost of Sales object.
+        - The selected cost lines are taken from the total Cost of Sales object
+          without repeating its construction.
         - If the fluid type is not found, a placeholder is returned with:
           ``expense_year = [start_year]``, ``cost = [0]``, and
           ``cost_allocation = [fluid_type]``.
@@ -1471,19 +1577,8 @@ class BaseProject:
             )
 
         else:
-            allocation_array = np.array(cst.cost_allocation)
-            mask = (allocation_array == fluid_type)
-
-            return CostOfSales(
-                **kwargs,
-                expense_year=cst.expense_year[mask],
-                cost=cst.cost[mask],
-                cost_allocation=allocation_array[mask].tolist(),
-                cost_type=np.array(cst.cost_type)[mask].tolist(),
-                description=np.array(cst.description)[mask].tolist(),
-                tax_portion=cst.tax_portion[mask],
-                tax_discount=cst.tax_discount[mask],
-            )
+            index = np.flatnonzero(np.array(cst.cost_allocation) == fluid_type)
+            return cst.take(index)
 
     @staticmethod
     def _classify_costs_by_fluid(classifier) -> dict:
@@ -1677,6 +1772,93 @@ class BaseProject:
         # Modify cost_type attribute of the cost_obj
         cost_obj.cost_type = ct.tolist()
 
+    def _get_cost_ledger(
+        self,
+        key: tuple,
+        costs: tuple,
+        total: CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales,
+        classifier,
+        filter_func,
+    ) -> _CostLedger:
+        """
+        Build the cost ledger of a cost category.
+
+        The cost lines are classified by fluid and their cost types are assigned
+        once. They are then sorted by fluid and cost type, so that the cost object
+        of each pair of fluid and cost type is a slice of the sorted cost lines.
+
+        Parameters
+        ----------
+        key : tuple
+            The project timelines upon which the cost types are assigned.
+        costs : tuple
+            The cost objects of the category, as provided to the project.
+        total : CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales
+            The sum of the cost objects of the category.
+        classifier : callable
+            The method classifying the total cost by fluid,
+            e.g. `_classify_capital_cost_by_fluid`.
+        filter_func : callable
+            The method filtering a cost object by cost type, e.g.
+            `_filter_capital_cost`. It provides the zero-cost placeholders.
+
+        Returns
+        -------
+        _CostLedger
+            The cost ledger of the category.
+        """
+
+        costs_fluid = self._classify_costs_by_fluid(classifier=classifier)
+
+        for ftype in _LEDGER_FLUIDS:
+            self._prepare_cost_types(cost_obj=costs_fluid[ftype])
+
+        rows = total.__class__.concat(costs_fluid[ftype] for ftype in _LEDGER_FLUIDS)
+
+        fluid_code = np.repeat(
+            np.array(list(_LEDGER_FLUIDS.values()), dtype=np.int8),
+            [len(costs_fluid[ftype]) for ftype in _LEDGER_FLUIDS],
+        )
+        cost_type_code = np.array(
+            [_LEDGER_COST_TYPES[ct] for ct in rows.cost_type], dtype=np.int8
+        )
+
+        # Sort the cost lines by fluid and cost type, preserving their order
+        order = np.lexsort((cost_type_code, fluid_code))
+        rows = rows.take(order)
+        fluid_code = fluid_code[order]
+        cost_type_code = cost_type_code[order]
+
+        # Locate the cost lines of each pair of fluid and cost type
+        groups = fluid_code.astype(int) * len(_LEDGER_COST_TYPES) + cost_type_code
+        edges = np.searchsorted(
+            groups, np.arange(len(_LEDGER_FLUIDS) * len(_LEDGER_COST_TYPES) + 1)
+        )
+
+        bounds = {}
+        placeholders = {}
+
+        for ftype, fcode in _LEDGER_FLUIDS.items():
+            for ctype, ccode in _LEDGER_COST_TYPES.items():
+                group = fcode * len(_LEDGER_COST_TYPES) + ccode
+                bounds[(ftype, ctype)] = slice(int(edges[group]), int(edges[group + 1]))
+
+                if edges[group] == edges[group + 1]:
+                    placeholders[(ftype, ctype)] = filter_func(
+                        cost_obj_fluid=costs_fluid[ftype], include_cost_type=ctype
+                    )
+
+        return _CostLedger(
+            key=key,
+            costs=costs,
+            total=total,
+            rows=rows,
+            fluid_code=fluid_code,
+            cost_type_code=cost_type_code,
+            bounds=bounds,
+            placeholders=placeholders,
+        )
+
     def _filter_capital_cost(
         self, cost_obj_fluid: CapitalCost, include_cost_type: CostType
     ) -> CapitalCost:
@@ -2847,9 +3029,12 @@ class BaseProject:
             "gas_cost_of_sales": self._gas_cost_of_sales_sunk_cost,
         }
 
-        sunkcost_arr = {
-            key: val.expenditures_pre_tax() for key, val in sunkcost_map.items()
-        }
+        sunkcost_arr = self._get_linear_stage(
+            stage="sunk_cost",
+            compute=lambda: {
+                key: val.expenditures_pre_tax() for key, val in sunkcost_map.items()
+            },
+        )
 
         # Define depreciable sunk costs
         self._oil_depreciable_sunk_cost = sunkcost_arr["oil_capital"]
@@ -2910,9 +3095,12 @@ class BaseProject:
             "gas_cost_of_sales": self._gas_cost_of_sales_preonstream,
         }
 
-        preonstream_arr = {
-            key: val.expenditures_pre_tax() for key, val in preonstream_map.items()
-        }
+        preonstream_arr = self._get_linear_stage(
+            stage="preonstream",
+            compute=lambda: {
+                key: val.expenditures_pre_tax() for key, val in preonstream_map.items()
+            },
+        )
 
         # Define depreciable preonstream costs
         self._oil_depreciable_preonstream = preonstream_arr["oil_capital"]
@@ -3101,51 +3289,38 @@ class BaseProject:
             -   `_gas_cost_of_sales_expenditures_pre_tax`
         """
 
-        # Prepare expenditures pre tax associated with capital, intangible,
-        # opex, asr, and lbt costs
-        (
-            self._oil_capital_expenditures_pre_tax,
-            self._gas_capital_expenditures_pre_tax,
-            self._oil_intangible_expenditures_pre_tax,
-            self._gas_intangible_expenditures_pre_tax,
-            self._oil_opex_expenditures_pre_tax,
-            self._gas_opex_expenditures_pre_tax,
-            self._oil_asr_expenditures_pre_tax,
-            self._gas_asr_expenditures_pre_tax,
-            self._oil_lbt_expenditures_pre_tax,
-            self._gas_lbt_expenditures_pre_tax,
-        ) = [
-            self._calc_pre_tax_expenditures(
-                target_attr=attr,
-                year_inflation=year_inflation,
-                inflation_rate=inflation_rate,
-                inflation_rate_applied_to=inflation_rate_applied_to,
-            )
-            for attr in [
-                self._oil_capital_postonstream,
-                self._gas_capital_postonstream,
-                self._oil_intangible_postonstream,
-                self._gas_intangible_postonstream,
-                self._oil_opex_postonstream,
-                self._gas_opex_postonstream,
-                self._oil_asr_postonstream,
-                self._gas_asr_postonstream,
-                self._oil_lbt_postonstream,
-                self._gas_lbt_postonstream,
-            ]
-        ]
+        def _compute() -> dict:
+            # Prepare expenditures pre tax associated with capital, intangible,
+            # opex, asr, and lbt costs
+            expenditures = {
+                f"{fluid}_{categ}": self._calc_pre_tax_expenditures(
+                    target_attr=getattr(self, f"_{fluid}_{categ}_postonstream"),
+                    year_inflation=year_inflation,
+                    inflation_rate=inflation_rate,
+                    inflation_rate_applied_to=inflation_rate_applied_to,
+                )
+                for categ in ["capital", "intangible", "opex", "asr", "lbt"]
+                for fluid in ["oil", "gas"]
+            }
 
-        # Prepare expenditures pre tax associated with cost of sales
-        (
-            self._oil_cost_of_sales_expenditures_pre_tax,
-            self._gas_cost_of_sales_expenditures_pre_tax,
-        ) = [
-            attr.expenditures_pre_tax()
-            for attr in [
-                self._oil_cost_of_sales_postonstream,
-                self._gas_cost_of_sales_postonstream,
-            ]
-        ]
+            # Prepare expenditures pre tax associated with cost of sales
+            for fluid in ["oil", "gas"]:
+                expenditures[f"{fluid}_cost_of_sales"] = getattr(
+                    self, f"_{fluid}_cost_of_sales_postonstream"
+                ).expenditures_pre_tax()
+
+            return expenditures
+
+        expenditures_pre_tax = self._get_linear_stage(
+            stage="expenditures_pre_tax",
+            compute=_compute,
+            year_inflation=year_inflation,
+            inflation_rate=inflation_rate,
+            inflation_rate_applied_to=inflation_rate_applied_to,
+        )
+
+        for key, val in expenditures_pre_tax.items():
+            setattr(self, f"_{key}_expenditures_pre_tax", val)
 
     def _get_indirect_taxes(self, tax_rate: np.ndarray | float = 0.0) -> None:
         """
@@ -3183,46 +3358,494 @@ class BaseProject:
             -   `_gas_cost_of_sales_indirect_tax`
         """
 
-        # Prepare indirect taxes associated with capital, intangible,
-        # opex, asr, and lbt costs
-        (
-            self._oil_capital_indirect_tax,
-            self._gas_capital_indirect_tax,
-            self._oil_intangible_indirect_tax,
-            self._gas_intangible_indirect_tax,
-            self._oil_opex_indirect_tax,
-            self._gas_opex_indirect_tax,
-            self._oil_asr_indirect_tax,
-            self._gas_asr_indirect_tax,
-            self._oil_lbt_indirect_tax,
-            self._gas_lbt_indirect_tax,
-        ) = [
-            attr.indirect_taxes(tax_rate=tax_rate)
-            for attr in [
-                self._oil_capital_postonstream,
-                self._gas_capital_postonstream,
-                self._oil_intangible_postonstream,
-                self._gas_intangible_postonstream,
-                self._oil_opex_postonstream,
-                self._gas_opex_postonstream,
-                self._oil_asr_postonstream,
-                self._gas_asr_postonstream,
-                self._oil_lbt_postonstream,
-                self._gas_lbt_postonstream,
-            ]
-        ]
+        def _compute() -> dict:
+            # Prepare indirect taxes associated with capital, intangible,
+            # opex, asr, and lbt costs
+            indirect_taxes = {
+                f"{fluid}_{categ}": getattr(
+                    self, f"_{fluid}_{categ}_postonstream"
+                ).indirect_taxes(tax_rate=tax_rate)
+                for categ in ["capital", "intangible", "opex", "asr", "lbt"]
+                for fluid in ["oil", "gas"]
+            }
+
+            # Prepare indirect taxes associated with cost of sales
+            for fluid in ["oil", "gas"]:
+                indirect_taxes[f"{fluid}_cost_of_sales"] = getattr(
+                    self, f"_{fluid}_cost_of_sales_postonstream"
+                ).indirect_taxes()
+
+            return indirect_taxes
+
+        indirect_taxes = self._get_linear_stage(
+            stage="indirect_taxes", compute=_compute, tax_rate=tax_rate
+        )
 
-        # Prepare indirect taxes associated with cost of sales
-        (
-            self._oil_cost_of_sales_indirect_tax,
-            self._gas_cost_of_sales_indirect_tax,
-        ) = [
-            attr.indirect_taxes()
-            for attr in [
-                self._oil_cost_of_sales_postonstream,
-                self._gas_cost_of_sales_postonstream,
-            ]
-        ]
+        for key, val in indirect_taxes.items():
+            setattr(self, f"_{key}_indirect_tax", val)
+
+    def _get_depreciation(
+        self,
+        depr_method: DeprMethod = DeprMethod.PSC_DB,
+        decline_factor: float | int = 2,
+        year_inflation: np.ndarray = None,
+        inflation_rate: np.ndarray | float = 0.0,
+        tax_rate: np.ndarray | float = 0.0,
+    ) -> dict:
+        """
+        Calculate the depreciation of the postonstream capital costs of OIL and GAS.
+
+        Parameters
+        ----------
+        depr_method : DeprMethod, default=DeprMethod.PSC_DB
+            The depreciation method.
+        decline_factor : float or int, default=2
+            The decline factor of the declining balance methods.
+        year_inflation : np.ndarray, optional
+            Array specifying the inflation year for each time step.
+        inflation_rate : np.ndarray or float, default=0.0
+            Inflation rate(s) to be applied.
+        tax_rate : np.ndarray or float, default=0.0
+            Indirect tax rate(s) applied to the capital costs.
+
+        Returns
+        -------
+        dict
+            The tuple (depreciation, undepreciated asset) of each fluid,
+            under keys ``oil_capital`` and ``gas_capital``.
+        """
+
+        return self._get_linear_stage(
+            stage="depreciation",
+            compute=lambda: {
+                f"{fluid}_capital": getattr(
+                    self, f"_{fluid}_capital_postonstream"
+                ).total_depreciation_rate(
+                    depr_method=depr_method,
+                    decline_factor=decline_factor,
+                    year_inflation=year_inflation,
+                    inflation_rate=inflation_rate,
+                    tax_rate=tax_rate,
+                )
+                for fluid in ["oil", "gas"]
+            },
+            depr_method=depr_method,
+            decline_factor=decline_factor,
+            year_inflation=year_inflation,
+            inflation_rate=inflation_rate,
+            tax_rate=tax_rate,
+        )
+
+    def _get_linear_stage(self, stage: str, compute, **kwargs) -> dict:
+        """
+        Retrieve the arrays of a calculation stage which is linear in cost.
+
+        Pre-tax expenditures, indirect taxes, depreciation, sunk costs and
+        preonstream costs scale linearly with the cost of each category. When the
+        contract holds a linear cache (see `get_cost_scaled`), the arrays of the
+        unscaled costs are computed once per set of arguments, and each scaled
+        contract multiplies them by its CAPEX or OPEX multiplier.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage.
+        compute : callable
+            Returns the arrays of the stage as a dict keyed by "{fluid}_{category}".
+            The values are arrays, or tuples of arrays.
+        **kwargs
+            The arguments the stage depends on.
+
+        Returns
+        -------
+        dict
+            The arrays of the stage, keyed by "{fluid}_{category}".
+        """
+
+        if self._linear_cache is None:
+            return compute()
+
+        key = (stage, tuple((k, _get_hashable(v)) for k, v in kwargs.items()))
+        if key not in self._linear_cache:
+            self._linear_cache[key] = compute()
+
+        multipliers = self._cost_multipliers or {"capex": 1.0, "opex": 1.0}
+
+        def _scale(value, multiplier: float):
+            if isinstance(value, tuple):
+                return tuple(val * multiplier for val in value)
+            return value * multiplier
+
+        return {
+            name: _scale(
+                value,
+                multipliers[
+                    "capex" if name.split("_", 1)[1] in _CAPEX_CATEGORIES else "opex"
+                ],
+            )
+            for name, value in self._linear_cache[key].items()
+        }
+
+    def _get_fingerprint_state(self):
+        """
+        Retrieve the non-init state the results of the contract depend on, namely
+        the cost multipliers of a cost-scaled copy, to be fingerprinted along with
+        the arguments of the contract.
+        """
+
+        return self._cost_multipliers
+
+    def _get_setup_fingerprint(self) -> str:
+        """
+        Retrieve the fingerprint of the inputs of the cached stages of the run pipeline,
+        namely the setup attributes of the contract and its cost multipliers.
+
+        The fingerprint is computed upon construction and kept until a setup attribute
+        or the cost multipliers are assigned. The setup attributes are not expected to
+        be modified in place; use clone() to adjust them instead.
+        """
+
+        if self._setup_fingerprint is None:
+            self._setup_fingerprint = get_fingerprint(
+                (
+                    [getattr(self, name) for name in _SETUP_ATTRS],
+                    self._cost_multipliers,
+                )
+            )
+
+        return self._setup_fingerprint
+
+    def _run_stage(
+        self,
+        stage: str,
+        compute,
+        outputs: tuple,
+        setup_key: str,
+        arguments: dict = None,
+    ) -> None:
+        """
+        Run a stage of the run pipeline, unless its inputs are unchanged since its last run.
+
+        The stages which are cached depend only on the setup attributes of the contract
+        (dates, lifting and cost objects), its cost multipliers and the run arguments
+        declared by the stage. Fiscal terms, e.g. the pre-tax split, the FTP portion or
+        the DMO fee, are not among their inputs. Hence, a re-run after changing a fiscal
+        term restores the outputs of the stages instead of computing them again.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the stage.
+        compute : callable
+            Computes the stage and assigns its outputs, called with the arguments.
+        outputs : tuple
+            The names of the attributes assigned by the stage.
+        setup_key : str
+            The fingerprint of the setup attributes, see `_get_setup_fingerprint`.
+        arguments : dict, optional
+            The run arguments the stage depends on.
+        """
+
+        arguments = arguments or {}
+        key = get_fingerprint((setup_key, arguments))
+
+        if self._stage_cache is None:
+            self._stage_cache = {}
+
+        # Restore copies of the outputs, as downstream stages may modify them in place
+        cached = self._stage_cache.get(stage)
+        if cached is not None and cached[0] == key:
+            for name, value in cached[1].items():
+                setattr(self, name, value.copy() if isinstance(value, np.ndarray) else value)
+            return
+
+        compute(**arguments)
+
+        self._stage_cache[stage] = (
+            key,
+            {
+                name: (
+                    getattr(self, name).copy()
+                    if isinstance(getattr(self, name), np.ndarray)
+                    else getattr(self, name)
+                )
+                for name in outputs
+            },
+        )
+
+    def _run_setup_stages(self, setup_key: str) -> None:
+        """
+        Run the cached stages which depend only on the setup attributes of the contract:
+        WAP prices, validation of the cost objects, sunk costs and preonstream costs.
+
+        Parameters
+        ----------
+        setup_key : str
+            The fingerprint of the setup attributes, see `_get_setup_fingerprint`.
+        """
+
+        # WAP (Weighted Average Price) for each produced fluid
+        self._run_stage(
+            stage="wap_price",
+            compute=self._get_wap_price,
+            outputs=_WAP_PRICE_OUTPUTS,
+            setup_key=setup_key,
+        )
+
+        # Validate sunk cost, pre-onstream, and post-onstream objects
+        self._run_stage(
+            stage="cost_objects_validation",
+            compute=self._get_cost_objects_validation,
+            outputs=(),
+            setup_key=setup_key,
+        )
+
+        # Prepare sunk costs and preonstream costs
+        self._run_stage(
+            stage="sunk_cost",
+            compute=self._get_sunkcost_array,
+            outputs=_SUNK_COST_OUTPUTS,
+            setup_key=setup_key,
+        )
+
+        self._run_stage(
+            stage="preonstream",
+            compute=self._get_preonstream_array,
+            outputs=_PREONSTREAM_OUTPUTS,
+            setup_key=setup_key,
+        )
+
+    def _run_expenditures_stage(
+        self,
+        setup_key: str,
+        year_inflation: np.ndarray,
+        inflation_rate: np.ndarray | float,
+        inflation_rate_applied_to: InflationAppliedTo,
+        tax_rate: np.ndarray | float,
+    ) -> None:
+        """
+        Run the cached stage of the pre-tax expenditures, indirect taxes and
+        post-tax expenditures of each cost category.
+
+        Parameters
+        ----------
+        setup_key : str
+            The fingerprint of the setup attributes, see `_get_setup_fingerprint`.
+        year_inflation : np.ndarray
+            Array specifying the inflation year for each time step.
+        inflation_rate : np.ndarray or float
+            Inflation rate(s) to be applied.
+        inflation_rate_applied_to : InflationAppliedTo
+            Specifies which expenditures the inflation rate should be applied to.
+        tax_rate : np.ndarray or float
+            Indirect tax rate(s) applied to applicable expenditures.
+        """
+
+        def compute(year_inflation, inflation_rate, inflation_rate_applied_to, tax_rate):
+            self._get_expenditures_pre_tax(
+                year_inflation=year_inflation,
+                inflation_rate=inflation_rate,
+                inflation_rate_applied_to=inflation_rate_applied_to,
+            )
+            self._get_indirect_taxes(tax_rate=tax_rate)
+            self._get_expenditures_post_tax()
+
+        self._run_stage(
+            stage="expenditures",
+            compute=compute,
+            outputs=_EXPENDITURES_OUTPUTS,
+            setup_key=setup_key,
+            arguments={
+                "year_inflation": year_inflation,
+                "inflation_rate": inflation_rate,
+                "inflation_rate_applied_to": inflation_rate_applied_to,
+                "tax_rate": tax_rate,
+            },
+        )
+
+    def clone(self, **overrides):
+        """
+        Create a copy of the contract with some of its attributes overridden.
+
+        The copy is cheap: it shares the input objects (lifting, cost objects and
+        their arrays) with this contract, which are only read upon run, and does not
+        repeat the construction unless an overridden attribute is processed upon
+        construction (dates, lifting or cost objects). Even then, the cost ledgers
+        whose cost objects and timelines are unchanged are reused. The copy can be
+        adjusted and run without affecting this contract, so that several copies can
+        be evaluated concurrently.
+
+        Parameters
+        ----------
+        **overrides
+            The attributes of the copy to be overridden, e.g. a fiscal term.
+
+        Returns
+        -------
+        BaseProject
+            The copy, of the same class as this contract.
+
+        Raises
+        ------
+        BaseProjectException
+            If overrides include an attribute which is not an argument of the contract.
+        """
+
+        init_attrs = [fld.name for fld in fields(self) if fld.init]
+        unknown = [key for key in overrides if key not in init_attrs]
+        if unknown:
+            raise BaseProjectException(
+                f"Attributes {unknown} are not arguments of "
+                f"{self.__class__.__qualname__} and cannot be overridden."
+            )
+
+        cloned = copy.copy(self)
+        for key, value in overrides.items():
+            setattr(cloned, key, value)
+
+        # The copy holds its own stage cache, so that copies run concurrently
+        # do not evict the stages of each other
+        cloned._stage_cache = {}
+
+        # Overriding a setup attribute requires the construction of the contract,
+        # which reuses the cost ledgers whose inputs are unchanged
+        if any(key in _SETUP_ATTRS for key in overrides):
+            if any(key in _LINEAR_STAGE_ATTRS for key in overrides):
+                cloned._linear_cache = None
+                cloned._cost_multipliers = None
+
+            cloned.__post_init__()
+            return cloned
+
+        # Revenues are updated in place upon run, hence refreshed from lifting
+        for fluid in ["oil", "gas", "sulfur", "electricity", "co2"]:
+            lifting = getattr(cloned, f"_{fluid}_lifting")
+            setattr(cloned, f"_{fluid}_revenue", lifting.revenue())
+
+        return cloned
+
+    def get_cost_scaled(
+        self,
+        capex: float = 1.0,
+        opex: float = 1.0,
+        variable_opex: bool = True,
+        **changes,
+    ):
+        """
+        Create a copy of the contract with CAPEX and OPEX scaled by multipliers.
+
+        Instead of scaling every cost object and rebuilding the contract, the copy
+        shares the cost objects and a linear cache with this contract. Upon run,
+        the stages which are linear in cost (pre-tax expenditures, indirect taxes,
+        depreciation, sunk costs and preonstream costs) are computed once for the
+        unscaled costs and reused through scalar multiplication. Only the
+        non-linear stages are recomputed.
+
+        The multipliers apply to the cost of capital, intangible, ASR, LBT and cost
+        of sales, and to the fixed cost and cost per volume of OPEX. The salvage
+        value of capital costs is not scaled, nor is the cost per volume of OPEX if
+        variable_opex is False. Since the stages are then no longer linear in the
+        multipliers, a contract with non-zero salvage values, or with variable OPEX
+        costs which are not scaled, is rebuilt with scaled cost objects instead.
+
+        Parameters
+        ----------
+        capex : float, default=1.0
+            The multiplier of capital and intangible costs.
+        opex : float, default=1.0
+            The multiplier of OPEX, ASR, LBT and cost of sales.
+        variable_opex : bool, default=True
+            Whether the cost per volume of OPEX is scaled along with its fixed cost.
+        **changes
+            Other attributes of the copy, e.g. a perturbed lifting. The attributes
+            which define the cost objects cannot be changed.
+
+        Returns
+        -------
+        BaseProject
+            The scaled copy, of the same class as this contract.
+
+        Raises
+        ------
+        BaseProjectException
+            If changes include an attribute which defines the cost objects.
+        """
+
+        fixed = [key for key in changes if key in _LINEAR_STAGE_ATTRS]
+        if fixed:
+            raise BaseProjectException(
+                f"Attributes {fixed} define the cost objects of the contract "
+                f"and cannot be changed in a cost-scaled copy."
+            )
+
+        if not self._is_cost_scaling_linear(variable_opex=variable_opex):
+            return self.clone(
+                **changes,
+                **self._get_scaled_cost_objects(
+                    capex=capex, opex=opex, variable_opex=variable_opex
+                ),
+            )
+
+        if self._linear_cache is None:
+            self._linear_cache = {}
+
+        scaled = self.clone(**changes)
+        scaled._linear_cache = self._linear_cache
+        scaled._cost_multipliers = {"capex": capex, "opex": opex}
+
+        return scaled
+
+    def _is_cost_scaling_linear(self, variable_opex: bool = True) -> bool:
+        """
+        Check whether the cost stages are linear in the CAPEX and OPEX multipliers,
+        i.e. the capital costs have no salvage value and, unless the variable OPEX
+        is scaled too, the OPEX has no variable cost.
+        """
+
+        return all(
+            not np.any(tan.salvage_value) for tan in self.capital_cost
+        ) and (
+            variable_opex or all(not np.any(opx.variable_cost) for opx in self.opex)
+        )
+
+    def _get_scaled_cost_objects(
+        self, capex: float, opex: float, variable_opex: bool = True
+    ) -> dict:
+        """
+        Get the cost objects of the contract scaled by the CAPEX and OPEX multipliers,
+        keyed by the name of the attribute of the contract.
+        """
+
+        return {
+            "capital_cost": tuple(
+                replace(tan, cost=tan.cost * capex) for tan in self.capital_cost
+            ),
+            "intangible_cost": tuple(
+                replace(intang, cost=intang.cost * capex)
+                for intang in self.intangible_cost
+            ),
+            "opex": tuple(
+                replace(
+                    opx,
+                    fixed_cost=opx.fixed_cost * opex,
+                    cost_per_volume=(
+                        opx.cost_per_volume * opex
+                        if variable_opex
+                        else opx.cost_per_volume
+                    ),
+                )
+                for opx in self.opex
+            ),
+            "asr_cost": tuple(
+                replace(asr, cost=asr.cost * opex) for asr in self.asr_cost
+            ),
+            "lbt_cost": tuple(
+                replace(bt, cost=bt.cost * opex) for bt in self.lbt_cost
+            ),
+            "cost_of_sales": tuple(
+                replace(cos, cost=cos.cost * opex) for cos in self.cost_of_sales
+            ),
+        }
 
     def _get_expenditures_post_tax(self) -> None:
         """
@@ -3828,15 +4451,12 @@ class BaseProject:
             Specifies which expenditures the inflation rate should be applied to.
         """
 
-        # WAP (Weighted Average Price) for each produced fluid
-        self._get_wap_price()
-
-        # Validate sunk cost, pre-onstream, and post-onstream objects
-        self._get_cost_objects_validation()
+        # Stages which only depend on the setup attributes and the cost arguments are
+        # skipped when these are unchanged since the last run (see `_run_stage`)
+        setup_key = self._get_setup_fingerprint()
 
-        # Prepare sunk costs and preonstream costs
-        self._get_sunkcost_array()
-        self._get_preonstream_array()
+        # WAP prices, validation of cost objects, sunk costs and preonstream costs
+        self._run_setup_stages(setup_key=setup_key)
 
         # Calculate (total = depreciable + non_depreciable costs)
         # for sunk cost and preonstream cost
@@ -3846,19 +4466,15 @@ class BaseProject:
                 non_depreciable = getattr(self, f"_{ftype}_non_depreciable_{ctype}")
                 setattr(self, f"_{ftype}_{ctype}", depreciable + non_depreciable)
 
-        # Calculate pre tax expenditures
-        self._get_expenditures_pre_tax(
+        # Calculate pre tax expenditures, indirect taxes and post tax expenditures
+        self._run_expenditures_stage(
+            setup_key=setup_key,
             year_inflation=year_inflation,
             inflation_rate=inflation_rate,
             inflation_rate_applied_to=inflation_rate_applied_to,
+            tax_rate=tax_rate,
         )
 
-        # Calculate indirect taxes
-        self._get_indirect_taxes(tax_rate=tax_rate)
-
-        # Calculate post tax expenditures
-        self._get_expenditures_post_tax()
-
         # Other revenue
         self._get_other_revenue(
             sulfur_revenue=sulfur_revenue,
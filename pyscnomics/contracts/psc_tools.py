@@ -10,6 +10,12 @@ from datetime import date
 from pyscnomics.econ.revenue import Lifting
 
 
+class PSCToolsException(Exception):
+    """Exception to be raised for a misuse of the PSC calculation kernels"""
+
+    pass
+
+
 def get_unrec_cost_2b_recovered_costrec(
         project_years: np.ndarray,
         depreciation: np.ndarray,
@@ -23,6 +29,11 @@ def get_unrec_cost_2b_recovered_costrec(
     """
     Function to get the Unrecoverable Cost, Cost to be Recovered and Cost Recovery.
 
+    The profiles may be given either for a single scenario, with shape (n_years,),
+    or for a batch of scenarios, with shape (n_scenarios, n_years). Only the carry
+    forward of the unrecovered cost is iterated over the years, every other
+    quantity is evaluated for all years and scenarios at once.
+
     Parameters
     ----------
     project_years: np.ndarray
@@ -47,88 +58,60 @@ def get_unrec_cost_2b_recovered_costrec(
     out: unrecovered_cost,  cost_2b_recovered, cost_recovery
 
     """
-    # Initializing the array of unrecovered cost
-    yearly_unrecovered_cost = np.zeros_like(project_years, dtype=float)
-    revenue_minus_cost = np.zeros_like(project_years, dtype=float)
-    unrecovered_cost = np.zeros_like(project_years, dtype=float)
-    cost_to_be_recovered = np.zeros_like(project_years, dtype=float)
-    cost_recovery = np.zeros_like(project_years, dtype=float)
-
-    # Looping through the project years
-    for index, _ in enumerate(project_years):
-        if index == 0:
-            # Yearly Unrecovered Cost
-            yearly_unrecovered_cost[index] = np.where(
-                depreciation[index] + non_capital[index] > (
-                            revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index]),
-                depreciation[index] + non_capital[index] - (
-                            revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index]),
-                0
-            )
-
-            # Revenue - Cost Yearly
-            revenue_minus_cost[index] = np.where(
-                yearly_unrecovered_cost[index] > 0,
-                0,
-                revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index]
-            )
-
-            # Unrecovered Cost
-            unrecovered_cost[index] = np.where(
-                yearly_unrecovered_cost[index] - revenue_minus_cost[index] < 0,
-                0,
-                yearly_unrecovered_cost[index] - revenue_minus_cost[index]
-            )
-
-            # Cost to be Recovered
-            cost_to_be_recovered[index] = np.where(
-                (0 - unrecovered_cost[index]) < 0,
-                0,
-                0 - unrecovered_cost[index]
-            )
-
-            # Cost Recovery
-            cost_recovery[index] = np.minimum(
-                revenue[index] - ftp_ctr[index] - ftp_gov[index],
-                depreciation[index] + non_capital[index] + cost_to_be_recovered[index]
-            ) * cr_cap_rate
+    shape = np.broadcast_shapes(
+        np.shape(project_years),
+        np.shape(depreciation),
+        np.shape(non_capital),
+        np.shape(revenue),
+        np.shape(ftp_ctr),
+        np.shape(ftp_gov),
+        np.shape(ic),
+    )
 
-        else:
-            # Yearly Unrecovered Cost
-            yearly_unrecovered_cost[index] = np.where(
-                depreciation[index] + non_capital[index] > (
-                            revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index]),
-                depreciation[index] + non_capital[index] - (
-                            revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index]),
-                0
-            )
-
-            # Revenue - Cost Yearly
-            revenue_minus_cost[index] = np.where(
-                yearly_unrecovered_cost[index] > 0,
-                0,
-                revenue[index] - ftp_ctr[index] - ftp_gov[index] - ic[index] - depreciation[index] - non_capital[index]
-            )
-
-            # Unrecovered Cost
-            unrecovered_cost[index] = np.where(
-                yearly_unrecovered_cost[index] + unrecovered_cost[index - 1] - revenue_minus_cost[index] < 0,
-                0,
-                yearly_unrecovered_cost[index] + unrecovered_cost[index - 1] - revenue_minus_cost[index]
-            )
-
-            # Cost to be Recovered
-            cost_to_be_recovered[index] = np.where(
-                (unrecovered_cost[index - 1] - unrecovered_cost[index]) < 0,
-                0,
-                unrecovered_cost[index - 1] - unrecovered_cost[index]
-            )
-
-            # Cost Recovery
-            cost_recovery[index] = np.minimum(
-                revenue[index] - ftp_ctr[index] - ftp_gov[index],
-                depreciation[index] + non_capital[index] + cost_to_be_recovered[index]
-            ) * cr_cap_rate
+    cost = np.broadcast_to(np.asarray(depreciation + non_capital, dtype=float), shape)
+    revenue_net = np.broadcast_to(
+        np.asarray(revenue - ftp_ctr - ftp_gov - ic, dtype=float), shape
+    )
+
+    # Yearly Unrecovered Cost
+    yearly_unrecovered_cost = np.where(cost > revenue_net, cost - revenue_net, 0)
+
+    # Revenue - Cost Yearly. The first year is not reduced by the cost.
+    revenue_minus_cost = np.where(
+        yearly_unrecovered_cost > 0, 0, revenue_net - depreciation - non_capital
+    )
+    revenue_minus_cost[..., 0] = np.where(
+        yearly_unrecovered_cost[..., 0] > 0, 0, revenue_net[..., 0]
+    )
+
+    # Unrecovered Cost, carried forward from one year to the next
+    unrecovered_cost = np.zeros(shape, dtype=float)
+    first_year = yearly_unrecovered_cost[..., 0] - revenue_minus_cost[..., 0]
+    unrecovered_cost[..., 0] = np.where(first_year < 0, 0, first_year)
+
+    for index in range(1, shape[-1]):
+        carried = (
+            yearly_unrecovered_cost[..., index]
+            + unrecovered_cost[..., index - 1]
+            - revenue_minus_cost[..., index]
+        )
+        unrecovered_cost[..., index] = np.where(carried < 0, 0, carried)
+
+    # Cost to be Recovered
+    unrecovered_prior = np.zeros(shape, dtype=float)
+    unrecovered_prior[..., 1:] = unrecovered_cost[..., :-1]
+
+    cost_to_be_recovered = np.where(
+        (unrecovered_prior - unrecovered_cost) < 0,
+        0,
+        unrecovered_prior - unrecovered_cost
+    )
+
+    # Cost Recovery
+    cost_recovery = np.minimum(
+        revenue - ftp_ctr - ftp_gov,
+        cost + cost_to_be_recovered
+    ) * cr_cap_rate
 
     return unrecovered_cost, cost_to_be_recovered, cost_recovery
 
@@ -238,6 +221,9 @@ def get_transfer(gas_unrecovered: np.ndarray,
     """
     A function to get the transferred cost between oil and gas.
 
+    The arrays may be given either for a single scenario, with shape (n_years,),
+    or for a batch of scenarios, with shape (n_scenarios, n_years).
+
     Parameters
     ----------
     gas_unrecovered: np.ndarray
@@ -258,32 +244,27 @@ def get_transfer(gas_unrecovered: np.ndarray,
             The transferred cost from oil to gas.
     """
 
-    trf2oil = np.zeros_like(oil_unrecovered)
-    trf2gas = np.zeros_like(gas_unrecovered)
-
     # Transfer to oil
     combined_condition_oil = np.logical_and(
         np.greater(oil_unrecovered, 0), np.equal(gas_unrecovered, 0)
     )
 
-    oil_indices = np.argwhere(combined_condition_oil)
-
-    if np.size(oil_indices) > 0:
-        trf2oil[oil_indices] = np.minimum(
-            gas_ets_pretransfer[oil_indices], oil_unrecovered[oil_indices]
-        )
+    trf2oil = np.where(
+        combined_condition_oil,
+        np.minimum(gas_ets_pretransfer, oil_unrecovered),
+        0,
+    ).astype(np.result_type(oil_unrecovered), copy=False)
 
     # Transfer to gas
     combined_condition_gas = np.logical_and(
         np.equal(oil_unrecovered, 0), np.greater(gas_unrecovered, 0)
     )
 
-    indices_gas = np.argwhere(combined_condition_gas)
-
-    if np.size(indices_gas) > 0:
-        trf2gas[indices_gas] = np.minimum(
-            oil_ets_pretransfer[indices_gas], gas_unrecovered[indices_gas]
-        )
+    trf2gas = np.where(
+        combined_condition_gas,
+        np.minimum(oil_ets_pretransfer, gas_unrecovered),
+        0,
+    ).astype(np.result_type(gas_unrecovered), copy=False)
 
     return trf2oil, trf2gas
 
@@ -624,3 +605,230 @@ def transfer_treatment(unrecovered_prior_to_cost: np.ndarray,
 
     return transfer_final
 
+
+
+def get_ftp_tax_considered(ftp_ctr: np.ndarray, unrec_cost: np.ndarray) -> np.ndarray:
+    """
+    Function to get the contractor's FTP considered in the tax payment of PDJP 20/2017.
+
+    The profiles may be given either for a single scenario, with shape (n_years,),
+    or for a batch of scenarios, with shape (n_scenarios, n_years).
+
+    Parameters
+    ----------
+    ftp_ctr: np.ndarray
+        The array of contractor's First Tranche Petroleum.
+    unrec_cost: np.ndarray
+        The array of the unrecovered cost.
+
+    Returns
+    -------
+    out: np.ndarray
+        The FTP considered in the tax payment of each year.
+
+    Notes
+    -----
+    The FTP considered in a year is the cumulative FTP less the FTP considered in the
+    prior years, reduced by the unrecovered cost and floored at zero. Hence, the
+    cumulative FTP considered S follows S_i = max(S_(i-1) + b_i, cum_ftp_i - unrec_cost_i),
+    with b_i = max(-unrec_cost_i, 0), which is solved with cumulative sums and a
+    maximum accumulation instead of a loop over the years. The FTP considered of each
+    year is then evaluated from S_(i-1) with the floors of the yearly formula, so the
+    years without FTP considered are exactly zero rather than rounding residues.
+    """
+    ftp_cum = np.cumsum(ftp_ctr, axis=-1, dtype=float)
+    unrec_cost = np.broadcast_to(np.asarray(unrec_cost, dtype=float), ftp_cum.shape)
+
+    offset = np.cumsum(np.maximum(-unrec_cost, 0), axis=-1)
+    considered_cum = offset + np.maximum(
+        np.maximum.accumulate(ftp_cum - unrec_cost - offset, axis=-1), 0
+    )
+
+    # FTP considered in the prior years, snapped to the cumulative FTP of the prior
+    # year once all of it has been considered
+    ftp_prior = np.zeros_like(considered_cum)
+    ftp_prior[..., 1:] = considered_cum[..., :-1]
+    ftp_cum_prior = np.zeros_like(ftp_cum)
+    ftp_cum_prior[..., 1:] = ftp_cum[..., :-1]
+    ftp_prior = np.where(
+        np.isclose(ftp_prior, ftp_cum_prior, rtol=1.0e-12, atol=0), ftp_cum_prior, ftp_prior
+    )
+
+    ftp_diff = np.where(ftp_cum > ftp_prior, ftp_cum - ftp_prior, 0)
+
+    return np.where(ftp_diff > unrec_cost, ftp_diff - unrec_cost, 0)
+
+
+def get_tax_payment_pdjp(
+        ftp_ctr: np.ndarray,
+        unrec_cost: np.ndarray,
+        tax_rate: np.ndarray | float,
+        taxable_income: np.ndarray,
+        ctr_share: np.ndarray,
+        ddmo: np.ndarray,
+) -> (np.ndarray, np.ndarray):
+    """
+    Function to get the contractor's tax payment and unpaid tax under PDJP 20/2017.
+
+    The profiles may be given either for a single scenario, with shape (n_years,),
+    or for a batch of scenarios, with shape (n_scenarios, n_years).
+
+    Parameters
+    ----------
+    ftp_ctr: np.ndarray
+        The array of contractor's First Tranche Petroleum.
+    unrec_cost: np.ndarray
+        The array of the unrecovered cost.
+    tax_rate: np.ndarray | float
+        The applied effective tax rate.
+    taxable_income: np.ndarray
+        The contractor's taxable income.
+    ctr_share: np.ndarray
+        The contractor's equity share.
+    ddmo: np.ndarray
+        The net DMO.
+
+    Returns
+    -------
+    out: tax_paid, unpaid_tax
+
+    Notes
+    -----
+    The tax due of a year is the tax of the year plus the unpaid tax of the prior year.
+    It is paid in full if the taxable income exceeds it, otherwise the contractor pays
+    its share less the net DMO and the remainder is carried forward. Since the branch
+    taken depends on the carried balance, the balance is resolved as a fixed point:
+    given the years in which a balance is carried, the balance is a cumulative sum
+    restarted after each year without balance. The years with a balance are then
+    re-evaluated, which settles at least one more year per pass.
+
+    Raises
+    ------
+    PSCToolsException
+        If the years with a balance have not settled after n_years + 1 passes.
+    """
+    shape = np.broadcast_shapes(
+        np.shape(ftp_ctr),
+        np.shape(unrec_cost),
+        np.shape(taxable_income),
+        np.shape(ctr_share),
+        np.shape(ddmo),
+    )
+
+    # Calculating the ftp tax payment
+    ftp_tax_paid = get_ftp_tax_considered(ftp_ctr=ftp_ctr, unrec_cost=unrec_cost) * tax_rate
+
+    # Calculating the taxable income without ftp
+    taxable_income_wo_ftp = np.where(
+        taxable_income - ftp_ctr < 0,
+        taxable_income - ftp_ctr + ddmo,
+        taxable_income - ftp_ctr,
+    )
+
+    # Defining Taxing flag
+    applied_tax = np.broadcast_to(ctr_share > 0, shape)
+    applied_tax_prior = np.zeros(shape, dtype=bool)
+    applied_tax_prior[..., 1:] = applied_tax[..., :-1]
+    cum_ti = np.cumsum(np.broadcast_to(taxable_income_wo_ftp, shape), axis=-1)
+
+    ctr_ets_tax = np.where(
+        np.logical_and(applied_tax, ~applied_tax_prior),
+        cum_ti * tax_rate,
+        np.where(
+            np.logical_and(applied_tax, applied_tax_prior),
+            taxable_income_wo_ftp * tax_rate,
+            0,
+        ),
+    )
+
+    # Tax from FTP and Contractor Equity
+    ctr_tax = np.broadcast_to(ftp_tax_paid + ctr_ets_tax, shape)
+
+    # The payment of the contractor when the tax due exceeds the taxable income
+    ctr_payable = np.broadcast_to(ctr_share + ftp_ctr - ddmo, shape)
+    taxable_income = np.broadcast_to(taxable_income, shape)
+
+    # Resolving the years in which the unpaid tax is carried forward
+    years = np.arange(shape[-1])
+    is_carried = np.zeros(shape, dtype=bool)
+    unpaid_tax = np.zeros(shape, dtype=float)
+
+    for _ in range(shape[-1] + 2):
+        unpaid_tax_prior = np.zeros(shape, dtype=float)
+        unpaid_tax_prior[..., 1:] = unpaid_tax[..., :-1]
+        tax_due = ctr_tax + unpaid_tax_prior
+
+        is_carried_new = np.logical_and(
+            ~(taxable_income > tax_due), tax_due > ctr_payable
+        )
+        if np.array_equal(is_carried_new, is_carried):
+            break
+
+        is_carried = is_carried_new
+        balance_cum = np.zeros((*shape[:-1], shape[-1] + 1), dtype=float)
+        balance_cum[..., 1:] = np.cumsum(
+            np.where(is_carried, ctr_tax - ctr_payable, 0), axis=-1
+        )
+        last_reset = np.maximum.accumulate(
+            np.where(is_carried, 0, years + 1), axis=-1
+        )
+        unpaid_tax = np.where(
+            is_carried,
+            balance_cum[..., 1:] - np.take_along_axis(balance_cum, last_reset, axis=-1),
+            0,
+        )
+    else:
+        raise PSCToolsException(
+            f"The unpaid tax has not converged after {shape[-1] + 1} passes"
+        )
+
+    tax_paid = np.where(taxable_income > tax_due, tax_due, ctr_payable)
+
+    return tax_paid, unpaid_tax
+
+
+def get_unpaid_and_tax_balance(
+        tax_payment: np.ndarray,
+        ets_ctr: np.ndarray,
+) -> (np.ndarray, np.ndarray):
+    """
+    Function to get the contractor's unpaid tax and tax payment.
+
+    The profiles may be given either for a single scenario, with shape (n_years,),
+    or for a batch of scenarios, with shape (n_scenarios, n_years).
+
+    Parameters
+    ----------
+    tax_payment: np.ndarray
+        The contractors tax payment
+    ets_ctr: np.ndarray
+        The contractor's share
+
+    Returns
+    -------
+    out: unpaid_tax, ctr_tax
+
+    Notes
+    -----
+    From the second year onward, the unpaid tax follows
+    unpaid_i = max(0, unpaid_(i-1) + tax_payment_i - ets_ctr_i). With W the cumulative
+    sum of tax_payment - ets_ctr, the unpaid tax is W less its running minimum, so no
+    loop over the years is required.
+    """
+    shape = np.broadcast_shapes(np.shape(tax_payment), np.shape(ets_ctr))
+    tax_payment = np.broadcast_to(np.asarray(tax_payment, dtype=float), shape)
+    ets_ctr = np.broadcast_to(np.asarray(ets_ctr, dtype=float), shape)
+
+    balance = np.zeros(shape, dtype=float)
+    balance[..., 1:] = tax_payment[..., 1:] - ets_ctr[..., 1:]
+    balance_cum = np.cumsum(balance, axis=-1)
+
+    unpaid_tax = balance_cum - np.minimum.accumulate(balance_cum, axis=-1)
+    unpaid_tax[..., 0] = 0
+
+    ctr_tax = np.zeros(shape, dtype=float)
+    ctr_tax[..., 1:] = np.minimum(
+        ets_ctr[..., 1:], unpaid_tax[..., :-1] + tax_payment[..., 1:]
+    )
+
+    return unpaid_tax, ctr_tax
@@ -1,13 +1,78 @@
-from dataclasses import dataclass, field
+import copy
+from dataclasses import dataclass, field, fields
 import numpy as np
 from datetime import date
 
 from pyscnomics.econ.revenue import Lifting
-from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, CostOfSales, LBT
 from pyscnomics.econ.selection import FluidType
 from pyscnomics.contracts.costrecovery import CostRecovery
 from pyscnomics.contracts.grossplit import GrossSplit
 from pyscnomics.contracts import psc_tools
+from pyscnomics.tools.helper import LRUCache, get_contract_snapshot, get_fingerprint
+
+
+class TransitionException(Exception):
+    """ Exception to be raised for a misuse of Transition class """
+
+    pass
+
+
+# LRU cache of the transitioned runs of the first contract, keyed on the fingerprint of its inputs
+_CONTRACT1_RUN_CACHE = LRUCache(maxsize=32)
+
+
+def get_contract1_cache_info() -> dict:
+    """
+    Function to get the statistics of the cache of the first contract runs used by Transition.
+
+    Returns
+    -------
+    out: dict
+        The number of calls, hits and misses, the hit rate, the current size
+        and the maximum size of the cache.
+
+    Notes
+    -------
+    The statistics are cumulative over the current process since the last call of
+    clear_contract1_cache(). Transitions run in worker processes, e.g. by a Monte Carlo
+    or optimization pool, use the caches of those processes and are not counted.
+    """
+    return _CONTRACT1_RUN_CACHE.info()
+
+
+def clear_contract1_cache(maxsize: int = None):
+    """
+    Function to clear the cache of the first contract runs used by Transition and reset its statistics.
+
+    Parameters
+    ----------
+    maxsize: int
+        The new maximum number of cached runs. A maxsize of 0 disables the cache.
+        When None, the maximum size is kept.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise TransitionException(f"Cache size must be non-negative, not {maxsize}")
+
+    _CONTRACT1_RUN_CACHE.clear(maxsize=maxsize)
+
+
+def _get_cached_contract1_run(key: str) -> CostRecovery | GrossSplit | None:
+    """
+    Retrieve the transitioned run of the first contract from the cache, None when missing.
+    The cached run is shared by all Transition objects, hence a copy of it is returned.
+    """
+    cached = _CONTRACT1_RUN_CACHE.get(key)
+
+    return get_contract_snapshot(cached) if cached is not None else None
+
+
+def _store_contract1_run(key: str, contract: CostRecovery | GrossSplit):
+    """
+    Store a copy of the transitioned run of the first contract, evicting the least
+    recently used run.
+    """
+    if _CONTRACT1_RUN_CACHE.maxsize > 0:
+        _CONTRACT1_RUN_CACHE.put(key, get_contract_snapshot(contract))
 
 
 def adjust_rows(original_value: float | np.ndarray,
@@ -68,7 +133,15 @@ def adjusting_contract_arguments(arguments_dict: dict,
     -------
     arguments_dict: dict
         The dictionary containing adjusted arguments.
+
+    Notes
+    -----
+    The adjustment is applied to a shallow copy of arguments_dict, so that the
+    arguments kept by the Transition object are left intact and a re-run of
+    the same Transition object does not pad the arguments twice.
     """
+    arguments_dict = dict(arguments_dict)
+
     if 'tax_rate' in arguments_dict.keys():
         arguments_dict['tax_rate'] = adjust_rows(original_value=arguments_dict['tax_rate'],
                                                  first_contract=first_contract,
@@ -127,6 +200,7 @@ class Transition:
     # Attributes to define later
     _contract1_transitioned: CostRecovery | GrossSplit = field(default=None, init=False, repr=False)
     _contract2_transitioned: CostRecovery | GrossSplit = field(default=None, init=False, repr=False)
+    _sub_contract_runs: dict = field(default=None, init=False, repr=False)
 
     project_years: np.ndarray = field(default=None, init=False, repr=False)
 
@@ -343,7 +417,101 @@ class Transition:
 
         return new_contract
 
-    def run(self, unrec_portion: float = 0.0):
+    def clone(self, **overrides):
+        """
+        Create a copy of the transition contract with some of its attributes overridden.
+
+        The copy shares the first and second contracts, which are only read upon run,
+        and holds its own copy of the contract arguments. Use the clone() method of the
+        contracts to adjust them, e.g. clone(contract2=self.contract2.clone(**changes)).
+
+        Parameters
+        ----------
+        **overrides
+            The attributes of the copy to be overridden.
+
+        Returns
+        -------
+        Transition
+            The copy of the transition contract.
+
+        Raises
+        ------
+        TransitionException
+            If overrides include an attribute which is not an argument of Transition.
+        """
+        init_attrs = [fld.name for fld in fields(self) if fld.init]
+        unknown = [key for key in overrides if key not in init_attrs]
+        if unknown:
+            raise TransitionException(
+                f"Attributes {unknown} are not arguments of Transition and cannot be overridden."
+            )
+
+        cloned = copy.copy(self)
+        cloned.argument_contract1 = dict(self.argument_contract1)
+        cloned.argument_contract2 = dict(self.argument_contract2)
+        for key, value in overrides.items():
+            setattr(cloned, key, value)
+
+        return cloned
+
+    def _get_aligned_contract(
+            self,
+            contract: CostRecovery | GrossSplit,
+            start_date_trans: date,
+            end_date_trans: date,
+    ) -> CostRecovery | GrossSplit:
+        """
+        Create a copy of a contract whose lifting and cost objects are placed on the
+        project timeline of the transition with their align() method. The align() method
+        shares the arrays of the original objects instead of padding them with zero rows.
+        """
+        return self._parse_dataclass(
+            contract=contract,
+            start_date_trans=start_date_trans,
+            end_date_trans=end_date_trans,
+            **{
+                key_new: tuple(
+                    obj.align(start_year=start_date_trans.year, end_year=end_date_trans.year)
+                    for obj in getattr(contract, key_old)
+                )
+                for key_new, key_old in (
+                    ("lifting", "lifting"),
+                    ("capital", "capital_cost"),
+                    ("intangible", "intangible_cost"),
+                    ("opex", "opex"),
+                    ("asr", "asr_cost"),
+                    ("cost_of_sales", "cost_of_sales"),
+                    ("lbt", "lbt_cost"),
+                )
+            },
+        )
+
+    def _get_sub_contract_runs(self) -> dict:
+        """
+        Run the first and second contracts on the project timeline of the transition.
+
+        The lifting and cost objects of both contracts are placed on the shared project
+        timeline, see _get_aligned_contract(). The runs are cached by the fingerprint of
+        the contracts and their arguments, hence a re-run which only changes the transition
+        terms, i.e. the unrecoverable cost portion, reuses them. Besides, the run of the
+        first contract is kept in a module-level cache keyed by the fingerprint of its
+        inputs, which is shared by all Transition objects. Studies which only perturb the
+        second contract hence run the first contract once, see get_contract1_cache_info().
+
+        Returns
+        -------
+        dict
+            The transitioned first and second contracts and the unrecoverable cost
+            transferred from the first contract, keyed by 'contract1', 'contract2'
+            and 'unrec_cost_prior'.
+        """
+        key = get_fingerprint(
+            (self.contract1, self.contract2, self.argument_contract1, self.argument_contract2)
+        )
+        if self._sub_contract_runs is not None and self._sub_contract_runs["key"] == key:
+            return self._sub_contract_runs
+
         # Defining the transition start date and end date
         start_date_trans = min([self.contract1.start_date, self.contract2.start_date])
         end_date_trans = max([self.contract1.end_date, self.contract2.end_date])
@@ -358,297 +526,15 @@ class Transition:
             additional_year = 0
             end_date_condition = 0
 
-        # project_years_trans = np.arange(start_date_trans.year, end_date_trans.year + 1 + additional_year)
-        # project_duration_trans = end_date_trans.year - start_date_trans.year + 1 + additional_year
-
         # Defining the array of years between the prior contract to the new contract
         years_to_new = np.arange(self.contract1.end_date.year + 1,
                                  self.contract2.end_date.year + 1 + additional_year - end_date_condition)
         years_to_prior = np.arange(self.contract1.start_date.year,
                                    self.contract2.start_date.year + additional_year - end_date_condition)
 
-        len_to_new = len(years_to_new)
-        len_to_prior = len(years_to_prior)
-
-        # Defining the row gap and description between the prior contract and the new contract
+        # Defining the row gap between the prior contract and the new contract
         zeros_to_new = np.zeros_like(years_to_new, dtype=float)
         zeros_to_prior = np.zeros_like(years_to_prior, dtype=float)
-        desc_to_new = ['-'] * len_to_new
-        desc_to_prior = ['-'] * len_to_prior
-        fluid_to_new = [FluidType.OIL] * len_to_new
-        fluid_to_prior = [FluidType.OIL] * len_to_prior
-        ic_to_new = [False] * len_to_new
-        ic_to_prior = [False] * len_to_prior
-
-        # Modifying the contract1
-        # Changing the start_date and end_date of contract1
-        new_lifting_1st = [
-            Lifting(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                lifting_rate=np.concatenate((lift.lifting_rate, zeros_to_new)),
-                price=np.concatenate((lift.price, zeros_to_new)),
-                prod_year=np.concatenate((lift.prod_year, years_to_new)),
-                fluid_type=lift.fluid_type,
-                ghv=np.concatenate((lift.ghv, zeros_to_new)),
-                prod_rate=np.concatenate((lift.prod_rate, zeros_to_new)),
-                prod_rate_baseline=np.concatenate((lift.prod_rate_baseline, zeros_to_new))
-            )
-            for lift in self.contract1.lifting
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 tangible
-        new_tang_1st = [
-            CapitalCost(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((tang.cost, zeros_to_new)),
-                expense_year=np.concatenate((tang.expense_year, years_to_new)).astype(int),
-                cost_allocation=tang.cost_allocation + fluid_to_new,
-                description=tang.description + desc_to_new,
-                tax_portion=np.concatenate((tang.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((tang.tax_discount, zeros_to_new)),
-                pis_year=np.concatenate((tang.pis_year, zeros_to_new)).astype(int),
-                salvage_value=np.concatenate((tang.salvage_value, zeros_to_new)),
-                useful_life=np.concatenate((tang.useful_life, zeros_to_new)),
-                depreciation_factor=np.concatenate((tang.depreciation_factor, zeros_to_new)),
-                is_ic_applied=tang.is_ic_applied + ic_to_new,
-            )
-            for tang in self.contract1.capital_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 intangible
-        new_intang_1st = [
-            Intangible(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((intang.cost, zeros_to_new)),
-                expense_year=np.concatenate((intang.expense_year, years_to_new)).astype(int),
-                cost_allocation=intang.cost_allocation + fluid_to_new,
-                description=intang.description + desc_to_new,
-                tax_portion=np.concatenate((intang.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((intang.tax_discount, zeros_to_new)),
-            )
-            for intang in self.contract1.intangible_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 opex
-        new_opex_1st = [
-            OPEX(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                expense_year=np.concatenate((opx.expense_year, years_to_new)).astype(int),
-                cost_allocation=opx.cost_allocation + fluid_to_new,
-                description=opx.description + desc_to_new,
-                fixed_cost=np.concatenate((opx.fixed_cost, zeros_to_new)),
-                prod_rate=np.concatenate((opx.prod_rate, zeros_to_new)),
-                cost_per_volume=np.concatenate((opx.cost_per_volume, zeros_to_new)),
-                tax_portion=np.concatenate((opx.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((opx.tax_discount, zeros_to_new)),
-
-            )
-            for opx in self.contract1.opex
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 asr
-        new_asr_1st = [
-            ASR(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((asr.cost, zeros_to_new)),
-                expense_year=np.concatenate((asr.expense_year, years_to_new)).astype(int),
-                cost_allocation=asr.cost_allocation + fluid_to_new,
-                description=asr.description + desc_to_new,
-                tax_portion=np.concatenate((asr.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((asr.tax_discount, zeros_to_new)),
-                final_year=np.concatenate((asr.final_year, years_to_new)),
-                future_rate=np.concatenate((asr.future_rate, zeros_to_new)),
-            )
-            for asr in self.contract1.asr_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 Cost of Sales
-        new_cost_of_sales_1st = [
-            CostOfSales(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((cos.cost, zeros_to_new)),
-                expense_year=np.concatenate((cos.expense_year, years_to_new)).astype(int),
-                cost_allocation=cos.cost_allocation + fluid_to_new,
-                description=cos.description + desc_to_new,
-                tax_portion=np.concatenate((cos.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((cos.tax_discount, zeros_to_new)),
-            )
-            for cos in self.contract1.cost_of_sales
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract1 Land and Building Tax
-        new_lbt_1st = [
-            LBT(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((bt.cost, zeros_to_new)),
-                expense_year=np.concatenate((bt.expense_year, years_to_new)).astype(int),
-                cost_allocation=bt.cost_allocation + fluid_to_new,
-                description=bt.description + desc_to_new,
-                tax_portion=np.concatenate((bt.tax_portion, zeros_to_new)),
-                tax_discount=np.concatenate((bt.tax_discount, zeros_to_new)),
-                final_year=np.concatenate((bt.final_year, years_to_new)),
-                utilized_land_area=np.concatenate((bt.utilized_land_area, zeros_to_new)),
-                utilized_building_area=np.concatenate((bt.utilized_building_area, zeros_to_new)),
-                njop_land=np.concatenate((bt.njop_land, zeros_to_new)),
-                njop_building=np.concatenate((bt.njop_building, zeros_to_new)),
-                gross_revenue=np.concatenate((bt.gross_revenue, zeros_to_new)),
-
-            )
-            for bt in self.contract1.lbt_cost
-        ]
-
-        # Modifying the contract2
-        # Changing the start_date and end_date of contract2
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 lifting
-        new_lifting_2nd = [
-            Lifting(start_year=start_date_trans.year,
-                    end_year=end_date_trans.year,
-                    lifting_rate=np.concatenate((zeros_to_prior, lift.lifting_rate)),
-                    price=np.concatenate((zeros_to_prior, lift.price)),
-                    prod_year=np.concatenate((years_to_prior, lift.prod_year)).astype(int),
-                    fluid_type=lift.fluid_type,
-                    ghv=np.concatenate((zeros_to_prior, lift.ghv)),
-                    prod_rate=np.concatenate((zeros_to_prior, lift.prod_rate)),
-                    prod_rate_baseline=np.concatenate((zeros_to_prior, lift.prod_rate_baseline)))
-            for lift in self.contract2.lifting
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 tangible
-        new_tang_2nd = [
-            CapitalCost(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((zeros_to_prior, tang.cost)),
-                expense_year=np.concatenate((years_to_prior, tang.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + tang.cost_allocation,
-                description=desc_to_prior + tang.description,
-                tax_portion=np.concatenate((zeros_to_prior, tang.tax_portion)),
-                tax_discount=np.concatenate((zeros_to_prior, tang.tax_discount)),
-                pis_year=np.concatenate((zeros_to_prior, tang.pis_year)).astype(int),
-                salvage_value=np.concatenate((zeros_to_prior, tang.salvage_value)),
-                useful_life=np.concatenate((zeros_to_prior, tang.useful_life)),
-                depreciation_factor=np.concatenate((zeros_to_prior, tang.depreciation_factor)),
-                is_ic_applied=ic_to_prior + tang.is_ic_applied
-            )
-            for tang in self.contract2.capital_cost
-        ]
-        # Concatenating the zeros_to_new and years_to_new to the contract2 intangible
-        new_intang_2nd = [
-            Intangible(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((zeros_to_prior, intang.cost)),
-                expense_year=np.concatenate((years_to_prior, intang.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + intang.cost_allocation,
-                description=desc_to_prior + intang.description,
-                tax_portion=np.concatenate((zeros_to_prior, intang.tax_portion)),
-                tax_discount=np.concatenate((zeros_to_prior, intang.tax_discount)),
-            )
-            for intang in self.contract2.intangible_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 opex
-        new_opex_2nd = [
-            OPEX(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                expense_year=np.concatenate((years_to_prior, opx.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + opx.cost_allocation,
-                description=desc_to_prior + opx.description,
-                tax_portion=np.concatenate((years_to_prior, opx.tax_portion)).astype(int),
-                tax_discount=np.concatenate((years_to_prior, opx.tax_discount)).astype(int),
-                fixed_cost=np.concatenate((zeros_to_prior, opx.fixed_cost)),
-                prod_rate=np.concatenate((zeros_to_prior, opx.prod_rate)),
-                cost_per_volume=np.concatenate((zeros_to_prior, opx.cost_per_volume)),
-            )
-            for opx in self.contract2.opex
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 asr
-        new_asr_2nd = [
-            ASR(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((zeros_to_prior, asr.cost)),
-                expense_year=np.concatenate((years_to_prior, asr.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + asr.cost_allocation,
-                description=desc_to_prior + asr.description,
-                tax_portion=np.concatenate((zeros_to_prior, asr.tax_portion)),
-                tax_discount=np.concatenate((zeros_to_prior, asr.tax_discount)),
-                final_year=np.concatenate((years_to_prior, asr.final_year)),
-                future_rate=np.concatenate((zeros_to_prior, asr.future_rate)),
-            )
-            for asr in self.contract2.asr_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 Cost Of Sales
-        new_cost_of_sales_2nd = [
-            CostOfSales(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((zeros_to_prior, cos.cost)),
-                expense_year=np.concatenate((years_to_prior, cos.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + cos.cost_allocation,
-                tax_portion=np.concatenate((zeros_to_prior, cos.tax_portion)),
-                tax_discount=np.concatenate((zeros_to_prior, cos.tax_discount)),
-            )
-            for cos in self.contract2.asr_cost
-        ]
-
-        # Concatenating the zeros_to_new and years_to_new to the contract2 Land and Building Tax
-        new_lbt_2nd = [
-            LBT(
-                start_year=start_date_trans.year,
-                end_year=end_date_trans.year,
-                cost=np.concatenate((zeros_to_prior, bt.cost)),
-                expense_year=np.concatenate((years_to_prior, bt.expense_year)).astype(int),
-                cost_allocation=fluid_to_prior + bt.cost_allocation,
-                tax_portion=np.concatenate((zeros_to_prior, bt.tax_portion)),
-                tax_discount=np.concatenate((zeros_to_prior, bt.tax_discount)),
-                final_year=np.concatenate((years_to_prior, bt.final_year)),
-                utilized_land_area=np.concatenate((zeros_to_prior, bt.utilized_land_area)),
-                utilized_building_area=np.concatenate((zeros_to_prior, bt.utilized_building_area)),
-                njop_land=np.concatenate((zeros_to_prior, bt.njop_land)),
-                njop_building=np.concatenate((zeros_to_prior, bt.njop_building)),
-                gross_revenue=np.concatenate((zeros_to_prior, bt.gross_revenue)),
-            )
-            for bt in self.contract2.lbt_cost
-        ]
-
-        # Parsing the attributes to the new object of contract
-        contract1_new = self._parse_dataclass(
-            contract=self.contract1,
-            start_date_trans=start_date_trans,
-            end_date_trans=end_date_trans,
-            lifting=tuple(new_lifting_1st),
-            capital=tuple(new_tang_1st),
-            intangible=tuple(new_intang_1st),
-            opex=tuple(new_opex_1st),
-            asr=tuple(new_asr_1st),
-            cost_of_sales=tuple(new_cost_of_sales_1st),
-            lbt=tuple(new_lbt_1st)
-        )
-
-        contract2_new = self._parse_dataclass(
-            contract=self.contract2,
-            start_date_trans=start_date_trans,
-            end_date_trans=end_date_trans,
-            lifting=tuple(new_lifting_2nd),
-            capital=tuple(new_tang_2nd),
-            intangible=tuple(new_intang_2nd),
-            opex=tuple(new_opex_2nd),
-            asr=tuple(new_asr_2nd),
-            cost_of_sales=tuple(new_cost_of_sales_2nd),
-            lbt=tuple(new_lbt_2nd)
-        )
 
         # Adjusting the contract arguments
         new_argument_contract1 = adjusting_contract_arguments(
@@ -663,12 +549,31 @@ class Transition:
             prior_rows=zeros_to_prior,
             post_rows=zeros_to_new,)
 
-        # Executing the new contract
-        # for i in self.argument_contract1.keys():
-        #     print(i, ': ', self.argument_contract1[i])
-        # input()
+        # Executing the new contract, the run of the first contract is retrieved from the cache
+        # when the first contract, its arguments and the transition timeline are unchanged
+        contract1_key = get_fingerprint((
+            type(self.contract1).__qualname__,
+            self.contract1,
+            new_argument_contract1,
+            start_date_trans,
+            end_date_trans,
+        ))
+        contract1_new = _get_cached_contract1_run(key=contract1_key)
+
+        if contract1_new is None:
+            contract1_new = self._get_aligned_contract(
+                contract=self.contract1,
+                start_date_trans=start_date_trans,
+                end_date_trans=end_date_trans,
+            )
+            contract1_new.run(**new_argument_contract1)
+            _store_contract1_run(key=contract1_key, contract=contract1_new)
 
-        contract1_new.run(**new_argument_contract1)
+        contract2_new = self._get_aligned_contract(
+            contract=self.contract2,
+            start_date_trans=start_date_trans,
+            end_date_trans=end_date_trans,
+        )
         contract2_new.run(**new_argument_contract2)
 
         # Defining the unrecoverable cost from the prior contract
@@ -682,41 +587,36 @@ class Transition:
         unrec_cost_prior[len(years_to_prior)] = latest_unrec
 
         # Calculating the Unrecoverable cost in the transitioned cashflow
+        zeros_trans = np.zeros_like(contract2_new.project_years, dtype=float)
         unrec_trans = psc_tools.get_unrecovered_cost(revenue=contract2_new._consolidated_taxable_income,
                                                      depreciation=unrec_cost_prior,
-                                                     non_capital=np.zeros_like(contract2_new.project_years,
-                                                                               dtype=float),
-                                                     ftp_ctr=np.zeros_like(contract2_new.project_years, dtype=float),
-                                                     ftp_gov=np.zeros_like(contract2_new.project_years, dtype=float),
-                                                     ic=np.zeros_like(contract2_new.project_years, dtype=float))
+                                                     non_capital=zeros_trans,
+                                                     ftp_ctr=zeros_trans,
+                                                     ftp_gov=zeros_trans,
+                                                     ic=zeros_trans)
 
         cost_to_be_recovered_trans = psc_tools.get_cost_to_be_recovered(unrecovered_cost=unrec_trans)
 
         cost_recovery_trans = CostRecovery._get_cost_recovery(
             revenue=contract2_new._consolidated_taxable_income,
-            ftp=np.zeros_like(contract2_new.project_years, dtype=float),
-            ic=np.zeros_like(contract2_new.project_years, dtype=float),
+            ftp=zeros_trans,
+            ic=zeros_trans,
             depreciation=unrec_cost_prior,
-            non_capital=np.zeros_like(contract2_new.project_years, dtype=float),
+            non_capital=zeros_trans,
             cost_to_be_recovered=cost_to_be_recovered_trans,
             cr_cap_rate=1.0)
 
         # Calculate taxable income after considering transferred unrecoverable cost from contract1
         taxable_income_trans = CostRecovery._get_ets_before_transfer(
             revenue=contract2_new._consolidated_taxable_income,
-            ftp_ctr=np.zeros_like(contract2_new.project_years,dtype=float),
-            ftp_gov=np.zeros_like(contract2_new.project_years,dtype=float),
-            ic=np.zeros_like(contract2_new.project_years,dtype=float),
+            ftp_ctr=zeros_trans,
+            ftp_gov=zeros_trans,
+            ic=zeros_trans,
             cost_recovery=cost_recovery_trans)
 
         # Calculate tax payment of adjusted taxable income
         tax_payment_transition = taxable_income_trans * contract2_new._tax_rate_arr
 
-        # Calculate new ctr net share
-        contract2_new._consolidated_ctr_net_share = (contract2_new._consolidated_taxable_income -
-                                                     (unrec_cost_prior * unrec_portion) -
-                                                     tax_payment_transition)
-
         # Calculate new cashflow of contract2
         contract2_new._consolidated_cashflow = (contract2_new._consolidated_cashflow +
                                                 contract2_new._consolidated_tax_payment -
@@ -730,6 +630,27 @@ class Transition:
 
         contract2_new._consolidated_tax_payment = tax_payment_transition
 
+        self._sub_contract_runs = {
+            "key": key,
+            "contract1": contract1_new,
+            "contract2": contract2_new,
+            "unrec_cost_prior": unrec_cost_prior,
+        }
+
+        return self._sub_contract_runs
+
+    def run(self, unrec_portion: float = 0.0):
+        sub_contract_runs = self._get_sub_contract_runs()
+
+        # The second contract is copied, as only its ctr net share depends on unrec_portion
+        contract1_new = sub_contract_runs["contract1"]
+        contract2_new = copy.copy(sub_contract_runs["contract2"])
+
+        # Calculate new ctr net share
+        contract2_new._consolidated_ctr_net_share = (contract2_new._consolidated_taxable_income -
+                                                     (sub_contract_runs["unrec_cost_prior"] * unrec_portion) -
+                                                     contract2_new._consolidated_tax_payment)
+
         # Parsing new contract to the attributes of Transition dataclass
         self._contract1_transitioned = contract1_new
         self._contract2_transitioned = contract2_new
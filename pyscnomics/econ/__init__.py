@@ -32,6 +32,7 @@ from .selection import (
     InflationAppliedTo,
     OptimizationParameter,
     OptimizationTarget,
+    OptimizationMethod,
     VariableSplit522017,
     VariableSplit082017
 )
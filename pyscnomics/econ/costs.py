@@ -9,9 +9,10 @@ The associated cost components are:
 (6) CostOfSales.
 """
 
+import copy
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
 import pyscnomics.econ.depreciation as depr
 from pyscnomics.econ.selection import (
@@ -22,10 +23,14 @@ from pyscnomics.econ.selection import (
 from pyscnomics.econ.costs_tools import (
     get_cost_adjustment_by_inflation,
     calc_indirect_tax,
-    calc_distributed_cost,
+    calc_distributed_cost_total,
 )
 
 
+# Attributes which describe the cost object as a whole, not the cost lines
+_SHARED_ATTRS = ("start_year", "end_year", "project_duration", "project_years")
+
+
 class GeneralCostException(Exception):
     """ Exception to be raised for an incorrect use of class GeneralCost """
 
@@ -283,6 +288,85 @@ class GeneralCost:
             year_inflation=year_inflation, inflation_rate=inflation_rate
         ) + self.indirect_taxes(tax_rate=tax_rate)
 
+    def take(self, index: np.ndarray | slice):
+        """
+        Select a subset of the cost lines without constructing a new instance.
+
+        The attributes of the instance are already prepared and validated upon
+        construction, hence the selected cost lines are taken as they are. Selecting
+        with a slice returns views of the arrays of this instance.
+
+        Parameters
+        ----------
+        index : np.ndarray | slice
+            The positions of the cost lines to be selected.
+
+        Returns
+        -------
+        GeneralCost
+            A copy of the instance holding only the selected cost lines.
+        """
+
+        taken = copy.copy(self)
+        rows = np.arange(len(self))[index]
+
+        for fld in fields(self):
+            if fld.name in _SHARED_ATTRS:
+                continue
+
+            value = getattr(self, fld.name)
+            if isinstance(value, np.ndarray) and value.ndim > 0:
+                setattr(taken, fld.name, value[index])
+
+            elif isinstance(value, list):
+                setattr(
+                    taken,
+                    fld.name,
+                    value[index] if isinstance(index, slice) else [value[i] for i in rows],
+                )
+
+        return taken
+
+    def align(self, start_year: int, end_year: int):
+        """
+        Place the cost lines on a wider project timeline without constructing a new instance.
+
+        The cost lines are aggregated by their expense year relative to the start year,
+        hence only the attributes describing the project timeline have to be changed.
+        The arrays of the cost lines are shared with this instance.
+
+        Parameters
+        ----------
+        start_year : int
+            The start year of the new project timeline.
+        end_year : int
+            The end year of the new project timeline.
+
+        Returns
+        -------
+        GeneralCost
+            A copy of the instance placed on the new project timeline.
+
+        Raises
+        ------
+        GeneralCostException
+            If the new project timeline does not cover the current one.
+        """
+
+        if start_year > self.start_year or end_year < self.end_year:
+            raise GeneralCostException(
+                f"The project timeline ({start_year} - {end_year}) does not cover "
+                f"the current project timeline ({self.start_year} - {self.end_year})"
+            )
+
+        aligned = copy.copy(self)
+        aligned.start_year = start_year
+        aligned.end_year = end_year
+        aligned.project_duration = end_year - start_year + 1
+        aligned.project_years = np.arange(start_year, end_year + 1, 1)
+
+        return aligned
+
     def __len__(self):
         return len(self.expense_year)
 
@@ -695,7 +779,9 @@ class CapitalCost(GeneralCost):
         (2) Prior to the core calculations, attribute 'cost' is adjusted by tax
             and inflation schemes (if any),
         (3) The depreciation charges are aligned with the corresponding periods
-            based on pis_year.
+            based on pis_year,
+        (4) The charges which fall after the end of the project are summed up as
+            the undepreciated asset.
         """
 
         # Cost adjustment due to inflation and tax
@@ -717,60 +803,34 @@ class CapitalCost(GeneralCost):
             tax_discount=self.tax_discount,
         )
 
-        # Calculate depreciation
+        # Calculate depreciation charges of all assets, as a matrix
+        # of shape (number of assets, number of periods)
         # Depreciation method is straight line
         if depr_method == DeprMethod.SL:
-            depreciation_charge = np.array(
-                [
-                    depr.straight_line_depreciation_rate(
-                        cost=c,
-                        salvage_value=sv,
-                        useful_life=ul,
-                        depreciation_len=self.project_duration,
-                    )
-                    for c, sv, ul in zip(
-                        cost_adjusted,
-                        self.salvage_value,
-                        self.useful_life,
-                    )
-                ]
+            depreciation_charge = depr.straight_line_depreciation_matrix(
+                cost=cost_adjusted,
+                salvage_value=self.salvage_value,
+                useful_life=self.useful_life,
+                depreciation_len=self.project_duration,
             )
 
         # Depreciation method is declining balance
         elif depr_method == DeprMethod.DB:
-            depreciation_charge = np.array(
-                [
-                    depr.declining_balance_depreciation_rate(
-                        cost=c,
-                        salvage_value=sv,
-                        useful_life=ul,
-                        decline_factor=decline_factor,
-                        depreciation_len=self.project_duration,
-                    )
-                    for c, sv, ul in zip(
-                        cost_adjusted,
-                        self.salvage_value,
-                        self.useful_life,
-                    )
-                ]
+            depreciation_charge = depr.declining_balance_depreciation_matrix(
+                cost=cost_adjusted,
+                salvage_value=self.salvage_value,
+                useful_life=self.useful_life,
+                decline_factor=decline_factor,
+                depreciation_len=self.project_duration,
             )
 
         # Depreciation method is PSC declining balance
         elif depr_method == DeprMethod.PSC_DB:
-            depreciation_charge = np.array(
-                [
-                    depr.psc_declining_balance_depreciation_rate(
-                        cost=c,
-                        depreciation_factor=dr,
-                        useful_life=ul,
-                        depreciation_len=self.project_duration,
-                    )
-                    for c, dr, ul in zip(
-                        cost_adjusted,
-                        self.depreciation_factor,
-                        self.useful_life,
-                    )
-                ]
+            depreciation_charge = depr.psc_declining_balance_depreciation_matrix(
+                cost=cost_adjusted,
+                depreciation_factor=self.depreciation_factor,
+                useful_life=self.useful_life,
+                depreciation_len=self.project_duration,
             )
 
         else:
@@ -778,40 +838,16 @@ class CapitalCost(GeneralCost):
                 f"Depreciation method ({depr_method}) is not recognized"
             )
 
-        # The relative difference of pis_year and start_year
-        shift_indices = self.pis_year - self.start_year
-
-        overdue = (self.pis_year + self.useful_life - self.end_year - 1).astype(int)
-
-        if np.any(overdue > 0):
-
-            # Some assets have not been fully depreciated by the end of the project.
-            # These assets are overdue by {overdue[overdue > 0]} years.
-            is_overdue = overdue > 0
-            max_overdue = int(np.max(overdue[is_overdue]))
-            overdue_depr_charge = [
-                np.concatenate((row[-i:-i+o], np.zeros(max_overdue-o))) if i > 0
-                else row for row, i, o in zip(depreciation_charge, shift_indices, overdue)
-            ]
-            overdue_depr_charge = np.asarray(overdue_depr_charge)[is_overdue]
-
-        else:
-            overdue_depr_charge = np.zeros([1, 1])
-
-        # Modify depreciation_charge so that expenditures are aligned with
-        # the corresponding pis_year (or expense_year)
-        depreciation_charge = np.array(
-            [
-                np.concatenate((np.zeros(i), row[:-i])) if i > 0 else row
-                for row, i in zip(depreciation_charge, shift_indices)
-            ]
+        # Align depreciation charges with the corresponding pis_year, whose
+        # relative difference to start_year is an index offset. Charges of assets
+        # which have not been fully depreciated by the end of the project make up
+        # the undepreciated asset.
+        total_depreciation_charge, undepreciated_asset = depr.get_depreciation_schedule(
+            depreciation_charge=depreciation_charge,
+            shift=self.pis_year - self.start_year,
+            depreciation_len=self.project_duration,
         )
 
-        # Calculate total depreciation charge and undepreciated asset
-        total_depreciation_charge = depreciation_charge.sum(axis=0)
-        undepreciated_asset = overdue_depr_charge.sum(axis=0)
-        # undepreciated_asset = np.sum(cost_adjusted) - np.sum(total_depreciation_charge)
-
         return total_depreciation_charge, undepreciated_asset
 
     def total_depreciation_book_value(
@@ -872,13 +908,19 @@ class CapitalCost(GeneralCost):
         )[0]
 
         # Calculate total depreciation book value
-        return np.cumsum(
+        cumulative_expenditures = np.cumsum(
             self.expenditures_post_tax(
                 year_inflation=year_inflation,
                 inflation_rate=inflation_rate,
                 tax_rate=tax_rate,
             )
-        ) - np.cumsum(total_depreciation_charge)
+        )
+        book_value = cumulative_expenditures - np.cumsum(total_depreciation_charge)
+
+        # Snap the rounding residue of fully depreciated assets to zero,
+        # relative to the asset cost so that it holds in any cost units
+        residue = 1.0e-9 * np.max(np.abs(cumulative_expenditures), initial=0.0)
+        return np.where(np.isclose(book_value, 0.0, rtol=0.0, atol=residue), 0.0, book_value)
 
     def __eq__(self, other):
         # Between two instances of CapitalCost
@@ -972,6 +1014,54 @@ class CapitalCost(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "CapitalCost":
+        """
+        Combine an iterable of CapitalCost instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of CapitalCost to be combined.
+
+        Returns
+        -------
+        CapitalCost
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise CapitalException("Must provide at least one instance of CapitalCost to concat")
+
+        for cst in costs:
+            if not isinstance(cst, CapitalCost):
+                raise CapitalException(
+                    f"Must concat instances of CapitalCost. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of CapitalCost."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            cost=np.concatenate([cst.cost for cst in costs]),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+            pis_year=np.concatenate([cst.pis_year for cst in costs]),
+            salvage_value=np.concatenate([cst.salvage_value for cst in costs]),
+            useful_life=np.concatenate([cst.useful_life for cst in costs]),
+            depreciation_factor=np.concatenate([cst.depreciation_factor for cst in costs]),
+            is_ic_applied=[item for cst in costs for item in cst.is_ic_applied],
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of CapitalCost
         # and another instance of CapitalCost
@@ -1445,6 +1535,49 @@ class Intangible(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "Intangible":
+        """
+        Combine an iterable of Intangible instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of Intangible to be combined.
+
+        Returns
+        -------
+        Intangible
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise IntangibleException("Must provide at least one instance of Intangible to concat")
+
+        for cst in costs:
+            if not isinstance(cst, Intangible):
+                raise IntangibleException(
+                    f"Must concat instances of Intangible. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of Intangible."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            cost=np.concatenate([cst.cost for cst in costs]),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of Intangible
         # and another instance of Intangible
@@ -1958,6 +2091,51 @@ class OPEX(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "OPEX":
+        """
+        Combine an iterable of OPEX instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of OPEX to be combined.
+
+        Returns
+        -------
+        OPEX
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise OPEXException("Must provide at least one instance of OPEX to concat")
+
+        for cst in costs:
+            if not isinstance(cst, OPEX):
+                raise OPEXException(
+                    f"Must concat instances of OPEX. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of OPEX."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            fixed_cost=np.concatenate([cst.fixed_cost for cst in costs]),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+            prod_rate=np.concatenate([cst.prod_rate for cst in costs]),
+            cost_per_volume=np.concatenate([cst.cost_per_volume for cst in costs]),
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of OPEX
         # and another instance of OPEX
@@ -2467,8 +2645,9 @@ class ASR(GeneralCost):
         -   The method first calculates the future cost using the `_calc_future_cost` method.
         -   It adjusts the future cost for inflation using `get_cost_adjustment_by_inflation`,
             which accounts for inflation rates across the project's duration.
-        -   Finally, it distributes the adjusted cost using `calc_distributed_cost`, summing
-            the distributed costs for each year to provide the total pre-tax expenditures.
+        -   Finally, it distributes the adjusted cost using `calc_distributed_cost_total`,
+            which sums the distributed costs for each year to provide the total pre-tax
+            expenditures.
         """
 
         # Calculate future cost
@@ -2486,7 +2665,7 @@ class ASR(GeneralCost):
         )
 
         # Calculate distributed cost
-        distributed_cost = calc_distributed_cost(
+        return calc_distributed_cost_total(
             cost=cost_adjusted_by_inflation,
             expense_year=self.expense_year,
             final_year=self.final_year,
@@ -2494,8 +2673,6 @@ class ASR(GeneralCost):
             project_duration=self.project_duration,
         )
 
-        return np.sum(distributed_cost, axis=1, keepdims=False)
-
     def indirect_taxes(self, tax_rate: np.ndarray | float = 0.0) -> np.ndarray:
         """
         Calculate and distribute indirect taxes over the project duration.
@@ -2522,7 +2699,7 @@ class ASR(GeneralCost):
         -   It calculates the indirect tax using `calc_indirect_tax`, which applies the
             tax portion, tax rate, and tax discount.
         -   The method then distributes the calculated taxes across the project's timeline
-            using `calc_distributed_cost`.
+            using `calc_distributed_cost_total`.
         -   The final result is the sum of the distributed taxes for each project year.
         """
 
@@ -2541,7 +2718,7 @@ class ASR(GeneralCost):
         )
 
         # Calculate distributed indirect taxes
-        distributed_taxes = calc_distributed_cost(
+        return calc_distributed_cost_total(
             cost=indirect_tax,
             expense_year=self.expense_year,
             final_year=self.final_year,
@@ -2549,8 +2726,6 @@ class ASR(GeneralCost):
             project_duration=self.project_duration,
         )
 
-        return np.sum(distributed_taxes, axis=1, keepdims=False)
-
     def __eq__(self, other):
         # Between two instances of ASR
         if isinstance(other, ASR):
@@ -2640,6 +2815,51 @@ class ASR(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "ASR":
+        """
+        Combine an iterable of ASR instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of ASR to be combined.
+
+        Returns
+        -------
+        ASR
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise ASRException("Must provide at least one instance of ASR to concat")
+
+        for cst in costs:
+            if not isinstance(cst, ASR):
+                raise ASRException(
+                    f"Must concat instances of ASR. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of ASR."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            cost=np.concatenate([cst.cost for cst in costs]),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+            final_year=np.concatenate([cst.final_year for cst in costs]),
+            future_rate=np.concatenate([cst.future_rate for cst in costs]),
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of ASR
         # and another instance of ASR
@@ -3246,7 +3466,7 @@ class LBT(GeneralCost):
         -   The method first adjusts future costs using the `get_cost_adjustment_by_inflation`
             function, which applies inflation rates based on the provided parameters.
         -   It then calculates the distributed costs across the project's timeline using
-            `calc_distributed_cost`.
+            `calc_distributed_cost_total`.
         -   The final result is the sum of the distributed costs for each project year.
         """
 
@@ -3262,7 +3482,7 @@ class LBT(GeneralCost):
         )
 
         # Calculate distributed cost
-        distributed_cost = calc_distributed_cost(
+        return calc_distributed_cost_total(
             cost=cost_adjusted_by_inflation,
             expense_year=self.expense_year,
             final_year=self.final_year,
@@ -3270,8 +3490,6 @@ class LBT(GeneralCost):
             project_duration=self.project_duration,
         )
 
-        return np.sum(distributed_cost, axis=1, keepdims=False)
-
     def indirect_taxes(self, tax_rate: np.ndarray | float = 0.0) -> np.ndarray:
         """
         Calculate and distribute indirect taxes over the project duration.
@@ -3297,7 +3515,7 @@ class LBT(GeneralCost):
         -   The indirect tax is first calculated using the `calc_indirect_tax` function, which
             applies the specified tax rate, portion, and discount to the project's costs.
         -   The calculated taxes are then distributed over the project timeline using the
-            `calc_distributed_cost` function.
+            `calc_distributed_cost_total` function.
         -   The final result is the sum of distributed indirect taxes for each year in
             the project timeline.
         """
@@ -3314,7 +3532,7 @@ class LBT(GeneralCost):
         )
 
         # Calculate distributed indirect taxes
-        distributed_taxes = calc_distributed_cost(
+        return calc_distributed_cost_total(
             cost=indirect_tax,
             expense_year=self.expense_year,
             final_year=self.final_year,
@@ -3322,8 +3540,6 @@ class LBT(GeneralCost):
             project_duration=self.project_duration,
         )
 
-        return np.sum(distributed_taxes, axis=1, keepdims=False)
-
     def __eq__(self, other):
         # Between two instances of LBT
         if isinstance(other, LBT):
@@ -3417,6 +3633,55 @@ class LBT(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "LBT":
+        """
+        Combine an iterable of LBT instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of LBT to be combined.
+
+        Returns
+        -------
+        LBT
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise LBTException("Must provide at least one instance of LBT to concat")
+
+        for cst in costs:
+            if not isinstance(cst, LBT):
+                raise LBTException(
+                    f"Must concat instances of LBT. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of LBT."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+            final_year=np.concatenate([cst.final_year for cst in costs]),
+            utilized_land_area=np.concatenate([cst.utilized_land_area for cst in costs]),
+            utilized_building_area=np.concatenate([cst.utilized_building_area for cst in costs]),
+            njop_land=np.concatenate([cst.njop_land for cst in costs]),
+            njop_building=np.concatenate([cst.njop_building for cst in costs]),
+            gross_revenue=np.concatenate([cst.gross_revenue for cst in costs]),
+            cost=np.concatenate([cst.cost for cst in costs]),
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of LBT
         # and another instance of LBT
@@ -3909,6 +4174,51 @@ class CostOfSales(GeneralCost):
                 f"CapitalCost/Intangible/OPEX/ASR/LBT/CostOfSales, an integer, or a float."
             )
 
+    @classmethod
+    def concat(cls, costs) -> "CostOfSales":
+        """
+        Combine an iterable of CostOfSales instances into a single instance.
+
+        The result is equal to summing the instances one by one, but every
+        attribute is concatenated once and validated once, so the cost of the
+        combination grows linearly with the number of cost lines.
+
+        Parameters
+        ----------
+        costs: iterable
+            The instances of CostOfSales to be combined.
+
+        Returns
+        -------
+        CostOfSales
+            The combined instance.
+        """
+        costs = tuple(costs)
+
+        if len(costs) == 0:
+            raise CostOfSalesException(
+                "Must provide at least one instance of CostOfSales to concat"
+            )
+
+        for cst in costs:
+            if not isinstance(cst, CostOfSales):
+                raise CostOfSalesException(
+                    f"Must concat instances of CostOfSales. "
+                    f"{cst}({cst.__class__.__qualname__}) is not an instance of CostOfSales."
+                )
+
+        return cls(
+            start_year=min(cst.start_year for cst in costs),
+            end_year=max(cst.end_year for cst in costs),
+            cost_allocation=[item for cst in costs for item in cst.cost_allocation],
+            cost_type=[item for cst in costs for item in cst.cost_type],
+            description=[item for cst in costs for item in cst.description],
+            tax_portion=np.concatenate([cst.tax_portion for cst in costs]),
+            tax_discount=np.concatenate([cst.tax_discount for cst in costs]),
+            expense_year=np.concatenate([cst.expense_year for cst in costs]),
+            cost=np.concatenate([cst.cost for cst in costs]),
+        )
+
     def __add__(self, other):
         # Only allows addition between an instance of CostOfSales
         # and another instance of CostOfSales
@@ -3,6 +3,7 @@ Collection of functions to carry out some operations related to module costs.py
 """
 
 import numpy as np
+from functools import lru_cache
 
 
 class TaxInflationException(Exception):
@@ -149,6 +150,7 @@ def get_cost_adjustment_by_inflation(
         The inflation rate(s) for the project period. If a single float is provided,
         it applies uniformly across all years; otherwise, an array of rates for
         each year should be given.
+        A 2D array provides a batch of inflation scenarios, one per row.
 
     Returns
     -------
@@ -169,9 +171,14 @@ def get_cost_adjustment_by_inflation(
     (3) Parameter 'id_end' configure the index location of 'expense_year' in array
         'project_years' based on the associated 'year_inflation'. The result is then
         added by unity. This parameter sets up the second index to slice the 'inflation_rate_arr',
-    (4) Slice 'inflation_rate_arr' according to 'id_start' and 'id_end'. Add the results
-        by unity, then multiple the associated elements.
+    (4) Gather the multipliers from a table whose element [id_start, id_end] is the
+        product of (1 + 'inflation_rate_arr') over the indices id_start to id_end - 1.
+        The table is computed once per inflation series and cached,
     (5) Cost adjustment is undertaken by multiplication: 'cost' * 'mult'.
+
+    A batch of inflation scenarios can be provided as a 2D array 'inflation_rate'
+    of shape (n_scenarios, project duration), which returns the adjusted costs as
+    an array of shape (n_scenarios, number of costs).
     """
 
     # Prepare attribute year_inflation
@@ -208,35 +215,95 @@ def get_cost_adjustment_by_inflation(
             f"of the project ({end_year})"
         )
 
-    # Create an array of inflation_rate
-    inflation_rate_arr = check_input(target_func=project_years, param=inflation_rate)
+    # Create an array of inflation_rate, or a 2D array for a batch of scenarios
+    if isinstance(inflation_rate, np.ndarray) and inflation_rate.ndim == 2:
+        if inflation_rate.shape[1] != len(project_years):
+            raise TaxInflationException(
+                f"Unequal length of arrays: "
+                f"inflation_rate: ({inflation_rate.shape[1]}), "
+                f"project_years: ({len(project_years)})"
+            )
+        inflation_rate_arr = inflation_rate
+
+    else:
+        inflation_rate_arr = check_input(target_func=project_years, param=inflation_rate)
+
+    inflation_rate_arr = np.ascontiguousarray(inflation_rate_arr, dtype=np.float64)
 
     # Specify the start and end indices to slice the inflation rate array
-    id_start = (
-        np.array(
-            [
-                np.argwhere(year_inflation[i] == project_years).ravel()
-                for i, _ in enumerate(year_inflation)
-            ]
-        ).ravel()
-        + 1
-    ).astype(np.int64)
+    id_start = np.searchsorted(project_years, year_inflation).astype(np.int64) + 1
 
-    id_end = (
-        (expense_year - year_inflation) + (year_inflation - start_year) + 1
+    id_end = np.clip(
+        (expense_year - year_inflation) + (year_inflation - start_year) + 1,
+        0,
+        len(project_years),
     ).astype(np.int64)
 
-    # Multipliers to adjust cost by inflation
-    mult = np.array(
-        [
-            np.prod(1.0 + inflation_rate_arr[id_start[i] : id_end[i]])
-            for i, _ in enumerate(id_start)
-        ]
-    )
+    # Multipliers to adjust cost by inflation, gathered from the table of
+    # cumulative inflation between any two indices of the project years.
+    # Only the table of a single series is cached, batches of scenarios are
+    # large and seldom repeated.
+    if inflation_rate_arr.ndim == 1:
+        table = _get_inflation_table(rates=inflation_rate_arr.tobytes())
+    else:
+        table = _build_inflation_table(rates=inflation_rate_arr)
+    mult = table[..., id_start, id_end]
 
     return cost * mult
 
 
+@lru_cache(maxsize=256)
+def _get_inflation_table(rates: bytes) -> np.ndarray:
+    """
+    Get the table of cumulative inflation multipliers of an inflation series,
+    cached per series, hence read-only.
+
+    Parameters
+    ----------
+    rates : bytes
+        The buffer of the float64 array of inflation rates, of shape (n_years,).
+
+    Returns
+    -------
+    np.ndarray
+        The table of multipliers, of shape (n_years + 1, n_years + 1).
+    """
+
+    table = _build_inflation_table(rates=np.frombuffer(rates, dtype=np.float64))
+    table.flags.writeable = False
+
+    return table
+
+
+def _build_inflation_table(rates: np.ndarray) -> np.ndarray:
+    """
+    Create the table of cumulative inflation multipliers of inflation series.
+
+    Element [i, j] of the table is the product of (1 + inflation rate) over
+    the indices i to j - 1, or unity if j <= i.
+
+    Parameters
+    ----------
+    rates : np.ndarray
+        The inflation rates, of shape (n_years,) or (n_scenarios, n_years).
+
+    Returns
+    -------
+    np.ndarray
+        The table of multipliers, of shape (n_years + 1, n_years + 1) or
+        (n_scenarios, n_years + 1, n_years + 1).
+    """
+
+    growth = 1.0 + rates
+    n_years = rates.shape[-1]
+
+    table = np.ones(rates.shape[:-1] + (n_years + 1, n_years + 1), dtype=np.float64)
+    for i in range(n_years):
+        table[..., i, i + 1:] = np.cumprod(growth[..., i:], axis=-1)
+
+    return table
+
+
 def apply_cost_adjustment(
     start_year: int,
     cost: np.ndarray,
@@ -442,6 +509,120 @@ def calc_distributed_cost(
         the final year for each element.
     """
 
+    cost_split, id_start, id_end = _get_distribution_indices(
+        cost=cost,
+        expense_year=expense_year,
+        final_year=final_year,
+        project_years=project_years,
+        project_duration=project_duration,
+    )
+
+    # Distributed values for each cost elements
+    rows = np.arange(project_duration)[:, np.newaxis]
+    is_distributed = (rows >= id_start) & (rows < id_end)
+
+    return np.where(is_distributed, cost_split, 0.0)
+
+
+def calc_distributed_cost_total(
+    cost: np.ndarray,
+    expense_year: np.ndarray,
+    final_year: np.ndarray,
+    project_years: np.ndarray,
+    project_duration: int,
+) -> np.ndarray:
+    """
+    Distribute the cost evenly over the project duration and sum over the elements.
+
+    The result equals the sum over the columns of `calc_distributed_cost`, without
+    the dense matrix of shape (project_duration, number of elements). Each element
+    adds its decomposed value to a difference array at its start index and removes
+    it at its end index, so that the yearly total is the cumulative sum of the
+    difference array.
+
+    Parameters
+    ----------
+    cost : np.ndarray
+        The total cost for each element. Must be a 1D array of floats.
+    expense_year : np.ndarray
+        The year in which each cost element is incurred. Must be a 1D array of integers.
+    final_year : np.ndarray
+        The final year for each cost element to be distributed. Must be a 1D array of integers.
+    project_years : np.ndarray
+        The array of project years used to index the distribution. Must be a 1D array of integers.
+    project_duration : int
+        The total duration of the project in years.
+
+    Returns
+    -------
+    np.ndarray
+        The distributed cost of all elements for each project year.
+
+    Notes
+    -----
+    Years in which no element is being distributed are set to exactly zero, so that
+    the rounding of the cumulative sum does not leave residuals after the final years.
+    """
+
+    cost_split, id_start, id_end = _get_distribution_indices(
+        cost=cost,
+        expense_year=expense_year,
+        final_year=final_year,
+        project_years=project_years,
+        project_duration=project_duration,
+    )
+
+    # Elements with an empty distribution period are not distributed
+    is_distributed = id_end > id_start
+    cost_split = cost_split[is_distributed]
+    id_start = id_start[is_distributed]
+    id_end = id_end[is_distributed]
+
+    # Difference arrays of the distributed values and of the number of elements
+    length = project_duration + 1
+    distributed_cost = np.cumsum(
+        np.bincount(id_start, weights=cost_split, minlength=length)
+        - np.bincount(id_end, weights=cost_split, minlength=length)
+    )[:project_duration]
+
+    elements_count = np.cumsum(
+        np.bincount(id_start, minlength=length) - np.bincount(id_end, minlength=length)
+    )[:project_duration]
+
+    return np.where(elements_count > 0, distributed_cost, 0.0)
+
+
+def _get_distribution_indices(
+    cost: np.ndarray,
+    expense_year: np.ndarray,
+    final_year: np.ndarray,
+    project_years: np.ndarray,
+    project_duration: int,
+) -> tuple:
+    """
+    Prepare the decomposed values and the start and end indices of cost elements
+    to be distributed evenly from their expense years to their final years.
+
+    Parameters
+    ----------
+    cost : np.ndarray
+        The total cost for each element.
+    expense_year : np.ndarray
+        The year in which each cost element is incurred.
+    final_year : np.ndarray
+        The final year for each cost element to be distributed.
+    project_years : np.ndarray
+        The array of project years used to index the distribution.
+    project_duration : int
+        The total duration of the project in years.
+
+    Returns
+    -------
+    tuple
+        The decomposed value, the start index and the end index (clipped to the
+        project duration) of each cost element.
+    """
+
     # Prepare attribute cost
     if not isinstance(cost, np.ndarray):
         raise TaxInflationException(
@@ -470,22 +651,11 @@ def calc_distributed_cost(
     years_to_split = (final_year - expense_year + 1).astype(int)
 
     # Decomposed values for each cost elements
-    cost_split = cost / years_to_split
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cost_split = cost / years_to_split
 
     # The start and end indices to distribute each cost elements
-    id_start = np.array(
-        [
-            np.argwhere(expense_year[i] == project_years).ravel()
-            for i, _ in enumerate(expense_year)
-        ]
-    ).ravel()
-
-    id_end = (id_start + years_to_split).astype(int)
-
-    # Distributed values for each cost elements
-    distributed_cost = np.zeros([project_duration, len(expense_year)], dtype=np.float64)
-
-    for i, _ in enumerate(expense_year):
-        distributed_cost[id_start[i] : id_end[i], i] = cost_split[i]
+    id_start = np.searchsorted(project_years, expense_year).astype(int)
+    id_end = np.clip(id_start + years_to_split, 0, project_duration).astype(int)
 
-    return distributed_cost
+    return cost_split, id_start, id_end
@@ -57,16 +57,12 @@ def straight_line_depreciation_rate(
     is extended with zero values for the additional periods.
     """
 
-    depreciation_rate = (cost - salvage_value) / useful_life
-    depreciation_charge = np.repeat(depreciation_rate, useful_life)
-
-    # Extend the depreciation charge array beyond useful life if needed
-    if depreciation_len > useful_life:
-        extension = np.zeros(int(depreciation_len - useful_life))
-        depreciation_charge = np.concatenate((depreciation_charge, extension))
-
-    return depreciation_charge
-
+    return straight_line_depreciation_matrix(
+        cost=np.array([cost]),
+        salvage_value=np.array([salvage_value]),
+        useful_life=np.array([useful_life]),
+        depreciation_len=depreciation_len,
+    )[0]
 
 def straight_line_book_value(
     cost: float,
@@ -158,63 +154,13 @@ def declining_balance_depreciation_rate(
     - If `depreciation_len` is greater than `useful_life`, the schedule is extended with zeros.
     """
 
-    # Exponent value
-    periods = np.arange(1, int(useful_life), 1, dtype=np.int64)
-
-    # Depreciation factor
-    depreciation_factor = decline_factor / useful_life
-
-    # Depreciation charge
-    depreciation_charge = (
-        depreciation_factor * cost * np.power(1 - depreciation_factor, periods - 1)
-    )
-
-    # Depreciation charge reaches the salvage value
-    if depreciation_charge.sum() > (cost - salvage_value):
-        remaining_depreciation = cost - salvage_value - np.cumsum(depreciation_charge)
-        remaining_depreciation_modified = np.where(
-            remaining_depreciation < 0, 0, remaining_depreciation
-        )
-        remaining_depreciation_unique_sum = np.sum(
-            np.unique(remaining_depreciation_modified)
-        )
-
-        # Depreciation charge is paid off since the first year
-        if remaining_depreciation_unique_sum == 0:
-            depreciation_charge_new = np.zeros_like(depreciation_charge)
-            depreciation_charge_new[0] = (
-                depreciation_charge[0] + remaining_depreciation[0]
-            )
-            depreciation_charge = depreciation_charge_new.copy()
-
-        # Depreciation charge is paid off after the first year
-        elif remaining_depreciation_unique_sum > 0:
-            idx = np.argmin(remaining_depreciation_modified)
-            depreciation_charge[idx] = remaining_depreciation[idx - 1]
-            depreciation_charge[idx + 1:] = 0
-
-        else:
-            raise DepreciationException(
-                f"Cannot have a negative value in variable remaining_depreciation_unique_sum: "
-                f"{remaining_depreciation_unique_sum}"
-            )
-
-    # Add the remaining charge as the last element of depreciation_charge array
-    depreciation_charge = np.concatenate(
-        (
-            depreciation_charge,
-            cost - salvage_value - np.sum(depreciation_charge, keepdims=True),
-        )
-    )
-
-    # Extend the depreciation charge array beyond useful life if
-    # project duration is longer than useful life
-    if depreciation_len > useful_life:
-        extension = np.zeros(int(depreciation_len - useful_life))
-        depreciation_charge = np.concatenate((depreciation_charge, extension))
-
-    return depreciation_charge
-
+    return declining_balance_depreciation_matrix(
+        cost=np.array([cost]),
+        salvage_value=np.array([salvage_value]),
+        useful_life=np.array([useful_life]),
+        decline_factor=decline_factor,
+        depreciation_len=depreciation_len,
+    )[0]
 
 def declining_balance_book_value(
     cost: float,
@@ -311,32 +257,12 @@ def psc_declining_balance_depreciation_rate(
     concept of psc declining balance.
     """
 
-    if depreciation_factor > 1 or depreciation_factor < 0:
-        raise DepreciationException(
-            f"The value of depreciation_factor must fall within the following interval: "
-            f"0 <= depreciation_factor <= 1"
-        )
-
-    # Create an array of exponents
-    periods = np.arange(1, int(useful_life), 1, dtype=np.int64)
-
-    # Calculate depreciation charge
-    depreciation_charge = (
-        depreciation_factor * cost * np.power(1 - depreciation_factor, periods - 1)
-    )
-
-    # Modify depreciation charge; specify the last element as the remaining cost
-    depreciation_charge = np.concatenate(
-        (depreciation_charge, cost - np.sum(depreciation_charge, keepdims=True))
-    )
-
-    # Modify depreciation charge; accounting for project duration
-    if depreciation_len > len(depreciation_charge):
-        extension = np.zeros(int(depreciation_len - len(depreciation_charge)))
-        depreciation_charge = np.concatenate((depreciation_charge, extension))
-
-    return depreciation_charge
-
+    return psc_declining_balance_depreciation_matrix(
+        cost=np.array([cost]),
+        useful_life=np.array([useful_life]),
+        depreciation_factor=depreciation_factor,
+        depreciation_len=depreciation_len,
+    )[0]
 
 def psc_declining_balance_book_value(
     cost: float,
@@ -389,6 +315,300 @@ def psc_declining_balance_book_value(
     return book_value
 
 
+def _get_periods_matrix(
+    useful_life: np.ndarray, depreciation_len: int = 0
+) -> tuple:
+    """
+    Prepare the period indices shared by the depreciation matrices.
+
+    Parameters
+    ----------
+    useful_life : np.ndarray
+        The useful life of each asset.
+    depreciation_len : int, optional
+        The minimum number of periods of the matrices. (default: 0)
+
+    Returns
+    -------
+    tuple
+        The useful life of each asset as integers (as a column) and the
+        period indices (as a row) of the matrices.
+    """
+
+    useful_life = np.asarray(useful_life).astype(np.int64).reshape(-1, 1)
+    n_periods = max(int(depreciation_len), int(np.max(useful_life, initial=0)))
+
+    return useful_life, np.arange(n_periods, dtype=np.int64)[np.newaxis, :]
+
+
+def _limit_depreciation_charge(
+    depreciation_charge: np.ndarray, limit: np.ndarray, is_valid: np.ndarray
+) -> np.ndarray:
+    """
+    Limit the cumulative depreciation charges of each row to a depreciable amount.
+
+    For each row whose charges exceed the limit, the charges are paid off at the
+    first period in which the remaining depreciable amount is exhausted: that
+    period takes the remaining amount of the previous period and the subsequent
+    periods are set to zero. If the limit is already exhausted at the first
+    period, the whole amount is charged at the first period.
+
+    Parameters
+    ----------
+    depreciation_charge : np.ndarray
+        The depreciation charges, of shape (n_assets, n_periods).
+    limit : np.ndarray
+        The depreciable amount of each asset.
+    is_valid : np.ndarray
+        The mask of the periods to be considered for each asset.
+
+    Returns
+    -------
+    np.ndarray
+        The limited depreciation charges.
+    """
+
+    limit = np.asarray(limit, dtype=np.float64).reshape(-1)
+    exceeds = np.cumsum(depreciation_charge, axis=1)[:, -1] > limit
+
+    if not np.any(exceeds):
+        return depreciation_charge
+
+    remaining = limit[:, np.newaxis] - np.cumsum(depreciation_charge, axis=1)
+    remaining_modified = np.where(remaining < 0, 0, remaining)
+
+    # Depreciation charge is paid off since the first period
+    is_paid_first = exceeds & ~np.any(is_valid & (remaining_modified > 0), axis=1)
+
+    # Depreciation charge is paid off after the first period
+    idx = np.argmin(np.where(is_valid, remaining_modified, np.inf), axis=1)
+    idx_previous = np.where(idx > 0, idx - 1, is_valid.sum(axis=1) - 1)
+    rows = np.arange(depreciation_charge.shape[0])
+    periods = np.arange(depreciation_charge.shape[1])[np.newaxis, :]
+
+    paid_off = np.where(periods < idx[:, np.newaxis], depreciation_charge, 0.0)
+    paid_off[rows, idx] = remaining[rows, idx_previous]
+
+    paid_first = np.zeros_like(depreciation_charge)
+    paid_first[:, 0] = depreciation_charge[:, 0] + remaining[:, 0]
+
+    return np.where(
+        exceeds[:, np.newaxis],
+        np.where(is_paid_first[:, np.newaxis], paid_first, paid_off),
+        depreciation_charge,
+    )
+
+
+def straight_line_depreciation_matrix(
+    cost: np.ndarray,
+    salvage_value: np.ndarray,
+    useful_life: np.ndarray,
+    depreciation_len: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the straight-line depreciation charges of several assets at once.
+
+    Parameters
+    ----------
+    cost : np.ndarray
+        Cost of each asset.
+    salvage_value : np.ndarray
+        Remaining value of each asset after depreciation.
+    useful_life : np.ndarray
+        Duration for depreciation of each asset.
+    depreciation_len : int, optional
+        Minimum number of periods of the depreciation charges. (default: 0)
+
+    Returns
+    -------
+    np.ndarray
+        The depreciation charges, of shape (n_assets, n_periods), where
+        n_periods is the larger of depreciation_len and the longest useful life.
+        Row i equals `straight_line_depreciation_rate` of asset i, extended
+        with zeros.
+    """
+
+    cost = np.asarray(cost, dtype=np.float64).reshape(-1, 1)
+    salvage_value = np.asarray(salvage_value, dtype=np.float64).reshape(-1, 1)
+    depreciation_rate = (cost - salvage_value) / np.reshape(useful_life, (-1, 1))
+
+    useful_life, periods = _get_periods_matrix(useful_life, depreciation_len)
+
+    return np.where(periods < useful_life, depreciation_rate, 0.0)
+
+
+def declining_balance_depreciation_matrix(
+    cost: np.ndarray,
+    salvage_value: np.ndarray,
+    useful_life: np.ndarray,
+    decline_factor: float = 2,
+    depreciation_len: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the declining balance depreciation charges of several assets at once.
+
+    Parameters
+    ----------
+    cost : np.ndarray
+        Cost of each asset.
+    salvage_value : np.ndarray
+        Residual value of each asset at the end of its useful life.
+    useful_life : np.ndarray
+        Useful life of each asset in years.
+    decline_factor : float, optional
+        The factor by which the depreciation is accelerated.
+        Default is 2 (double-declining balance method).
+    depreciation_len : int, optional
+        Minimum number of periods of the depreciation charges. (default: 0)
+
+    Returns
+    -------
+    np.ndarray
+        The depreciation charges, of shape (n_assets, n_periods), where
+        n_periods is the larger of depreciation_len and the longest useful life.
+        Row i equals `declining_balance_depreciation_rate` of asset i, extended
+        with zeros.
+    """
+
+    cost = np.asarray(cost, dtype=np.float64).reshape(-1, 1)
+    salvage_value = np.asarray(salvage_value, dtype=np.float64).reshape(-1, 1)
+    depreciation_factor = decline_factor / np.reshape(useful_life, (-1, 1))
+
+    useful_life, periods = _get_periods_matrix(useful_life, depreciation_len)
+
+    # Depreciation charge of the periods prior to the last period of useful life
+    is_declining = periods < useful_life - 1
+    depreciation_charge = np.where(
+        is_declining,
+        depreciation_factor * cost * np.power(1 - depreciation_factor, periods),
+        0.0,
+    )
+
+    # Depreciation charge reaches the salvage value
+    depreciation_charge = _limit_depreciation_charge(
+        depreciation_charge=depreciation_charge,
+        limit=cost - salvage_value,
+        is_valid=is_declining,
+    )
+
+    # Add the remaining charge at the last period of useful life
+    return np.where(
+        periods == useful_life - 1,
+        cost - salvage_value - np.cumsum(depreciation_charge, axis=1)[:, -1:],
+        depreciation_charge,
+    )
+
+
+def psc_declining_balance_depreciation_matrix(
+    cost: np.ndarray,
+    useful_life: np.ndarray,
+    depreciation_factor: np.ndarray | float = 0.5,
+    depreciation_len: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the psc declining balance depreciation charges of several assets at once.
+
+    Parameters
+    ----------
+    cost : np.ndarray
+        Initial cost of each asset.
+    useful_life : np.ndarray
+        Useful life of each asset in periods.
+    depreciation_factor : np.ndarray | float, optional
+        Depreciation factor of each asset (default is 0.5).
+    depreciation_len : int, optional
+        Minimum number of periods of the depreciation charges. (default: 0)
+
+    Returns
+    -------
+    np.ndarray
+        The depreciation charges, of shape (n_assets, n_periods), where
+        n_periods is the larger of depreciation_len and the longest useful life.
+        Row i equals `psc_declining_balance_depreciation_rate` of asset i, extended
+        with zeros.
+    """
+
+    depreciation_factor = np.asarray(depreciation_factor, dtype=np.float64)
+
+    if np.any(depreciation_factor > 1) or np.any(depreciation_factor < 0):
+        raise DepreciationException(
+            f"The value of depreciation_factor must fall within the following interval: "
+            f"0 <= depreciation_factor <= 1"
+        )
+
+    useful_life, periods = _get_periods_matrix(useful_life, depreciation_len)
+
+    cost = np.asarray(cost, dtype=np.float64).reshape(-1, 1)
+    depreciation_factor = np.broadcast_to(depreciation_factor, cost.shape[:1]).reshape(-1, 1)
+
+    # Depreciation charge of the periods prior to the last period of useful life
+    depreciation_charge = np.where(
+        periods < useful_life - 1,
+        depreciation_factor * cost * np.power(1 - depreciation_factor, periods),
+        0.0,
+    )
+
+    # Specify the last period of useful life as the remaining cost
+    return np.where(
+        periods == useful_life - 1,
+        cost - np.cumsum(depreciation_charge, axis=1)[:, -1:],
+        depreciation_charge,
+    )
+
+
+def get_depreciation_schedule(
+    depreciation_charge: np.ndarray,
+    shift: np.ndarray,
+    depreciation_len: int,
+) -> tuple:
+    """
+    Align the depreciation charges of several assets with the project periods.
+
+    The charges of each asset start at its placed-in-service period, which is
+    handled as an index offset into the depreciation matrix rather than by
+    shifting every row.
+
+    Parameters
+    ----------
+    depreciation_charge : np.ndarray
+        The depreciation charges of each asset from its placed-in-service period,
+        of shape (n_assets, n_periods).
+    shift : np.ndarray
+        The index of the placed-in-service period of each asset in the project
+        periods. Negative indices are treated as zero.
+    depreciation_len : int
+        The number of project periods.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        (1) The total depreciation charge of each project period,
+        (2) The undepreciated asset, i.e. the total charges which fall after the
+            last project period.
+    """
+
+    depreciation_charge = np.atleast_2d(depreciation_charge)
+    shift = np.clip(np.asarray(shift, dtype=np.int64).reshape(-1, 1), 0, None)
+    n_periods = depreciation_charge.shape[1]
+
+    # Index of the charge of each asset in each project period
+    index = np.arange(depreciation_len, dtype=np.int64)[np.newaxis, :] - shift
+    is_charged = (index >= 0) & (index < n_periods)
+    charge = np.take_along_axis(
+        depreciation_charge, np.clip(index, 0, max(n_periods - 1, 0)), axis=1
+    )
+    charge = np.where(is_charged, charge, 0.0)
+
+    # Charges from the period following the last project period onwards
+    is_overdue = np.arange(n_periods)[np.newaxis, :] >= depreciation_len - shift
+
+    total_depreciation_charge = charge.sum(axis=0)
+    undepreciated_asset = np.where(is_overdue, depreciation_charge, 0.0).sum()
+
+    return total_depreciation_charge, undepreciated_asset
+
+
 def unit_of_production_rate(
     start_year_project: int,
     cost: float,
@@ -509,32 +729,12 @@ def unit_of_production_rate(
     # Calculate amortization charge (2 * UOP)
     amortization_charge = 2.0 * amortization_charge
 
-    # Calculate remaining amortization
-    remaining_amortization = cost - salvage_value - np.cumsum(amortization_charge)
-    remaining_amortization_modified = np.where(
-        remaining_amortization < 0, 0, remaining_amortization
-    )
-    remaining_amortization_unique_sum = np.sum(
-        np.unique(remaining_amortization_modified)
-    )
-
-    # Amortization charge is paid off since the first year
-    if remaining_amortization_unique_sum == 0:
-        amortization_charge_new = np.zeros_like(amortization_charge)
-        amortization_charge_new[0] = amortization_charge[0] + remaining_amortization[0]
-        amortization_charge = amortization_charge_new.copy()
-
-    # Amortization charge is paid off after the first year
-    elif remaining_amortization_unique_sum > 0:
-        idx = np.argmin(remaining_amortization_modified)
-        amortization_charge[idx] = remaining_amortization[idx - 1]
-        amortization_charge[idx + 1:] = 0
-
-    else:
-        raise UnitOfProductionException(
-            f"Cannot have a negative value in variable remaining_amortization_unique_sum: "
-            f"{remaining_amortization_unique_sum}"
-        )
+    # Amortization charge reaches the salvage value
+    amortization_charge = _limit_depreciation_charge(
+        depreciation_charge=amortization_charge[np.newaxis, :],
+        limit=np.array([cost - salvage_value]),
+        is_valid=np.ones((1, len(amortization_charge)), dtype=bool),
+    )[0]
 
     # Allocate amortization_charge according to their associated year
     amortization_charge = np.bincount(
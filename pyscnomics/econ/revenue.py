@@ -2,6 +2,7 @@
 Prepares lifting data and calculate the associated revenue.
 """
 
+import copy
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
@@ -88,6 +89,7 @@ class Lifting:
     project_duration: int = field(default=None, init=False)
     project_years: np.ndarray = field(default=None, init=False)
     prod_rate_total: np.ndarray = field(default=None, init=False)
+    _memo: dict = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         """
@@ -281,8 +283,8 @@ class Lifting:
 
         This function uses `np.bincount` to sum the values in `target_param` based on
         their associated production year (relative to the project's start year).
-        The resulting array is then padded with zeros if the project duration exceeds
-        the number of aggregated entries.
+        The resulting array has the length of the project duration, where the years
+        without production data are filled with zeros.
 
         Parameters
         ----------
@@ -299,14 +301,95 @@ class Lifting:
         -----
         - `np.bincount` is used to group and sum values based on the difference between
           `self.prod_year` and `self.start_year`.
-        - If the resulting array is shorter than the project duration, it is extended
-          with zeros to ensure alignment.
+        - Argument `minlength` of `np.bincount` ensures the alignment with the
+          project duration.
         """
 
-        param_arr = np.bincount(self.prod_year - self.start_year, weights=target_param)
-        zeros = np.zeros(self.project_duration - len(param_arr))
+        return np.bincount(
+            self.prod_year - self.start_year,
+            weights=target_param,
+            minlength=self.project_duration,
+        )
+
+    def _get_weighted_average(
+        self, target_param: np.ndarray, weight: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculates the weighted average of `target_param` for each production year
+        and aligns it with the project duration.
+
+        Parameters
+        ----------
+        target_param : np.ndarray
+            An array of numeric values to be averaged by production year.
+        weight : np.ndarray
+            The weight associated with each element of `target_param`.
+
+        Returns
+        -------
+        np.ndarray
+            A 1D array of the same length as the project duration, where each element
+            represents the weighted average for a production year. Years without
+            production data are filled with zeros.
+
+        Notes
+        -----
+        The averages are computed as the ratio of two weighted `np.bincount`,
+        i.e. sum(target_param * weight) / sum(weight) within each production year.
+        """
+        numerator = self._get_array(target_param=target_param * weight)
+        denominator = self._get_array(target_param=weight)
+
+        return np.divide(
+            numerator,
+            denominator,
+            out=np.zeros_like(numerator),
+            where=denominator != 0,
+        )
+
+    def _get_memoized(self, name: str, sources: tuple, func) -> np.ndarray:
+        """
+        Returns the result of `func`, computed once per set of source arrays.
+
+        Parameters
+        ----------
+        name : str
+            The name of the memoized quantity.
+        sources : tuple
+            The arrays from which the quantity is computed.
+        func : callable
+            A function with no argument which computes the quantity.
+
+        Returns
+        -------
+        np.ndarray
+            A copy of the memoized quantity.
+
+        Notes
+        -----
+        The memo is validated against the identity of the source arrays, so shallow
+        copies of the instance whose arrays are reassigned (e.g. in sensitivity and
+        uncertainty analysis) never get a stale result. Each copy starts with its own
+        memo (see `__copy__`). A copy is returned since callers are free to modify
+        the result in place.
+
+        Modifying a source array in place (e.g. `lifting.price *= 2`) keeps its
+        identity and is not detected, hence is not supported: assign a new array
+        instead (e.g. `lifting.price = lifting.price * 2`).
+        """
+        if self._memo is None:
+            self._memo = {}
 
-        return np.concatenate((param_arr, zeros))
+        key = (name, self.start_year, self.project_duration)
+        entry = self._memo.get(key)
+
+        if entry is None or not all(
+            arr is src for arr, src in zip(entry[0], sources)
+        ):
+            entry = (sources, func())
+            self._memo[key] = entry
+
+        return entry[1].copy()
 
     def get_lifting_rate_ghv_arr(self) -> np.ndarray:
         """
@@ -327,8 +410,13 @@ class Lifting:
         -----
         - Internally uses `_get_array()` with `target_param = lifting_rate * ghv`.
         - Ensures alignment with production years and fills missing years with zeros.
+        - The result is memoized for the current `prod_year`, `lifting_rate` and `ghv`.
         """
-        return self._get_array(target_param=self.lifting_rate * self.ghv)
+        return self._get_memoized(
+            name="lifting_rate_ghv",
+            sources=(self.prod_year, self.lifting_rate, self.ghv),
+            func=lambda: self._get_array(target_param=self.lifting_rate * self.ghv),
+        )
 
     def get_lifting_rate_arr(self) -> np.ndarray:
         """
@@ -420,8 +508,8 @@ class Lifting:
         with the project duration.
 
         The method computes WAP based on the `price`, `lifting_rate`, and `ghv` attributes,
-        weighted by the product of `lifting_rate` and `ghv`. The resulting array is sorted
-        by production year and extended with zeros to match the project duration.
+        weighted by the product of `lifting_rate` and `ghv`. The resulting array is aligned
+        with the production year, where years without production data are set to zero.
 
         Returns
         -------
@@ -432,38 +520,28 @@ class Lifting:
         Notes
         -----
         If `lifting_rate` or `ghv` is zero, a small value (1E-33) is used to avoid
-        division by zero.
+        division by zero. The WAP is computed as the ratio of two weighted `np.bincount`
+        and memoized for the current `prod_year`, `lifting_rate`, `ghv` and `price`.
         """
-        # Identify unique year in prod_year array
-        unique_year, indices = np.unique(self.prod_year, return_inverse=True)
-
-        # Calculate weight
-        weight = np.where(
-            self.lifting_rate * self.ghv == 0, 1e-33, self.lifting_rate * self.ghv
-        )
-
-        # Calculate WAP (Weighted Average Price)
-        wap = np.array(
-            [
-                np.average(self.price[indices == i], weights=weight[indices == i])
-                for i, _ in enumerate(unique_year)
-            ]
+        def _calc_wap() -> np.ndarray:
+            lifting_rate_ghv = self.lifting_rate * self.ghv
+            weight = np.where(lifting_rate_ghv == 0, 1e-33, lifting_rate_ghv)
+            return self._get_weighted_average(target_param=self.price, weight=weight)
+
+        return self._get_memoized(
+            name="price",
+            sources=(self.prod_year, self.lifting_rate, self.ghv, self.price),
+            func=_calc_wap,
         )
 
-        # Sorted WAP so as to align with the corresponding prod_year
-        wap_sorted = np.bincount(unique_year - self.start_year, weights=wap)
-        zeros = np.zeros(self.project_duration - len(wap_sorted))
-
-        return np.concatenate((wap_sorted, zeros))
-
     def get_aggregate_ghv(self) -> np.ndarray:
         """
         Calculate the weighted average gross heating value (WAGHV) for each production year
         and align it with the project duration.
 
         The method computes the WAGHV based on the `ghv` attribute, weighted by the
-        `lifting_rate`. The resulting array is sorted by production year and extended
-        with zeros to match the project duration.
+        `lifting_rate`. The resulting array is aligned with the production year, where
+        years without production data are set to zero.
 
         Returns
         -------
@@ -474,28 +552,19 @@ class Lifting:
         Notes
         -----
         If `lifting_rate` is zero, a small value (1E-33) is used to avoid division by zero
-        in the weighting calculation.
+        in the weighting calculation. The WAGHV is computed as the ratio of two weighted
+        `np.bincount` and memoized for the current `prod_year`, `lifting_rate` and `ghv`.
         """
-        # Identify unique year in prod_year array
-        unique_year, indices = np.unique(self.prod_year, return_inverse=True)
-
-        # Determine weight values
-        weight = np.where(self.lifting_rate == 0, 1e-33, self.lifting_rate)
-
-        # Calculate the Weighted Average Gross Heating Value (WAGHV)
-        waghv = np.array(
-            [
-                np.average(self.ghv[indices == i], weights=weight[indices == i])
-                for i, _ in enumerate(unique_year)
-            ]
+        def _calc_waghv() -> np.ndarray:
+            weight = np.where(self.lifting_rate == 0, 1e-33, self.lifting_rate)
+            return self._get_weighted_average(target_param=self.ghv, weight=weight)
+
+        return self._get_memoized(
+            name="ghv",
+            sources=(self.prod_year, self.lifting_rate, self.ghv),
+            func=_calc_waghv,
         )
 
-        # Sorted WAGHV so as to align with the corresponding prod_year
-        waghv_sorted = np.bincount(unique_year - self.start_year, weights=waghv)
-        zeros = np.zeros(self.project_duration - len(waghv_sorted))
-
-        return np.concatenate((waghv_sorted, zeros))
-
     def revenue(self) -> np.ndarray:
         """
         Calculate the revenue of a particular fluid type and aligns it with the
@@ -510,20 +579,67 @@ class Lifting:
         -----
         The revenue is calculated as follows: revenue = lifting rate * price * ghv.
         The function np.bincount() is used to align the revenue elements with its
-        correponding year.
+        correponding year. The revenue is memoized for the current `prod_year`,
+        `lifting_rate`, `ghv` and `price`.
         """
 
-        rev = self.lifting_rate * self.price * self.ghv
-        rev_update = np.bincount(self.prod_year - self.start_year, weights=rev)
+        return self._get_memoized(
+            name="revenue",
+            sources=(self.prod_year, self.lifting_rate, self.ghv, self.price),
+            func=lambda: self._get_array(
+                target_param=self.lifting_rate * self.price * self.ghv
+            ),
+        )
+
+    def align(self, start_year: int, end_year: int):
+        """
+        Place the lifting data on a wider project timeline without constructing
+        a new instance.
 
-        # Modify revenue, accounting for project duration
-        zeros = np.zeros(self.project_duration - len(rev_update))
+        Parameters
+        ----------
+        start_year : int
+            The start year of the new project timeline.
+        end_year : int
+            The end year of the new project timeline.
 
-        return np.concatenate((rev_update, zeros))
+        Returns
+        -------
+        Lifting
+            A copy of the instance placed on the new project timeline, which shares
+            the arrays of this instance.
+
+        Raises
+        ------
+        LiftingException
+            If the new project timeline does not cover the current one.
+        """
+
+        if start_year > self.start_year or end_year < self.end_year:
+            raise LiftingException(
+                f"The project timeline ({start_year} - {end_year}) does not cover "
+                f"the current project timeline ({self.start_year} - {self.end_year})"
+            )
+
+        aligned = copy.copy(self)
+        aligned.start_year = start_year
+        aligned.end_year = end_year
+        aligned.project_duration = end_year - start_year + 1
+        aligned.project_years = np.arange(start_year, end_year + 1, 1)
+
+        return aligned
 
     def __len__(self):
         return len(self.prod_year)
 
+    def __copy__(self):
+        # A shallow copy shares the arrays but not the memo, which it would overwrite
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        copied._memo = None
+
+        return copied
+
     def __eq__(self, other):
         # Between two instances of lifting
         if isinstance(other, Lifting):
@@ -445,6 +445,23 @@ class OptimizationTarget(Enum):
     PI = "PI"
 
 
+class OptimizationMethod(Enum):
+    """
+    Enumeration class representing the search method of the optimization.
+
+    Attributes
+    ----------
+    BOUNDED: str
+        Minimize the absolute difference to the target within the bounds.
+    ROOT: str
+        Find the root of the difference to the target within a bracket,
+        exploiting the monotonicity of the indicator on the parameter.
+    """
+
+    BOUNDED = "Bounded"
+    ROOT = "Root"
+
+
 class VariableSplit522017:
     """
     Variable Spilt Component for Gross Split No.20 Year 2019 Regime.
@@ -712,6 +729,16 @@ class UncertaintyDistribution(Enum):
     NORMAL = "Normal"
 
 
+class UncertaintySampling(Enum):
+    """
+    Uncertainty Sampling Scheme Option.
+    """
+
+    RANDOM = "Random"
+    LATIN_HYPERCUBE = "Latin Hypercube"
+    SOBOL = "Sobol"
+
+
 class SunkCostInvestmentType(Enum):
     """
     Selection for sunk cost (or pre-onstream cost) investment type.
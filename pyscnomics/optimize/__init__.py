@@ -3,6 +3,12 @@ Specify callable methods from package 'optimize'
 """
 
 from .adjuster import AdjustData
-from .optimization import adjust_contract, optimize_psc
+from .optimization import (
+    adjust_contract,
+    optimize_psc,
+    get_evaluation_cache_info,
+    get_evaluation_stats_info,
+    clear_evaluation_cache,
+)
 from .sensitivity import sensitivity_psc
 from .uncertainty import uncertainty_psc
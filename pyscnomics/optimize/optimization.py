@@ -3,12 +3,16 @@
 Configuration to undertake optimization study.
 """
 import numpy as np
-from scipy.optimize import minimize_scalar
+from scipy.optimize import minimize_scalar, brentq
+from multiprocess import Pool
+from multiprocess.pool import ThreadPool
 
 from pyscnomics.contracts.costrecovery import CostRecovery
 from pyscnomics.contracts.grossplit import GrossSplit
-from pyscnomics.econ.selection import OptimizationParameter, OptimizationTarget
+from pyscnomics.contracts.transition import Transition
+from pyscnomics.econ.selection import OptimizationParameter, OptimizationTarget, OptimizationMethod
 from pyscnomics.tools.summary import get_summary
+from pyscnomics.tools.helper import LRUCache, get_contract_snapshot, get_fingerprint
 
 from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, LBT
 
@@ -19,17 +23,101 @@ class OptimizationException(Exception):
     pass
 
 
-def adjust_contract(
+class _RootFoundException(Exception):
+    """Exception to stop the root finding once the target is within tolerance"""
+
+    pass
+
+
+# LRU cache of the contract evaluations, keyed on the fingerprint of the adjusted contract
+_EVALUATION_CACHE = LRUCache(maxsize=256)
+
+
+def get_evaluation_cache_info() -> dict:
+    """
+    Function to get the statistics of the evaluation cache used by evaluate_contract().
+
+    Returns
+    -------
+    out: dict
+        The number of calls, hits and misses, the hit rate, the current size
+        and the maximum size of the cache.
+
+    Notes
+    -------
+    The statistics are cumulative over the current process since the last call of
+    clear_evaluation_cache(). Evaluations run on a process pool by evaluate_contracts()
+    use the caches of the worker processes and are not counted. The statistics of a
+    single optimization request are given by get_evaluation_stats_info().
+    """
+    return _EVALUATION_CACHE.info()
+
+
+def clear_evaluation_cache(maxsize: int = None):
+    """
+    Function to clear the evaluation cache used by evaluate_contract() and reset its statistics.
+
+    Parameters
+    ----------
+    maxsize: int
+        The new maximum number of cached evaluations. A maxsize of 0 disables the cache.
+        When None, the maximum size is kept.
+    """
+    if maxsize is not None and maxsize < 0:
+        raise OptimizationException(f"Cache size must be non-negative, not {maxsize}")
+
+    _EVALUATION_CACHE.clear(maxsize=maxsize)
+
+
+def _record_evaluation(evaluation_stats: dict | None, hit: bool):
+    """Count an evaluation of an optimization request, and whether it was served without a run."""
+    if evaluation_stats is not None:
+        evaluation_stats['calls'] = evaluation_stats.get('calls', 0) + 1
+        evaluation_stats['hits'] = evaluation_stats.get('hits', 0) + int(hit)
+
+
+def get_evaluation_stats_info(evaluation_stats: dict) -> dict:
+    """
+    Function to get the statistics of the evaluations of a single optimization request.
+
+    Parameters
+    ----------
+    evaluation_stats: dict
+        The dictionary passed as evaluation_stats to optimize_psc() or optimize_parameters().
+
+    Returns
+    -------
+    out: dict
+        The number of calls, hits and misses, and the hit rate. The calls are the contract
+        states requested by the search, including the states evaluated ahead on a worker
+        pool. The hits are the calls served by the memo of the request or by the evaluation
+        cache, and the misses are the contract runs.
+
+    Notes
+    -------
+    Unlike get_evaluation_cache_info(), the statistics only cover the request, and include
+    the evaluations run on a worker pool.
+    """
+    calls = evaluation_stats.get('calls', 0)
+    hits = evaluation_stats.get('hits', 0)
+
+    return {
+        'calls': calls,
+        'hits': hits,
+        'misses': calls - hits,
+        'hit_rate': hits / calls if calls > 0 else 0.0,
+    }
+
+
+def get_adjusted_contract(
     contract: CostRecovery | GrossSplit,
     contract_arguments: dict,
     variable: OptimizationParameter,
     value: float,
-    summary_argument: dict,
-    target_parameter: str
 ) -> (CostRecovery | GrossSplit, dict):
     """
-    The function used to adjust the variable within a psc contract object.
-    This function will be used by optimize_psc().
+    The function used to get a copy of a psc contract object, and of its arguments,
+    with the variable adjusted. The passed contract and contract arguments are not modified.
 
     Parameters
     ----------
@@ -41,16 +129,11 @@ def adjust_contract(
         The enum selection of variable that will be changed.
     value: float
         The new value of the variable that will be replaced.
-    summary_argument: dict
-        The dictionary containing the arguments that passed summary function.
-    target_parameter: str
-        The string of the targeted parameter.
 
     Returns
     -------
     out: tuple
-        The result of the target parameter and contract object that has been modified and run.
-
+        The adjusted copy of the contract object and of the contract arguments.
     """
     # When the optimization is VAT
     if variable is OptimizationParameter.VAT_DISCOUNT:
@@ -75,32 +158,35 @@ def adjust_contract(
             adjustment_variable=OptimizationParameter.DEPRECIATION_ACCELERATION,
         )
 
+    contract_arguments = dict(contract_arguments)
+    overrides = {}
+
     # The condition when contract is Cost Recovery
     if isinstance(contract, CostRecovery):
         # Changing the attributes of the contract based on the chosen variable
         if variable is OptimizationParameter.OIL_CTR_PRETAX:
-            contract.oil_ctr_pretax_share = value
+            overrides['oil_ctr_pretax_share'] = value
 
         if variable is OptimizationParameter.GAS_CTR_PRETAX:
-            contract.gas_ctr_pretax_share = value
+            overrides['gas_ctr_pretax_share'] = value
 
         if variable is OptimizationParameter.OIL_FTP_PORTION:
-            contract.oil_ftp_portion = value
+            overrides['oil_ftp_portion'] = value
 
         if variable is OptimizationParameter.GAS_FTP_PORTION:
-            contract.gas_ftp_portion = value
+            overrides['gas_ftp_portion'] = value
 
         if variable is OptimizationParameter.OIL_IC:
-            contract.oil_ic_rate = value
+            overrides['oil_ic_rate'] = value
 
         if variable is OptimizationParameter.GAS_IC:
-            contract.gas_ic_rate = value
+            overrides['gas_ic_rate'] = value
 
         if variable is OptimizationParameter.OIL_DMO_FEE:
-            contract.oil_dmo_fee_portion = value
+            overrides['oil_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.GAS_DMO_FEE:
-            contract.gas_dmo_fee_portion = value
+            overrides['gas_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.VAT_RATE:
             contract_arguments['vat_rate'] = value
@@ -112,13 +198,13 @@ def adjust_contract(
     if isinstance(contract, GrossSplit):
         # Changing the attributes of the contract based on the chosen variable
         if variable is OptimizationParameter.MINISTERIAL_DISCRETION:
-            contract.split_ministry_disc = value
+            overrides['split_ministry_disc'] = value
 
         if variable is OptimizationParameter.OIL_DMO_FEE:
-            contract.oil_dmo_fee_portion = value
+            overrides['oil_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.GAS_DMO_FEE:
-            contract.gas_dmo_fee_portion = value
+            overrides['gas_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.VAT_RATE:
             contract_arguments['vat_rate'] = value
@@ -126,14 +212,446 @@ def adjust_contract(
         if variable is OptimizationParameter.EFFECTIVE_TAX_RATE:
             contract_arguments['effective_tax_rate'] = value
 
+    # The contract is always cloned, since the returned contract is run in place
+    return contract.clone(**overrides), contract_arguments
+
+
+def evaluate_contract(
+    contract: CostRecovery | GrossSplit | Transition,
+    contract_arguments: dict,
+    summary_argument: dict,
+    target_parameter: str,
+    evaluation_stats: dict | None = None,
+) -> (float, CostRecovery | GrossSplit | Transition):
+    """
+    The function used to run a contract object and retrieve the value of the targeted parameter.
+
+    Parameters
+    ----------
+    contract: CostRecovery | GrossSplit | Transition
+        The contract object, which is run in place. Pass a clone of a shared contract.
+    contract_arguments: dict
+        The contract arguments that passed on the fly .run() of the contract dataclass.
+    summary_argument: dict
+        The dictionary containing the arguments that passed summary function.
+    target_parameter: str
+        The string of the targeted parameter.
+    evaluation_stats: dict | None
+        The statistics of the optimization request, in which the evaluation is counted.
+        See get_evaluation_stats_info().
+
+    Notes
+    -------
+    The evaluations are cached, keyed on the fingerprint of the contract inputs,
+    the contract arguments, the summary arguments and the target parameter. A cached
+    evaluation returns a copy of the contract snapshot taken after its run, without
+    running the contract again. See get_evaluation_cache_info() and clear_evaluation_cache().
+
+    Returns
+    -------
+    out: tuple
+        The result of the target parameter and contract object that has been run.
+    """
+    result_psc, executed_contract, hit = _evaluate_contract(
+        contract, contract_arguments, summary_argument, target_parameter
+    )
+    _record_evaluation(evaluation_stats=evaluation_stats, hit=hit)
+
+    return result_psc, executed_contract
+
+
+def _evaluate_contract(
+    contract: CostRecovery | GrossSplit | Transition,
+    contract_arguments: dict,
+    summary_argument: dict,
+    target_parameter: str,
+) -> (float, CostRecovery | GrossSplit | Transition, bool):
+    """The body of evaluate_contract(), also returning whether the evaluation was a cache hit."""
+    summary_argument = {k: v for k, v in summary_argument.items() if k != 'contract'}
+
+    # Retrieving the evaluation of the same fiscal state from the cache
+    key = get_fingerprint((
+        type(contract).__qualname__,
+        contract,
+        contract_arguments,
+        summary_argument,
+        target_parameter,
+    ))
+
+    cached = _EVALUATION_CACHE.get(key)
+
+    if cached is not None:
+        summary, executed_contract = cached
+
+        # The cached contract is copied, since the caller may modify it
+        return summary[target_parameter], get_contract_snapshot(executed_contract), True
+
     # Running the contract
     contract.run(**contract_arguments)
 
     # Get the summary of the new contract and get its value of the targeted optimization
-    summary_argument['contract'] = contract
-    result_psc = get_summary(**summary_argument)[target_parameter]
+    summary = get_summary(contract=contract, **summary_argument)
+    result_psc = summary[target_parameter]
+
+    # Storing a snapshot of the executed contract, evicting the least recently used evaluation
+    if _EVALUATION_CACHE.maxsize > 0:
+        _EVALUATION_CACHE.put(key, (summary, get_contract_snapshot(contract)))
+
+    return result_psc, contract, False
+
+
+def _evaluate_state(state: tuple) -> (float, CostRecovery | GrossSplit | Transition, bool):
+    return _evaluate_contract(*state)
+
+
+def evaluate_contracts(
+    states: list,
+    executor: str | None = None,
+    max_workers: int | None = None,
+    evaluation_stats: dict | None = None,
+) -> list:
+    """
+    The function used to evaluate several contract states, optionally on a worker pool.
+
+    Parameters
+    ----------
+    states: list
+        The list of (contract, contract_arguments, summary_argument, target_parameter)
+        tuples, as passed to evaluate_contract(). The contracts must be distinct objects.
+    executor: str | None
+        The pool to evaluate the states on: 'process', 'thread', or None to evaluate
+        them serially.
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+    evaluation_stats: dict | None
+        The statistics of the optimization request, in which the evaluations are counted,
+        including those run by the workers. See get_evaluation_stats_info().
+
+    Returns
+    -------
+    out: list
+        The result of evaluate_contract() for each state.
+    """
+    if executor not in ('process', 'thread', None):
+        raise OptimizationException(
+            f"The executor, {executor}, is not recognized. "
+            f"Please select executor between: 'process', 'thread', or None."
+        )
+
+    if executor is None or len(states) <= 1:
+        results = [_evaluate_state(state) for state in states]
+    else:
+        pool_class = Pool if executor == 'process' else ThreadPool
+        with pool_class(processes=max_workers) as pool:
+            results = pool.map(_evaluate_state, states)
+
+    # The evaluations are counted here, since the workers do not share the statistics
+    for _, _, hit in results:
+        _record_evaluation(evaluation_stats=evaluation_stats, hit=hit)
+
+    return [(result_psc, executed_contract) for result_psc, executed_contract, _ in results]
+
+
+def adjust_contract(
+    contract: CostRecovery | GrossSplit,
+    contract_arguments: dict,
+    variable: OptimizationParameter,
+    value: float,
+    summary_argument: dict,
+    target_parameter: str
+) -> (CostRecovery | GrossSplit, dict):
+    """
+    The function used to adjust the variable within a psc contract object.
+    This function will be used by optimize_psc().
+
+    Parameters
+    ----------
+    contract: CostRecovery | GrossSplit
+        The contract object.
+    contract_arguments: dict
+        The contract arguments that passed on the fly .run() of the contract dataclass.
+    variable: OptimizationParameter
+        The enum selection of variable that will be changed.
+    value: float
+        The new value of the variable that will be replaced.
+    summary_argument: dict
+        The dictionary containing the arguments that passed summary function.
+    target_parameter: str
+        The string of the targeted parameter.
+
+    Notes
+    -------
+    The passed contract and contract arguments are not modified, the adjusted copy
+    of the contract is run instead. See get_adjusted_contract() and evaluate_contract().
+
+    Returns
+    -------
+    out: tuple
+        The result of the target parameter and contract object that has been modified and run.
+
+    """
+    contract_adjusted, contract_arguments_adjusted = get_adjusted_contract(
+        contract=contract,
+        contract_arguments=contract_arguments,
+        variable=variable,
+        value=value,
+    )
+
+    return evaluate_contract(
+        contract=contract_adjusted,
+        contract_arguments=contract_arguments_adjusted,
+        summary_argument=summary_argument,
+        target_parameter=target_parameter,
+    )
+
+
+def get_parameter_bounds(
+    dict_optimization: dict,
+    index: int,
+) -> (float, float):
+    """
+    The function to get the most favourable value of an optimization parameter for the contractor,
+    and the opposite bound.
+
+    Parameters
+    ----------
+    dict_optimization: dict
+        The optimization dictionary that containing the information about minimum boundary and upper boundary
+        of the optimized parameters.
+    index: int
+        The index of the parameter in dict_optimization.
+
+    Returns
+    -------
+    out: tuple
+        The most favourable value and the opposite bound of the parameter.
+    """
+    param = dict_optimization['parameter'][index]
+
+    # Get the maximum value of each params
+    if param is OptimizationParameter.OIL_CTR_PRETAX:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.GAS_CTR_PRETAX:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.OIL_FTP_PORTION:
+        max_value = dict_optimization['min'][index]
+    elif param is OptimizationParameter.GAS_FTP_PORTION:
+        max_value = dict_optimization['min'][index]
+    elif param is OptimizationParameter.OIL_IC:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.GAS_IC:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.OIL_DMO_FEE:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.GAS_DMO_FEE:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.VAT_RATE:
+        max_value = dict_optimization['min'][index]
+    elif param is OptimizationParameter.EFFECTIVE_TAX_RATE:
+        max_value = dict_optimization['min'][index]
+    elif param is OptimizationParameter.VAT_DISCOUNT:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.LBT_DISCOUNT:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.DEPRECIATION_ACCELERATION:
+        max_value = dict_optimization['max'][index]
+    elif param is OptimizationParameter.MINISTERIAL_DISCRETION:
+        max_value = dict_optimization['max'][index]
+    else:
+        raise OptimizationException(f" Optimization parameter, {param}, is not recognized."
+                                    f" Optimization parameter should be chosen from OptimizationParameter enum.")
+
+    if max_value == dict_optimization['max'][index]:
+        other_value = dict_optimization['min'][index]
+    else:
+        other_value = dict_optimization['max'][index]
+
+    return float(max_value), float(other_value)
+
+
+def optimize_parameters(
+    dict_optimization: dict,
+    contract: CostRecovery | GrossSplit | Transition,
+    contract_arguments: dict,
+    target_optimization_value: float,
+    summary_argument: dict,
+    target_parameter: str,
+    adjust: callable = get_adjusted_contract,
+    method: OptimizationMethod = OptimizationMethod.BOUNDED,
+    tolerance: float = 1e-6,
+    max_iter: int = 50,
+    executor: str | None = None,
+    max_workers: int | None = None,
+    evaluation_stats: dict | None = None,
+) -> (list, list, float, list):
+    """
+    The function to optimize the parameters of a contract one by one, until the target is achieved.
+    This function is used by optimize_psc_core() of both the psc and the transition contracts.
 
-    return result_psc, contract
+    Parameters
+    ----------
+    dict_optimization: dict
+        The optimization dictionary, see optimize_psc_core().
+    contract: CostRecovery | GrossSplit | Transition
+        The contract object, which is not modified.
+    contract_arguments: dict
+        The contract arguments that passed on the fly .run() of the contract dataclass.
+    target_optimization_value: float
+        The desired target value.
+    summary_argument: dict
+        The dictionary containing the arguments that passed summary function.
+    target_parameter: str
+        The string of the targeted parameter.
+    adjust: callable
+        The function returning an adjusted copy of the contract and of its arguments,
+        with the signature of get_adjusted_contract().
+    method: OptimizationMethod
+        The search method, see optimize_psc_core().
+    tolerance: float
+        The accepted difference to the target for the ROOT method, in the unit of the targeted indicator.
+    max_iter: int
+        The maximum number of iterations of the ROOT method.
+    executor: str | None
+        The pool to evaluate the independent contract states on: 'process', 'thread',
+        or None to evaluate them serially, one by one as they are needed.
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+    evaluation_stats: dict | None
+        A dictionary in which the evaluations of the request are counted, to be reported
+        with get_evaluation_stats_info(). Not counted when None.
+
+    Notes
+    -------
+    Each parameter is evaluated with the preceding parameters at their most favourable value.
+    These states, and the bracket ends of the ROOT method, do not depend on one another.
+    With an executor, they are evaluated at once on a worker pool, at the cost of evaluating
+    the parameters after the one which achieves the target. The search within the bounds
+    of that parameter is sequential.
+
+    Returns
+    -------
+    out : tuple
+        The list of parameters, the list of their optimized values, the value of the targeted
+        parameter and the list of executed contracts, see optimize_psc_core().
+    """
+    # Changing the parameters list[str] into list[OptimizationParameters(Enum)]
+    list_params = dict_optimization['parameter']
+
+    # Defining Base Value list to contain value of optimized parameters and status of the optimization
+    list_params_value = ['Base Value'] * len(list_params)
+
+    # Defining the empty result of optimization target, will be defined later
+    result_optimization = None
+
+    # Defining the executed contract list
+    list_executed_contract = []
+
+    # Defining the base state of each parameter, with the preceding parameters at their most favourable value
+    list_bounds = [get_parameter_bounds(dict_optimization=dict_optimization, index=index)
+                   for index in range(len(list_params))]
+    list_base = [(contract, contract_arguments)]
+    for param, (max_value, _) in zip(list_params[:-1], list_bounds[:-1]):
+        list_base.append(adjust(*list_base[-1], param, max_value))
+
+    # The evaluations of each parameter, by value of the parameter
+    list_evaluations = [{} for _ in list_params]
+
+    # Evaluating the independent states at once on the worker pool
+    if executor is not None:
+        points = [(index, max_value) for index, (max_value, _) in enumerate(list_bounds)]
+        if method is OptimizationMethod.ROOT:
+            points += [(index, other_value) for index, (_, other_value) in enumerate(list_bounds)]
+
+        results = evaluate_contracts(
+            states=[
+                (*adjust(*list_base[index], list_params[index], value), summary_argument, target_parameter)
+                for index, value in points
+            ],
+            executor=executor,
+            max_workers=max_workers,
+            evaluation_stats=evaluation_stats,
+        )
+
+        for (index, value), result in zip(points, results):
+            list_evaluations[index][value] = result
+
+    for index, param in enumerate(list_params):
+        max_value, other_value = list_bounds[index]
+
+        def evaluate(new_value, index=index, param=param):
+            new_value = float(new_value)
+            if new_value in list_evaluations[index]:
+                _record_evaluation(evaluation_stats=evaluation_stats, hit=True)
+            else:
+                list_evaluations[index][new_value] = evaluate_contract(
+                    *adjust(*list_base[index], param, new_value), summary_argument, target_parameter,
+                    evaluation_stats=evaluation_stats,
+                )
+
+            return list_evaluations[index][new_value]
+
+        # Changing the Contract parameter value based on the given input
+        result_psc, executed_contract = evaluate(max_value)
+
+        # Able to conduct optimization since the result is greater than the target
+        if result_psc > target_optimization_value:
+            # Defining the upper and lower limit of the optimized variable
+            bounds = (dict_optimization['min'][index],
+                      dict_optimization['max'][index])
+
+            if method is OptimizationMethod.ROOT:
+                optimized_parameter = get_root_optimization(
+                    evaluate=evaluate,
+                    bounds=bounds,
+                    max_value=max_value,
+                    other_value=other_value,
+                    target_optimization_value=target_optimization_value,
+                    tolerance=tolerance,
+                    max_iter=max_iter,
+                )
+
+            elif method is OptimizationMethod.BOUNDED:
+                # Optimization of the objective function
+                optimized_parameter = minimize_scalar(
+                    lambda new_value: abs(evaluate(new_value)[0] - target_optimization_value),
+                    bounds=bounds,
+                    method='bounded',
+                ).x
+
+            else:
+                raise OptimizationException(
+                    f"Optimization method {method} is not recognized. "
+                    f"Optimization method should be chosen from OptimizationMethod enum."
+                )
+
+            # The optimized value has been evaluated by the search
+            function_result, executed_contract = evaluate(optimized_parameter)
+
+            # Writing the result of optimization to the list_params_value
+            list_params_value[index] = optimized_parameter
+
+            # Defining the result_optimization
+            result_optimization = function_result
+
+            # Filling the list with executed contract
+            list_executed_contract.append(executed_contract)
+
+            # Exiting the loop since the target has been achieved
+            break
+
+        elif result_psc <= target_optimization_value:
+            # Writing the maximum value to the list_params_value
+            list_params_value[index] = max_value
+
+            # Defining the result_optimization
+            result_optimization = result_psc
+
+            list_executed_contract.append(executed_contract)
+
+    # Converting the list of enum into list of str enum value
+    list_str = [enum_value.value for enum_value in list_params]
+
+    return list_str, list_params_value, result_optimization, list_executed_contract
 
 
 def optimize_psc_core(
@@ -143,6 +661,12 @@ def optimize_psc_core(
     target_optimization_value: float,
     summary_argument: dict,
     target_parameter: OptimizationTarget = OptimizationTarget.IRR,
+    method: OptimizationMethod = OptimizationMethod.BOUNDED,
+    tolerance: float = 1e-6,
+    max_iter: int = 50,
+    executor: str | None = None,
+    max_workers: int | None = None,
+    evaluation_stats: dict | None = None,
  ) -> (list, list, float, list):
     """
     The function to get contract variable(s) that resulting the desired target or contract's economic target.
@@ -162,6 +686,21 @@ def optimize_psc_core(
         The dictionary containing the arguments that passed summary function.
     target_parameter: OptimizationTarget
         The enum selection for economic indicator  that will be optimized.
+    method: OptimizationMethod
+        The search method. BOUNDED minimizes the absolute difference to the target,
+        ROOT finds the root of the difference to the target within the bounds.
+    tolerance: float
+        The accepted difference to the target, in the unit of the targeted indicator.
+        Only used by the ROOT method.
+    max_iter: int
+        The maximum number of iterations of the ROOT method.
+    executor: str | None
+        The pool to evaluate the independent contract states on: 'process', 'thread',
+        or None to evaluate them serially. See optimize_parameters().
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+    evaluation_stats: dict | None
+        A dictionary in which the evaluations of the request are counted. See optimize_parameters().
 
     Notes
     -------
@@ -174,6 +713,11 @@ def optimize_psc_core(
         'min' keys containing the minimum value of each parameter.
         'max' keys containing the minimum value of each parameter.
 
+    The ROOT method brackets the target between the evaluation at the most favourable value,
+    which is required anyway to check the feasibility, and the evaluation at the opposite bound.
+    It then refines the bracket with Brent's method, which typically needs a handful of contract
+    runs instead of the ~25 runs of the bounded minimization. When the target is not bracketed,
+    e.g. the indicator is not monotone on the parameter, it falls back to the bounded minimization.
 
     Returns
     -------
@@ -205,139 +749,88 @@ def optimize_psc_core(
             f"is should be one of: {[OptimizationTarget.value]}"
         )
 
-    # Changing the parameters list[str] into list[OptimizationParameters(Enum)]
-    list_params = dict_optimization['parameter']
+    return optimize_parameters(
+        dict_optimization=dict_optimization,
+        contract=contract,
+        contract_arguments=contract_arguments,
+        target_optimization_value=target_optimization_value,
+        summary_argument=summary_argument,
+        target_parameter=target_parameter,
+        adjust=get_adjusted_contract,
+        method=method,
+        tolerance=tolerance,
+        max_iter=max_iter,
+        executor=executor,
+        max_workers=max_workers,
+        evaluation_stats=evaluation_stats,
+    )
 
-    # Defining Base Value list to contain value of optimized parameters and status of the optimization
-    list_params_value = ['Base Value'] * len(list_params)
 
-    # Defining the empty result of optimization target, will be defined later
-    result_optimization = None
+def get_root_optimization(
+    evaluate: callable,
+    bounds: tuple,
+    max_value: float,
+    other_value: float,
+    target_optimization_value: float,
+    tolerance: float = 1e-6,
+    max_iter: int = 50,
+) -> float:
+    """
+    Function to find the value of a contract variable which results in the target,
+    by bracketed root finding of the difference between the indicator and the target.
 
-    # Defining the executed contract list
-    list_executed_contract = []
+    Parameters
+    ----------
+    evaluate: callable
+        The memoized function returning the value of the targeted parameter and
+        the executed contract for a value of the variable.
+    bounds: tuple
+        The minimum and maximum value of the variable.
+    max_value: float
+        The value of the variable which is the most favourable for the contractor.
+    other_value: float
+        The opposite bound of the variable.
+    target_optimization_value: float
+        The desired target value.
+    tolerance: float
+        The accepted difference to the target, in the unit of the targeted parameter.
+    max_iter: int
+        The maximum number of iterations of Brent's method.
 
-    psc = contract
-    for index, param in enumerate(list_params):
+    Returns
+    -------
+    out: float
+        The optimized value of the variable.
+    """
+    def objective_root(new_value: float) -> float:
+        difference = evaluate(new_value)[0] - target_optimization_value
+        if abs(difference) <= tolerance:
+            raise _RootFoundException(float(new_value))
+        return difference
+
+    try:
+        # The most favourable value and the opposite bound close the bracket
+        if objective_root(max_value) > 0 > objective_root(other_value):
+            optimized_parameter = brentq(
+                objective_root,
+                min(other_value, max_value),
+                max(other_value, max_value),
+                maxiter=max_iter,
+                disp=False,
+            )
 
-        # Get the maximum value of each params
-        if param is OptimizationParameter.OIL_CTR_PRETAX:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_CTR_PRETAX:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.OIL_FTP_PORTION:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.GAS_FTP_PORTION:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.OIL_IC:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_IC:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.OIL_DMO_FEE:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_DMO_FEE:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.VAT_RATE:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.EFFECTIVE_TAX_RATE:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.VAT_DISCOUNT:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.LBT_DISCOUNT:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.DEPRECIATION_ACCELERATION:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.MINISTERIAL_DISCRETION:
-            max_value = dict_optimization['max'][index]
+        # The target is not bracketed, fall back to minimizing the difference
         else:
-            raise OptimizationException(f" Optimization parameter, {param}, is not recognized."
-                                        f" Optimization parameter should be chosen from OptimizationParameter enum.")
-
-        # Changing the Contract parameter value based on the given input
-        result_psc, psc = adjust_contract(
-            contract=psc,
-            contract_arguments=contract_arguments,
-            variable=param,
-            value=max_value,
-            summary_argument=summary_argument,
-            target_parameter=target_parameter, )
-
-        # Able to conduct optimization since the result is greater than the target
-        if result_psc > target_optimization_value:
-            # Defining the upper and lower limit of the optimized variable
-            bounds = (dict_optimization['min'][index],
-                      dict_optimization['max'][index])
-
-            def objective_run(new_value):
-                result_psc_obj, executed_contract = adjust_contract(
-                    contract=psc,
-                    contract_arguments=contract_arguments,
-                    variable=param,
-                    value=new_value,
-                    summary_argument=summary_argument,
-                    target_parameter=target_parameter)
-
-                result_obj = abs(result_psc_obj - target_optimization_value)
-                return result_obj
-
-            # Optimization of the objective function
-            optim_result = minimize_scalar(objective_run, bounds=bounds, method='bounded')
+            optimized_parameter = minimize_scalar(
+                lambda new_value: abs(evaluate(new_value)[0] - target_optimization_value),
+                bounds=bounds,
+                method='bounded',
+            ).x
 
-            # Difference value from target and optimization result
-            optimized_diff = optim_result.fun
+    except _RootFoundException as found:
+        optimized_parameter = found.args[0]
 
-            # Optimized Parameter Value
-            optimized_parameter = optim_result.x
-
-            # Result of the objective function
-            function_result = optimized_diff + target_optimization_value
-
-            # Writing the result of optimization to the list_params_value
-            list_params_value[index] = optimized_parameter
-
-            # Defining the result_optimization
-            result_optimization = function_result
-
-            # Defining the executed contract
-            executed_contract = adjust_contract(
-                contract=psc,
-                contract_arguments=contract_arguments,
-                variable=param,
-                value=optimized_parameter,
-                summary_argument=summary_argument,
-                target_parameter=target_parameter)[1]
-
-            # Filling the list with executed contract
-            list_executed_contract.append(executed_contract)
-
-            # # Printing for debugging
-            # print('Parameter:', param)
-            # print('Optimized Parameter Value:', optimized_parameter)
-            # print('Targeted Value:', target_optimization_value)
-            # print('Optimization Value:', function_result)
-            # print('Difference of Target and Optimization Result:', optimized_diff)
-
-            # Exiting the loop since the target has been achieved
-            break
-
-        elif result_psc <= target_optimization_value:
-            # Writing the maximum value to the list_params_value
-            list_params_value[index] = max_value
-
-            # Defining the result_optimization
-            result_optimization = result_psc
-
-            list_executed_contract.append(psc)
-
-    # Converting the list of enum into list of str enum value
-    list_str = [enum_value.value for enum_value in list_params]
-
-    # # Printing for debugging
-    # print(list_str)
-    # print(list_params_value)
-    # print(result_optimization)
-
-    return list_str, list_params_value, result_optimization, list_executed_contract
+    return float(optimized_parameter)
 
 
 def adjust_cost_element(
@@ -637,6 +1130,11 @@ def optimize_psc(
         target_optimization_value: float,
         summary_argument: dict,
         target_parameter: OptimizationTarget = OptimizationTarget.IRR,
+        method: OptimizationMethod = OptimizationMethod.BOUNDED,
+        tolerance: float = 1e-6,
+        executor: str | None = None,
+        max_workers: int | None = None,
+        evaluation_stats: dict | None = None,
 ) -> (list, list, float, list):
     """
     The function to get contract variable(s) that resulting the desired target or contract's economic target.
@@ -657,6 +1155,17 @@ def optimize_psc(
         The dictionary containing the arguments that passed summary function.
     target_parameter: OptimizationTarget
         The enum selection for economic indicator  that will be optimized.
+    method: OptimizationMethod
+        The search method, passed to optimize_psc_core.
+    tolerance: float
+        The accepted difference to the target for the ROOT method, in the unit of the targeted indicator.
+    executor: str | None
+        The pool to evaluate the independent contract states on: 'process', 'thread',
+        or None to evaluate them serially. See optimize_parameters().
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+    evaluation_stats: dict | None
+        A dictionary in which the evaluations of the request are counted. See optimize_parameters().
 
     Notes
     -------
@@ -738,7 +1247,12 @@ def optimize_psc(
                 contract_arguments=contract_arguments_pseudo,
                 target_optimization_value=target_value_base,
                 summary_argument=summary_argument_pseudo,
-                target_parameter=target_parameter, )
+                target_parameter=target_parameter,
+                method=method,
+                tolerance=tolerance,
+                executor=executor,
+                max_workers=max_workers,
+                evaluation_stats=evaluation_stats, )
 
             variable_value_pseudo = optim_base_result[1][0]
 
@@ -759,6 +1273,11 @@ def optimize_psc(
         target_optimization_value=target_optimization_value,
         summary_argument=summary_argument,
         target_parameter=target_parameter,
+        method=method,
+        tolerance=tolerance,
+        executor=executor,
+        max_workers=max_workers,
+        evaluation_stats=evaluation_stats,
     )
 
     list_str = result[0]
@@ -1,13 +1,14 @@
-from scipy.optimize import minimize_scalar
-
 from pyscnomics.contracts.costrecovery import CostRecovery
 from pyscnomics.contracts.grossplit import GrossSplit
 from pyscnomics.contracts.transition import Transition
-from pyscnomics.econ.selection import OptimizationParameter, OptimizationTarget, FluidType
-from pyscnomics.tools.summary import get_summary
+from pyscnomics.econ.selection import OptimizationParameter, OptimizationTarget, OptimizationMethod, FluidType
 
 from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, LBT
-from pyscnomics.optimize.optimization import adjust_useful_life_years
+from pyscnomics.optimize.optimization import (
+    adjust_useful_life_years,
+    evaluate_contract,
+    optimize_parameters,
+)
 
 
 class OptimizationExceptionTransition(Exception):
@@ -16,21 +17,20 @@ class OptimizationExceptionTransition(Exception):
     pass
 
 
-def adjust_contract(
+def get_adjusted_contract(
         contract: Transition,
         contract_arguments: dict,
         variable: OptimizationParameter,
         value: float,
-        summary_argument: dict,
-        target_parameter: str
 ) -> (Transition, dict):
     """
-    The function used to adjust the variable within a psc contract object.
-    This function will be used by optimize_psc().
+    The function used to get a copy of a transition contract object, and of its arguments,
+    with the variable of the second contract adjusted. The passed contract and contract
+    arguments are not modified.
 
     Parameters
     ----------
-    contract: CostRecovery | GrossSplit
+    contract: Transition
         The contract object.
     contract_arguments: dict
         The contract arguments that passed on the fly .run() of the contract dataclass.
@@ -38,16 +38,11 @@ def adjust_contract(
         The enum selection of variable that will be changed.
     value: float
         The new value of the variable that will be replaced.
-    summary_argument: dict
-        The dictionary containing the arguments that passed summary function.
-    target_parameter: str
-        The string of the targeted parameter.
 
     Returns
     -------
     out: tuple
-        The result of the target parameter and contract object that has been modified and run.
-
+        The adjusted copy of the contract object and of the contract arguments.
     """
     # When the optimization is VAT
     if variable is OptimizationParameter.VAT_DISCOUNT:
@@ -72,65 +67,119 @@ def adjust_contract(
             adjustment_variable=OptimizationParameter.DEPRECIATION_ACCELERATION,
         )
 
+    argument_contract2 = dict(contract.argument_contract2)
+    overrides = {}
+
     # The condition when contract is Cost Recovery
     if isinstance(contract.contract2, CostRecovery):
         # Changing the attributes of the contract based on the chosen variable
         if variable is OptimizationParameter.OIL_CTR_PRETAX:
-            contract.contract2.oil_ctr_pretax_share = value
+            overrides['oil_ctr_pretax_share'] = value
 
         if variable is OptimizationParameter.GAS_CTR_PRETAX:
-            contract.contract2.gas_ctr_pretax_share = value
+            overrides['gas_ctr_pretax_share'] = value
 
         if variable is OptimizationParameter.OIL_FTP_PORTION:
-            contract.contract2.oil_ftp_portion = value
+            overrides['oil_ftp_portion'] = value
 
         if variable is OptimizationParameter.GAS_FTP_PORTION:
-            contract.contract2.gas_ftp_portion = value
+            overrides['gas_ftp_portion'] = value
 
         if variable is OptimizationParameter.OIL_IC:
-            contract.contract2.oil_ic_rate = value
+            overrides['oil_ic_rate'] = value
 
         if variable is OptimizationParameter.GAS_IC:
-            contract.contract2.gas_ic_rate = value
+            overrides['gas_ic_rate'] = value
 
         if variable is OptimizationParameter.OIL_DMO_FEE:
-            contract.contract2.oil_dmo_fee_portion = value
+            overrides['oil_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.GAS_DMO_FEE:
-            contract.contract2.gas_dmo_fee_portion = value
+            overrides['gas_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.VAT_RATE:
-            contract.argument_contract2['vat_rate'] = value
+            argument_contract2['vat_rate'] = value
 
         if variable is OptimizationParameter.EFFECTIVE_TAX_RATE:
-            contract.argument_contract2['effective_tax_rate'] = value
+            argument_contract2['effective_tax_rate'] = value
 
     # The condition when contract is Gross Split
     if isinstance(contract.contract2, GrossSplit):
         # Changing the attributes of the contract based on the chosen variable
         if variable is OptimizationParameter.MINISTERIAL_DISCRETION:
-            contract.contract2.split_ministry_disc = value
+            overrides['split_ministry_disc'] = value
 
         if variable is OptimizationParameter.OIL_DMO_FEE:
-            contract.contract2.oil_dmo_fee_portion = value
+            overrides['oil_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.GAS_DMO_FEE:
-            contract.contract2.gas_dmo_fee_portion = value
+            overrides['gas_dmo_fee_portion'] = value
 
         if variable is OptimizationParameter.VAT_RATE:
-            contract.argument_contract2['vat_rate'] = value
+            argument_contract2['vat_rate'] = value
 
         if variable is OptimizationParameter.EFFECTIVE_TAX_RATE:
-            contract.argument_contract2['effective_tax_rate'] = value
+            argument_contract2['effective_tax_rate'] = value
 
-    # Running the contract
-    contract.run(**contract_arguments)
+    contract_adjusted = contract.clone(
+        contract2=contract.contract2.clone(**overrides) if overrides else contract.contract2,
+        argument_contract2=argument_contract2,
+    )
 
-    # Get the summary of the new contract and get its value of the targeted optimization
-    summary_argument['contract'] = contract
-    result_psc = get_summary(**summary_argument)[target_parameter]
+    return contract_adjusted, dict(contract_arguments)
 
-    return result_psc, contract
+
+def adjust_contract(
+        contract: Transition,
+        contract_arguments: dict,
+        variable: OptimizationParameter,
+        value: float,
+        summary_argument: dict,
+        target_parameter: str
+) -> (Transition, dict):
+    """
+    The function used to adjust the variable within a psc contract object.
+    This function will be used by optimize_psc().
+
+    Parameters
+    ----------
+    contract: CostRecovery | GrossSplit
+        The contract object.
+    contract_arguments: dict
+        The contract arguments that passed on the fly .run() of the contract dataclass.
+    variable: OptimizationParameter
+        The enum selection of variable that will be changed.
+    value: float
+        The new value of the variable that will be replaced.
+    summary_argument: dict
+        The dictionary containing the arguments that passed summary function.
+    target_parameter: str
+        The string of the targeted parameter.
+
+    Notes
+    -------
+    The passed contract and contract arguments are not modified, the adjusted copy
+    of the contract is run instead. See get_adjusted_contract().
+
+    Returns
+    -------
+    out: tuple
+        The result of the target parameter and contract object that has been modified and run.
+
+    """
+    contract_adjusted, contract_arguments_adjusted = get_adjusted_contract(
+        contract=contract,
+        contract_arguments=contract_arguments,
+        variable=variable,
+        value=value,
+    )
+
+    return evaluate_contract(
+        contract=contract_adjusted,
+        contract_arguments=contract_arguments_adjusted,
+        summary_argument=summary_argument,
+        target_parameter=target_parameter,
+    )
 
 
 def adjust_cost_element(
@@ -375,8 +424,7 @@ def adjust_cost_element(
         raise OptimizationExceptionTransition(f"Contract Type {type(contract)} , is not recognized for optimization module")
 
     # Replacing the second contract with the contract_adjusted
-    contract_adjusted = contract
-    contract_adjusted.contract2 = contract2_adjusted
+    contract_adjusted = contract.clone(contract2=contract2_adjusted)
 
     return contract_adjusted
 
@@ -388,6 +436,12 @@ def optimize_psc_core(
     target_optimization_value: float,
     summary_argument: dict,
     target_parameter: OptimizationTarget = OptimizationTarget.IRR,
+    method: OptimizationMethod = OptimizationMethod.BOUNDED,
+    tolerance: float = 1e-6,
+    max_iter: int = 50,
+    executor: str | None = None,
+    max_workers: int | None = None,
+    evaluation_stats: dict | None = None,
  ) -> (list, list, float, list):
     """
     The function to get contract variable(s) that resulting the desired target or contract's economic target.
@@ -407,6 +461,21 @@ def optimize_psc_core(
         The dictionary containing the arguments that passed summary function.
     target_parameter: OptimizationTarget
         The enum selection for economic indicator  that will be optimized.
+    method: OptimizationMethod
+        The search method. BOUNDED minimizes the absolute difference to the target,
+        ROOT finds the root of the difference to the target within the bounds.
+    tolerance: float
+        The accepted difference to the target, in the unit of the targeted indicator.
+        Only used by the ROOT method.
+    max_iter: int
+        The maximum number of iterations of the ROOT method.
+    executor: str | None
+        The pool to evaluate the independent contract states on: 'process', 'thread',
+        or None to evaluate them serially. See optimize_parameters().
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+    evaluation_stats: dict | None
+        A dictionary in which the evaluations of the request are counted. See optimize_parameters().
 
     Notes
     -------
@@ -450,140 +519,18 @@ def optimize_psc_core(
             f"is should be one of: {[OptimizationTarget.value]}"
         )
 
-    # Changing the parameters list[str] into list[OptimizationParameters(Enum)]
-    list_params = dict_optimization['parameter']
-
-    # Defining Base Value list to contain value of optimized parameters and status of the optimization
-    list_params_value = ['Base Value'] * len(list_params)
-
-    # Defining the empty result of optimization target, will be defined later
-    result_optimization = None
-
-    # Defining the executed contract list
-    list_executed_contract = []
-
-    psc = contract
-    for index, param in enumerate(list_params):
-
-        # Get the maximum value of each params
-        if param is OptimizationParameter.OIL_CTR_PRETAX:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_CTR_PRETAX:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.OIL_FTP_PORTION:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.GAS_FTP_PORTION:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.OIL_IC:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_IC:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.OIL_DMO_FEE:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.GAS_DMO_FEE:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.VAT_RATE:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.EFFECTIVE_TAX_RATE:
-            max_value = dict_optimization['min'][index]
-        elif param is OptimizationParameter.VAT_DISCOUNT:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.LBT_DISCOUNT:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.DEPRECIATION_ACCELERATION:
-            max_value = dict_optimization['max'][index]
-        elif param is OptimizationParameter.MINISTERIAL_DISCRETION:
-            max_value = dict_optimization['max'][index]
-        else:
-            raise OptimizationExceptionTransition(f" Optimization parameter, {param}, is not recognized."
-                                                  f" Optimization parameter should be chosen "
-                                                  f"from OptimizationParameter enum.")
-
-        # Changing the Contract parameter value based on the given input
-        result_psc, psc = adjust_contract(
-            contract=psc,
-            contract_arguments=contract_arguments,
-            variable=param,
-            value=max_value,
-            summary_argument=summary_argument,
-            target_parameter=target_parameter,
-        )
-
-        # Able to conduct optimization since the result is greater than the target
-        if result_psc > target_optimization_value:
-            # Defining the upper and lower limit of the optimized variable
-            bounds = (dict_optimization['min'][index],
-                      dict_optimization['max'][index])
-
-            def objective_run(new_value):
-                result_psc_obj, executed_contract = adjust_contract(
-                    contract=psc,
-                    contract_arguments=contract_arguments,
-                    variable=param,
-                    value=new_value,
-                    summary_argument=summary_argument,
-                    target_parameter=target_parameter
-                )
-
-                result_obj = abs(result_psc_obj - target_optimization_value)
-                return result_obj
-
-            # Optimization of the objective function
-            optim_result = minimize_scalar(objective_run, bounds=bounds, method='bounded')
-
-            # Difference value from target and optimization result
-            optimized_diff = optim_result.fun
-
-            # Optimized Parameter Value
-            optimized_parameter = optim_result.x
-
-            # Result of the objective function
-            function_result = optimized_diff + target_optimization_value
-
-            # Writing the result of optimization to the list_params_value
-            list_params_value[index] = optimized_parameter
-
-            # Defining the result_optimization
-            result_optimization = function_result
-
-            # Defining the executed contract
-            executed_contract = adjust_contract(
-                contract=psc,
-                contract_arguments=contract_arguments,
-                variable=param,
-                value=optimized_parameter,
-                summary_argument=summary_argument,
-                target_parameter=target_parameter
-            )[1]
-
-            # Filling the list with executed contract
-            list_executed_contract.append(executed_contract)
-
-            # # Printing for debugging
-            # print('Parameter:', param)
-            # print('Optimized Parameter Value:', optimized_parameter)
-            # print('Targeted Value:', target_optimization_value)
-            # print('Optimization Value:', function_result)
-            # print('Difference of Target and Optimization Result:', optimized_diff)
-
-            # Exiting the loop since the target has been achieved
-            break
-
-        elif result_psc <= target_optimization_value:
-            # Writing the maximum value to the list_params_value
-            list_params_value[index] = max_value
-
-            # Defining the result_optimization
-            result_optimization = result_psc
-
-            list_executed_contract.append(psc)
-
-    # Converting the list of enum into list of str enum value
-    list_str = [enum_value.value for enum_value in list_params]
-
-    # # Printing for debugging
-    # print(list_str)
-    # print(list_params_value)
-    # print(result_optimization)
-
-    return list_str, list_params_value, result_optimization, list_executed_contract
+    return optimize_parameters(
+        dict_optimization=dict_optimization,
+        contract=contract,
+        contract_arguments=contract_arguments,
+        target_optimization_value=target_optimization_value,
+        summary_argument=summary_argument,
+        target_parameter=target_parameter,
+        adjust=get_adjusted_contract,
+        method=method,
+        tolerance=tolerance,
+        max_iter=max_iter,
+        executor=executor,
+        max_workers=max_workers,
+        evaluation_stats=evaluation_stats,
+    )
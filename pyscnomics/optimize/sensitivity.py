@@ -3,6 +3,7 @@ Collection of functions to administer sensitivity analysis.
 """
 
 import numpy as np
+from functools import partial
 
 from pyscnomics.econ import CostOfSales, Lifting, FluidType
 from pyscnomics.io.aggregator import Aggregate
@@ -19,6 +20,8 @@ into fully able to be run in python.
 """
 from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, LBT
 from pyscnomics.tools.summary import get_summary
+from multiprocess import Pool
+from multiprocess.pool import ThreadPool
 
 import pandas as pd
 
@@ -517,6 +520,96 @@ def _adjust_contract(
             run_contract=run_contract,
         )
 
+# The base contract and arguments held by each process pool worker, set once by
+# the pool initializer
+_SCENARIO_STATE = {}
+
+# The elements varied in a sensitivity sweep
+_SENSITIVITY_ELEMENTS = ['CAPEX', 'OPEX', 'OILPRICE', 'GASPRICE', 'LIFTING']
+
+# The indicators retrieved from the summary of each scenario
+_SENSITIVITY_INDICATORS = ['ctr_npv', 'ctr_irr', 'ctr_pi', 'ctr_pot', 'gov_take', 'ctr_net_share',]
+
+
+def _init_scenario_worker(state: dict):
+    _SCENARIO_STATE.clear()
+    _SCENARIO_STATE.update(state)
+
+
+def _calc_scenario_worker(scenario: tuple) -> dict:
+    return _calc_scenario(scenario=scenario, state=_SCENARIO_STATE)
+
+
+def _calc_scenario(scenario: tuple, state: dict) -> dict:
+    """
+    Run a single sensitivity scenario and return its indicators.
+
+    Parameters
+    ----------
+    scenario: tuple
+        The element and the adjustment value of the scenario.
+    state: dict
+        The base contract, contract arguments and summary arguments of the sweep,
+        and the unscaled base contract of the CAPEX and OPEX scenarios under
+        'linear_base' if these scenarios are run on cost-scaled copies.
+
+    Returns
+    -------
+    dict
+        The indicators of the adjusted contract.
+    """
+    element, adjustment_value = scenario
+    contract = state['contract']
+
+    # CAPEX and OPEX scenarios reuse the linear cost stages of one base contract.
+    # As in _adjust_element_single_contract, only the fixed cost of OPEX is scaled.
+    if element in ('CAPEX', 'OPEX') and 'linear_base' in state:
+        contract_adjusted = state['linear_base'].get_cost_scaled(
+            **{element.lower(): adjustment_value},
+            variable_opex=False,
+        )
+        contract_adjusted.run(**state['contract_arguments'])
+
+    else:
+        contract_adjusted = _adjust_contract(
+            contract=contract,
+            contract_arguments=state['contract_arguments'],
+            element=element,
+            adjustment_value=adjustment_value,
+            run_contract=True,
+        )
+    summary = get_summary(
+        **{**state['summary_arguments'], 'contract': contract_adjusted}
+    )
+
+    return {indicator: summary.get(indicator, None) for indicator in _SENSITIVITY_INDICATORS}
+
+
+def _get_scenario_key(
+        contract: BaseProject | CostRecovery | GrossSplit | Transition,
+        element: str,
+        adjustment_value: float,
+) -> tuple:
+    """
+    Get the key of a scenario, equal for scenarios which yield the same contract.
+
+    Any element with an adjustment value of 1.0, and a gas price adjustment of a
+    contract without gas lifting, leave the contract unchanged; they share the key
+    of the base scenario, which is run as the first element adjusted by 1.0.
+    """
+    if isinstance(contract, Transition):
+        liftings = contract.contract1.lifting + contract.contract2.lifting
+    else:
+        liftings = contract.lifting
+
+    has_gas = any(lift.fluid_type is FluidType.GAS for lift in liftings)
+
+    if adjustment_value == 1.0 or (element == 'GASPRICE' and not has_gas):
+        return (_SENSITIVITY_ELEMENTS[0], 1.0)
+
+    return (element, float(adjustment_value))
+
+
 def sensitivity_psc(
         contract: BaseProject | CostRecovery | GrossSplit | Transition,
         contract_arguments: dict,
@@ -525,7 +618,9 @@ def sensitivity_psc(
         max_deviation: float,
         base_value: float = 1.0,
         step: int = 10,
-        dataframe_output: bool = True
+        dataframe_output: bool = True,
+        executor: str | None = None,
+        max_workers: int | None = None,
 )-> dict | pd.DataFrame:
     """
     The function to get the sensitivity analysis of a contract.
@@ -548,11 +643,28 @@ def sensitivity_psc(
         The number of steps to create multipliers. Default is 10.
     dataframe_output: bool
         The option whether the output in a dataframe form or dictionary.
+    executor: str | None
+        The pool to run the scenarios on: 'process', 'thread', or None to run
+        them serially. Default is None.
+    max_workers: int | None
+        The number of workers of the pool. Defaults to the number of CPUs.
+
     Returns
     -------
     out: dict | pd.DataFrame
         The sensitivity result
+
+    Notes
+    -----
+    Scenarios which yield the same contract are run once. In particular, the
+    base case (an adjustment value of 1.0) is run once and shared by all elements.
     """
+    if executor not in ('process', 'thread', None):
+        raise SensitivityException(
+            f"The executor, {executor}, is not recognized. "
+            f"Please select executor between: 'process', 'thread', or None."
+        )
+
     # Get the multipliers
     multipliers = _get_multipliers(
         min_deviation=min_deviation,
@@ -561,34 +673,65 @@ def sensitivity_psc(
         step=step,
     )
 
-    # Adjust the element of the contract and contain it in a list
-    psc_adjusted_dict = {
+    # Map each scenario onto its key and retrieve the unique scenarios
+    scenario_keys = {
         element: {
-            mul: _adjust_contract(
-                contract=contract,
-                contract_arguments=contract_arguments,
-                element=element,
-                adjustment_value=mul,
-                run_contract=True
-            )
+            mul: _get_scenario_key(contract=contract, element=element, adjustment_value=mul)
             for mul in multipliers
         }
-        for element in ['CAPEX', 'OPEX', 'OILPRICE', 'GASPRICE', 'LIFTING']
+        for element in _SENSITIVITY_ELEMENTS
     }
+    scenarios = list(dict.fromkeys(
+        key for element in scenario_keys for key in scenario_keys[element].values()
+    ))
+
+    # Run the unique scenarios
+    state = {
+        'contract': contract,
+        'contract_arguments': contract_arguments,
+        'summary_arguments': summary_arguments,
+    }
+
+    # The base contract of the CAPEX and OPEX scenarios is built once, before the
+    # scenarios are dispatched, so that the workers only read it
+    if not isinstance(contract, Transition) and any(
+            element in ('CAPEX', 'OPEX') for element, _ in scenarios
+    ):
+        state['linear_base'] = _adjust_contract(
+            contract=contract,
+            contract_arguments=contract_arguments,
+            element='CAPEX',
+            adjustment_value=1.0,
+            run_contract=False,
+        )
 
-    # Get the summary of each contract in psc_adjusted_dict and contain it in a dictionary
+    if executor is None:
+        outputs = [_calc_scenario(scenario=scenario, state=state) for scenario in scenarios]
+
+    elif executor == 'thread':
+        with ThreadPool(processes=max_workers) as pool:
+            outputs = pool.map(partial(_calc_scenario, state=state), scenarios)
+
+    else:
+        # Each worker process receives the state once, through the pool initializer
+        with Pool(
+                processes=max_workers, initializer=_init_scenario_worker, initargs=(state,)
+        ) as pool:
+            outputs = pool.map(_calc_scenario_worker, scenarios)
+
+    scenario_result = dict(zip(scenarios, outputs))
+
+    # Get the summary of each scenario and contain it in a dictionary
     summary_adjusted_dict = {
         element: {
-            mul: get_summary(
-                **{**summary_arguments, 'contract': psc_adjusted_dict[element][mul]}
-            )
-            for mul in psc_adjusted_dict[element]
+            mul: scenario_result[scenario_keys[element][mul]]
+            for mul in multipliers
         }
-        for element in psc_adjusted_dict.keys()
+        for element in _SENSITIVITY_ELEMENTS
     }
 
     # Retrieve the value for NPV, IRR, PI, POT, Gov Take, and Contractor Share
-    indicator_list = ['ctr_npv', 'ctr_irr', 'ctr_pi', 'ctr_pot', 'gov_take', 'ctr_net_share',]
+    indicator_list = _SENSITIVITY_INDICATORS
 
     # Transform summary_adjusted_dict into the following structure
     sensitivity_result = {
@@ -3,18 +3,29 @@ Collection of functions to administer Monte Carlo simulation.
 The code below is the modification of the code from PSCnomics. The routine and result of this module is maintaining the
 requirements of the PSCnomics.
 """
+import os
 import copy
+import json
+import atexit
+import warnings
+import threading
 import numpy as np
-from scipy.stats import uniform, triang, truncnorm
+from contextlib import contextmanager
+from dataclasses import replace
+from scipy.stats import uniform, triang, truncnorm, norm, qmc
+from multiprocess import Pool
 
 from pyscnomics.tools.summary import get_summary
+from pyscnomics.tools.helper import get_fingerprint
+from pyscnomics.tools.sketch import QuantileSketch
 from pyscnomics.contracts.project import BaseProject
 from pyscnomics.contracts.costrecovery import CostRecovery
 from pyscnomics.contracts.grossplit import GrossSplit
 from pyscnomics.contracts.transition import Transition
 from pyscnomics.econ import FluidType
-from pyscnomics.econ.selection import UncertaintyDistribution
-from pyscnomics.io.getattr import get_contract_attributes
+from pyscnomics.econ.revenue import Lifting
+from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR, LBT, CostOfSales
+from pyscnomics.econ.selection import UncertaintyDistribution, UncertaintySampling
 from pyscnomics.api.converter import (
     convert_to_float,
     convert_str_to_taxsplit,
@@ -396,6 +407,80 @@ def get_transition(data: dict):
     return get_summary(**summary_arguments_dict)
 
 
+def get_sampling_quantiles(
+    run_number: int,
+    dimension: int,
+    sampling: UncertaintySampling = UncertaintySampling.RANDOM,
+    seed: int | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> np.ndarray:
+    """
+    Generate the uniform quantiles in [0, 1) used to draw the Monte Carlo multipliers.
+
+    Parameters
+    ----------
+    run_number: int
+        Number of runs.
+    dimension: int
+        Number of uncertain parameters.
+    sampling: UncertaintySampling
+        The sampling scheme: plain random, Latin Hypercube or scrambled Sobol.
+    seed: int | None
+        The seed of the sampling. The same seed always returns the same quantiles.
+    start: int
+        The first run of the returned rows.
+    stop: int | None
+        The run after the last run of the returned rows. Defaults to run_number.
+
+    Returns
+    -------
+    quantiles: np.ndarray
+        Array of quantiles of the runs start to stop, with shape (stop - start, dimension).
+
+    Notes
+    -----
+    Latin Hypercube and Sobol samples cover the unit hypercube more evenly than
+    plain random samples, so the percentiles converge with fewer runs. Sobol
+    sequences are best balanced when run_number is a power of two.
+
+    The rows of a seeded sample are the same whether they are generated at once or
+    by ranges of runs. Random and Sobol samples only generate the requested rows,
+    by advancing the generator to the first run. A Latin Hypercube stratifies the
+    whole sample, hence it is generated in full and the requested rows are returned;
+    callers drawing it by ranges should generate it once and slice it instead.
+    """
+    stop = run_number if stop is None else stop
+
+    if sampling == UncertaintySampling.RANDOM:
+        rng = np.random.default_rng(seed)
+        rng.bit_generator.advance(start * dimension)
+        quantiles = rng.random((stop - start, dimension))
+
+    elif sampling == UncertaintySampling.LATIN_HYPERCUBE:
+        quantiles = qmc.LatinHypercube(d=dimension, seed=seed).random(n=run_number)
+        quantiles = quantiles[start:stop]
+
+    elif sampling == UncertaintySampling.SOBOL:
+        sampler = qmc.Sobol(d=dimension, scramble=True, seed=seed)
+        if start > 0:
+            sampler.fast_forward(start)
+
+        # Sobol warns on a run number which is not a power of two
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            quantiles = sampler.random(n=stop - start)
+
+    else:
+        raise MonteCarloException(
+            f"The sampling scheme {sampling} is unavailable. "
+            f"Please select sampling scheme between: "
+            f"(i) Random, (ii) Latin Hypercube, or (iii) Sobol."
+        )
+
+    return quantiles
+
+
 def get_multipliers_montecarlo(
     run_number: int,
     distribution: str,
@@ -403,6 +488,8 @@ def get_multipliers_montecarlo(
     mean_value: float,
     max_value: float,
     std_dev: float,
+    quantiles: np.ndarray | None = None,
+    seed: int | np.random.Generator | None = None,
 ) -> np.ndarray:
     """
     Generate an array of multipliers for Monte Carlo simulation based on the specified distribution.
@@ -421,6 +508,11 @@ def get_multipliers_montecarlo(
         Maximum value for the distribution.
     std_dev: float
         Standard deviation for the normal distribution.
+    quantiles: np.ndarray | None
+        Uniform quantiles in [0, 1) of length run_number. When given, the multipliers
+        are obtained through the inverse CDF of the distribution.
+    seed: int | np.random.Generator | None
+        The seed of the random draw, only used when quantiles is not given.
 
     Returns
     -------
@@ -433,6 +525,11 @@ def get_multipliers_montecarlo(
     - For "Triangular" distribution, the function uses a triangular random variable.
     - For "Normal" distribution, the function uses a truncated normal random variable.
     """
+    def _draw(dist, **kwargs):
+        if quantiles is not None:
+            return dist.ppf(quantiles, **kwargs)
+        return dist.rvs(size=run_number, random_state=seed, **kwargs)
+
     # Uniform distribution
     if distribution == "Uniform":
         # Modify minimum and maximum values
@@ -443,10 +540,10 @@ def get_multipliers_montecarlo(
         }
 
         # Determine multipliers
-        multipliers = uniform.rvs(
+        multipliers = _draw(
+            uniform,
             loc=attrs_updated["min_value"],
             scale=attrs_updated["max_value"] - attrs_updated["min_value"],
-            size=run_number,
         )
 
     # Triangular distribution
@@ -465,11 +562,11 @@ def get_multipliers_montecarlo(
         )
 
         # Determine multipliers
-        multipliers = triang.rvs(
+        multipliers = _draw(
+            triang,
             c=c,
             loc=attrs_updated["min_value"],
             scale=attrs_updated["max_value"] - attrs_updated["min_value"],
-            size=run_number,
         )
 
     # Normal distribution
@@ -490,12 +587,12 @@ def get_multipliers_montecarlo(
         }
 
         # Determine multipliers
-        multipliers_init = truncnorm.rvs(
+        multipliers_init = _draw(
+            truncnorm,
             a=zvalues["min_value"],
             b=zvalues["max_value"],
             loc=zvalues["mean_value"],
             scale=1,
-            size=run_number,
         )
 
         multipliers = (multipliers_init * attrs_updated["std_dev"]) + attrs_updated["mean_value"]
@@ -509,6 +606,64 @@ def get_multipliers_montecarlo(
 
     return multipliers
 
+
+def get_sample_multipliers(
+    parameter: list,
+    run_number: int,
+    sampling: UncertaintySampling = UncertaintySampling.RANDOM,
+    seed: int | None = None,
+    start: int = 0,
+    stop: int | None = None,
+) -> np.ndarray:
+    """
+    Generate the multipliers of the uncertain parameters for the runs start to stop
+    of a Monte Carlo sample.
+
+    Parameters
+    ----------
+    parameter: list
+        The uncertain parameters, with their distribution, minimum, base, maximum
+        and standard deviation.
+    run_number: int
+        Number of runs of the whole sample.
+    sampling: UncertaintySampling
+        The sampling scheme, see get_sampling_quantiles.
+    seed: int | None
+        The seed of the sampling.
+    start: int
+        The first run of the returned rows.
+    stop: int | None
+        The run after the last run of the returned rows. Defaults to run_number.
+
+    Returns
+    -------
+    multipliers: np.ndarray
+        Array of multipliers with shape (stop - start, len(parameter)).
+    """
+    quantiles = get_sampling_quantiles(
+        run_number=run_number,
+        dimension=len(parameter),
+        sampling=sampling,
+        seed=seed,
+        start=start,
+        stop=stop,
+    )
+
+    multipliers = np.ones(quantiles.shape, dtype=np.float64)
+    for i, param in enumerate(parameter):
+        multipliers[:, i] = get_multipliers_montecarlo(
+            run_number=quantiles.shape[0],
+            distribution=param["dist"].value,
+            min_value=param["min"],
+            mean_value=param["base"],
+            max_value=param["max"],
+            std_dev=param["stddev"],
+            quantiles=quantiles[:, i],
+        )
+
+    return multipliers
+
+
 def min_mean_max_retriever(
         contract: BaseProject | CostRecovery | GrossSplit | Transition,
         verbose: bool = False
@@ -598,171 +753,913 @@ def min_mean_max_retriever(
 
 
 
+def _perturb_lifting(
+    lifting: tuple[Lifting, ...],
+    element: str,
+    multiplier: float,
+) -> tuple[Lifting, ...]:
+    """
+    Scale the price or the lifting volume of a tuple of Lifting objects.
+
+    Parameters
+    ----------
+    lifting: tuple[Lifting, ...]
+        The validated Lifting objects of a contract.
+    element: str
+        The perturbed element: "Oil Price", "Gas Price", or "Lifting".
+    multiplier: float
+        The multiplier applied to the associated arrays.
+
+    Returns
+    -------
+    tuple[Lifting, ...]
+        Shallow copies of the Lifting objects with the scaled arrays.
+
+    Notes
+    -----
+    The copies share every untouched array with the original objects and bypass
+    the validation in ``Lifting.__post_init__``, since the scaled arrays keep the
+    shape and the dtype of the validated ones. Consistent with the previous
+    JSON-based routine, element "Lifting" leaves the gas lifting untouched.
+    """
+    lifting_adjusted = []
+
+    for lift in lifting:
+        lift_adj = copy.copy(lift)
+
+        if (
+            (element == "Oil Price" and lift.fluid_type == FluidType.OIL)
+            or (element == "Gas Price" and lift.fluid_type == FluidType.GAS)
+        ):
+            lift_adj.price = lift.price * multiplier
+
+        elif element == "Lifting" and lift.fluid_type != FluidType.GAS:
+            lift_adj.lifting_rate = lift.lifting_rate * multiplier
+            lift_adj.prod_rate = lift.prod_rate * multiplier
+            lift_adj.prod_rate_total = lift_adj.prod_rate + lift.prod_rate_baseline
+
+        lifting_adjusted.append(lift_adj)
+
+    return tuple(lifting_adjusted)
+
+
+def _perturb_cost(
+    cost: tuple[CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales, ...],
+    multiplier: float,
+) -> tuple:
+    """
+    Scale the cost arrays of a tuple of cost objects.
+
+    Parameters
+    ----------
+    cost: tuple[CapitalCost | Intangible | OPEX | ASR | LBT | CostOfSales, ...]
+        The validated cost objects of a contract.
+    multiplier: float
+        The multiplier applied to the cost arrays.
+
+    Returns
+    -------
+    tuple
+        Shallow copies of the cost objects with the scaled cost arrays.
+
+    Notes
+    -----
+    For OPEX, both fixed_cost and cost_per_volume are scaled, hence the derived
+    variable_cost and cost are scaled by the same multiplier.
+    """
+    cost_adjusted = []
+
+    for cst in cost:
+        cst_adj = copy.copy(cst)
+
+        if isinstance(cst, OPEX):
+            cst_adj.fixed_cost = cst.fixed_cost * multiplier
+            cst_adj.cost_per_volume = cst.cost_per_volume * multiplier
+            cst_adj.variable_cost = cst.variable_cost * multiplier
+
+        cst_adj.cost = cst.cost * multiplier
+        cost_adjusted.append(cst_adj)
+
+    return tuple(cost_adjusted)
+
+
+def get_perturbed_contract(
+    contract: BaseProject | CostRecovery | GrossSplit,
+    parameter: list[dict],
+    multipliers: np.ndarray,
+    linear_costs: bool = False,
+) -> BaseProject | CostRecovery | GrossSplit:
+    """
+    Construct a perturbed copy of a contract for a single Monte Carlo run.
+
+    Parameters
+    ----------
+    contract: BaseProject | CostRecovery | GrossSplit
+        The validated base contract.
+    parameter: list[dict]
+        The uncertainty parameters, each identified by its "id":
+        (0) oil price, (1) gas price, (2) OPEX, ASR, LBT, and cost of sales,
+        (3) capital and intangible costs, (4) lifting.
+    multipliers: np.ndarray
+        The multiplier of each uncertainty parameter.
+    linear_costs: bool
+        Whether to leave the cost objects untouched and scale the linear cost
+        stages of the base contract instead (see BaseProject.get_cost_scaled).
+        Not applicable to a contract which is rebuilt from its cost objects
+        before it runs, such as the contracts of a Transition.
+
+    Returns
+    -------
+    BaseProject | CostRecovery | GrossSplit
+        A new contract object built from the scaled lifting and cost objects,
+        with the fiscal terms of the base contract.
+    """
+    attrs = {
+        "lifting": contract.lifting,
+        "capital_cost": contract.capital_cost,
+        "intangible_cost": contract.intangible_cost,
+        "opex": contract.opex,
+        "asr_cost": contract.asr_cost,
+        "lbt_cost": contract.lbt_cost,
+        "cost_of_sales": contract.cost_of_sales,
+    }
+    cost_multipliers = {"capex": 1.0, "opex": 1.0}
+
+    for param, mul in zip(parameter, multipliers):
+        if param["id"] == 0:
+            attrs["lifting"] = _perturb_lifting(attrs["lifting"], "Oil Price", mul)
+
+        elif param["id"] == 1:
+            attrs["lifting"] = _perturb_lifting(attrs["lifting"], "Gas Price", mul)
+
+        elif param["id"] == 2:
+            if linear_costs:
+                cost_multipliers["opex"] = mul
+            else:
+                for key in ["opex", "asr_cost", "lbt_cost", "cost_of_sales"]:
+                    attrs[key] = _perturb_cost(attrs[key], mul)
+
+        elif param["id"] == 3:
+            if linear_costs:
+                cost_multipliers["capex"] = mul
+            else:
+                for key in ["capital_cost", "intangible_cost"]:
+                    attrs[key] = _perturb_cost(attrs[key], mul)
+
+        elif param["id"] == 4:
+            attrs["lifting"] = _perturb_lifting(attrs["lifting"], "Lifting", mul)
+
+    # Reuse the linear cost stages of the base contract
+    if linear_costs:
+        changes = (
+            {"lifting": attrs["lifting"]}
+            if attrs["lifting"] is not contract.lifting
+            else {}
+        )
+        return contract.get_cost_scaled(**cost_multipliers, **changes)
+
+    # Re-derive the fluid-based attributes of the contract from the scaled objects
+    return replace(contract, **attrs)
+
+
+def get_percentile_precision(
+    data: np.ndarray,
+    percentiles: tuple = (10, 50, 90),
+    confidence: float = 0.95,
+) -> tuple:
+    """
+    Estimate the percentiles of a sample and their distribution-free confidence intervals.
+
+    Parameters
+    ----------
+    data: np.ndarray
+        The sample, with the runs along the first axis.
+    percentiles: tuple
+        The percentiles to be estimated, in percent.
+    confidence: float
+        The confidence level of the intervals.
+
+    Returns
+    -------
+    tuple
+        The percentiles, the lower and upper bounds of their confidence intervals,
+        and the relative precision, i.e. the interval half-width divided by the
+        magnitude of the percentile. Each has shape (len(percentiles), ...).
+
+    Notes
+    -----
+    The bounds are order statistics whose ranks follow the normal approximation
+    of the binomial distribution, n * p -/+ z * sqrt(n * p * (1 - p)).
+    """
+    n = data.shape[0]
+    data_sorted = np.sort(data, axis=0)
+    prob, lower_rank, upper_rank = _get_rank_bounds(
+        n=n, percentiles=percentiles, confidence=confidence
+    )
+
+    estimate = np.percentile(a=data, q=percentiles, method="higher", axis=0)
+    lower = data_sorted[lower_rank]
+    upper = data_sorted[upper_rank]
+
+    return estimate, lower, upper, _get_relative_precision(estimate, lower, upper)
+
+
+def get_sketch_percentile_precision(
+    sketches: list,
+    percentiles: tuple = (10, 50, 90),
+    confidence: float = 0.95,
+) -> tuple:
+    """
+    Estimate the percentiles and their confidence intervals from quantile sketches.
+
+    Parameters
+    ----------
+    sketches: list
+        The QuantileSketch of each indicator, all holding the same number of runs.
+    percentiles: tuple
+        The percentiles to be estimated, in percent.
+    confidence: float
+        The confidence level of the intervals.
+
+    Returns
+    -------
+    tuple
+        The same outputs as get_percentile_precision, with one column per sketch.
+    """
+    n = sketches[0].count
+    prob, lower_rank, upper_rank = _get_rank_bounds(
+        n=n, percentiles=percentiles, confidence=confidence
+    )
+
+    estimate = np.column_stack([sk.quantile(prob) for sk in sketches])
+    lower = np.column_stack([sk.quantile((lower_rank + 0.5) / n) for sk in sketches])
+    upper = np.column_stack([sk.quantile((upper_rank + 0.5) / n) for sk in sketches])
+
+    return estimate, lower, upper, _get_relative_precision(estimate, lower, upper)
+
+
+def get_percentile_ranks(n: int, percentiles: tuple = (10, 50, 90)) -> np.ndarray:
+    """
+    Return the ranks of the sorted runs reported as the percentiles of a study.
+
+    The ranks are those taken by np.percentile with method="higher", so that the
+    exact and the streaming aggregation report the same rows.
+
+    Parameters
+    ----------
+    n: int
+        The number of completed runs.
+    percentiles: tuple
+        The percentiles, between 0 and 100.
+
+    Returns
+    -------
+    np.ndarray
+        The 0-based rank of each percentile.
+    """
+    return np.percentile(np.arange(n), percentiles, method="higher").astype(int)
+
+
+def _get_rank_bounds(n: int, percentiles: tuple, confidence: float) -> tuple:
+    prob = np.asarray(percentiles, dtype=np.float64) / 100
+    z = norm.ppf(0.5 + confidence / 2)
+
+    half_rank = z * np.sqrt(n * prob * (1 - prob))
+    lower_rank = np.clip(np.floor(n * prob - half_rank).astype(int), 0, n - 1)
+    upper_rank = np.clip(np.ceil(n * prob + half_rank).astype(int), 0, n - 1)
+
+    return prob, lower_rank, upper_rank
+
+
+def _get_relative_precision(
+    estimate: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> np.ndarray:
+    half_width = (upper - lower) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(half_width == 0, 0.0, half_width / np.abs(estimate))
+
+
+def get_adjusted_contract(
+    contract_type: int,
+    contract: BaseProject | CostRecovery | GrossSplit | Transition,
+    parameter: list,
+    multipliers: np.ndarray,
+) -> BaseProject | CostRecovery | GrossSplit | Transition:
+    """
+    Perturb the base contract with the multipliers of a single Monte Carlo run.
+
+    Parameters
+    ----------
+    contract_type: int
+        The contract type as translated by uncertainty_psc; 3 denotes Transition.
+    contract: BaseProject | CostRecovery | GrossSplit | Transition
+        The base contract.
+    parameter: list
+        The uncertain parameters.
+    multipliers: np.ndarray
+        The multiplier of each parameter.
+
+    Returns
+    -------
+    BaseProject | CostRecovery | GrossSplit | Transition
+        The perturbed contract. For a Transition contract only the second
+        contract is perturbed.
+    """
+    if contract_type >= 3:
+        return replace(
+            contract,
+            contract2=get_perturbed_contract(
+                contract=contract.contract2,
+                parameter=parameter,
+                multipliers=multipliers,
+            ),
+        )
+
+    return get_perturbed_contract(
+        contract=contract,
+        parameter=parameter,
+        multipliers=multipliers,
+        linear_costs=True,
+    )
+
+
+def get_contract_indicators(
+    n: int,
+    contract_type: int,
+    contract: BaseProject | CostRecovery | GrossSplit | Transition,
+    contract_arguments: dict,
+    summary_arguments: dict,
+    parameter: list,
+    multipliers: np.ndarray,
+    store: dict | None = None,
+) -> tuple:
+    """
+    Run a single Monte Carlo realisation and return its indicators.
+
+    Parameters
+    ----------
+    n: int
+        The index of the run.
+    contract_type: int
+        The contract type as translated by uncertainty_psc.
+    contract: BaseProject | CostRecovery | GrossSplit | Transition
+        The base contract.
+    contract_arguments: dict
+        The arguments of the contract run.
+    summary_arguments: dict
+        The arguments of the summary.
+    parameter: list
+        The uncertain parameters.
+    multipliers: np.ndarray
+        The multiplier of each parameter.
+    store: dict | None
+        The memory-mapped arrays of an opened Monte Carlo store. When given, the
+        profiles and indicators of the run are written to row n of the store.
+
+    Returns
+    -------
+    tuple
+        Contractor NPV, IRR, PI, POT, government take and contractor net share.
+        A run which fails returns NaN, and its row of the store is set to NaN.
+    """
+    try:
+        contractAdj = get_adjusted_contract(
+            contract_type=contract_type,
+            contract=contract,
+            parameter=parameter,
+            multipliers=multipliers,
+        )
+        contractAdj.run(**contract_arguments)
+        if store is not None:
+            write_montecarlo_profiles(store=store, n=n, contract=contractAdj)
+
+        csummary = get_summary(**{**summary_arguments, "contract": contractAdj})
+        del contractAdj
+        indicators = (
+            csummary["ctr_npv"],
+            csummary["ctr_irr"],
+            csummary["ctr_pi"],
+            csummary["ctr_pot"],
+            csummary["gov_take"],
+            csummary["ctr_net_share"],
+        )
+        if store is not None:
+            store["indicators"][n] = indicators
+        return indicators
+    except Exception as err:
+        print(f"Error: {err}")
+
+        # Clear the profiles the run may have partially written. A failure of the
+        # store itself is only warned of, so that it only fails this run.
+        if store is not None:
+            try:
+                for key in ("indicators", *_STORE_PROFILES):
+                    store[key][n] = np.nan
+            except Exception as store_err:
+                warnings.warn(
+                    f"The profiles of the failed run {n} could not be cleared "
+                    f"from the Monte Carlo store: {store_err}",
+                    UserWarning,
+                )
+        return (np.nan,) * 6
+
+
+# The base contract held by each pool worker, set once by the pool initializer
+_WORKER_STATE = {}
+
+# The persistent pool and the key of the state its workers were initialized with
+_WORKER_POOL = {"pool": None, "key": None}
+
+# Guards the persistent pool, which a concurrent study must not close while in use
+_WORKER_POOL_LOCK = threading.RLock()
+
+
+def _init_worker(state: dict):
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(state)
+
+
+def _get_chunk(task: tuple) -> tuple:
+    start, stop, sample, multipliers, store_path = task
+
+    # Only the rows of a sample held by the main process are sent along
+    if multipliers is None:
+        multipliers = get_sample_multipliers(
+            parameter=_WORKER_STATE["parameter"], start=start, stop=stop, **sample
+        )
+
+    # The store is opened per chunk, since a warm pool outlives the store of a study
+    store = (
+        open_montecarlo_store(path=store_path, mode="r+")
+        if store_path is not None
+        else None
+    )
+    if store is not None:
+        store["samples"][start:stop] = multipliers
+
+    indicators = np.array(
+        [
+            get_contract_indicators(n=start + i, multipliers=row, store=store, **_WORKER_STATE)
+            for i, row in enumerate(multipliers)
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 6)
+
+    if store is not None:
+        for array in store.values():
+            if isinstance(array, np.memmap):
+                array.flush()
+        del store
+
+    return multipliers, indicators
+
+
+def _sketch_chunk(task: tuple) -> list:
+    # Sketch the indicators and the parameters of the completed runs only
+    multipliers, indicators = _get_chunk(task)
+    completed = ~get_failed_runs(indicators)
+    base = np.array([item["base"] for item in _WORKER_STATE["parameter"]], dtype=np.float64)
+    columns = np.concatenate((indicators, multipliers * base), axis=1)[completed]
+
+    return [QuantileSketch().update(columns[:, i]) for i in range(columns.shape[1])]
+
+
+def get_failed_runs(indicators: np.ndarray) -> np.ndarray:
+    """
+    Flag the runs which failed, whose indicators are all NaN.
+
+    Parameters
+    ----------
+    indicators: np.ndarray
+        The indicators of the runs, with shape (n_runs, 6).
+
+    Returns
+    -------
+    np.ndarray
+        A boolean array of shape (n_runs,), True for each failed run.
+    """
+    return np.all(np.isnan(indicators), axis=1)
+
+
+def get_pool_size(pool_size: int | None = None) -> int:
+    """
+    Resolve the number of worker processes, which defaults to the number of CPUs.
+    """
+    return pool_size if pool_size is not None else (os.cpu_count() or 1)
+
+
+def get_worker_pool(
+    state: dict,
+    key: str,
+    pool_size: int | None = None,
+):
+    """
+    Return a persistent worker pool whose workers hold the given base state.
+
+    The pool is created once and reused for as long as the same key is requested.
+    A different key closes the current pool and starts a new one, because the
+    state is only sent to the workers through the pool initializer.
+
+    Parameters
+    ----------
+    state: dict
+        The keyword arguments of get_contract_indicators shared by all runs.
+    key: str
+        The identity of the state, such as its get_fingerprint digest.
+    pool_size: int | None
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    multiprocess.pool.Pool
+        The worker pool.
+
+    Notes
+    -----
+    The pool may be closed by the next request of a different key. A study which
+    maps tasks on the pool should hold it through use_worker_pool instead.
+    """
+    key = (key, get_pool_size(pool_size=pool_size))
+
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL["pool"] is not None and _WORKER_POOL["key"] == key:
+            return _WORKER_POOL["pool"]
+
+        close_worker_pool()
+        _WORKER_POOL["pool"] = Pool(
+            processes=key[1], initializer=_init_worker, initargs=(state,)
+        )
+        _WORKER_POOL["key"] = key
+
+        return _WORKER_POOL["pool"]
+
+
+@contextmanager
+def use_worker_pool(
+    state: dict,
+    key: str,
+    pool_size: int | None = None,
+):
+    """
+    Hold the persistent worker pool of get_worker_pool for the duration of a block.
+
+    A concurrent study waits for the block to exit before it can swap the pool for
+    one of a different key, so that the pool is not closed while in use.
+
+    Parameters
+    ----------
+    state: dict
+        The keyword arguments of get_contract_indicators shared by all runs.
+    key: str
+        The identity of the state, such as its get_fingerprint digest.
+    pool_size: int | None
+        The number of worker processes. Defaults to the number of CPUs.
+
+    Yields
+    ------
+    multiprocess.pool.Pool
+        The worker pool.
+    """
+    with _WORKER_POOL_LOCK:
+        yield get_worker_pool(state=state, key=key, pool_size=pool_size)
+
+
+def close_worker_pool():
+    """
+    Close the persistent worker pool, if any.
+    """
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL["pool"] is not None:
+            _WORKER_POOL["pool"].close()
+            _WORKER_POOL["pool"].join()
+
+        _WORKER_POOL["pool"] = None
+        _WORKER_POOL["key"] = None
+
+
+atexit.register(close_worker_pool)
+
+
+# The per-run profiles kept in a Monte Carlo store
+_STORE_PROFILES = ("cashflow", "contractor_take", "government_take")
+
+
+def create_montecarlo_store(
+    path: str,
+    run_number: int,
+    parameter: list,
+    project_years: np.ndarray,
+    sampling: UncertaintySampling,
+    seed: int | None,
+):
+    """
+    Create a Monte Carlo store to keep the profiles of every run on disk.
+
+    The store is a directory holding memory-mapped .npy arrays with one row per run:
+    the samples (multipliers), the six indicators and the consolidated cashflow,
+    contractor take and government take profiles. Rows are filled with NaN until
+    their run is evaluated, the samples being written by the chunk of runs which
+    draws them. Rows stay NaN if their run fails. A metadata.json file records
+    the seed, the sampling scheme, the parameters, the project years and the number
+    of failed runs.
+
+    Parameters
+    ----------
+    path: str
+        The directory of the store. It is created if it does not exist.
+    run_number: int
+        The number of runs.
+    parameter: list
+        The uncertain parameters.
+    project_years: np.ndarray
+        The project years of the profiles.
+    sampling: UncertaintySampling
+        The sampling scheme of the multipliers.
+    seed: int | None
+        The seed of the sampling.
+    """
+    os.makedirs(path, exist_ok=True)
+
+    shapes = {"samples": (run_number, len(parameter)), "indicators": (run_number, 6)}
+    shapes.update({key: (run_number, len(project_years)) for key in _STORE_PROFILES})
+    for key, shape in shapes.items():
+        array = np.lib.format.open_memmap(
+            os.path.join(path, f"{key}.npy"), mode="w+", dtype=np.float64, shape=shape
+        )
+        array[:] = np.nan
+        array.flush()
+        del array
+
+    metadata = {
+        "seed": seed,
+        "sampling": sampling.value,
+        "run_number": run_number,
+        "failed_runs": 0,
+        "project_years": np.asarray(project_years).tolist(),
+        "indicators": ProcessMonte.target,
+        "parameter": [
+            {key: (val.value if key == "dist" else val) for key, val in item.items()}
+            for item in parameter
+        ],
+    }
+    with open(os.path.join(path, "metadata.json"), "w") as file:
+        json.dump(metadata, file, indent=2, default=float)
+
+
+def open_montecarlo_store(path: str, mode: str = "r") -> dict:
+    """
+    Open a Monte Carlo store created by create_montecarlo_store.
+
+    Parameters
+    ----------
+    path: str
+        The directory of the store.
+    mode: str
+        The memory-map mode of the arrays, "r" to read or "r+" to write.
+
+    Returns
+    -------
+    dict
+        The metadata under key "metadata", and the memory-mapped arrays under keys
+        "samples", "indicators", "cashflow", "contractor_take" and "government_take".
+    """
+    with open(os.path.join(path, "metadata.json")) as file:
+        store = {"metadata": json.load(file)}
+
+    for key in ("samples", "indicators", *_STORE_PROFILES):
+        store[key] = np.load(os.path.join(path, f"{key}.npy"), mmap_mode=mode)
+
+    return store
+
+
+def write_montecarlo_profiles(
+    store: dict,
+    n: int,
+    contract: BaseProject | CostRecovery | GrossSplit | Transition,
+):
+    """
+    Write the consolidated profiles of an executed contract to row n of a store.
+
+    The contractor take falls back to the contractor net share for contracts
+    without a contractor take. A profile the contract lacks is left as NaN.
+    """
+    profiles = {
+        "cashflow": getattr(contract, "_consolidated_cashflow", None),
+        "contractor_take": getattr(
+            contract,
+            "_consolidated_contractor_take",
+            getattr(contract, "_consolidated_ctr_net_share", None),
+        ),
+        "government_take": getattr(contract, "_consolidated_government_take", None),
+    }
+
+    for key, profile in profiles.items():
+        if profile is not None:
+            length = min(len(profile), store[key].shape[1])
+            store[key][n, :length] = profile[:length]
+
+
+def get_store_percentiles(
+    path: str,
+    profile: str = "cashflow",
+    percentiles: tuple = (10, 50, 90),
+) -> np.ndarray:
+    """
+    Compute the yearly percentiles of a profile kept in a Monte Carlo store.
+
+    Parameters
+    ----------
+    path: str
+        The directory of the store.
+    profile: str
+        The profile, either "cashflow", "contractor_take" or "government_take".
+    percentiles: tuple
+        The percentiles to be computed, in percent.
+
+    Returns
+    -------
+    np.ndarray
+        The percentile profiles, with shape (len(percentiles), n_years). Runs which
+        were not completed are ignored.
+    """
+    if profile not in _STORE_PROFILES:
+        raise MonteCarloException(
+            f"The profile {profile} is unavailable. "
+            f"Please select profile between: {', '.join(_STORE_PROFILES)}."
+        )
+
+    store = open_montecarlo_store(path=path)
+    data = store[profile][: store["metadata"]["run_number"]]
+    completed = ~np.all(np.isnan(data), axis=1)
+
+    return np.percentile(a=data[completed], q=percentiles, axis=0)
+
+
 class ProcessMonte:
     target = ["npv", "irr", "pi", "pot", "gov_take", "ctr_net_share"]
 
-    def __init__(self, type, contract, numSim, params):
+    def __init__(
+        self,
+        type,
+        contract,
+        contract_arguments,
+        summary_arguments,
+        numSim,
+        params,
+        sampling=UncertaintySampling.RANDOM,
+        seed=None,
+        rel_tol=None,
+        batch_size=None,
+        confidence=0.95,
+        pool_size=None,
+        chunk_size=None,
+        streaming=False,
+        store_path=None,
+    ):
         self.type = type
         self.numSim = numSim
+        self.sampling = sampling
+        self.seed = seed
+        self.relTol = rel_tol
+        self.batchSize = batch_size
+        self.confidence = confidence
+        self.poolSize = pool_size
+        self.chunkSize = chunk_size
+        self.streaming = streaming
+        self.storePath = store_path
+
+        # The multipliers are drawn by ranges of runs, which must share one seed.
+        # A seed is drawn here when none is given, so that the outcomes can be reproduced.
+        if self.seed is None:
+            self.seed = int(np.random.SeedSequence().generate_state(1)[0])
+
         self.baseContract = contract
+        self.contractArguments = contract_arguments
+        self.summaryArguments = summary_arguments
         self.parameter = params
+
+        # A Latin Hypercube stratifies the whole sample, hence it is drawn once and held.
+        # Other samples are drawn by ranges of runs, by the workers and per batch.
+        self.multipliers = None
+        if self.sampling == UncertaintySampling.LATIN_HYPERCUBE:
+            if self.streaming:
+                raise MonteCarloException(
+                    f"Latin Hypercube sampling stratifies the whole sample, which "
+                    f"cannot be streamed. Please select Random or Sobol sampling "
+                    f"for a streaming simulation."
+                )
+            self.multipliers = get_sample_multipliers(
+                parameter=self.parameter, **self.get_sample()
+            )
+
+        # The workers of the pool are keyed on the content of the base state, so
+        # repeated studies of the same contract reuse the warm pool
+        self.key = get_fingerprint(self.get_state())
         self.hasGas = False
         for i in range(len(self.parameter)):
             if self.parameter[i]["id"] == 1:
                 self.hasGas = True
                 break
 
-        # Get multipliers
-        self.multipliers = np.ones([self.numSim, len(self.parameter)], dtype=np.float64)
+    def get_sample(self) -> dict:
+        return {"run_number": self.numSim, "sampling": self.sampling, "seed": self.seed}
 
-        for i in range(len(self.parameter)):
-            self.multipliers[:, i] = get_multipliers_montecarlo(
-                run_number=self.numSim,
-                distribution=(
-                    self.parameter[i]["dist"].value
-                ),
-                min_value=self.parameter[i]["min"],
-                mean_value=self.parameter[i]["base"],
-                max_value=self.parameter[i]["max"],
-                std_dev=self.parameter[i]["stddev"],
-            )
+    def get_multipliers(self, start: int, stop: int) -> np.ndarray:
+        """
+        Draw the multipliers of the runs start to stop, so that no more than the
+        multipliers of a batch or a chunk of runs are held at once.
+        """
+        if self.multipliers is not None:
+            return self.multipliers[start:stop, :]
 
-    def Adjust_Data(self, multipliers: np.ndarray):
-        Adj_Contract = copy.deepcopy(self.baseContract)
+        return get_sample_multipliers(
+            parameter=self.parameter, start=start, stop=stop, **self.get_sample()
+        )
 
-        def Adj_Partial_Data(
-            contract_: dict, par: str, key: str, multiplier: float, datakeys: list = []
-        ):
-            for item_key in contract_[key].keys():
-                item = contract_[key][item_key]
-                if (
-                    par == "Lifting"
-                    and key == "lifting"
-                    and item["fluid_type"] == "Gas"
-                ):
-                    continue
-                if key == "lifting":
-                    if (
-                        (par == "Oil Price" and item["fluid_type"] == "Oil")
-                        or (par == "Gas Price" and item["fluid_type"] == "Gas")
-                        or par == "Lifting"
-                    ):
-                        lifting_key = (
-                            ["price"]
-                            if par == "Oil Price" or par == "Gas Price"
-                            else ["lifting_rate", "prod_rate"]
-                        )
-                        for lift_keys in lifting_key:
-                            item[lift_keys] = (
-                                np.array(item[lift_keys]) * multiplier
-                            ).tolist()
-                else:
-                    for data_key in datakeys:
-                        item[data_key] = (
-                            np.array(item[data_key]) * multiplier
-                        ).tolist()
-
-        # for iloop in range(2 if self.type >= 3 else 1):
-        contract_ = (
-            # Adj_Contract if self.type < 3 else Adj_Contract[f"contract_{iloop+1}"]
-            Adj_Contract if self.type < 3 else Adj_Contract[f"contract_{2}"]
+    def get_state(self) -> dict:
+        return {
+            "contract_type": self.type,
+            "contract": self.baseContract,
+            "contract_arguments": self.contractArguments,
+            "summary_arguments": self.summaryArguments,
+            "parameter": self.parameter,
+        }
+
+    def get_project_years(self) -> np.ndarray:
+        if self.type >= 3:
+            contracts = (self.baseContract.contract1, self.baseContract.contract2)
+        else:
+            contracts = (self.baseContract,)
+
+        return np.arange(
+            min(ctr.start_date.year for ctr in contracts),
+            max(ctr.end_date.year for ctr in contracts) + 1,
         )
-        for i in range(len(self.parameter)):
-            # OIl
-            if self.parameter[i]["id"] == 0:
-                Adj_Partial_Data(contract_, "Oil Price", "lifting", multipliers[i])
-            elif self.parameter[i]["id"] == 1:
-                Adj_Partial_Data(contract_, "Gas Price", "lifting", multipliers[i])
-            elif self.parameter[i]["id"] == 2:
-                Adj_Partial_Data(
-                    contract_,
-                    "OPEX",
-                    "opex",
-                    multipliers[i],
-                    ["fixed_cost", "cost_per_volume"],
-                )
-                Adj_Partial_Data(
-                    contract_,
-                    "ASR",
-                    "asr",
-                    multipliers[i],
-                    ["cost"],
-                )
-                Adj_Partial_Data(
-                    contract_,
-                    "LBT",
-                    "lbt",
-                    multipliers[i],
-                    ["cost"],
-                )
-                Adj_Partial_Data(
-                    contract_,
-                    "COS",
-                    "cost_of_sales",
-                    multipliers[i],
-                    ["cost"],
-                )
-            elif self.parameter[i]["id"] == 3:
-                Adj_Partial_Data(
-                    contract_, "CAPEX", "capital", multipliers[i], ["cost"]
-                )
-                Adj_Partial_Data(
-                    contract_, "CAPEX", "intangible", multipliers[i], ["cost"]
-                )
-            elif self.parameter[i]["id"] == 4:
-                Adj_Partial_Data(contract_, "Lifting", "lifting", multipliers[i])
-
-        return Adj_Contract
-
-    def calcContract(self, n: int):
-        try:
-            print(f"Monte Progress:{n}", flush=True)
-            # time.sleep(100)
-
-            dataAdj = self.Adjust_Data(self.multipliers[n, :])
-            csummary = (
-                get_costrecovery(data=dataAdj)
-                if self.type == 1
-                else (
-                    get_grosssplit(data=dataAdj)
-                    if self.type == 2
-                    else (
-                        get_transition(data=dataAdj)
-                        if self.type >= 3
-                        else get_baseproject(data=dataAdj)
-                    )
-                )
+
+    def calcRange(self, start: int, stop: int, streaming: bool = False) -> tuple | list:
+        """
+        Evaluate the runs start to stop on the persistent worker pool.
+
+        Every worker receives the base contract once, through the pool initializer.
+        Tasks are contiguous chunks of runs carrying only their range of runs, whose
+        multipliers are drawn by the worker, and each run sends back its six indicators
+        with its multipliers. Each chunk opens the Monte Carlo store, if any, to write the
+        profiles of its runs. The rows of a Latin Hypercube sample, held here, are sent with
+        their chunk. When streaming, each chunk sends back one QuantileSketch per indicator
+        and parameter of its completed runs instead, merged here.
+        """
+        if self.chunkSize is None:
+            n_workers = get_pool_size(pool_size=self.poolSize)
+            chunk_size = max(int(np.ceil((stop - start) / (4 * n_workers))), 1)
+        else:
+            chunk_size = self.chunkSize
+
+        tasks = [
+            (
+                n,
+                min(n + chunk_size, stop),
+                self.get_sample(),
+                None
+                if self.multipliers is None
+                else self.multipliers[n: min(n + chunk_size, stop), :],
+                self.storePath,
             )
-            del dataAdj
-            return {
-                "n": n,
-                "output": (
-                    csummary["ctr_npv"],
-                    csummary["ctr_irr"],
-                    csummary["ctr_pi"],
-                    csummary["ctr_pot"],
-                    csummary["gov_take"],
-                    csummary["ctr_net_share"],
-                ),
-            }
-        except Exception as err:
-            print(f"Error: {err}")
-            return {
-                "n": n,
-                "output": (
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                ),
-            }
+            for n in range(start, stop, chunk_size)
+        ]
+
+        with use_worker_pool(
+            state=self.get_state(), key=self.key, pool_size=self.poolSize
+        ) as pool:
+            chunks = pool.map(_sketch_chunk if streaming else _get_chunk, tasks)
+
+        if streaming:
+            sketches = chunks[0]
+            for chunk in chunks[1:]:
+                for sketch, other in zip(sketches, chunk):
+                    sketch.merge(other)
+            return sketches
+
+        multipliers, indicators = zip(*chunks)
+        return np.concatenate(multipliers, axis=0), np.concatenate(indicators, axis=0)
 
     def calculate(self):
-        results = np.zeros(
-            [self.numSim, len(self.target) + len(self.parameter)], dtype=np.float64
-        )
+        n_columns = len(self.target) + len(self.parameter)
+
+        if self.storePath is not None:
+            create_montecarlo_store(
+                path=self.storePath,
+                run_number=self.numSim,
+                parameter=self.parameter,
+                project_years=self.get_project_years(),
+                sampling=self.sampling,
+                seed=self.seed,
+            )
+
+        # Streaming keeps one quantile sketch per column instead of every run
+        if self.streaming:
+            sketches = [QuantileSketch() for _ in range(n_columns)]
+        else:
+            results = np.zeros([self.numSim, n_columns], dtype=np.float64)
 
         # # Execute MonteCarlo simulation
         # client = Client()
@@ -791,43 +1688,112 @@ class ProcessMonte:
         #             for index, item in enumerate(self.parameter)
         #         ]
 
-        # Execute MonteCarlo simulation using pathos multiprocessing
-        from pathos.multiprocessing import ProcessingPool as Pool
-        with Pool() as pool:
-            futures = pool.map(self.calcContract, range(self.numSim))
-
-        for res in futures:
-            results[res["n"], 0: len(self.target)] = res["output"]
-            results[res["n"], len(self.target):] = [
-                self.multipliers[res["n"], index] * item["base"]
-                for index, item in enumerate(self.parameter)
-            ]
-
-        # Sorted the results
-        results_sorted = np.take_along_axis(
-            arr=results,
-            indices=np.argsort(results, axis=0),
-            axis=0,
-        )
-        # Specify probability
-        prob = np.arange(1, self.numSim + 1, dtype=np.float64) / self.numSim
-
-        # Arrange the results
-        results_arranged = np.concatenate((prob[:, np.newaxis], results_sorted), axis=1)
-
-        # Calculate P10, P50, P90
-        percentiles = np.percentile(
-            a=results_arranged,
-            q=[10, 50, 90],
-            method="higher",
-            axis=0,
-        )
+        # Execute MonteCarlo simulation on the persistent worker pool.
+        # Without a tolerance all runs are evaluated in a single batch
+        if self.relTol is None:
+            batch_size = self.numSim
+        else:
+            batch_size = self.batchSize or max(self.numSim // 20, 100)
+
+        n_run = 0
+        precision = None
+        base = np.array([item["base"] for item in self.parameter], dtype=np.float64)
+        while n_run < self.numSim:
+            n_next = min(n_run + batch_size, self.numSim)
+
+            if self.streaming:
+                batch = self.calcRange(n_run, n_next, streaming=True)
+                for sketch, other in zip(sketches, batch):
+                    sketch.merge(other)
+            else:
+                multipliers, indicators = self.calcRange(n_run, n_next)
+                results[n_run:n_next, 0: len(self.target)] = indicators
+                results[n_run:n_next, len(self.target):] = multipliers * base
+            n_run = n_next
+
+            # Failed runs are left out of the distribution, and only counted
+            if self.streaming:
+                n_failed = n_run - sketches[0].count
+            else:
+                completed = ~get_failed_runs(results[:n_run, 0: len(self.target)])
+                n_failed = n_run - int(np.sum(completed))
+
+            if n_failed == n_run:
+                raise MonteCarloException(
+                    f"All {n_run} runs of the Monte Carlo simulation failed."
+                )
 
-        # Determine indices of data
-        indices = np.linspace(0, self.numSim, 101)[0:-1].astype(int)
+            # Stop once P10, P50 and P90 of NPV, IRR and PI are precise enough
+            if self.relTol is not None:
+                if self.streaming:
+                    precision = get_sketch_percentile_precision(
+                        sketches=sketches[0:3],
+                        confidence=self.confidence,
+                    )[3]
+                else:
+                    precision = get_percentile_precision(
+                        data=results[:n_run, 0:3][completed],
+                        confidence=self.confidence,
+                    )[3]
+                if np.max(precision) <= self.relTol:
+                    break
+
+        # Record the runs used, which is less than the budget when stopped early
+        if self.storePath is not None:
+            metadata_path = os.path.join(self.storePath, "metadata.json")
+            with open(metadata_path) as file:
+                metadata = json.load(file)
+            metadata["run_number"] = n_run
+            metadata["failed_runs"] = n_failed
+            with open(metadata_path, "w") as file:
+                json.dump(metadata, file, indent=2)
+
+        # Determine indices of data, over the completed runs
+        n_completed = n_run - n_failed
+        indices = np.linspace(0, n_completed, 101)[0:-1].astype(int)
         indices[0] = 1
-        if indices[-1] != self.numSim - 1:
-            indices = np.append(indices, int(self.numSim - 1))
+        if indices[-1] != n_completed - 1:
+            indices = np.append(indices, int(n_completed - 1))
+
+        # The ranks of P10, P50, P90 among the sorted runs
+        ranks = get_percentile_ranks(n=n_completed)
+
+        if self.streaming:
+            # Approximate the sorted runs at the CDF indices and the percentile ranks
+            # from the sketches, whose k-th run of n lies at the probability (k + 0.5) / n
+            results_curve = np.column_stack(
+                [
+                    (indices + 1) / n_completed,
+                    *[sketch.quantile((indices + 0.5) / n_completed) for sketch in sketches],
+                ]
+            )
+
+            # Calculate P10, P50, P90
+            percentiles = np.column_stack(
+                [
+                    (ranks + 1) / n_completed,
+                    *[sketch.quantile((ranks + 0.5) / n_completed) for sketch in sketches],
+                ]
+            )
+
+        else:
+            results = results[:n_run, :][completed]
+
+            # Sorted the results
+            results_sorted = np.take_along_axis(
+                arr=results,
+                indices=np.argsort(results, axis=0),
+                axis=0,
+            )
+            # Specify probability
+            prob = np.arange(1, n_completed + 1, dtype=np.float64) / n_completed
+
+            # Arrange the results
+            results_arranged = np.concatenate((prob[:, np.newaxis], results_sorted), axis=1)
+            results_curve = results_arranged[indices, :]
+
+            # Calculate P10, P50, P90
+            percentiles = results_arranged[ranks, :]
 
         # Final outcomes
         outcomes = {
@@ -836,10 +1802,23 @@ class ProcessMonte:
                 if self.hasGas
                 else ["Oil Price", "Opex", "Capex", "Cum. prod."]
             ),
-            "results": results_arranged[indices, :].tolist(),
+            "results": results_curve.tolist(),
             "P10": percentiles[0, :].tolist(),
             "P50": percentiles[1, :].tolist(),
             "P90": percentiles[2, :].tolist(),
+            "sampling": self.sampling.value,
+            "seed": self.seed,
+            "run_number": n_run,
+            "failed_runs": n_failed,
+            "store_path": self.storePath,
+            "precision": (
+                {
+                    key: precision[:, index].tolist()
+                    for index, key in enumerate(self.target[0:3])
+                }
+                if precision is not None
+                else None
+            ),
         }
 
         return outcomes
@@ -874,6 +1853,15 @@ def uncertainty_psc(
         opex_distribution: UncertaintyDistribution = UncertaintyDistribution.NORMAL,
         capex_distribution: UncertaintyDistribution = UncertaintyDistribution.NORMAL,
         lifting_distribution: UncertaintyDistribution = UncertaintyDistribution.NORMAL,
+        sampling: UncertaintySampling = UncertaintySampling.RANDOM,
+        seed: int | None = None,
+        rel_tol: float | None = None,
+        batch_size: int | None = None,
+        confidence: float = 0.95,
+        pool_size: int | None = None,
+        chunk_size: int | None = None,
+        streaming: bool = False,
+        store_path: str | None = None,
         verbose: bool = True,
 ):
     # Translating the contract type before parsing into ProcessMonte class
@@ -943,19 +1931,23 @@ def uncertainty_psc(
     if FluidType.GAS not in fluid_produced:
         del parameter[1]
 
-    # Constructing the contract key
-    contract_dict = get_contract_attributes(
-        contract=contract,
-        contract_arguments=contract_arguments,
-        summary_arguments=summary_arguments
-    )
-
     # Executing the montecarlo
     monte = ProcessMonte(
         contract_type,
-        contract_dict,
+        contract,
+        contract_arguments,
+        summary_arguments,
         run_number,
         parameter,
+        sampling=sampling,
+        seed=seed,
+        rel_tol=rel_tol,
+        batch_size=batch_size,
+        confidence=confidence,
+        pool_size=pool_size,
+        chunk_size=chunk_size,
+        streaming=streaming,
+        store_path=store_path,
     )
 
     return monte.calculate()
@@ -4,5 +4,6 @@ Specify callable methods from package 'tools'
 
 from .summary import get_summary
 from .table import get_table
+from .sketch import QuantileSketch
 from .rpd import *
 from . import ltp
@@ -2,7 +2,12 @@
 Handles summation operation on two arrays, accounting for different starting years.
 """
 
+import copy
+import hashlib
+import threading
 import numpy as np
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from functools import wraps
 from typing import Dict
@@ -1600,3 +1605,189 @@ def sum_remainder(start_year: int, end_year: int, arr: np.ndarray) -> float:
     duration = end_year - start_year + 1
 
     return np.sum(arr[duration:])
+
+
+def get_fingerprint(target) -> str:
+    """
+    Get a digest of the content of an object, to be used as a cache key.
+
+    Parameters
+    ----------
+    target
+        The object to be fingerprinted. Arrays, dataclasses, dictionaries, lists
+        and tuples are traversed recursively, other objects are represented by repr().
+
+    Returns
+    -------
+    str
+        The hexadecimal digest of the content.
+
+    Notes
+    -----
+    Only the fields of a dataclass which are passed to its constructor are taken into
+    account, so the fingerprint of a contract depends on its inputs and not on the
+    results of its last run. A dataclass whose results also depend on non-init state
+    (e.g. the cost multipliers of a cost-scaled contract) exposes that state through
+    a ``_get_fingerprint_state`` method, whose return value is fingerprinted as well.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    def _update(value):
+        if isinstance(value, np.ndarray):
+            if value.dtype == object:
+                digest.update(f"objarray{value.shape}".encode())
+                _update(value.tolist())
+            else:
+                digest.update(f"array{value.dtype.str}{value.shape}".encode())
+                digest.update(np.ascontiguousarray(value).tobytes())
+
+        elif is_dataclass(value) and not isinstance(value, type):
+            digest.update(f"{type(value).__qualname__}(".encode())
+            for fld in fields(value):
+                if fld.init:
+                    digest.update(f"{fld.name}=".encode())
+                    _update(getattr(value, fld.name))
+            if hasattr(value, "_get_fingerprint_state"):
+                digest.update(b"state=")
+                _update(value._get_fingerprint_state())
+            digest.update(b")")
+
+        elif isinstance(value, dict):
+            digest.update(f"dict{len(value)}{{".encode())
+            for key in sorted(value, key=repr):
+                _update(key)
+                _update(value[key])
+            digest.update(b"}")
+
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"{type(value).__name__}{len(value)}[".encode())
+            for element in value:
+                _update(element)
+            digest.update(b"]")
+
+        else:
+            digest.update(f"{type(value).__qualname__}:{value!r};".encode())
+
+    _update(target)
+
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    A cache of bounded size which evicts its least recently used entry, and keeps
+    the statistics of its lookups. The cache can be shared by several threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries. A maxsize of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._calls = 0
+        self._hits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def get(self, key):
+        """
+        Retrieve the entry of a key, None when missing, and count the lookup.
+        The entry is marked as the most recently used one.
+        """
+        with self._lock:
+            self._calls += 1
+            value = self._entries.get(key)
+
+            if value is not None:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+        return value
+
+    def put(self, key, value):
+        """Store the entry of a key, evicting the least recently used entries beyond maxsize."""
+        with self._lock:
+            self._entries[key] = value
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def info(self) -> dict:
+        """
+        Get the number of lookups, hits and misses, the hit rate, the current size
+        and the maximum size of the cache.
+        """
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hits": self._hits,
+                "misses": self._calls - self._hits,
+                "hit_rate": self._hits / self._calls if self._calls > 0 else 0.0,
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+            }
+
+    def clear(self, maxsize: int = None):
+        """
+        Remove all entries and reset the statistics. When maxsize is given,
+        it replaces the maximum number of entries.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._calls = 0
+            self._hits = 0
+
+            if maxsize is not None:
+                self._maxsize = maxsize
+
+
+def _get_read_only_copy(obj):
+    """Copy a Lifting or cost object, whose arrays are read-only views of the original arrays."""
+    copied = copy.copy(obj)
+    for name, value in vars(copied).items():
+        if isinstance(value, np.ndarray):
+            view = value.view()
+            view.flags.writeable = False
+            vars(copied)[name] = view
+
+    return copied
+
+
+def get_contract_snapshot(contract):
+    """
+    Copy a contract which has been run, to be kept in or retrieved from a cache.
+
+    Parameters
+    ----------
+    contract
+        The contract to be copied.
+
+    Returns
+    -------
+    The copy of the contract, which has its own copy of the result arrays and
+    dictionaries of the run.
+
+    Notes
+    -----
+    The Lifting and cost objects of the contract, and the contracts held by a
+    transition contract, are shared as shallow copies whose arrays are read-only
+    views of the original arrays, rather than copied. Modifying their arrays in
+    place hence raises instead of affecting the cached contract.
+    """
+    snapshot = copy.copy(contract)
+    for name, value in vars(snapshot).items():
+        if isinstance(value, np.ndarray):
+            vars(snapshot)[name] = value.copy()
+        elif isinstance(value, dict):
+            vars(snapshot)[name] = copy.copy(value)
+        elif is_dataclass(value) and not isinstance(value, type):
+            vars(snapshot)[name] = _get_read_only_copy(value)
+        elif isinstance(value, tuple) and value and all(is_dataclass(obj) for obj in value):
+            vars(snapshot)[name] = tuple(_get_read_only_copy(obj) for obj in value)
+
+    return snapshot
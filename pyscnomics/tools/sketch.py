@@ -0,0 +1,178 @@
+"""
+A mergeable quantile sketch to aggregate large samples with bounded memory.
+"""
+
+from dataclasses import dataclass, field
+import numpy as np
+
+
+class QuantileSketchException(Exception):
+    """Exception to be raised when class QuantileSketch is misused"""
+
+    pass
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Create a mergeable sketch which approximates the quantiles of a stream of values.
+
+    The sketch summarises the values as weighted centroids, in the spirit of the
+    merging t-digest. Centroids are formed by binning the sorted values on the
+    scale k(q) = compression / (2 * pi) * arcsin(2q - 1), which keeps centroids
+    small at the tails, so that P10 and P90 stay accurate. The memory used is
+    bounded by the compression, regardless of the number of values.
+
+    Parameters
+    ----------
+    compression: int
+        The accuracy parameter of the sketch. The sketch holds at most about
+        compression / 2 centroids.
+    buffer_size: int
+        The number of incoming values buffered before the centroids are compressed.
+    """
+
+    compression: int = 500
+    buffer_size: int = 10000
+
+    # Attributes to be defined later
+    _means: np.ndarray = field(default=None, init=False, repr=False)
+    _weights: np.ndarray = field(default=None, init=False, repr=False)
+    _buffer: list = field(default=None, init=False, repr=False)
+    _buffer_count: int = field(default=0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    _min: float = field(default=np.inf, init=False, repr=False)
+    _max: float = field(default=-np.inf, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.compression <= 0:
+            raise QuantileSketchException(
+                f"Compression must be positive, not {self.compression}"
+            )
+
+        self._means = np.zeros(0, dtype=np.float64)
+        self._weights = np.zeros(0, dtype=np.float64)
+        self._buffer = []
+
+    @property
+    def count(self) -> int:
+        """The number of values added to the sketch."""
+        return self._count
+
+    def update(self, values: np.ndarray | float) -> "QuantileSketch":
+        """
+        Add values to the sketch.
+
+        Parameters
+        ----------
+        values: np.ndarray | float
+            The values to be added.
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch itself.
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+
+        self._buffer.append(values)
+        self._buffer_count += values.size
+        self._count += values.size
+        self._min = min(self._min, values.min())
+        self._max = max(self._max, values.max())
+
+        if self._buffer_count >= self.buffer_size:
+            self._compress()
+
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other: QuantileSketch
+            The sketch to be merged.
+
+        Returns
+        -------
+        QuantileSketch
+            The sketch itself, now summarising the values of both sketches.
+        """
+        if not isinstance(other, QuantileSketch):
+            raise QuantileSketchException(
+                f"Must merge QuantileSketch, {other} ({other.__class__.__qualname__}) "
+                f"is not an instance of QuantileSketch"
+            )
+
+        other._compress()
+        self._compress()
+
+        # An empty sketch, e.g. of an empty chunk of runs, adds nothing
+        if other._count == 0:
+            return self
+
+        self._means = np.concatenate((self._means, other._means))
+        self._weights = np.concatenate((self._weights, other._weights))
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._compress(force=True)
+
+        return self
+
+    def quantile(self, q: np.ndarray | float) -> np.ndarray | float:
+        """
+        Estimate the quantiles of the values added to the sketch.
+
+        Parameters
+        ----------
+        q: np.ndarray | float
+            The probabilities, between 0 and 1.
+
+        Returns
+        -------
+        np.ndarray | float
+            The estimated quantiles.
+        """
+        if self._count == 0:
+            raise QuantileSketchException("Cannot estimate quantiles of an empty sketch")
+
+        self._compress()
+
+        # Centroids are located at the midpoint of their cumulative weight
+        cum_weights = np.cumsum(self._weights)
+        mid = (cum_weights - self._weights / 2) / cum_weights[-1]
+
+        return np.interp(
+            np.clip(q, 0, 1),
+            np.concatenate(([0.0], mid, [1.0])),
+            np.concatenate(([self._min], self._means, [self._max])),
+        )
+
+    def _compress(self, force: bool = False):
+        if self._buffer_count == 0 and not force:
+            return
+
+        means = np.concatenate([self._means, *self._buffer])
+        weights = np.concatenate(
+            [self._weights, *[np.ones(len(buf)) for buf in self._buffer]]
+        )
+        self._buffer = []
+        self._buffer_count = 0
+
+        order = np.argsort(means, kind="stable")
+        means = means[order]
+        weights = weights[order]
+
+        # Bin the values by the integer part of the k-scale at their mid quantile
+        cum_weights = np.cumsum(weights)
+        q_mid = (cum_weights - weights / 2) / cum_weights[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_mid - 1)
+        _, bins = np.unique(np.floor(k), return_inverse=True)
+
+        self._weights = np.bincount(bins, weights=weights)
+        self._means = np.bincount(bins, weights=means * weights) / self._weights
@@ -0,0 +1,90 @@
+"""
+Shared fixtures of the unit testing
+"""
+
+import pytest
+import numpy as np
+from datetime import date
+
+from pyscnomics.econ.selection import FluidType
+from pyscnomics.econ.revenue import Lifting
+from pyscnomics.econ.costs import CapitalCost, OPEX
+from pyscnomics.contracts.grossplit import GrossSplit
+
+
+@pytest.fixture
+def make_contract():
+    """
+    A factory of small contracts, producing 100 units of oil a year from the
+    onstream year, with optional gas lifting, capital costs and OPEX.
+    """
+
+    def _make_contract(
+        contract_class=GrossSplit,
+        start_year: int = 2023,
+        end_year: int = 2032,
+        onstream_year: int = None,
+        oil_price: float = 70.0,
+        gas: bool = False,
+        costs: bool = True,
+    ):
+        onstream_year = start_year + 2 if onstream_year is None else onstream_year
+        prod_year = np.arange(onstream_year, end_year + 1)
+
+        lifting = [
+            Lifting(
+                start_year=start_year,
+                end_year=end_year,
+                prod_year=prod_year,
+                lifting_rate=np.full(len(prod_year), 100.0),
+                price=np.full(len(prod_year), oil_price),
+                fluid_type=FluidType.OIL,
+            )
+        ]
+        arguments = {}
+
+        if gas:
+            lifting.append(
+                Lifting(
+                    start_year=start_year,
+                    end_year=end_year,
+                    prod_year=prod_year,
+                    lifting_rate=np.full(len(prod_year), 50.0),
+                    price=np.full(len(prod_year), 6.0),
+                    ghv=np.ones(len(prod_year)),
+                    fluid_type=FluidType.GAS,
+                )
+            )
+            arguments["gas_onstream_date"] = date(onstream_year, 1, 1)
+
+        if costs:
+            opex_year = np.arange(start_year + 3, end_year + 1)
+            arguments["capital_cost"] = (
+                CapitalCost(
+                    start_year=start_year,
+                    end_year=end_year,
+                    expense_year=np.array([start_year + 1, start_year + 3]),
+                    cost=np.array([3000.0, 2000.0]),
+                    cost_allocation=[FluidType.OIL, FluidType.OIL],
+                ),
+            )
+            arguments["opex"] = (
+                OPEX(
+                    start_year=start_year,
+                    end_year=end_year,
+                    expense_year=opex_year,
+                    fixed_cost=np.full(len(opex_year), 300.0),
+                    cost_allocation=[FluidType.OIL] * len(opex_year),
+                ),
+            )
+
+        return contract_class(
+            start_date=date(start_year, 1, 1),
+            end_date=date(end_year, 12, 31),
+            oil_onstream_date=date(onstream_year, 1, 1),
+            approval_year=start_year,
+            lifting=tuple(lifting),
+            **arguments,
+        )
+
+    return _make_contract
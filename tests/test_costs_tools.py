@@ -0,0 +1,83 @@
+"""
+A collection of unit testing for the cost adjustment functions in costs_tools
+"""
+
+import numpy as np
+
+from pyscnomics.econ import costs_tools
+from pyscnomics.econ.costs_tools import (
+    get_cost_adjustment_by_inflation,
+    calc_distributed_cost,
+    calc_distributed_cost_total,
+)
+
+
+def test_cost_adjustment_by_inflation():
+
+    # Expected result: cost is inflated from the year after year_inflation
+    # up to and including the expense year
+    calc = get_cost_adjustment_by_inflation(
+        start_year=2023,
+        end_year=2027,
+        cost=np.array([100, 100, 100, 100]),
+        expense_year=np.array([2023, 2025, 2027, 2024]),
+        project_years=np.arange(2023, 2028),
+        year_inflation=np.array([2023, 2023, 2024, 2025]),
+        inflation_rate=np.array([0.0, 0.1, 0.2, 0.0, 0.5]),
+    )
+
+    np.testing.assert_allclose(calc, [100, 132, 180, 100])
+
+
+def test_cost_adjustment_by_inflation_batch():
+
+    rng = np.random.default_rng(0)
+    inputs = {
+        "start_year": 2020,
+        "end_year": 2039,
+        "cost": rng.uniform(0, 100, 50),
+        "expense_year": rng.integers(2020, 2040, 50),
+        "project_years": np.arange(2020, 2040),
+        "year_inflation": rng.integers(2020, 2030, 50),
+    }
+    inflation_rate = rng.uniform(0, 0.1, (4, 20))
+
+    costs_tools._get_inflation_table.cache_clear()
+    calc = get_cost_adjustment_by_inflation(**inputs, inflation_rate=inflation_rate)
+
+    # Only the tables of single inflation series are cached
+    assert costs_tools._get_inflation_table.cache_info().currsize == 0
+
+    assert calc.shape == (4, 50)
+    for i in range(4):
+        np.testing.assert_allclose(
+            calc[i],
+            get_cost_adjustment_by_inflation(**inputs, inflation_rate=inflation_rate[i]),
+        )
+
+    assert costs_tools._get_inflation_table.cache_info().currsize == 4
+
+
+def test_distributed_cost_total():
+
+    inputs = {
+        "cost": np.array([90, 40, 10, 30]),
+        "expense_year": np.array([2023, 2024, 2026, 2025]),
+        "final_year": np.array([2025, 2025, 2030, 2025]),
+        "project_years": np.arange(2023, 2028),
+        "project_duration": 5,
+    }
+
+    # Expected results: the last two years of the third element fall outside the project
+    distributed = np.array(
+        [
+            [30, 0, 0, 0],
+            [30, 20, 0, 0],
+            [30, 20, 0, 30],
+            [0, 0, 2, 0],
+            [0, 0, 2, 0],
+        ]
+    )
+
+    np.testing.assert_allclose(calc_distributed_cost(**inputs), distributed)
+    np.testing.assert_allclose(calc_distributed_cost_total(**inputs), [30, 50, 80, 2, 2])
@@ -10,6 +10,8 @@ from pyscnomics.econ.depreciation import (
     straight_line_book_value,
     declining_balance_book_value,
     psc_declining_balance_book_value,
+    declining_balance_depreciation_matrix,
+    get_depreciation_schedule,
 )
 
 
@@ -278,3 +280,40 @@ def test_psc_decline_balance_depreciation():
         cost - np.sum(calc_depre2), np.array([0]), atol=tolerance
     )
     np.testing.assert_allclose(book2, calc_book2)
+
+
+def test_depreciation_matrix_and_schedule():
+    """A unit testing for depreciation of several assets at once"""
+
+    # Expected results: each row equals the depreciation of a single asset
+    cost = np.array([100, 50, 80])
+    salvage_value = np.array([0, 10, 0])
+    useful_life = np.array([5, 3, 2])
+
+    calc_matrix = declining_balance_depreciation_matrix(
+        cost=cost,
+        salvage_value=salvage_value,
+        useful_life=useful_life,
+        decline_factor=2,
+        depreciation_len=6,
+    )
+
+    assert calc_matrix.shape == (3, 6)
+    for row, c, sv, ul in zip(calc_matrix, cost, salvage_value, useful_life):
+        np.testing.assert_allclose(
+            row,
+            declining_balance_depreciation_rate(
+                cost=c, salvage_value=sv, useful_life=ul, depreciation_len=6
+            ),
+        )
+
+    # Expected results: charges start at the placed-in-service periods, and
+    # the charges after the last period are undepreciated
+    calc_total, calc_undepreciated = get_depreciation_schedule(
+        depreciation_charge=np.array([[10, 10, 10, 0], [5, 5, 5, 5]]),
+        shift=np.array([0, 2]),
+        depreciation_len=4,
+    )
+
+    np.testing.assert_allclose(calc_total, [10, 10, 15, 5])
+    np.testing.assert_allclose(calc_undepreciated, 10)
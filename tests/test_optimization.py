@@ -0,0 +1,258 @@
+"""
+A collection of unit testing for the optimization of a contract
+"""
+
+import pytest
+import numpy as np
+
+from pyscnomics.econ.selection import OptimizationParameter, OptimizationMethod
+from pyscnomics.optimize import optimization, optimization_transition
+from pyscnomics.optimize.optimization import (
+    OptimizationException,
+    evaluate_contract,
+    get_parameter_bounds,
+    get_root_optimization,
+    get_evaluation_cache_info,
+    get_evaluation_stats_info,
+    clear_evaluation_cache,
+    optimize_parameters,
+)
+
+
+@pytest.fixture
+def summary_calls(monkeypatch):
+    # Counts the evaluations which are not served from the cache
+    calls = []
+
+    def _get_summary(contract, **kwargs):
+        calls.append(contract)
+        return {"ctr_npv": float(np.sum(contract._oil_wap_price))}
+
+    monkeypatch.setattr(optimization, "get_summary", _get_summary)
+    clear_evaluation_cache(maxsize=256)
+    yield calls
+    clear_evaluation_cache(maxsize=256)
+
+
+@pytest.fixture
+def evaluate_price(make_contract):
+    # Evaluates the contract at the given oil price
+    def _evaluate(oil_price: float) -> float:
+        return evaluate_contract(
+            contract=make_contract(oil_price=oil_price),
+            contract_arguments={},
+            summary_argument={"discount_rate": 0.1},
+            target_parameter="ctr_npv",
+        )
+
+    return _evaluate
+
+
+def test_evaluation_cache_hit(summary_calls, evaluate_price):
+
+    first, executed = evaluate_price(oil_price=70.0)
+    second, cached = evaluate_price(oil_price=70.0)
+
+    # Expected result: the second evaluation is served from the cache, as a copy
+    assert second == first == 560.0
+    assert len(summary_calls) == 1
+    assert cached is not executed
+    np.testing.assert_array_equal(cached._oil_wap_price, executed._oil_wap_price)
+
+    info = get_evaluation_cache_info()
+    assert (info["calls"], info["hits"], info["misses"], info["size"]) == (2, 1, 1, 1)
+
+
+def test_evaluation_cache_lru_eviction(summary_calls, evaluate_price):
+
+    clear_evaluation_cache(maxsize=2)
+    evaluate_price(oil_price=60.0)
+    evaluate_price(oil_price=70.0)
+    evaluate_price(oil_price=60.0)
+    evaluate_price(oil_price=80.0)
+
+    # Expected result: 70.0 is the least recently used evaluation and is evicted
+    assert get_evaluation_cache_info()["size"] == 2
+    evaluate_price(oil_price=60.0)
+    assert len(summary_calls) == 3
+    evaluate_price(oil_price=70.0)
+    assert len(summary_calls) == 4
+
+
+def test_evaluation_cache_disabled(summary_calls, evaluate_price):
+
+    clear_evaluation_cache(maxsize=0)
+    evaluate_price(oil_price=70.0)
+    evaluate_price(oil_price=70.0)
+
+    # Expected result: every evaluation runs the contract
+    assert len(summary_calls) == 2
+    assert get_evaluation_cache_info()["size"] == 0
+    assert get_evaluation_cache_info()["maxsize"] == 0
+
+    with pytest.raises(optimization.OptimizationException):
+        clear_evaluation_cache(maxsize=-1)
+
+
+@pytest.fixture
+def optimize_price(make_contract):
+    # Optimizes the oil price of the contract, counting the evaluations of the request
+    def _adjust(contract, contract_arguments, param, value):
+        return make_contract(oil_price=value), contract_arguments
+
+    def _optimize(executor: str | None = None) -> dict:
+        evaluation_stats = {}
+        optimize_parameters(
+            dict_optimization={
+                "parameter": [OptimizationParameter.OIL_CTR_PRETAX],
+                "min": np.array([50.0]),
+                "max": np.array([90.0]),
+            },
+            contract=make_contract(),
+            contract_arguments={},
+            target_optimization_value=600.0,
+            summary_argument={"discount_rate": 0.1},
+            target_parameter="ctr_npv",
+            adjust=_adjust,
+            method=OptimizationMethod.ROOT,
+            executor=executor,
+            evaluation_stats=evaluation_stats,
+        )
+
+        return get_evaluation_stats_info(evaluation_stats=evaluation_stats)
+
+    return _optimize
+
+
+def test_evaluation_stats_per_request(summary_calls, optimize_price):
+
+    first = optimize_price()
+
+    # Expected result: the misses of the request are its contract runs
+    assert first["misses"] == len(summary_calls) > 0
+    assert first["hits"] > 0
+    assert first["hit_rate"] == first["hits"] / first["calls"]
+
+    # Expected result: the repeated request is served from the evaluation cache
+    second = optimize_price()
+    assert len(summary_calls) == first["misses"]
+    assert second["calls"] == first["calls"]
+    assert (second["hits"], second["misses"], second["hit_rate"]) == (second["calls"], 0, 1.0)
+
+
+def test_evaluation_stats_with_executor(summary_calls, optimize_price):
+
+    info = optimize_price(executor="thread")
+
+    # Expected result: the evaluations run on the worker pool are counted
+    assert info["misses"] == len(summary_calls) > 0
+    assert get_evaluation_stats_info(evaluation_stats={})["hit_rate"] == 0.0
+
+
+def _memoized(function):
+    # The evaluate callable of optimize_parameters, counting the distinct evaluations
+    evaluations = {}
+
+    def evaluate(value):
+        value = float(value)
+        if value not in evaluations:
+            evaluations[value] = (function(value), None)
+        return evaluations[value]
+
+    return evaluate, evaluations
+
+
+def test_root_optimization_brentq():
+
+    # A decreasing indicator, e.g. of the FTP portion, which is most favourable at its minimum
+    evaluate, evaluations = _memoized(lambda value: 20.0 * (1.0 - value) ** 2)
+    optimized = get_root_optimization(
+        evaluate=evaluate,
+        bounds=(0.0, 1.0),
+        max_value=0.0,
+        other_value=1.0,
+        target_optimization_value=5.0,
+        tolerance=1.0e-6,
+    )
+
+    # Expected result: Brent's method stops within the tolerance in a few evaluations
+    assert abs(evaluate(optimized)[0] - 5.0) <= 1.0e-6
+    np.testing.assert_allclose(optimized, 0.5, atol=1.0e-6)
+    assert len(evaluations) < 15
+
+
+def test_root_optimization_target_at_bound():
+
+    evaluate, evaluations = _memoized(lambda value: 10.0 * value)
+    optimized = get_root_optimization(
+        evaluate=evaluate,
+        bounds=(0.0, 1.0),
+        max_value=1.0,
+        other_value=0.0,
+        target_optimization_value=10.0,
+    )
+
+    # Expected result: the most favourable value already meets the target
+    assert optimized == 1.0
+    assert list(evaluations) == [1.0]
+
+
+def test_root_optimization_bounded_fallback():
+
+    # A non-monotone indicator above the target at both bounds, hence not bracketed
+    evaluate, evaluations = _memoized(lambda value: 40.0 * (value - 0.5) ** 2)
+    optimized = get_root_optimization(
+        evaluate=evaluate,
+        bounds=(0.0, 1.0),
+        max_value=0.0,
+        other_value=1.0,
+        target_optimization_value=2.0,
+    )
+
+    # Expected result: the bounded minimization of the difference reaches the target
+    assert abs(evaluate(optimized)[0] - 2.0) < 1.0e-3
+    assert 0.0 < optimized < 1.0
+
+
+def test_parameter_bounds():
+
+    dict_optimization = {
+        "parameter": [
+            OptimizationParameter.OIL_CTR_PRETAX,
+            OptimizationParameter.OIL_FTP_PORTION,
+            OptimizationParameter.EFFECTIVE_TAX_RATE,
+            "Oil Price",
+        ],
+        "min": np.array([0.3, 0.05, 0.22, 50.0]),
+        "max": np.array([0.7, 0.2, 0.4, 90.0]),
+    }
+
+    # Expected result: the most favourable value for the contractor comes first
+    assert get_parameter_bounds(dict_optimization, 0) == (0.7, 0.3)
+    assert get_parameter_bounds(dict_optimization, 1) == (0.05, 0.2)
+    assert get_parameter_bounds(dict_optimization, 2) == (0.22, 0.4)
+
+    with pytest.raises(OptimizationException):
+        get_parameter_bounds(dict_optimization, 3)
+
+
+def test_transition_optimization_method(monkeypatch):
+
+    calls = []
+    monkeypatch.setattr(
+        optimization_transition, "optimize_parameters", lambda **kwargs: calls.append(kwargs)
+    )
+    optimization_transition.optimize_psc_core(
+        dict_optimization={},
+        contract=None,
+        contract_arguments={},
+        target_optimization_value=0.1,
+        summary_argument={},
+        method=OptimizationMethod.ROOT,
+        tolerance=1.0e-3,
+    )
+
+    # Expected result: the search method and its tolerance reach the shared search
+    assert calls[0]["method"] is OptimizationMethod.ROOT
+    assert calls[0]["tolerance"] == 1.0e-3
+    assert calls[0]["target_parameter"] == "ctr_irr"
@@ -7,10 +7,12 @@ import pytest
 import numpy as np
 from datetime import date
 
-from pyscnomics.econ.selection import FluidType, TaxType
+from pyscnomics.econ.selection import FluidType, TaxType, CostType, DeprMethod
 from pyscnomics.econ.revenue import Lifting
 from pyscnomics.econ.costs import CapitalCost, Intangible, OPEX, ASR
 from pyscnomics.contracts.project import BaseProject, BaseProjectException
+import pyscnomics.contracts.project as project_module
+from pyscnomics.tools.helper import get_fingerprint
 
 
 # Create an example of Lifting data
@@ -369,3 +371,329 @@ def test_base_project_asr_expenditures():
     np.testing.assert_allclose(gas_case1, gas_case1_calc)
     np.testing.assert_allclose(oil_case2, oil_case2_calc)
     np.testing.assert_allclose(gas_case2, gas_case2_calc)
+
+
+def test_base_project_cost_scaled():
+    """A unit testing for the linear-scaling shortcut of CAPEX and OPEX"""
+
+    def _make_project(capex: float = 1.0, opex: float = 1.0) -> BaseProject:
+        return BaseProject(
+            start_date=date(2023, 1, 1),
+            end_date=date(2030, 12, 31),
+            oil_onstream_date=date(2023, 1, 1),
+            gas_onstream_date=date(2024, 1, 1),
+            approval_year=2023,
+            lifting=(lifting_mangga, lifting_jeruk),
+            capital_cost=(
+                CapitalCost(
+                    start_year=2023,
+                    end_year=2030,
+                    cost=np.array([100, 50]) * capex,
+                    expense_year=np.array([2023, 2025]),
+                    cost_allocation=[FluidType.OIL, FluidType.GAS],
+                    tax_portion=np.array([0.5, 0.5]),
+                ),
+            ),
+            opex=(
+                OPEX(
+                    start_year=2023,
+                    end_year=2030,
+                    fixed_cost=np.array([10, 10, 10]) * opex,
+                    expense_year=np.array([2024, 2025, 2026]),
+                    cost_allocation=[FluidType.OIL] * 3,
+                ),
+            ),
+        )
+
+    run_arguments = {"tax_rate": 0.11, "inflation_rate": 0.05}
+
+    # Expected result: a cost-scaled copy equals a project built with scaled costs
+    base = _make_project()
+    base.run(**run_arguments)
+
+    for capex, opex in [(1.5, 1.0), (0.8, 1.2)]:
+        expected = _make_project(capex=capex, opex=opex)
+        expected.run(**run_arguments)
+
+        scaled = base.get_cost_scaled(capex=capex, opex=opex)
+        scaled.run(**run_arguments)
+
+        np.testing.assert_allclose(
+            scaled._consolidated_cashflow, expected._consolidated_cashflow
+        )
+        np.testing.assert_allclose(
+            scaled._oil_capital_indirect_tax, expected._oil_capital_indirect_tax
+        )
+
+    # The base project keeps its own results
+    reference = _make_project()
+    reference.run(**run_arguments)
+    base.run(**run_arguments)
+    np.testing.assert_allclose(
+        base._consolidated_cashflow, reference._consolidated_cashflow
+    )
+
+    # A cost-scaled copy does not share the fingerprint of its source
+    assert base.get_cost_scaled(capex=2.0, opex=3.0)._get_fingerprint_state() == {
+        "capex": 2.0,
+        "opex": 3.0,
+    }
+    fingerprint = get_fingerprint(base.get_cost_scaled(capex=2.0, opex=3.0))
+    assert fingerprint != get_fingerprint(base)
+    assert fingerprint != get_fingerprint(base.get_cost_scaled(capex=3.0, opex=2.0))
+    assert fingerprint == get_fingerprint(base.get_cost_scaled(capex=2.0, opex=3.0))
+
+    # Cost objects cannot be changed in a cost-scaled copy
+    with pytest.raises(BaseProjectException):
+        base.get_cost_scaled(capex=2.0, capital_cost=base.capital_cost)
+
+
+
+def test_base_project_cost_scaled_nonlinear():
+    """A unit testing for cost-scaled copies of a project with salvage value and variable OPEX"""
+
+    def _make_project(
+        capex: float = 1.0, opex: float = 1.0, variable_opex: float = None
+    ) -> BaseProject:
+        variable_opex = opex if variable_opex is None else variable_opex
+        return BaseProject(
+            start_date=date(2023, 1, 1),
+            end_date=date(2030, 12, 31),
+            oil_onstream_date=date(2023, 1, 1),
+            gas_onstream_date=date(2024, 1, 1),
+            approval_year=2023,
+            lifting=(lifting_mangga, lifting_jeruk),
+            capital_cost=(
+                CapitalCost(
+                    start_year=2023,
+                    end_year=2030,
+                    cost=np.array([100, 50]) * capex,
+                    expense_year=np.array([2024, 2025]),
+                    cost_allocation=[FluidType.OIL, FluidType.GAS],
+                    salvage_value=np.array([20, 10]),
+                    useful_life=np.array([4, 4]),
+                ),
+            ),
+            opex=(
+                OPEX(
+                    start_year=2023,
+                    end_year=2030,
+                    fixed_cost=np.array([10, 10, 10]) * opex,
+                    prod_rate=np.array([5, 5, 5]),
+                    cost_per_volume=np.array([20, 20, 20]) * variable_opex,
+                    expense_year=np.array([2024, 2025, 2026]),
+                    cost_allocation=[FluidType.OIL] * 3,
+                ),
+            ),
+        )
+
+    run_arguments = {"tax_rate": 0.11, "inflation_rate": 0.05}
+    depr_arguments = {"depr_method": DeprMethod.SL}
+
+    # Expected result: the capital cost and both the fixed and variable OPEX are scaled
+    base = _make_project()
+    base.run(**run_arguments)
+
+    for capex, opex in [(1.5, 1.0), (0.8, 1.2)]:
+        expected = _make_project(capex=capex, opex=opex)
+        expected.run(**run_arguments)
+
+        scaled = base.get_cost_scaled(capex=capex, opex=opex)
+        scaled.run(**run_arguments)
+
+        np.testing.assert_allclose(
+            scaled._consolidated_cashflow, expected._consolidated_cashflow
+        )
+
+        for fluid in ["oil_capital", "gas_capital"]:
+            for calc, expect in zip(
+                scaled._get_depreciation(**depr_arguments)[fluid],
+                expected._get_depreciation(**depr_arguments)[fluid],
+            ):
+                np.testing.assert_allclose(calc, expect)
+
+    # Expected result: with variable_opex=False, only the fixed cost of OPEX is scaled
+    expected = _make_project(opex=1.2, variable_opex=1.0)
+    expected.run(**run_arguments)
+
+    scaled = base.get_cost_scaled(opex=1.2, variable_opex=False)
+    scaled.run(**run_arguments)
+
+    np.testing.assert_allclose(
+        scaled._consolidated_cashflow, expected._consolidated_cashflow
+    )
+
+    # Expected result: a contract with variable OPEX which is not scaled shares
+    # no linear cache, and is fingerprinted by its rebuilt cost objects
+    assert not base._is_cost_scaling_linear(variable_opex=False)
+    assert scaled._get_fingerprint_state() is None
+    assert get_fingerprint(scaled) == get_fingerprint(expected)
+
+
+def test_base_project_clone():
+    """A unit testing for the copy-on-write clone of a project"""
+
+    base = BaseProject(
+        start_date=date(2023, 1, 1),
+        end_date=date(2030, 12, 31),
+        oil_onstream_date=date(2023, 1, 1),
+        gas_onstream_date=date(2024, 1, 1),
+        approval_year=2023,
+        lifting=(lifting_mangga, lifting_jeruk),
+        capital_cost=(
+            CapitalCost(
+                start_year=2023,
+                end_year=2030,
+                cost=np.array([100, 50]),
+                expense_year=np.array([2023, 2025]),
+                cost_allocation=[FluidType.OIL, FluidType.GAS],
+                tax_portion=np.array([0.5, 0.5]),
+            ),
+        ),
+    )
+    base.run(tax_rate=0.11)
+    base_cashflow = base._consolidated_cashflow.copy()
+
+    # Expected result: the clone shares the inputs and runs independently of the base project
+    cloned = base.clone()
+    assert cloned is not base
+    assert cloned.capital_cost is base.capital_cost
+
+    cloned.run(tax_rate=0.5)
+    np.testing.assert_allclose(base._consolidated_cashflow, base_cashflow)
+    assert not np.allclose(cloned._consolidated_cashflow, base_cashflow)
+
+    cloned.run(tax_rate=0.11)
+    np.testing.assert_allclose(cloned._consolidated_cashflow, base_cashflow)
+
+    # Expected result: overriding a setup attribute constructs the clone again
+    oil_only = base.clone(lifting=(lifting_mangga,))
+    oil_only.run(tax_rate=0.11)
+    np.testing.assert_allclose(oil_only._gas_revenue, 0)
+    np.testing.assert_allclose(base._consolidated_cashflow, base_cashflow)
+
+    # Only the arguments of the project can be overridden
+    with pytest.raises(BaseProjectException):
+        base.clone(project_years=np.arange(2023, 2031))
+
+
+def test_base_project_stage_cache(monkeypatch):
+    """A unit testing for the cached stages of the run pipeline"""
+
+    project = BaseProject(
+        start_date=date(2023, 1, 1),
+        end_date=date(2030, 12, 31),
+        oil_onstream_date=date(2023, 1, 1),
+        gas_onstream_date=date(2024, 1, 1),
+        approval_year=2023,
+        lifting=(lifting_mangga, lifting_jeruk),
+        capital_cost=(
+            CapitalCost(
+                start_year=2023,
+                end_year=2030,
+                cost=np.array([100, 50]),
+                expense_year=np.array([2023, 2025]),
+                cost_allocation=[FluidType.OIL, FluidType.GAS],
+                tax_portion=np.array([0.5, 0.5]),
+            ),
+        ),
+    )
+    project.run(tax_rate=0.11)
+    cashflow = project._consolidated_cashflow.copy()
+
+    calls = []
+    get_expenditures_pre_tax = project._get_expenditures_pre_tax
+
+    def _count_expenditures_pre_tax(**kwargs):
+        calls.append(kwargs)
+        return get_expenditures_pre_tax(**kwargs)
+
+    project._get_expenditures_pre_tax = _count_expenditures_pre_tax
+
+    # Expected result: a re-run with the same inputs restores the expenditures stage
+    project.run(tax_rate=0.11)
+    assert len(calls) == 0
+    np.testing.assert_allclose(project._consolidated_cashflow, cashflow)
+
+    # Expected result: a change of a declared argument computes the stage again
+    project.run(tax_rate=0.5)
+    assert len(calls) == 1
+    assert not np.allclose(project._consolidated_cashflow, cashflow)
+
+    project.run(tax_rate=0.11)
+    assert len(calls) == 2
+    np.testing.assert_allclose(project._consolidated_cashflow, cashflow)
+
+    # Expected result: the setup fingerprint is computed once, and a re-run does not
+    # hash the setup attributes again
+    fingerprints = []
+
+    def _count_fingerprint(value):
+        fingerprints.append(value)
+        return get_fingerprint(value)
+
+    monkeypatch.setattr(project_module, "get_fingerprint", _count_fingerprint)
+
+    setup_key = project._get_setup_fingerprint()
+    assert project._get_setup_fingerprint() == setup_key
+    assert len(fingerprints) == 0
+
+    # Expected result: assigning a setup attribute invalidates the fingerprint
+    project.lifting = (lifting_mangga,)
+    assert project._get_setup_fingerprint() != setup_key
+    assert len(fingerprints) == 1
+
+    # Expected result: a clone holds its own stage cache
+    cloned = project.clone()
+    assert cloned._stage_cache == {}
+    assert cloned._stage_cache is not project._stage_cache
+    assert cloned._get_setup_fingerprint() == project._get_setup_fingerprint()
+
+
+def test_base_project_cost_ledger():
+    """A unit testing for the classification of costs by fluid and cost type"""
+
+    lifting = Lifting(
+        start_year=2021,
+        end_year=2030,
+        lifting_rate=np.array([100, 100, 100]),
+        price=np.array([10, 10, 10]),
+        prod_year=np.array([2024, 2025, 2026]),
+        fluid_type=FluidType.OIL,
+    )
+
+    capital = CapitalCost(
+        start_year=2021,
+        end_year=2030,
+        cost=np.array([10, 20, 30, 40, 50]),
+        expense_year=np.array([2025, 2021, 2023, 2026, 2023]),
+        cost_allocation=[
+            FluidType.OIL, FluidType.OIL, FluidType.GAS, FluidType.OIL, FluidType.OIL
+        ],
+    )
+
+    project = BaseProject(
+        start_date=date(2021, 1, 1),
+        end_date=date(2030, 12, 31),
+        oil_onstream_date=date(2024, 1, 1),
+        gas_onstream_date=date(2024, 1, 1),
+        approval_year=2022,
+        lifting=(lifting,),
+        capital_cost=(capital,),
+    )
+
+    # Expected result: cost lines keep their order within each fluid and cost type
+    np.testing.assert_allclose(project._oil_capital_postonstream.cost, [10, 40])
+    np.testing.assert_allclose(project._oil_capital_preonstream.cost, [50])
+    np.testing.assert_allclose(project._oil_capital_sunk_cost.cost, [20])
+    np.testing.assert_allclose(project._gas_capital_preonstream.cost, [30])
+    assert project._oil_capital_postonstream.cost_type == [CostType.POST_ONSTREAM_COST] * 2
+
+    # Expected result: a zero-cost placeholder for a fluid and cost type without costs
+    np.testing.assert_allclose(project._gas_capital_postonstream.cost, [0])
+    np.testing.assert_allclose(project._gas_capital_postonstream.expense_year, [2024])
+
+    # Expected result: a clone with unchanged cost objects reuses the cost ledgers
+    cloned = project.clone(lifting=(lifting,))
+    assert cloned._cost_ledgers["capital"] is project._cost_ledgers["capital"]
+    np.testing.assert_allclose(cloned._oil_capital_postonstream.cost, [10, 40])
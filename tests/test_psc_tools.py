@@ -0,0 +1,193 @@
+"""
+A collection of unit testing for the PSC calculation kernels in psc_tools
+"""
+
+import numpy as np
+
+from pyscnomics.contracts import psc_tools
+
+
+def _get_cost_recovery_inputs(n_scenarios: int, n_years: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    size = (n_scenarios, n_years)
+
+    return {
+        "project_years": np.arange(2020, 2020 + n_years),
+        "depreciation": rng.uniform(0, 50, size) * (rng.random(size) < 0.6),
+        "non_capital": rng.uniform(0, 30, size),
+        "revenue": rng.uniform(0, 150, size) * (rng.random(size) < 0.7),
+        "ftp_ctr": rng.uniform(0, 5, size),
+        "ftp_gov": rng.uniform(0, 5, size),
+        "ic": rng.uniform(0, 3, size) * (rng.random(size) < 0.3),
+    }
+
+
+def test_unrec_cost_2b_recovered_costrec_single():
+
+    # Expected result: costs carried forward until revenue is sufficient
+    zeros = np.zeros(4)
+    unrecovered, cost_to_be_recovered, cost_recovery = (
+        psc_tools.get_unrec_cost_2b_recovered_costrec(
+            project_years=np.arange(2020, 2024),
+            depreciation=np.array([100, 0, 0, 0]),
+            non_capital=np.array([0, 20, 20, 20]),
+            revenue=np.array([0, 60, 100, 100]),
+            ftp_ctr=zeros,
+            ftp_gov=zeros,
+            ic=zeros,
+            cr_cap_rate=1.0,
+        )
+    )
+
+    np.testing.assert_allclose(unrecovered, [100, 60, 0, 0])
+    np.testing.assert_allclose(cost_to_be_recovered, [0, 40, 60, 0])
+    np.testing.assert_allclose(cost_recovery, [0, 60, 80, 20])
+
+
+def test_unrec_cost_2b_recovered_costrec_batch():
+
+    inputs = _get_cost_recovery_inputs(n_scenarios=6, n_years=12)
+    batch = psc_tools.get_unrec_cost_2b_recovered_costrec(**inputs, cr_cap_rate=0.8)
+
+    for i in range(6):
+        single = psc_tools.get_unrec_cost_2b_recovered_costrec(
+            project_years=inputs["project_years"],
+            **{key: val[i] for key, val in inputs.items() if key != "project_years"},
+            cr_cap_rate=0.8,
+        )
+
+        for batch_result, single_result in zip(batch, single):
+            assert batch_result.shape == (6, 12)
+            np.testing.assert_array_equal(batch_result[i], single_result)
+
+
+def test_transfer_batch():
+
+    oil_unrecovered = np.array([[10, 0, 5, 0], [0, 0, 3, 8]], dtype=float)
+    gas_unrecovered = np.array([[0, 4, 5, 0], [2, 0, 0, 0]], dtype=float)
+    oil_ets = np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=float)
+    gas_ets = np.array([[20, 2, 2, 2], [1, 1, 1, 1]], dtype=float)
+
+    trf2oil, trf2gas = psc_tools.get_transfer(
+        gas_unrecovered=gas_unrecovered,
+        oil_unrecovered=oil_unrecovered,
+        gas_ets_pretransfer=gas_ets,
+        oil_ets_pretransfer=oil_ets,
+    )
+
+    np.testing.assert_allclose(trf2oil, [[10, 0, 0, 0], [0, 0, 1, 1]])
+    np.testing.assert_allclose(trf2gas, [[0, 2, 0, 0], [2, 0, 0, 0]])
+
+    for i in range(2):
+        single = psc_tools.get_transfer(
+            gas_unrecovered=gas_unrecovered[i],
+            oil_unrecovered=oil_unrecovered[i],
+            gas_ets_pretransfer=gas_ets[i],
+            oil_ets_pretransfer=oil_ets[i],
+        )
+        np.testing.assert_array_equal(trf2oil[i], single[0])
+        np.testing.assert_array_equal(trf2gas[i], single[1])
+
+
+def test_ftp_tax_considered():
+
+    # Expected result: FTP is considered once it exceeds the unrecovered cost
+    ftp_considered = psc_tools.get_ftp_tax_considered(
+        ftp_ctr=np.array([10, 10, 10, 10]),
+        unrec_cost=np.array([25, 12, 0, 0]),
+    )
+
+    np.testing.assert_allclose(ftp_considered, [0, 8, 22, 10])
+
+
+def test_unpaid_and_tax_balance():
+
+    # Expected result: the unpaid tax is carried forward to the next years
+    unpaid_tax, ctr_tax = psc_tools.get_unpaid_and_tax_balance(
+        tax_payment=np.array([5, 10, 2, 8, 1]),
+        ets_ctr=np.array([0, 4, 6, 3, 9]),
+    )
+
+    np.testing.assert_allclose(unpaid_tax, [0, 6, 2, 7, 0])
+    np.testing.assert_allclose(ctr_tax, [0, 4, 6, 3, 8])
+
+
+def test_tax_payment_pdjp_batch():
+
+    rng = np.random.default_rng(1)
+    size = (6, 12)
+    inputs = {
+        "ftp_ctr": rng.uniform(0, 10, size),
+        "unrec_cost": rng.uniform(0, 60, size) * (rng.random(size) < 0.4),
+        "ctr_share": rng.uniform(-5, 40, size) * (rng.random(size) < 0.7),
+        "ddmo": rng.uniform(0, 8, size),
+    }
+    inputs["taxable_income"] = (
+        inputs["ftp_ctr"] + inputs["ctr_share"] + rng.uniform(0, 30, size) - inputs["ddmo"]
+    )
+
+    batch = psc_tools.get_tax_payment_pdjp(**inputs, tax_rate=0.8)
+
+    for i in range(6):
+        tax_paid, unpaid_tax = psc_tools.get_tax_payment_pdjp(
+            **{key: val[i] for key, val in inputs.items()}, tax_rate=0.8
+        )
+
+        np.testing.assert_array_equal(batch[0][i], tax_paid)
+        np.testing.assert_array_equal(batch[1][i], unpaid_tax)
+
+
+def _tax_payment_pdjp_loop(ftp_ctr, unrec_cost, tax_rate, taxable_income, ctr_share, ddmo):
+    # Reference: the year-by-year loop of the PDJP 20/2017 tax payment
+    ftp_cum = np.cumsum(ftp_ctr)
+    ftp_prior = np.zeros_like(ftp_ctr, dtype=float)
+    ftp_considered = np.zeros_like(ftp_ctr, dtype=float)
+    for i in range(len(ftp_ctr)):
+        ftp_prior[i] = ftp_prior[i - 1] + ftp_considered[i - 1] if i > 0 else 0
+        ftp_diff = ftp_cum[i] - ftp_prior[i] if ftp_cum[i] > ftp_prior[i] else 0
+        ftp_considered[i] = ftp_diff - unrec_cost[i] if ftp_diff > unrec_cost[i] else 0
+
+    taxable_income_wo_ftp = np.where(
+        taxable_income - ftp_ctr < 0,
+        taxable_income - ftp_ctr + ddmo,
+        taxable_income - ftp_ctr,
+    )
+    applied_tax = ctr_share > 0
+    applied_tax_prior = np.concatenate(([False], applied_tax[:-1]))
+    ctr_ets_tax = np.where(
+        applied_tax & ~applied_tax_prior,
+        np.cumsum(taxable_income_wo_ftp) * tax_rate,
+        np.where(applied_tax & applied_tax_prior, taxable_income_wo_ftp * tax_rate, 0),
+    )
+    ctr_tax = ftp_considered * tax_rate + ctr_ets_tax
+
+    tax_paid = np.zeros_like(taxable_income, dtype=float)
+    unpaid_tax = np.zeros_like(taxable_income, dtype=float)
+    for i in range(len(taxable_income)):
+        tax_due = ctr_tax[i] + (unpaid_tax[i - 1] if i > 0 else 0)
+        tax_paid[i] = (
+            tax_due if taxable_income[i] > tax_due else ctr_share[i] + ftp_ctr[i] - ddmo[i]
+        )
+        unpaid_tax[i] = tax_due - tax_paid[i] if tax_due > tax_paid[i] else 0
+
+    return tax_paid, unpaid_tax
+
+
+def test_tax_payment_pdjp_exact_zero_ftp():
+
+    inputs = {
+        "ftp_ctr": np.array([32.3, 91.2, 60.2, 52.2, 24.6, 85.9, 88.3, 84.4]),
+        "unrec_cost": np.array([-49.16, 0, 1, 89.14, 99.07, 0, 0, 249.5]),
+        "taxable_income": np.array([143, 0, 83, 90, -37, 186, 0, 0]),
+        "ctr_share": np.array([85, -8.1, 48.3, 0, 91.2, 10.7, 68, -22.3]),
+        "ddmo": np.array([0, 0, 0, 13.94, 9.63, 4.27, 0, 5.08]),
+        "tax_rate": 0.44,
+    }
+
+    # Expected result: no rounding residue of the FTP considered flips a tax payment
+    tax_paid, unpaid_tax = psc_tools.get_tax_payment_pdjp(**inputs)
+    expected_paid, expected_unpaid = _tax_payment_pdjp_loop(**inputs)
+
+    np.testing.assert_allclose(tax_paid, expected_paid, atol=1.0e-9)
+    np.testing.assert_allclose(unpaid_tax, expected_unpaid, atol=1.0e-9)
+    np.testing.assert_allclose(tax_paid[6], 156.3)
@@ -2,6 +2,7 @@
 A unit testing for revenue module.
 """
 
+import copy
 import numpy as np
 import pytest
 
@@ -631,3 +632,58 @@ def test_prepare_get_prod_rate_total_arr():
 
     # Test whether expected == calculated
     np.testing.assert_allclose(prod_rate_total_arr_expected, prod_rate_total_arr_calculated)
+
+
+def test_weighted_average_price_and_ghv():
+    """
+    Test the `get_price_arr` and `get_aggregate_ghv` methods in the Lifting class.
+
+    Notes
+    -----
+    The function performs the following tests:
+    (1) The weighted averages are computed per production year, where a year whose
+        weights are all zero falls back to the plain average,
+    (2) Repeated calls return equal results which can be modified in place safely,
+    (3) A shallow copy with a reassigned price array does not return stale results,
+    (4) A shallow copy keeps its own memo, leaving the memo of the original intact.
+    """
+    # Expected result
+    price_arr_expected = np.array([0., 22., 0., 40.])
+    ghv_arr_expected = np.array([0., 1.25, 0., 1.5])
+
+    # Calculated result
+    lifting_apel = Lifting(
+        start_year=2023,
+        end_year=2026,
+        lifting_rate=np.array([100, 300, 0, 0]),
+        price=np.array([10, 30, 20, 60]),
+        prod_year=np.array([2024, 2024, 2026, 2026]),
+        ghv=np.array([2, 1, 1, 2]),
+        fluid_type=FluidType.GAS,
+    )
+
+    price_arr_calculated = lifting_apel.get_price_arr()
+    ghv_arr_calculated = lifting_apel.get_aggregate_ghv()
+
+    # Test whether expected == calculated
+    np.testing.assert_allclose(price_arr_expected, price_arr_calculated)
+    np.testing.assert_allclose(ghv_arr_expected, ghv_arr_calculated)
+
+    # Test whether repeated calls are not affected by in place modification
+    revenue = lifting_apel.revenue()
+    revenue += 1.0
+    np.testing.assert_allclose(lifting_apel.revenue(), [0., 11000., 0., 0.])
+
+    # Test whether a shallow copy with a new price array is recomputed
+    lifting_copy = copy.copy(lifting_apel)
+    lifting_copy.price = lifting_apel.price * 2
+    np.testing.assert_allclose(lifting_copy.get_price_arr(), price_arr_expected * 2)
+    np.testing.assert_allclose(lifting_copy.revenue(), [0., 22000., 0., 0.])
+    np.testing.assert_allclose(lifting_apel.get_price_arr(), price_arr_expected)
+
+    # Test whether the copy has its own memo, so the original is not recomputed
+    assert lifting_copy._memo is not lifting_apel._memo
+    price_entry = lifting_apel._memo[("price", 2023, 4)]
+    lifting_copy.price = lifting_apel.price * 3
+    lifting_copy.get_price_arr()
+    assert lifting_apel._memo[("price", 2023, 4)] is price_entry
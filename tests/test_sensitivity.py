@@ -0,0 +1,135 @@
+"""
+A collection of unit testing for the sensitivity analysis
+"""
+
+import pytest
+import numpy as np
+from datetime import date
+from dataclasses import replace
+
+from pyscnomics.econ.selection import FluidType
+from pyscnomics.econ.revenue import Lifting
+from pyscnomics.econ.costs import CapitalCost, OPEX
+from pyscnomics.contracts.grossplit import GrossSplit
+from pyscnomics.optimize import sensitivity
+from pyscnomics.optimize.sensitivity import sensitivity_psc
+
+
+def _get_contract() -> GrossSplit:
+    # An oil-only contract producing from 2025, with capital costs and OPEX
+    prod_year = np.arange(2025, 2033)
+    opex_year = np.arange(2026, 2033)
+
+    return GrossSplit(
+        start_date=date(2023, 1, 1),
+        end_date=date(2032, 12, 31),
+        oil_onstream_date=date(2025, 1, 1),
+        approval_year=2023,
+        lifting=(
+            Lifting(
+                start_year=2023,
+                end_year=2032,
+                prod_year=prod_year,
+                lifting_rate=np.full(len(prod_year), 100.0),
+                price=np.full(len(prod_year), 70.0),
+                fluid_type=FluidType.OIL,
+            ),
+        ),
+        capital_cost=(
+            CapitalCost(
+                start_year=2023,
+                end_year=2032,
+                expense_year=np.array([2024, 2026]),
+                cost=np.array([3000.0, 2000.0]),
+                cost_allocation=[FluidType.OIL, FluidType.OIL],
+            ),
+        ),
+        opex=(
+            OPEX(
+                start_year=2023,
+                end_year=2032,
+                expense_year=opex_year,
+                fixed_cost=np.full(len(opex_year), 300.0),
+                cost_allocation=[FluidType.OIL] * len(opex_year),
+            ),
+        ),
+    )
+
+
+def _get_summary(contract, **kwargs) -> dict:
+    # Indicators of the adjusted inputs, in place of the full contract summary
+    contract._get_expenditures_pre_tax()
+    revenue = np.sum(contract._oil_lifting.revenue())
+    capex = np.sum(contract._oil_capital_expenditures_pre_tax)
+    opex = np.sum(contract._oil_opex_expenditures_pre_tax)
+
+    return {
+        "ctr_npv": revenue - capex - opex,
+        "ctr_irr": revenue,
+        "ctr_pi": capex,
+        "ctr_pot": opex,
+        "gov_take": 0.0,
+        "ctr_net_share": 0.0,
+    }
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_sensitivity_pooled_matches_serial(monkeypatch, executor):
+
+    monkeypatch.setattr(sensitivity, "get_summary", _get_summary)
+    arguments = {
+        # An oil-only contract, whose gas price scenarios all equal the base scenario
+        "contract": _get_contract(),
+        "contract_arguments": {},
+        "summary_arguments": {"discount_rate": 0.1},
+        "min_deviation": 0.2,
+        "max_deviation": 0.2,
+        "step": 4,
+        "dataframe_output": False,
+    }
+
+    serial = sensitivity_psc(**arguments)
+    pooled = sensitivity_psc(**arguments, executor=executor, max_workers=2)
+
+    assert pooled == serial
+
+    # Expected result: the duplicate scenarios share the base scenario
+    npv = serial["ctr_npv"]
+    for multiplier in npv:
+        assert npv[multiplier]["GASPRICE"] == npv[1.0]["CAPEX"]
+
+    assert npv[1.2]["CAPEX"] < npv[1.0]["CAPEX"] < npv[0.8]["CAPEX"]
+    assert npv[1.2]["OPEX"] < npv[1.0]["OPEX"] < npv[0.8]["OPEX"]
+
+
+def test_sensitivity_opex_scales_fixed_cost_only(monkeypatch):
+
+    monkeypatch.setattr(sensitivity, "get_summary", _get_summary)
+    base = _get_contract()
+    contract = replace(
+        base,
+        opex=(
+            replace(base.opex[0], prod_rate=np.full(7, 40.0), cost_per_volume=np.full(7, 2.0)),
+        ),
+    )
+
+    results = sensitivity_psc(
+        contract=contract,
+        contract_arguments={},
+        summary_arguments={"discount_rate": 0.1},
+        min_deviation=0.2,
+        max_deviation=0.2,
+        step=4,
+        dataframe_output=False,
+    )
+
+    # Expected result: as by the element adjuster, the variable OPEX is not scaled
+    adjusted = sensitivity._adjust_contract(
+        contract=contract,
+        contract_arguments={},
+        element="OPEX",
+        adjustment_value=1.2,
+        run_contract=False,
+    )
+    assert results["ctr_pot"][1.2]["OPEX"] == pytest.approx(7 * (300.0 * 1.2 + 40.0 * 2.0))
+    assert results["ctr_pot"][1.2]["OPEX"] == pytest.approx(_get_summary(adjusted)["ctr_pot"])
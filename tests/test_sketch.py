@@ -0,0 +1,65 @@
+"""
+A unit test for module sketch.py
+"""
+
+import pytest
+import numpy as np
+
+from pyscnomics.tools.sketch import QuantileSketch, QuantileSketchException
+
+
+def test_sketch_quantile():
+
+    values = np.random.default_rng(0).lognormal(5, 1, 200_000)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(values, 50):
+        sketch.update(chunk)
+
+    q = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+
+    assert sketch.count == 200_000
+    assert len(sketch._means) <= sketch.compression
+    np.testing.assert_allclose(sketch.quantile(q), np.quantile(values, q), rtol=5e-3)
+    assert sketch.quantile(0) == values.min()
+    assert sketch.quantile(1) == values.max()
+
+
+def test_sketch_merge():
+
+    values = np.random.default_rng(1).normal(100, 15, 100_000)
+    merged = QuantileSketch().update(values[:30_000])
+    merged.merge(QuantileSketch().update(values[30_000:]))
+
+    q = np.array([0.1, 0.5, 0.9])
+
+    assert merged.count == 100_000
+    np.testing.assert_allclose(merged.quantile(q), np.quantile(values, q), rtol=1e-3)
+
+
+def test_sketch_merge_empty():
+
+    values = np.arange(1, 101, dtype=float)
+
+    # Expected result: merging empty sketches leaves the sketch unchanged
+    empty = QuantileSketch().merge(QuantileSketch())
+    assert empty.count == 0
+
+    merged = QuantileSketch().update(values).merge(QuantileSketch())
+    assert merged.count == 100
+    assert merged.quantile(1) == 100
+
+    merged = QuantileSketch().merge(QuantileSketch().update(values))
+    assert merged.count == 100
+    assert merged.quantile(0) == 1
+
+
+def test_sketch_exceptions():
+
+    with pytest.raises(QuantileSketchException):
+        QuantileSketch(compression=0)
+
+    with pytest.raises(QuantileSketchException):
+        QuantileSketch().quantile(0.5)
+
+    with pytest.raises(QuantileSketchException):
+        QuantileSketch().merge(np.ones(3))
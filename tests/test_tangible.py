@@ -5,7 +5,7 @@ A collection of unit testing for Tangible class
 import pytest
 import numpy as np
 from pyscnomics.econ.selection import DeprMethod, FluidType, TaxType
-from pyscnomics.econ.costs import CapitalException, CapitalCost
+from pyscnomics.econ.costs import CapitalException, CapitalCost, GeneralCostException
 
 
 def test_capital_incorrect_year_input():
@@ -174,6 +174,51 @@ def test_capital_arithmetics():
     assert div2 == calc_div2
 
 
+def test_capital_concat():
+    """A unit testing for the combination of many instances of Capital class at once"""
+
+    mangga_capital = CapitalCost(
+        start_year=2023,
+        end_year=2030,
+        cost=np.array([100, 100]),
+        expense_year=np.array([2024, 2023]),
+        cost_allocation=[FluidType.OIL, FluidType.GAS],
+        useful_life=np.array([5, 4]),
+    )
+
+    jeruk_capital = CapitalCost(
+        start_year=2022,
+        end_year=2032,
+        cost=np.array([200]),
+        expense_year=np.array([2023]),
+        cost_allocation=[FluidType.OIL],
+        is_ic_applied=[True],
+    )
+
+    # Expected results
+    calc_add = mangga_capital + jeruk_capital + mangga_capital
+
+    # Calculated results
+    calc_concat = CapitalCost.concat([mangga_capital, jeruk_capital, mangga_capital])
+
+    # Execute tests
+    assert calc_concat == calc_add
+    assert calc_concat.start_year == 2022
+    assert calc_concat.end_year == 2032
+    assert calc_concat.cost_allocation == calc_add.cost_allocation
+    assert calc_concat.is_ic_applied == calc_add.is_ic_applied
+    np.testing.assert_allclose(calc_concat.useful_life, calc_add.useful_life)
+    np.testing.assert_allclose(
+        calc_concat.expenditures_post_tax(), calc_add.expenditures_post_tax()
+    )
+
+    with pytest.raises(CapitalException):
+        CapitalCost.concat([])
+
+    with pytest.raises(CapitalException):
+        CapitalCost.concat([mangga_capital, 500])
+
+
 def test_capital_expenditures():
     """A unit testing for expenditures method in Capital class"""
 
@@ -445,3 +490,72 @@ def test_capital_book_value():
     np.testing.assert_allclose(bookDB, calc_bookDB)
     np.testing.assert_allclose(bookDDB, calc_bookDDB)
     np.testing.assert_allclose(bookPSC, calc_bookPSC)
+
+
+@pytest.mark.parametrize("scale", [1.0e-8, 1.0, 1.0e12])
+def test_capital_book_value_cost_units(scale):
+    """A unit testing for the book value of Capital object in different cost units"""
+
+    # Expected results: the book value scales with the cost, fully depreciated at zero
+    bookDB = np.array([0, 0, 80, 104, 83.2, 66.56, 20.48, 0]) * scale
+
+    # Calculated results
+    mangga_capital = CapitalCost(
+        start_year=2023,
+        end_year=2030,
+        cost=np.array([100, 50]) * scale,
+        expense_year=np.array([2025, 2026]),
+        useful_life=np.array([5, 5]),
+        cost_allocation=[FluidType.OIL, FluidType.OIL],
+    )
+
+    calc_bookDB = mangga_capital.total_depreciation_book_value(
+        depr_method=DeprMethod.DB, decline_factor=1
+    )
+
+    # Execute testing
+    np.testing.assert_allclose(bookDB, calc_bookDB)
+
+
+def test_capital_align():
+    """A unit testing for placing an instance of Capital class on a wider project timeline"""
+
+    mangga_capital = CapitalCost(
+        start_year=2023,
+        end_year=2026,
+        cost=np.array([100, 50]),
+        expense_year=np.array([2023, 2025]),
+        cost_allocation=[FluidType.OIL, FluidType.GAS],
+        useful_life=np.array([5, 4]),
+    )
+
+    # Expected results: the instance padded with zero cost lines
+    padded_capital = CapitalCost(
+        start_year=2021,
+        end_year=2030,
+        cost=np.array([0, 0, 100, 50, 0, 0, 0, 0]),
+        expense_year=np.array([2021, 2022, 2023, 2025, 2027, 2028, 2029, 2030]),
+        cost_allocation=[FluidType.OIL] * 3 + [FluidType.GAS] + [FluidType.OIL] * 4,
+        useful_life=np.array([5, 5, 5, 4, 5, 5, 5, 5]),
+    )
+
+    # Calculated results
+    aligned_capital = mangga_capital.align(start_year=2021, end_year=2030)
+
+    # Execute tests
+    assert aligned_capital.cost is mangga_capital.cost
+    assert mangga_capital.project_duration == 4
+    np.testing.assert_array_equal(aligned_capital.project_years, np.arange(2021, 2031))
+    np.testing.assert_allclose(
+        aligned_capital.expenditures_post_tax(inflation_rate=0.02, tax_rate=0.11),
+        padded_capital.expenditures_post_tax(inflation_rate=0.02, tax_rate=0.11),
+    )
+
+    for calc, expected in zip(
+        aligned_capital.total_depreciation_rate(inflation_rate=0.02),
+        padded_capital.total_depreciation_rate(inflation_rate=0.02),
+    ):
+        np.testing.assert_allclose(calc, expected)
+
+    with pytest.raises(GeneralCostException):
+        mangga_capital.align(start_year=2024, end_year=2030)
@@ -0,0 +1,163 @@
+"""
+A collection of unit testing for the Transition contract
+"""
+
+import pytest
+import numpy as np
+
+from pyscnomics.contracts.grossplit import GrossSplit
+from pyscnomics.contracts.transition import (
+    Transition,
+    adjusting_contract_arguments,
+    get_contract1_cache_info,
+    clear_contract1_cache,
+)
+
+
+class _StubRun:
+    """A transitioned contract whose run only records that it was called"""
+
+    def __init__(self, contract: GrossSplit, runs: list):
+        self.contract = contract
+        self.runs = runs
+        self.lifting = contract.lifting
+        self._oil_lifting = contract.lifting[0]
+
+    def run(self, **kwargs):
+        self.runs.append(self.contract)
+        zeros = np.zeros(10, dtype=float)
+        self.project_years = np.arange(2023, 2033)
+        self._consolidated_carward_cost_aftertf = zeros.copy()
+        self._consolidated_taxable_income = zeros.copy()
+        self._consolidated_cashflow = zeros.copy()
+        self._consolidated_tax_payment = zeros.copy()
+        self._consolidated_government_take = zeros.copy()
+        self._tax_rate_arr = zeros.copy()
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    # Records the contracts which are run, in place of the full contract runs
+    runs = []
+
+    def _get_aligned_contract(self, contract, start_date_trans, end_date_trans):
+        return _StubRun(contract=contract, runs=runs)
+
+    monkeypatch.setattr(Transition, "_get_aligned_contract", _get_aligned_contract)
+    clear_contract1_cache(maxsize=32)
+    yield runs
+    clear_contract1_cache(maxsize=32)
+
+
+@pytest.fixture
+def contract1_run(make_contract):
+    # The run of the first contract of a transition, producing from each start year
+    def _get_contract1_run(contract1_price: float, contract2_price: float = 70.0):
+        transition = Transition(
+            contract1=make_contract(
+                start_year=2023,
+                end_year=2027,
+                onstream_year=2023,
+                oil_price=contract1_price,
+                costs=False,
+            ),
+            contract2=make_contract(
+                start_year=2028,
+                end_year=2032,
+                onstream_year=2028,
+                oil_price=contract2_price,
+                costs=False,
+            ),
+            argument_contract1={},
+            argument_contract2={},
+        )
+
+        return transition._get_sub_contract_runs()["contract1"]
+
+    return _get_contract1_run
+
+
+def test_contract1_run_shared_across_transitions(runs, contract1_run):
+
+    first = contract1_run(contract1_price=60.0, contract2_price=70.0)
+    second = contract1_run(contract1_price=60.0, contract2_price=80.0)
+
+    # Expected result: the first contract is run once, the second contract twice
+    assert len(runs) == 3
+    assert get_contract1_cache_info()["hits"] == 1
+
+    # Expected result: each transition holds its own copy of the cached run
+    assert second is not first
+    second._consolidated_cashflow[0] = 1.0
+    assert first._consolidated_cashflow[0] == 0.0
+    assert contract1_run(contract1_price=60.0)._consolidated_cashflow[0] == 0.0
+
+    # Expected result: the Lifting objects of the copies share read-only arrays
+    assert second.lifting[0] is not first.lifting[0]
+    assert np.shares_memory(second.lifting[0].price, first.lifting[0].price)
+    for lifting in (second.lifting[0], second._oil_lifting):
+        with pytest.raises(ValueError):
+            lifting.price[0] = 1.0
+    assert contract1_run(contract1_price=60.0).lifting[0].price[0] == 60.0
+
+    # Expected result: the arrays of the input contract stay writable
+    assert first.contract.lifting[0].price.flags.writeable
+
+
+def test_contract1_run_cost_scaled(runs, make_contract):
+
+    def _get_contract1_run(contract1: GrossSplit):
+        transition = Transition(
+            contract1=contract1,
+            contract2=make_contract(start_year=2028, end_year=2032, onstream_year=2028),
+            argument_contract1={},
+            argument_contract2={},
+        )
+        return transition._get_sub_contract_runs()["contract1"]
+
+    contract1 = make_contract(start_year=2023, end_year=2027, onstream_year=2023)
+    _get_contract1_run(contract1)
+    scaled = _get_contract1_run(contract1.get_cost_scaled(capex=5.0))
+
+    # Expected result: a cost-scaled first contract is not served the unscaled run
+    assert len(runs) == 4
+    assert get_contract1_cache_info()["hits"] == 0
+    assert scaled.contract._cost_multipliers == {"capex": 5.0, "opex": 1.0}
+
+
+def test_contract1_run_cache_eviction(runs, contract1_run):
+
+    clear_contract1_cache(maxsize=1)
+    contract1_run(contract1_price=60.0)
+    contract1_run(contract1_price=50.0)
+    contract1_run(contract1_price=60.0)
+
+    # Expected result: the run of 60.0 is evicted by the run of 50.0
+    assert len(runs) == 6
+    assert get_contract1_cache_info()["size"] == 1
+
+
+def test_contract1_run_cache_disabled(runs, contract1_run):
+
+    clear_contract1_cache(maxsize=0)
+    contract1_run(contract1_price=60.0)
+    contract1_run(contract1_price=60.0)
+
+    # Expected result: the first contract is run by each transition
+    assert len(runs) == 4
+    assert get_contract1_cache_info()["size"] == 0
+
+
+def test_adjusting_contract_arguments_leaves_input_intact():
+
+    arguments = {"tax_rate": np.array([0.4, 0.4])}
+    adjusted = adjusting_contract_arguments(
+        arguments_dict=arguments,
+        first_contract=True,
+        prior_rows=np.zeros(0),
+        post_rows=np.zeros(3),
+    )
+
+    # Expected result: the arguments are padded on a copy
+    np.testing.assert_allclose(adjusted["tax_rate"], [0.4, 0.4, 0, 0, 0])
+    np.testing.assert_allclose(arguments["tax_rate"], [0.4, 0.4])
@@ -0,0 +1,680 @@
+"""
+A collection of unit testing for the Monte Carlo simulation of uncertainty
+"""
+
+import copy
+import pytest
+import threading
+import numpy as np
+from types import SimpleNamespace
+from dataclasses import replace
+
+from pyscnomics.econ.selection import UncertaintyDistribution, UncertaintySampling
+from pyscnomics.contracts.costrecovery import CostRecovery
+from pyscnomics.contracts.grossplit import GrossSplit
+from pyscnomics.contracts.transition import Transition
+from pyscnomics.io.getattr import get_contract_attributes
+from pyscnomics.optimize import uncertainty
+from pyscnomics.optimize.uncertainty import (
+    ProcessMonte,
+    get_worker_pool,
+    use_worker_pool,
+    close_worker_pool,
+    get_perturbed_contract,
+    get_adjusted_contract,
+    get_sampling_quantiles,
+    get_multipliers_montecarlo,
+    get_percentile_precision,
+    get_percentile_ranks,
+    create_montecarlo_store,
+    open_montecarlo_store,
+    write_montecarlo_profiles,
+    get_store_percentiles,
+)
+
+
+# Oil price, gas price, OPEX, CAPEX and lifting
+_PARAMETER = [{"id": index} for index in range(5)]
+_MULTIPLIERS = np.array([1.1, 0.9, 1.2, 0.8, 1.5])
+
+
+@pytest.fixture
+def make_monte(make_contract):
+    # A factory of Monte Carlo studies of the oil price
+    def _make_monte(oil_price: float = 70.0, **kwargs) -> ProcessMonte:
+        contract = make_contract(CostRecovery, oil_price=oil_price, gas=True)
+
+        params = [
+            {
+                "id": 0,
+                "dist": UncertaintyDistribution.UNIFORM,
+                "min": 50.0,
+                "base": 70.0,
+                "max": 90.0,
+                "stddev": 5.0,
+            }
+        ]
+
+        return ProcessMonte(
+            type=1,
+            contract=contract,
+            contract_arguments={},
+            summary_arguments={"discount_rate": 0.1},
+            params=params,
+            **{"numSim": 10, "seed": 1, **kwargs},
+        )
+
+    return _make_monte
+
+
+@pytest.fixture
+def indicators(monkeypatch):
+    # Indicators of the sampled oil price multiplier, in place of the contract runs
+    def _get_contract_indicators(n, multipliers, store=None, **kwargs):
+        if store is not None:
+            store["indicators"][n] = np.full(6, multipliers[0])
+        return (100 * multipliers[0], 0.1 * multipliers[0], multipliers[0], 5.0, 0.5, 0.5)
+
+    monkeypatch.setattr(uncertainty, "get_contract_indicators", _get_contract_indicators)
+    close_worker_pool()
+    yield
+    close_worker_pool()
+
+
+def test_worker_pool_shared_by_identical_studies(make_monte):
+
+    first = make_monte()
+    second = make_monte()
+    other = make_monte(oil_price=60.0)
+
+    # Expected result: the key depends on the content of the study, not its instance
+    assert first.key == second.key
+    assert first.key != other.key
+
+    try:
+        pool = get_worker_pool(state=first.get_state(), key=first.key, pool_size=1)
+        assert get_worker_pool(state=second.get_state(), key=second.key, pool_size=1) is pool
+    finally:
+        close_worker_pool()
+
+
+def test_worker_pool_held_by_concurrent_study(make_monte):
+
+    first = make_monte()
+    other = make_monte(oil_price=60.0)
+    swapped = []
+    thread = threading.Thread(
+        target=lambda: swapped.append(
+            get_worker_pool(state=other.get_state(), key=other.key, pool_size=1)
+        )
+    )
+
+    try:
+        with use_worker_pool(state=first.get_state(), key=first.key, pool_size=1) as pool:
+            thread.start()
+            thread.join(timeout=0.5)
+
+            # Expected result: the study of another contract waits for the pool in use
+            assert thread.is_alive()
+            assert pool.map(abs, [-1, -2]) == [1, 2]
+
+        thread.join()
+        assert swapped[0] is not pool
+    finally:
+        close_worker_pool()
+
+
+def _adjust_json(data: dict, parameter: list, multipliers: np.ndarray) -> dict:
+    # The JSON routine the Monte Carlo runs used before perturbing contract objects
+    data = copy.deepcopy(data)
+    scaled = {
+        2: [("opex", ["fixed_cost", "cost_per_volume"]), ("asr", ["cost"]), ("lbt", ["cost"]),
+            ("cost_of_sales", ["cost"])],
+        3: [("capital", ["cost"]), ("intangible", ["cost"])],
+    }
+    for item, multiplier in zip(parameter, multipliers):
+        if item["id"] in scaled:
+            for key, data_keys in scaled[item["id"]]:
+                for cost in data[key].values():
+                    for data_key in data_keys:
+                        cost[data_key] = (np.array(cost[data_key]) * multiplier).tolist()
+            continue
+
+        for lift in data["lifting"].values():
+            if item["id"] == 4 and lift["fluid_type"] == "Oil":
+                data_keys = ["lifting_rate", "prod_rate"]
+            elif (item["id"], lift["fluid_type"]) in [(0, "Oil"), (1, "Gas")]:
+                data_keys = ["price"]
+            else:
+                continue
+            for data_key in data_keys:
+                lift[data_key] = (np.array(lift[data_key]) * multiplier).tolist()
+
+    return data
+
+
+@pytest.fixture
+def expenditure_runs(monkeypatch):
+    # Runs up to the pre-tax expenditures, summarized by the revenue and the costs
+    def _run(self, **kwargs):
+        self._get_wap_price()
+        self._get_expenditures_pre_tax()
+
+    def _get_summary(contract, **kwargs):
+        revenue = contract._oil_lifting.revenue().sum() + contract._gas_lifting.revenue().sum()
+        capex = contract._oil_capital_expenditures_pre_tax.sum()
+        opex = contract._oil_opex_expenditures_pre_tax.sum()
+        return {
+            "ctr_npv": revenue - capex - opex,
+            "ctr_irr": revenue,
+            "ctr_pi": capex,
+            "ctr_pot": opex,
+            "gov_take": contract._gas_lifting.revenue().sum(),
+            "ctr_net_share": contract._oil_lifting.get_lifting_rate_arr().sum(),
+        }
+
+    monkeypatch.setattr(CostRecovery, "run", _run)
+    monkeypatch.setattr(uncertainty, "get_summary", _get_summary)
+    close_worker_pool()
+    yield
+    close_worker_pool()
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_monte_matches_json_path(streaming, expenditure_runs, make_contract):
+
+    contract = make_contract(CostRecovery, gas=True)
+    parameter = [
+        {"id": index, "dist": UncertaintyDistribution.UNIFORM, "min": 0.8 * base,
+         "base": base, "max": 1.2 * base, "stddev": 1.25}
+        for index, base in enumerate([70.0, 6.0, 300.0, 5000.0, 800.0])
+    ]
+    monte = ProcessMonte(
+        type=1,
+        contract=contract,
+        contract_arguments={},
+        summary_arguments={"discount_rate": 0.1},
+        numSim=200,
+        params=parameter,
+        seed=11,
+        pool_size=2,
+        streaming=streaming,
+    )
+    outcomes = monte.calculate()
+
+    # The same seeded sample, run through the JSON routine and aggregated as before
+    data = get_contract_attributes(
+        contract=contract, contract_arguments={}, summary_arguments={"discount_rate": 0.1}
+    )
+    for key in ("oil_carry_forward_depreciation", "gas_carry_forward_depreciation"):
+        data["costrecovery"][key] = getattr(contract, key)
+    multipliers = monte.get_multipliers(0, 200)
+    results = np.zeros([200, 6 + len(parameter)])
+    for n, row in enumerate(multipliers):
+        summary = uncertainty.get_costrecovery(data=_adjust_json(data, parameter, row))
+        results[n, :6] = [summary[key] for key in ("ctr_npv", "ctr_irr", "ctr_pi",
+                                                   "ctr_pot", "gov_take", "ctr_net_share")]
+        results[n, 6:] = row * [item["base"] for item in parameter]
+
+    results_sorted = np.take_along_axis(results, np.argsort(results, axis=0), axis=0)
+    prob = np.arange(1, 201, dtype=np.float64) / 200
+    results_arranged = np.concatenate((prob[:, np.newaxis], results_sorted), axis=1)
+    percentiles = np.percentile(results_arranged, q=[10, 50, 90], method="higher", axis=0)
+
+    # Expected result: the object path reports the P10, P50 and P90 of the JSON path
+    for index, key in enumerate(["P10", "P50", "P90"]):
+        np.testing.assert_allclose(
+            outcomes[key], percentiles[index], rtol=1e-2 if streaming else 1e-10
+        )
+
+
+def test_perturbed_contract(make_contract):
+
+    contract = make_contract(CostRecovery, gas=True)
+    perturbed = get_perturbed_contract(
+        contract=contract, parameter=_PARAMETER, multipliers=_MULTIPLIERS
+    )
+
+    # Expected result: the arrays of the copies are scaled, the base contract is intact
+    oil, gas = perturbed.lifting
+    np.testing.assert_allclose(oil.price, 70.0 * 1.1)
+    np.testing.assert_allclose(gas.price, 6.0 * 0.9)
+    np.testing.assert_allclose(oil.lifting_rate, 100.0 * 1.5)
+    np.testing.assert_allclose(gas.lifting_rate, 50.0)
+    np.testing.assert_allclose(perturbed.opex[0].fixed_cost, 300.0 * 1.2)
+    np.testing.assert_allclose(perturbed.capital_cost[0].cost, [3000.0 * 0.8, 2000.0 * 0.8])
+
+    np.testing.assert_allclose(contract.lifting[0].price, 70.0)
+    np.testing.assert_allclose(contract.lifting[0].lifting_rate, 100.0)
+    np.testing.assert_allclose(contract.capital_cost[0].cost, [3000.0, 2000.0])
+
+    # Expected result: the fluid-based attributes are derived from the scaled objects
+    np.testing.assert_allclose(
+        perturbed._oil_lifting.revenue(), contract._oil_lifting.revenue() * 1.1 * 1.5
+    )
+
+
+def test_perturbed_contract_linear_costs(make_contract):
+
+    contract = make_contract(CostRecovery, gas=True)
+    rebuilt = get_perturbed_contract(
+        contract=contract, parameter=_PARAMETER, multipliers=_MULTIPLIERS
+    )
+    scaled = get_perturbed_contract(
+        contract=contract, parameter=_PARAMETER, multipliers=_MULTIPLIERS, linear_costs=True
+    )
+
+    # Expected result: scaling the cost stages equals rebuilding the cost objects
+    rebuilt._get_expenditures_pre_tax()
+    scaled._get_expenditures_pre_tax()
+    for attr in ["_oil_capital_expenditures_pre_tax", "_oil_opex_expenditures_pre_tax"]:
+        np.testing.assert_allclose(getattr(scaled, attr), getattr(rebuilt, attr))
+
+    np.testing.assert_allclose(
+        scaled._oil_lifting.revenue(), rebuilt._oil_lifting.revenue()
+    )
+
+
+@pytest.mark.parametrize("salvage_value", [None, np.array([300.0, 200.0])])
+def test_perturbed_contract_linear_costs_variable_opex(salvage_value, make_contract):
+
+    # With a salvage value the scaled copy is rebuilt from scaled cost objects
+    base = make_contract(CostRecovery, gas=True)
+    contract = replace(
+        base,
+        capital_cost=(replace(base.capital_cost[0], salvage_value=salvage_value),),
+        opex=(
+            replace(base.opex[0], prod_rate=np.full(7, 40.0), cost_per_volume=np.full(7, 2.0)),
+        ),
+    )
+    rebuilt = get_perturbed_contract(
+        contract=contract, parameter=_PARAMETER, multipliers=_MULTIPLIERS
+    )
+    scaled = get_perturbed_contract(
+        contract=contract, parameter=_PARAMETER, multipliers=_MULTIPLIERS, linear_costs=True
+    )
+
+    # Expected result: the fixed and variable OPEX are both scaled by the multiplier
+    rebuilt._get_expenditures_pre_tax()
+    scaled._get_expenditures_pre_tax()
+    np.testing.assert_allclose(
+        scaled._oil_opex_expenditures_pre_tax[3:], (300.0 + 40.0 * 2.0) * 1.2
+    )
+    for attr in ["_oil_capital_expenditures_pre_tax", "_oil_opex_expenditures_pre_tax"]:
+        np.testing.assert_allclose(getattr(scaled, attr), getattr(rebuilt, attr))
+
+
+def test_adjusted_transition_contract(make_contract):
+
+    transition = Transition(
+        contract1=make_contract(GrossSplit, gas=True),
+        contract2=make_contract(CostRecovery, gas=True),
+        argument_contract1={},
+        argument_contract2={},
+    )
+    adjusted = get_adjusted_contract(
+        contract_type=3, contract=transition, parameter=_PARAMETER, multipliers=_MULTIPLIERS
+    )
+
+    # Expected result: only the second contract is perturbed
+    assert adjusted.contract1 is transition.contract1
+    np.testing.assert_allclose(adjusted.contract2.lifting[0].price, 70.0 * 1.1)
+    np.testing.assert_allclose(transition.contract2.lifting[0].price, 70.0)
+
+
+@pytest.mark.parametrize("sampling", list(UncertaintySampling))
+def test_sampling_quantiles_seeded(sampling):
+
+    quantiles = get_sampling_quantiles(run_number=64, dimension=3, sampling=sampling, seed=7)
+
+    # Expected result: a seeded sample is reproducible and lies in the unit hypercube
+    assert quantiles.shape == (64, 3)
+    assert np.all((quantiles >= 0) & (quantiles < 1))
+    np.testing.assert_array_equal(
+        quantiles,
+        get_sampling_quantiles(run_number=64, dimension=3, sampling=sampling, seed=7),
+    )
+    assert not np.array_equal(
+        quantiles,
+        get_sampling_quantiles(run_number=64, dimension=3, sampling=sampling, seed=8),
+    )
+
+
+@pytest.mark.parametrize("sampling", list(UncertaintySampling))
+def test_sampling_quantiles_by_range(sampling):
+
+    full = get_sampling_quantiles(run_number=64, dimension=3, sampling=sampling, seed=7)
+    rows = get_sampling_quantiles(
+        run_number=64, dimension=3, sampling=sampling, seed=7, start=20, stop=45
+    )
+
+    # Expected result: a range of runs holds the same rows as the whole sample
+    np.testing.assert_array_equal(rows, full[20:45])
+
+
+def test_sampling_quantiles_latin_hypercube_strata():
+
+    quantiles = get_sampling_quantiles(
+        run_number=50, dimension=2, sampling=UncertaintySampling.LATIN_HYPERCUBE, seed=3
+    )
+
+    # Expected result: each of the 50 strata of each parameter holds exactly one run
+    for column in quantiles.T:
+        np.testing.assert_array_equal(np.sort(np.floor(column * 50)), np.arange(50))
+
+
+def test_multipliers_from_quantiles():
+
+    quantiles = np.array([0.0, 0.25, 0.5, 0.75])
+    uniform = get_multipliers_montecarlo(
+        run_number=4,
+        distribution="Uniform",
+        min_value=50.0,
+        mean_value=100.0,
+        max_value=150.0,
+        std_dev=10.0,
+        quantiles=quantiles,
+    )
+
+    # Expected result: the inverse CDF of the uniform distribution on [0.5, 1.5]
+    np.testing.assert_allclose(uniform, [0.5, 0.75, 1.0, 1.25])
+
+    normal = get_multipliers_montecarlo(
+        run_number=4,
+        distribution="Normal",
+        min_value=80.0,
+        mean_value=100.0,
+        max_value=120.0,
+        std_dev=10.0,
+        quantiles=np.array([0.001, 0.5, 0.999, 0.6]),
+    )
+
+    # Expected result: the truncated normal is centred on 1.0 and bounded by [0.8, 1.2]
+    np.testing.assert_allclose(normal[1], 1.0)
+    assert np.all((normal >= 0.8) & (normal <= 1.2))
+
+
+def test_monte_multipliers_seeded(make_monte):
+
+    monte = make_monte()
+    multipliers = monte.get_multipliers(0, 10)
+
+    # Expected result: the multipliers of a study depend only on its seed
+    np.testing.assert_array_equal(multipliers, make_monte().get_multipliers(0, 10))
+    assert multipliers.shape == (10, 1)
+
+    # Expected result: the multipliers drawn by chunks are the rows of the whole sample
+    np.testing.assert_array_equal(
+        np.concatenate([monte.get_multipliers(0, 3), monte.get_multipliers(3, 10)]),
+        multipliers,
+    )
+
+    # Expected result: a study without a seed draws one, shared by all its chunks
+    unseeded = make_monte(seed=None)
+    assert unseeded.seed is not None
+    np.testing.assert_array_equal(
+        unseeded.get_multipliers(4, 6), unseeded.get_multipliers(0, 10)[4:6]
+    )
+
+
+def test_monte_latin_hypercube_drawn_once(monkeypatch, indicators, make_monte):
+
+    draws = []
+
+    def _get_sampling_quantiles(**kwargs):
+        draws.append(kwargs)
+        return get_sampling_quantiles(**kwargs)
+
+    monkeypatch.setattr(uncertainty, "get_sampling_quantiles", _get_sampling_quantiles)
+    monte = make_monte(
+        numSim=400,
+        pool_size=2,
+        rel_tol=1.0e-6,
+        batch_size=100,
+        sampling=UncertaintySampling.LATIN_HYPERCUBE,
+    )
+    outcomes = monte.calculate()
+
+    # Expected result: the whole sample is drawn once, the batches and chunks are its rows
+    assert len(draws) == 1
+    assert np.shares_memory(monte.get_multipliers(100, 200), monte.multipliers)
+    np.testing.assert_allclose(outcomes["P50"][1], 100 * outcomes["P50"][7] / 70.0)
+
+    # Expected result: a Latin Hypercube sample cannot be streamed
+    with pytest.raises(uncertainty.MonteCarloException):
+        make_monte(sampling=UncertaintySampling.LATIN_HYPERCUBE, streaming=True)
+
+
+def test_percentile_precision():
+
+    data = np.arange(1, 1001, dtype=float)[:, np.newaxis]
+    estimate, lower, upper, precision = get_percentile_precision(data=data, confidence=0.95)
+
+    # Expected result: the intervals bracket the percentiles and narrow with the sample size
+    np.testing.assert_allclose(estimate[:, 0], [101, 501, 901])
+    assert np.all(lower[:, 0] < estimate[:, 0]) and np.all(estimate[:, 0] < upper[:, 0])
+    np.testing.assert_allclose(precision[:, 0], (upper - lower)[:, 0] / 2 / estimate[:, 0])
+
+    precision_small = get_percentile_precision(data=data[::10], confidence=0.95)[3]
+    assert np.all(precision_small > precision)
+
+
+def test_monte_early_stopping(indicators, make_monte):
+
+    budget = make_monte(numSim=2000, pool_size=2).calculate()
+    stopped = make_monte(numSim=2000, pool_size=2, rel_tol=0.05, batch_size=200).calculate()
+
+    # Expected result: the tolerance is met before the budget of runs is exhausted
+    assert budget["run_number"] == 2000
+    assert budget["precision"] is None
+    assert stopped["run_number"] < 2000
+    assert stopped["run_number"] % 200 == 0
+    assert max(max(values) for values in stopped["precision"].values()) <= 0.05
+
+    # Expected result: the runs used are the leading rows of the same sample
+    assert np.isclose(stopped["P50"][1], budget["P50"][1], rtol=0.05)
+
+
+def test_monte_streaming_matches_in_memory(indicators, make_monte):
+
+    in_memory = make_monte(numSim=2000, pool_size=2).calculate()
+    streaming = make_monte(numSim=2000, pool_size=2, streaming=True).calculate()
+
+    # Expected result: the sketched percentiles are those of the runs held in memory
+    assert streaming["run_number"] == in_memory["run_number"] == 2000
+    for key in ["P10", "P50", "P90"]:
+        np.testing.assert_allclose(streaming[key], in_memory[key], rtol=1e-2)
+
+    np.testing.assert_allclose(
+        np.array(streaming["results"])[:, 1:],
+        np.array(in_memory["results"])[:, 1:],
+        rtol=2e-2,
+    )
+
+
+def test_monte_streaming_percentile_rows(indicators, make_monte):
+
+    in_memory = make_monte(numSim=200, pool_size=2).calculate()
+    streaming = make_monte(numSim=200, pool_size=2, streaming=True).calculate()
+
+    # Expected result: both modes report the same runs, hence the same probabilities
+    for key, rank in zip(["P10", "P50", "P90"], get_percentile_ranks(n=200)):
+        assert streaming[key][0] == in_memory[key][0] == (rank + 1) / 200
+        np.testing.assert_allclose(streaming[key], in_memory[key], rtol=1e-2)
+
+    np.testing.assert_array_equal(
+        np.array(streaming["results"])[:, 0], np.array(in_memory["results"])[:, 0]
+    )
+
+
+def test_montecarlo_store(tmp_path):
+
+    path = str(tmp_path / "store")
+    create_montecarlo_store(
+        path=path,
+        run_number=4,
+        parameter=[{"id": 0, "dist": UncertaintyDistribution.NORMAL}],
+        project_years=np.arange(2023, 2026),
+        sampling=UncertaintySampling.SOBOL,
+        seed=5,
+    )
+
+    store = open_montecarlo_store(path=path, mode="r+")
+    for n in range(3):
+        write_montecarlo_profiles(
+            store=store,
+            n=n,
+            contract=SimpleNamespace(
+                _consolidated_cashflow=np.full(3, 10.0 * n),
+                _consolidated_ctr_net_share=np.full(3, 1.0 * n),
+                _consolidated_government_take=np.full(3, 2.0 * n),
+            ),
+        )
+    store["cashflow"].flush()
+    del store
+
+    # Expected result: the incomplete fourth run is ignored
+    np.testing.assert_allclose(
+        get_store_percentiles(path=path, percentiles=(0, 50, 100)),
+        [[0.0] * 3, [10.0] * 3, [20.0] * 3],
+    )
+
+    store = open_montecarlo_store(path=path)
+    np.testing.assert_allclose(store["contractor_take"][2], 2.0)
+    assert np.all(np.isnan(store["indicators"]))
+    assert store["samples"].shape == (4, 1)
+    assert store["metadata"]["seed"] == 5
+    assert store["metadata"]["sampling"] == "Sobol"
+    assert store["metadata"]["parameter"][0]["dist"] == "Normal"
+    assert store["metadata"]["project_years"] == [2023, 2024, 2025]
+
+    with pytest.raises(uncertainty.MonteCarloException):
+        get_store_percentiles(path=path, profile="revenue")
+
+
+def test_monte_store_written_by_workers(tmp_path, indicators, make_monte):
+
+    path = str(tmp_path / "store")
+    monte = make_monte(
+        numSim=400, pool_size=2, rel_tol=0.05, batch_size=100, store_path=path
+    )
+    outcomes = monte.calculate()
+
+    # Expected result: each worker writes the rows of its runs, up to the runs used
+    store = open_montecarlo_store(path=path)
+    n_run = outcomes["run_number"]
+    assert store["metadata"]["run_number"] == n_run < 400
+    np.testing.assert_allclose(store["samples"][:n_run], monte.get_multipliers(0, n_run))
+    np.testing.assert_allclose(store["indicators"][:n_run, 0], store["samples"][:n_run, 0])
+    assert np.all(np.isnan(store["indicators"][n_run:]))
+    assert np.all(np.isnan(store["samples"][n_run:]))
+
+
+def test_monte_samples_returned_by_workers(monkeypatch, indicators, make_monte):
+
+    monte = make_monte(numSim=100, pool_size=2)
+    expected = monte.get_multipliers(0, 100)
+
+    def _get_multipliers(start, stop):
+        raise AssertionError("The multipliers are drawn again by the main process")
+
+    monkeypatch.setattr(monte, "get_multipliers", _get_multipliers)
+    outcomes = monte.calculate()
+
+    # Expected result: the sampled oil prices are those drawn by the workers
+    np.testing.assert_allclose(
+        outcomes["P50"][7], np.percentile(70.0 * expected[:, 0], 50, method="higher")
+    )
+
+
+def test_monte_store_rerun_on_warm_pool(tmp_path, indicators, make_monte):
+
+    # Studies of the same contract share the warm pool, and here the store as well
+    path = str(tmp_path / "store")
+    for num_sim in (20, 40, 10):
+        outcomes = make_monte(numSim=num_sim, pool_size=2, store_path=path).calculate()
+
+        # Expected result: every run of each study is written to the recreated store
+        store = open_montecarlo_store(path=path)
+        assert outcomes["run_number"] == store["indicators"].shape[0] == num_sim
+        np.testing.assert_allclose(store["indicators"][:, 0], store["samples"][:, 0])
+        del store
+
+
+class _StubContract:
+    """An adjusted contract whose run only sets a flat cashflow at its oil price"""
+
+    def __init__(self, price: float):
+        self.price = price
+
+    def run(self, **kwargs):
+        self._consolidated_cashflow = np.full(10, self.price)
+
+
+@pytest.fixture
+def failing_runs(monkeypatch):
+    # Runs whose oil price exceeds 80.0 fail after their profiles are written
+    def _get_adjusted_contract(contract_type, contract, parameter, multipliers):
+        return _StubContract(price=70.0 * multipliers[0])
+
+    def _get_summary(contract, **kwargs):
+        if contract.price > 80.0:
+            raise ValueError("The contract run failed")
+        return {
+            "ctr_npv": contract.price,
+            "ctr_irr": 0.1,
+            "ctr_pi": 1.0,
+            "ctr_pot": 5.0,
+            "gov_take": 0.5,
+            "ctr_net_share": 0.5,
+        }
+
+    monkeypatch.setattr(uncertainty, "get_adjusted_contract", _get_adjusted_contract)
+    monkeypatch.setattr(uncertainty, "get_summary", _get_summary)
+    close_worker_pool()
+    yield
+    close_worker_pool()
+
+
+def test_monte_failed_runs_excluded(tmp_path, failing_runs, make_monte):
+
+    path = str(tmp_path / "store")
+    outcomes = make_monte(numSim=200, pool_size=2, store_path=path).calculate()
+
+    # Expected result: the failed runs are NaN rows of the store and are counted
+    store = open_montecarlo_store(path=path)
+    failed = store["samples"][:, 0] * 70.0 > 80.0
+    assert 0 < outcomes["failed_runs"] == store["metadata"]["failed_runs"] == np.sum(failed)
+    assert np.all(np.isnan(store["indicators"][failed]))
+    assert np.all(np.isnan(store["cashflow"][failed]))
+    assert not np.any(np.isnan(store["indicators"][~failed]))
+
+    # Expected result: the distribution holds the completed runs only, with no zeros
+    npv = np.array(outcomes["results"])[:, 1]
+    assert np.all((npv >= 50.0) & (npv <= 80.0))
+    assert 50.0 <= outcomes["P10"][1] < outcomes["P90"][1] <= 80.0
+
+    # Expected result: streaming sketches the same completed runs
+    streaming = make_monte(numSim=200, pool_size=2, streaming=True).calculate()
+    assert streaming["failed_runs"] == outcomes["failed_runs"]
+    np.testing.assert_allclose(streaming["P50"][1], outcomes["P50"][1], rtol=0.05)
+
+
+def test_failed_run_with_failing_store(failing_runs):
+
+    # A store too small for run 5, whose writes and cleanup both fail
+    store = {key: np.zeros((1, 10)) for key in ("indicators", *uncertainty._STORE_PROFILES)}
+
+    # Expected result: the run is recorded as failed instead of raising
+    with pytest.warns(UserWarning, match="failed run 5"):
+        indicators = uncertainty.get_contract_indicators(
+            n=5,
+            contract_type=1,
+            contract=None,
+            contract_arguments={},
+            summary_arguments={},
+            parameter=_PARAMETER,
+            multipliers=np.array([1.0]),
+            store=store,
+        )
+    assert np.all(np.isnan(indicators))
@@ -0,0 +1,94 @@
+"""
+A collection of unit testings to validate the progressive split of each
+Gross Split regime.
+"""
+
+import numpy as np
+import pytest
+
+from pyscnomics.econ.selection import FluidType, GrossSplitRegime
+from pyscnomics.contracts.grossplit import GrossSplit
+
+
+def test_prog_price_split_brackets():
+
+    # Expected result
+    price = np.array([30, 40, 54.9, 100, 120])
+    prog_price_split_08_2017_expected = np.array([0.075, 0.05, 0.05, -0.05, -0.075])
+
+    price_gas = np.array([4, 5, 7, 8.5, 11, 14])
+    prog_price_split_13_2024_expected = np.array(
+        [0.05, 0.0475, 0.0425, 0.0, -0.0025, -0.05]
+    )
+
+    # Calculated result
+    prog_price_split_08_2017_calculated = GrossSplit._get_prog_price_split_08_2017(
+        FluidType.OIL, price
+    )
+    prog_price_split_13_2024_calculated = GrossSplit._get_prog_price_split_13_2024(
+        FluidType.GAS, price_gas
+    )
+
+    # Test whether expected == calculated
+    np.testing.assert_allclose(
+        prog_price_split_08_2017_expected, prog_price_split_08_2017_calculated
+    )
+    np.testing.assert_allclose(
+        prog_price_split_13_2024_expected, prog_price_split_13_2024_calculated
+    )
+    np.testing.assert_allclose(
+        GrossSplit._get_prog_price_split_08_2017(FluidType.GAS, price), np.zeros(5)
+    )
+
+
+def test_prog_cum_split_brackets():
+
+    # Expected result
+    cum = np.array([500, 1000, 25000, 200000])
+    prog_cum_split_08_2017_expected = np.array([0.05, 0.04, 0.02, 0.0])
+    prog_cum_split_52_2017_expected = np.array([0.1, 0.1, 0.1, 0.0])
+
+    # Calculated result
+    prog_cum_split_08_2017_calculated = GrossSplit._get_prog_cum_split_08_2017(cum)
+    prog_cum_split_52_2017_calculated = GrossSplit._get_prog_cum_split_52_2017(cum)
+
+    # Test whether expected == calculated
+    np.testing.assert_allclose(
+        prog_cum_split_08_2017_expected, prog_cum_split_08_2017_calculated
+    )
+    np.testing.assert_allclose(
+        prog_cum_split_52_2017_expected, prog_cum_split_52_2017_calculated
+    )
+
+    # Test whether a cumulative value out of the regulation raises an error
+    with pytest.raises(ValueError):
+        GrossSplit._get_prog_cum_split_52_2017(np.array([100, -1]))
+
+
+def test_wrapper_progressive_split_batch():
+
+    price = np.array([[60, 90, 120], [30, 75, 110]])
+    cum = np.array([20000, 40000, 100000])
+
+    # The progressive split does not depend on the attributes of the contract
+    contract = GrossSplit.__new__(GrossSplit)
+
+    for regime in [
+        GrossSplitRegime.PERMEN_ESDM_8_2017,
+        GrossSplitRegime.PERMEN_ESDM_52_2017,
+        GrossSplitRegime.PERMEN_ESDM_13_2024,
+    ]:
+        prog_price_split, prog_cum_split = contract._wrapper_progressive_split(
+            fluid=FluidType.OIL, price=price, cum=cum, regime=regime
+        )
+
+        assert prog_price_split.shape == (2, 3)
+        assert prog_cum_split.shape == (2, 3)
+
+        # Each scenario equals the result of the single scenario
+        for i in range(2):
+            single = contract._wrapper_progressive_split(
+                fluid=FluidType.OIL, price=price[i], cum=cum, regime=regime
+            )
+            np.testing.assert_array_equal(prog_price_split[i], single[0])
+            np.testing.assert_array_equal(prog_cum_split[i], single[1])
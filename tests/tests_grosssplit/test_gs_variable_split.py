@@ -0,0 +1,34 @@
+"""
+A collection of unit testings to validate the variable split of each
+Gross Split regime.
+"""
+
+import numpy as np
+import pytest
+
+from pyscnomics.econ.selection import GrossSplitRegime, VariableSplit132024
+from pyscnomics.contracts.grossplit import GrossSplit
+
+
+def test_variable_split_13_2024():
+
+    # The variable split does not depend on the other attributes of the contract
+    contract = GrossSplit.__new__(GrossSplit)
+    contract._variable_split_key = None
+    contract.field_loc = 'Onshore'
+    contract.infra_avail = VariableSplit132024.InfrastructureAvailability.NOT_AVAILABLE
+    contract.field_reserves = 'low'
+
+    # Expected result: string and enum parameters resolve from the same table
+    contract._wrapper_variable_split(regime=GrossSplitRegime.PERMEN_ESDM_13_2024)
+    np.testing.assert_allclose(contract._variable_split, 0.38)
+
+    # The cached variable split is updated once a component changes
+    contract.field_loc = VariableSplit132024.FieldLocation.ULTRADEEP_OFFSHORE
+    contract._wrapper_variable_split(regime=GrossSplitRegime.PERMEN_ESDM_13_2024)
+    np.testing.assert_allclose(contract._variable_split, 0.41)
+
+    # Test whether an unknown parameter raises an error
+    contract.field_reserves = 'unknown'
+    with pytest.raises(KeyError):
+        contract._wrapper_variable_split(regime=GrossSplitRegime.PERMEN_ESDM_13_2024)